@@ -1,10 +1,15 @@
 from dependency_injector import containers, providers
 
 from analyze.repository.observation import ObservationRepository
-from analyze.service.langflow_service import LangflowService
+from analyze.service.langflow_service import LangflowService, AsyncLangflowService
 from analyze.service.analyze import AnalyzeService
+from analyze.service.cache.memory_cache_backend import MemoryCacheBackend
+from analyze.service.cache.sqlite_cache_backend import SQLiteCacheBackend
+from analyze.service.report_cache import ReportCacheService
 from analyze.service.observation import ObservationService
+from analyze.service.case_reconcile import CaseReconcileService
 
+from core.repository.case import CaseRepository
 from core.repository.session import SessionRepository
 from core.db.connection import ConnectionManager
 from core.service.security import SecurityService
@@ -25,6 +30,11 @@ class Container(containers.DeclarativeContainer):
         ConnectionManager,
         db_url=config.mysql.db_url,
         pool_recycle=config.mysql.pool_recycle,
+        pool_size=config.mysql.pool_size,
+        max_overflow=config.mysql.max_overflow,
+        pool_timeout=config.mysql.pool_timeout,
+        pool_pre_ping=config.mysql.pool_pre_ping,
+        pool_use_lifo=config.mysql.pool_use_lifo,
     )
 
     security_service = providers.Singleton(
@@ -39,6 +49,10 @@ class Container(containers.DeclarativeContainer):
         SessionRepository, connection_manager=connection_manager
     )
 
+    case_repository = providers.Singleton(
+        CaseRepository, connection_manager=connection_manager
+    )
+
     # object repositories
     client_manager = providers.Singleton(
         ClientManager,
@@ -78,11 +92,51 @@ class Container(containers.DeclarativeContainer):
         observation_repository=observation_repository,
     )
 
-    langflow_service = providers.Singleton(
-        LangflowService,
-        langflow_host=config.langflow.host,
-        langflow_token=config.langflow.token,
+    langflow_service = providers.Selector(
+        config.langflow.client,
+        sync=providers.Singleton(
+            LangflowService,
+            langflow_host=config.langflow.host,
+            langflow_token=config.langflow.token,
+            flow_id=config.langflow.flow_id,
+            timeout=config.langflow.timeout,
+            connect_timeout=config.langflow.connect_timeout,
+            max_connections=config.langflow.max_connections,
+            max_retries=config.langflow.max_retries,
+            backoff_factor=config.langflow.backoff_factor,
+        ),
+        asyncio=providers.Singleton(
+            AsyncLangflowService,
+            langflow_host=config.langflow.host,
+            langflow_token=config.langflow.token,
+            flow_id=config.langflow.flow_id,
+            timeout=config.langflow.timeout,
+            connect_timeout=config.langflow.connect_timeout,
+            max_connections=config.langflow.max_connections,
+            max_retries=config.langflow.max_retries,
+            backoff_factor=config.langflow.backoff_factor,
+        ),
+    )
+
+    report_cache_backend = providers.Selector(
+        config.report_cache.backend,
+        memory=providers.Singleton(
+            MemoryCacheBackend,
+            ttl_seconds=config.report_cache.ttl_seconds,
+            max_size=config.report_cache.max_size,
+        ),
+        sqlite=providers.Singleton(
+            SQLiteCacheBackend,
+            path=config.report_cache.path,
+            ttl_seconds=config.report_cache.ttl_seconds,
+            max_size=config.report_cache.max_size,
+        ),
+    )
+    report_cache_service = providers.Singleton(
+        ReportCacheService,
+        cache_backend=report_cache_backend,
         flow_id=config.langflow.flow_id,
+        prompt_version=config.report_cache.prompt_version,
     )
 
     analyze_service = providers.Singleton(
@@ -93,4 +147,18 @@ class Container(containers.DeclarativeContainer):
         session_repository=session_repository,
         langflow_service=langflow_service,
         observation_service=observation_service,
+        max_workers=config.analyze.max_workers,
+        worker_count=config.analyze.worker_count,
+        lease_seconds=config.analyze.lease_seconds,
+        report_cache_service=report_cache_service,
+        window_max_tokens=config.analyze.window_max_tokens,
+        window_overlap_tokens=config.analyze.window_overlap_tokens,
+        batch_size=config.analyze.batch_size,
+        batch_flow_id=config.langflow.batch_flow_id,
+    )
+
+    case_reconcile_service = providers.Singleton(
+        CaseReconcileService,
+        case_repository=case_repository,
+        batch_size=config.case.reconcile_batch_size,
     )
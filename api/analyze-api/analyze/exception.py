@@ -10,3 +10,11 @@ class ObservationNotFound(ServiceException):
         self.status_code = 400
         self.error_code = 100
         super().__init__(self.message)
+
+
+class ScriptNotSorted(ServiceException):
+    def __init__(self, start_time: str):
+        self.message = f"Script record at {start_time} is not sorted by start_time"
+        self.status_code = 400
+        self.error_code = 101
+        super().__init__(self.message)
@@ -1,11 +1,14 @@
 import os
 from dependency_injector import providers
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
 from analyze.container import Container
+from core.exception import InvalidToken
 from analyze.setting.config import settings
 from analyze.route.monitor import router as monitor_router
 from analyze.scheduler.script_batch import start_analyze
+from analyze.scheduler.case_batch import start_reconcile
 
 config = providers.Configuration()
 container = Container()
@@ -20,6 +23,14 @@ app = FastAPI(
 )
 
 
+@app.exception_handler(InvalidToken)
+async def invalid_token_handler(request: Request, exc: InvalidToken):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"message": exc.message, "error_code": exc.error_code},
+    )
+
+
 def register_routers(app: FastAPI):
     app.include_router(
         monitor_router,
@@ -28,4 +39,5 @@ def register_routers(app: FastAPI):
 
 
 start_analyze()
+start_reconcile()
 register_routers(app)
@@ -0,0 +1,13 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class QueueStats(BaseModel):
+    mode: str = "cron"
+    # 조회에 실패하면 None
+    queue_depth: Optional[int] = 0
+    processed: int = 0
+    elapsed_seconds: float = 0.0
+    throughput_per_minute: float = 0.0
+    idle_interval: Optional[float] = None
+    ticked_at: Optional[str] = None
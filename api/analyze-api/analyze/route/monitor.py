@@ -1,8 +1,19 @@
-from dependency_injector.wiring import inject
+from dependency_injector.wiring import inject, Provide
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.security import OAuth2PasswordBearer
+
+from analyze.container import Container
+from analyze.model.domain.cache import CacheStats
+from analyze.model.domain.queue import QueueStats
+from core.db.connection import ConnectionManager
+from core.model.domain.pool import PoolStats
+from core.service.security import SecurityService
+from analyze.service.analyze import AnalyzeService
+from analyze.service.report_cache import ReportCacheService
 
 router = APIRouter()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/api/signin")
 
 
 @router.post("/liveness", tags=["Get"])
@@ -15,3 +26,43 @@ async def get_liveness():
 @inject
 async def get_readiness():
     return "OK"
+
+
+# analyze queue 깊이와 마지막 tick의 처리량
+@router.get("/queue", tags=["Get"])
+@inject
+async def get_queue_stats(
+    token: str = Depends(oauth2_scheme),
+    analyze_service: AnalyzeService = Depends(Provide[Container.analyze_service]),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> QueueStats:
+    security_service.verify_token(token)
+    return analyze_service.queue_stats
+
+
+# 관찰척도 분석 결과 cache hit/miss
+@router.get("/report-cache", tags=["Get"])
+@inject
+async def get_report_cache_stats(
+    token: str = Depends(oauth2_scheme),
+    report_cache_service: ReportCacheService = Depends(
+        Provide[Container.report_cache_service]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> CacheStats:
+    security_service.verify_token(token)
+    return report_cache_service.stats()
+
+
+# MySQL connection pool 사용량과 checkout 대기 시간
+@router.get("/pool", tags=["Get"])
+@inject
+async def get_pool_stats(
+    token: str = Depends(oauth2_scheme),
+    connection_manager: ConnectionManager = Depends(
+        Provide[Container.connection_manager]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> PoolStats:
+    security_service.verify_token(token)
+    return connection_manager.get_pool_stats()
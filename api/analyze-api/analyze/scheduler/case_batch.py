@@ -0,0 +1,35 @@
+from analyze.container import Container
+from dependency_injector.wiring import inject, Provide
+
+from analyze.scheduler.script_batch import sched
+from analyze.service.case_reconcile import CaseReconcileService
+
+
+@inject
+def reconcile_job(
+    case_reconcile_service: CaseReconcileService = Provide[
+        Container.case_reconcile_service
+    ],
+):
+    print("Session count reconcile start!")
+    case_reconcile_service.reconcile_session_count()
+
+
+@inject
+def start_reconcile(
+    reconcile_hour: int = Provide[Container.config.case.reconcile_hour],
+    reconcile_minute: int = Provide[Container.config.case.reconcile_minute],
+):
+    # analyze job과 같은 scheduler에서 하루 한 번 실행한다.
+    sched.add_job(
+        reconcile_job,
+        "cron",
+        hour=reconcile_hour,
+        minute=reconcile_minute,
+        id="reconcile_session_count",
+        replace_existing=True,
+    )
+
+
+def stop_reconcile():
+    sched.remove_job("reconcile_session_count")
@@ -1,7 +1,9 @@
+import traceback
 import warnings
 
 warnings.filterwarnings("ignore")
 
+from datetime import datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.schedulers.base import STATE_RUNNING
 from analyze.container import Container
@@ -12,16 +14,62 @@ from analyze.service.analyze import AnalyzeService
 sched = BackgroundScheduler(timezone="Asia/Seoul")
 
 
-@sched.scheduled_job("cron", second="0", id="analyze")
 @inject
 def analyze_job(
     analyze_service: AnalyzeService = Provide[Container.analyze_service],
 ):
     print("Analyze start!")
-    analyze_service.run_from_db()
+    analyze_service.run_workers()
 
 
-def start_analyze():
+@inject
+def drain_job(
+    idle_interval: float = None,
+    analyze_service: AnalyzeService = Provide[Container.analyze_service],
+    idle_interval_min: float = Provide[Container.config.analyze.idle_interval_min],
+    idle_interval_max: float = Provide[Container.config.analyze.idle_interval_max],
+):
+    """
+    READY session이 없어질 때까지 분석하고, 할 일이 없으면 polling 간격을 두 배씩 늘린다.
+    """
+    print("Analyze drain start!")
+    processed, failed = 0, False
+    try:
+        processed = analyze_service.drain()
+    except Exception:
+        # drain이 실패해도 다음 drain은 예약해야 분석이 멈추지 않는다.
+        print(traceback.format_exc())
+        failed = True
+    finally:
+        if failed:
+            # 실패하면(DB 장애 등) 바로 다시 시도하지 않고 polling 간격을 늘린다.
+            idle_interval = min(
+                (idle_interval or idle_interval_min) * 2, idle_interval_max
+            )
+        elif processed > 0 or idle_interval is None:
+            idle_interval = idle_interval_min
+        else:
+            idle_interval = min(idle_interval * 2, idle_interval_max)
+        analyze_service.queue_stats.idle_interval = idle_interval
+
+        sched.add_job(
+            drain_job,
+            "date",
+            run_date=datetime.now(sched.timezone) + timedelta(seconds=idle_interval),
+            kwargs={"idle_interval": idle_interval},
+            id="analyze",
+            replace_existing=True,
+        )
+
+
+@inject
+def start_analyze(
+    schedule_mode: str = Provide[Container.config.analyze.schedule_mode],
+):
+    if schedule_mode == "drain":
+        sched.add_job(drain_job, "date", id="analyze")
+    else:
+        sched.add_job(analyze_job, "cron", second="0", id="analyze")
     sched.start()
 
 
@@ -1,8 +1,12 @@
+import hashlib
 import json
 import os
 import datetime
 import traceback
 import threading
+from typing import Dict, Iterable, List
+from pydantic import ValidationError
+from concurrent.futures import ThreadPoolExecutor
 from object.service.script import ScriptService
 from object.service.analyze_report import AnalyzeReportService
 from core.repository.session import SessionRepository
@@ -10,12 +14,22 @@ from core.db.connection import ConnectionManager
 from core.model.domain.state_type import StateTypeEnum
 from core.model.domain.session import Session
 from core.model.domain.reports import AnalyzeReport
-from core.model.domain.script import Script
+from core.model.domain.script import Record
 from core.model.domain.reports import BatchPromptReport
 from core.db.transaction import transaction_scope
+from analyze.model.domain.observation import Observation
+from analyze.model.domain.queue import QueueStats
 from analyze.service.observation import ObservationService
 from analyze.service.langflow_service import LangflowService
-from analyze.utils.script_util import make_merged_script
+from analyze.service.report_cache import ReportCacheService
+from analyze.utils.report_util import merge_reports
+from analyze.exception import ScriptNotSorted
+from analyze.utils.script_util import (
+    check_record_order,
+    iter_record_windows,
+    merge_records,
+    sort_records,
+)
 
 
 class AnalyzeService:
@@ -30,6 +44,14 @@ class AnalyzeService:
         session_repository: SessionRepository,
         langflow_service: LangflowService,
         observation_service: ObservationService,
+        max_workers: int = None,
+        worker_count: int = None,
+        lease_seconds: int = None,
+        report_cache_service: ReportCacheService = None,
+        window_max_tokens: int = None,
+        window_overlap_tokens: int = None,
+        batch_size: int = None,
+        batch_flow_id: str = None,
     ):
         self.connection_manager = connection_manager
         self.script_service = script_service
@@ -37,6 +59,21 @@ class AnalyzeService:
         self.session_repository = session_repository
         self.langflow_service = langflow_service
         self.observation_service = observation_service
+        # 동시에 langflow로 보내는 관찰척도 요청 수 (1 이하이면 순차 실행)
+        self.max_workers = max_workers or 1
+        # 한 프로세스에서 동시에 분석하는 session 수
+        self.worker_count = worker_count or 1
+        # claim한 session을 점유하는 시간 (분석 최대 소요 시간보다 길어야 한다)
+        self.lease_seconds = lease_seconds or 3600
+        self.queue_stats = QueueStats()
+        # 없으면 매번 langflow를 호출한다.
+        self.report_cache_service = report_cache_service
+        # script가 이보다 길면 window로 나누어 분석한 뒤 합친다. (없으면 나누지 않음)
+        self.window_max_tokens = window_max_tokens
+        self.window_overlap_tokens = window_overlap_tokens or 0
+        # 한 번의 langflow 호출로 분석하는 관찰척도 수 (batch_flow_id가 없으면 1개씩 분석)
+        self.batch_flow_id = batch_flow_id
+        self.batch_size = (batch_size or 1) if batch_flow_id else 1
 
     def to_clean_dict(self, report_dict: dict):
         # 최상위 JSON에서 message 값 추출
@@ -52,113 +89,320 @@ class AnalyzeService:
 
         return json.loads(clean_message)
 
-    def export(self, analyze_report: AnalyzeReport, session_id: int):
+    def make_file_path(self, session_id: int) -> str:
         env = os.getenv("PHASE", "LOCAL")
-        file_path = f"{env}/{session_id}"
+        return f"{env}/{session_id}"
+
+    def make_checkpoint_path(self, session: Session) -> str:
+        """
+        checkpoint는 session의 script 별 prefix에 저장한다.
+        script가 다시 upload 되어 source_script_url이 바뀌면 이전 script의 checkpoint는 이어 쓰지 않는다.
+        """
+        script_key = hashlib.sha256(
+            (session.source_script_url or "").encode("utf-8")
+        ).hexdigest()[:16]
+        return f"{self.make_file_path(session.id)}/{script_key}"
+
+    def export(self, analyze_report: AnalyzeReport, session_id: int):
+        file_path = self.make_file_path(session_id)
         file_name = self.analyze_report_service.upload(analyze_report, file_path)
         return file_name
 
-    def run(self, script_url):
+    def load_checkpoints(self, checkpoint_path: str) -> Dict[str, BatchPromptReport]:
         """
-        1. script_url을 받아서 script download
-        2. observation에서 관찰척도 리스트 가져오기
-        3. 관찰척도 리스트에 대해 iterate하며 langflow_service.run() 호출
-        4. json dict -> BatchPromptReport 변환
-        5. BatchPromptReport를 합쳐서 AnalyzeReport 생성
+        이전 실행에서 결과가 정상적으로 나온 관찰척도 checkpoint를 불러온다.
+        불러오지 못하면 모든 관찰척도를 다시 분석한다.
         """
-        script_body = self.script_service.download_script(script_url)
-        scripts = Script(**json.loads(script_body.decode("utf-8")))
-        script = make_merged_script(scripts)
+        if checkpoint_path is None:
+            return dict()
+        try:
+            checkpoints = self.analyze_report_service.download_checkpoints(
+                checkpoint_path
+            )
+        except Exception as e:
+            print(f"[AnalyzeService] cannot load checkpoints '{checkpoint_path}': {e}")
+            return dict()
+        return {
+            name: report for name, report in checkpoints.items() if report.level != -1
+        }
 
-        observations = self.observation_service.list()
+    def save_checkpoint(
+        self, report: BatchPromptReport, checkpoint_path: str, name: str
+    ):
+        # 결과가 제대로 나오지 않은 경우는 재시도 때 다시 분석하도록 저장하지 않는다.
+        if checkpoint_path is None or report.level == -1:
+            return
+        try:
+            self.analyze_report_service.upload_checkpoint(report, checkpoint_path, name)
+        except Exception as e:
+            print(f"[AnalyzeService] cannot save checkpoint '{name}': {e}")
 
-        analyze_report = dict()
+    def delete_checkpoints(self, checkpoint_path: str, exclude: str = None):
+        try:
+            self.analyze_report_service.delete_checkpoints(
+                checkpoint_path, exclude=exclude
+            )
+        except Exception as e:
+            print(
+                f"[AnalyzeService] cannot delete checkpoints '{checkpoint_path}': {e}"
+            )
+
+    def get_cached_report(self, script: str, obs: Observation) -> BatchPromptReport:
+        if self.report_cache_service is None:
+            return None
+        # 관찰척도 하나씩 분석한 결과를 먼저 찾고, 없으면 batch flow의 결과를 찾는다.
+        flow_ids = [None, self.batch_flow_id] if self.batch_size > 1 else [None]
+        cached_report = self.report_cache_service.get(
+            script, obs.kor_name, flow_ids=flow_ids
+        )
+        if cached_report is not None:
+            print(f"[AnalyzeService] observations: {obs.kor_name} (cached)")
+            cached_report.category = obs.eng_name
+        return cached_report
+
+    def set_cached_report(
+        self,
+        script: str,
+        obs: Observation,
+        report: BatchPromptReport,
+        flow_id: str = None,
+    ):
+        if self.report_cache_service is not None:
+            self.report_cache_service.set(script, obs.kor_name, report, flow_id=flow_id)
+
+    def request_observation(self, script: str, obs: Observation) -> BatchPromptReport:
+        """
+        관찰척도 하나에 대해 langflow_service.run() 호출 후 BatchPromptReport로 변환
+        """
+        print(f"[AnalyzeService] observations: {obs.kor_name}")
+        input_dict = {
+            self.CHAT_INPUT_KEY: {
+                "input_value": script,
+            },
+            self.TEXT_INPUT_KEY: {"input_value": obs.kor_name},
+        }
+        langflow_res = self.to_clean_dict(
+            self.langflow_service.run(obs.kor_name, input_dict)
+        )["reports"]
+
+        # reports가 제대로 나오지 않은 경우
+        if not isinstance(langflow_res, dict):
+            print(f"[AnalyzeService] result error in '{obs.kor_name}'")
+            langflow_res = {
+                "descriptions": "",
+                "interactions": [],
+                "level": langflow_res,
+            }
+        elif langflow_res["level"] is None:
+            print(f"[AnalyzeService] result error in '{obs.kor_name}'")
+            langflow_res["level"] = -1
+
+        if "interactions" in langflow_res.keys() and not isinstance(
+            langflow_res["interactions"], list
+        ):
+            langflow_res["interactions"] = [langflow_res["interactions"]]
+
+        langflow_res["category"] = obs.eng_name
+        return BatchPromptReport(**langflow_res)
+
+    def split_batch_reports(
+        self, langflow_res: dict, observations: List[Observation]
+    ) -> Dict[str, BatchPromptReport]:
+        """
+        batch flow 응답 {"reports": {kor_name: {descriptions, interactions, level}, ...}}을
+        관찰척도 별 BatchPromptReport로 나눈다.
+        형식에 맞지 않거나 level이 없는 관찰척도는 결과에서 빠진다.
+        """
+        try:
+            reports = self.to_clean_dict(langflow_res)["reports"]
+        except Exception as e:
+            print(f"[AnalyzeService] cannot parse batch result: {e}")
+            return dict()
+        if not isinstance(reports, dict):
+            return dict()
+
+        batch_reports = dict()
         for obs in observations:
-            print(f"[AnalyzeService] observations: {obs.kor_name}")
+            report = reports.get(obs.kor_name)
+            if not isinstance(report, dict):
+                continue
+            level = report.get("level")
+            if isinstance(level, bool) or not isinstance(level, int) or level == -1:
+                continue
+
+            report = dict(report, category=obs.eng_name)
+            if "interactions" in report.keys() and not isinstance(
+                report["interactions"], list
+            ):
+                report["interactions"] = [report["interactions"]]
+            try:
+                batch_reports[obs.eng_name] = BatchPromptReport(**report)
+            except ValidationError:
+                continue
+        return batch_reports
+
+    def analyze_observations(
+        self, script: str, observations: List[Observation]
+    ) -> Dict[str, BatchPromptReport]:
+        """
+        관찰척도 여러 개를 batch flow 한 번으로 분석한다. (관찰척도가 하나이면 단독으로 분석)
+        batch 결과에서 빠지거나 형식이 맞지 않는 관찰척도는 관찰척도 하나씩 다시 분석한다.
+        같은 script, 관찰척도의 결과가 cache에 있으면 langflow를 호출하지 않는다.
+        """
+        reports = dict()
+        pending = []
+        for obs in observations:
+            cached_report = self.get_cached_report(script, obs)
+            if cached_report is not None:
+                reports[obs.eng_name] = cached_report
+            else:
+                pending.append(obs)
+
+        if len(pending) > 1 and self.batch_flow_id:
+            kor_names = [obs.kor_name for obs in pending]
+            print(f"[AnalyzeService] observations: {kor_names} (batch)")
             input_dict = {
                 self.CHAT_INPUT_KEY: {
                     "input_value": script,
                 },
-                self.TEXT_INPUT_KEY: {"input_value": obs.kor_name},
+                self.TEXT_INPUT_KEY: {
+                    "input_value": json.dumps(kor_names, ensure_ascii=False)
+                },
             }
-            langflow_res = self.to_clean_dict(
-                self.langflow_service.run(obs.kor_name, input_dict)
-            )["reports"]
-
-            # reports가 제대로 나오지 않은 경우
-            if not isinstance(langflow_res, dict):
-                print(f"[AnalyzeService] result error in '{obs.kor_name}'")
-                langflow_res = {
-                    "descriptions": "",
-                    "interactions": [],
-                    "level": langflow_res,
-                }
-            elif langflow_res["level"] is None:
-                print(f"[AnalyzeService] result error in '{obs.kor_name}'")
-                langflow_res["level"] = -1
-
-            if "interactions" in langflow_res.keys() and not isinstance(
-                langflow_res["interactions"], list
-            ):
-                langflow_res["interactions"] = [langflow_res["interactions"]]
+            batch_reports = self.split_batch_reports(
+                self.langflow_service.run(
+                    ", ".join(kor_names), input_dict, flow_id=self.batch_flow_id
+                ),
+                pending,
+            )
+            for obs in pending:
+                if obs.eng_name in batch_reports:
+                    reports[obs.eng_name] = batch_reports[obs.eng_name]
+                    self.set_cached_report(
+                        script,
+                        obs,
+                        reports[obs.eng_name],
+                        flow_id=self.batch_flow_id,
+                    )
 
-            langflow_res["category"] = obs.eng_name
-            report = BatchPromptReport(**langflow_res)
+        for obs in pending:
+            if obs.eng_name not in reports:
+                if len(pending) > 1 and self.batch_flow_id:
+                    print(
+                        f"[AnalyzeService] fallback to single prompt '{obs.kor_name}'"
+                    )
+                reports[obs.eng_name] = self.request_observation(script, obs)
+                self.set_cached_report(script, obs, reports[obs.eng_name])
+        return reports
+
+    def make_windows(self, records: Iterable[Record]) -> List[str]:
+        if not self.window_max_tokens:
+            return [merge_records(records)]
+        return [
+            merge_records(window)
+            for window in iter_record_windows(
+                records, self.window_max_tokens, self.window_overlap_tokens
+            )
+        ]
+
+    def run(self, script_url, checkpoint_path: str = None):
+        """
+        1. script_url의 script를 record 단위로 streaming download
+        2. record를 start_time 순서로 합치면서 window_max_tokens 이하의 window로 나누기
+           (순서가 어긋난 record가 있으면 script 전체를 읽어 정렬한 뒤 다시 나눈다)
+        3. observation에서 관찰척도 리스트 가져오기
+        4. checkpoint_path에 결과가 남아있는 관찰척도는 제외
+        5. 나머지 (관찰척도 batch_size개, window) 마다 최대 max_workers개씩 동시에 langflow_service.run() 호출
+        6. json dict -> BatchPromptReport 변환 후 관찰척도 별로 window 결과를 합쳐 checkpoint 저장
+        7. BatchPromptReport를 합쳐서 AnalyzeReport 생성
+        """
+        # script 파일을 통째로 읽지 않고 record 단위로 읽으면서 window를 만든다.
+        try:
+            records = self.script_service.iter_script_records(script_url)
+            windows = self.make_windows(check_record_order(records))
+        except ScriptNotSorted as e:
+            print(f"[AnalyzeService] {e.message}, sort records")
+            records = self.script_service.iter_script_records(script_url)
+            windows = self.make_windows(sort_records(records))
+        if len(windows) > 1:
+            print(f"[AnalyzeService] split script into {len(windows)} windows")
+
+        observations = self.observation_service.list()
+        checkpoints = self.load_checkpoints(checkpoint_path)
+        if checkpoints:
+            print(
+                f"[AnalyzeService] resume from {len(checkpoints)} checkpoints in '{checkpoint_path}'"
+            )
+
+        pending = [obs for obs in observations if obs.eng_name not in checkpoints]
+        groups = [
+            pending[i : i + self.batch_size]
+            for i in range(0, len(pending), self.batch_size)
+        ]
+        futures = {obs.eng_name: [] for obs in pending}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for window in windows:
+                for group in groups:
+                    future = executor.submit(self.analyze_observations, window, group)
+                    for obs in group:
+                        futures[obs.eng_name].append(future)
+
+        # 모든 요청이 끝난 뒤 관찰척도 순서대로 결과를 모은다.
+        # 예외가 발생한 관찰척도가 있으면 나머지 결과를 checkpoint에 저장한 뒤 다시 raise 한다.
+        # (이미 끝난 관찰척도는 checkpoint에 남아 재시도 때 다시 분석하지 않는다.)
+        analyze_report = dict()
+        error = None
+        for obs in observations:
+            if obs.eng_name in checkpoints:
+                analyze_report[obs.eng_name] = checkpoints[obs.eng_name]
+                continue
+            try:
+                reports = [
+                    future.result()[obs.eng_name] for future in futures[obs.eng_name]
+                ]
+            except Exception as e:
+                error = error or e
+                continue
+            report = merge_reports(reports, obs.eng_name)
+            self.save_checkpoint(report, checkpoint_path, obs.eng_name)
             analyze_report[obs.eng_name] = report
 
+        if error is not None:
+            raise error
         return AnalyzeReport(reports=analyze_report)
 
-    def run_from_db(self):
+    def run_from_db(self) -> bool:
         """
-        1. session 중 READY 상태인 것을 찾아 script_url을 가져온다.
-        2. run() 호출하여 AnalyzeReport 생성
+        1. READY 상태(또는 lease가 만료된 START 상태)인 session 하나를 START로 claim 한다.
+        2. run() 호출하여 AnalyzeReport 생성 (같은 script를 분석하던 checkpoint가 있으면 이어서 분석)
         3. run()에서 생성된 AnalyzeReport를 s3에 upload
-        4. 분석 완료 후 DONE 상태로 변경
+        4. 분석 완료 후 DONE 상태로 변경하고 checkpoint 삭제
+        처리할 session이 없으면 False를 반환한다.
+        실패한 session은 ERROR로 바뀌어 다시 claim 되지 않으므로, checkpoint로 이어서 분석하는 경우는
+        worker가 죽어 START로 남은 session의 lease가 만료된 경우와 운영자가 READY로 되돌린 경우뿐이다.
         """
         current_time = datetime.datetime.now()
         formatted_time = current_time.strftime("%H:%M:%S")
         print(f"[AnalyzeService] run from db at {formatted_time}")
 
         target_session: Session = None
-        update_analyze_start_state = False
-        update_analyze_done_state = False
         try:
-            db_session = self.connection_manager.make_session()
-            with transaction_scope(db_session) as tx_session:
-                target_session: Session = (
-                    self.session_repository.get_by_analyze_state_id(
-                        state_id=StateTypeEnum.READY, db_session=db_session
-                    )
-                )
-                if target_session is None:
-                    print(f"[AnalyzeService] no target_session")
-                    return
-
-                if (
-                    target_session.source_script_url is None
-                    or target_session.source_script_url == ""
-                ):
-                    print(
-                        f"[AnalyzeService] session id:[{target_session.id}] no target_session"
-                    )
-                    return
-
-                print(
-                    f"[AnalyzeService] session_id:[{target_session.id}] update target session state"
-                )
-                update_analyze_start_state = (
-                    self.session_repository.update_analyze_state_by_session_id(
-                        session_id=target_session.id,
-                        new_state_id=int(StateTypeEnum.START),
-                        db_session=tx_session,
-                    )
-                )
+            target_session = self.session_repository.claim_by_analyze_state_id(
+                lease_seconds=self.lease_seconds
+            )
+            if target_session is None:
+                print(f"[AnalyzeService] no target_session")
+                return False
 
             script_path = target_session.source_script_url
             print(
                 f"[AnalyzeService] session_id:[{target_session.id}] start analyze script {script_path}"
             )
-            analyze_report = self.run(script_path)
+            session_path = self.make_file_path(target_session.id)
+            checkpoint_path = self.make_checkpoint_path(target_session)
+            # 다른 script(이전 버전)를 분석하다 남은 checkpoint는 버린다.
+            self.delete_checkpoints(session_path, exclude=checkpoint_path)
+            analyze_report = self.run(script_path, checkpoint_path=checkpoint_path)
 
             file_name = self.export(analyze_report, target_session.id)
             db_session = self.connection_manager.make_session()
@@ -166,21 +410,89 @@ class AnalyzeService:
                 print(
                     f"[AnalyzeService] session_id:[{target_session.id}] upload analyze file {file_name}"
                 )
-                target_session.analyze_url = file_name
-                target_session.analyze_state_id = int(StateTypeEnum.DONE)
-                update_analyze_done_state = self.session_repository.update(
+                # claim 한 lease가 그대로일 때만 DONE으로 바꾼다.
+                updated = self.session_repository.update_analyze_state_by_session_id(
                     session_id=target_session.id,
-                    session=target_session,
+                    new_state_id=int(StateTypeEnum.DONE),
+                    analyze_url=file_name,
+                    lease_expired_at=target_session.analyze_lease_expired_at,
                     db_session=tx_session,
                 )
+            if not updated:
+                # 분석이 lease보다 오래 걸려 다른 worker가 다시 claim 한 session
+                # (그 worker가 checkpoint를 이어서 분석하므로 지우지 않는다)
+                print(
+                    f"[AnalyzeService] session_id:[{target_session.id}] lease expired, skip DONE"
+                )
+                return True
+            self.delete_checkpoints(session_path)
 
         except Exception as e:
             print(traceback.format_exc())
-            if update_analyze_start_state or update_analyze_done_state:
+            # claim 단계에서 실패했다면 처리한 session이 없다.
+            if target_session is None:
+                return False
+            try:
                 db_session = self.connection_manager.make_session()
                 with transaction_scope(db_session) as tx_session:
                     self.session_repository.update_analyze_state_by_session_id(
                         session_id=target_session.id,
                         new_state_id=int(StateTypeEnum.ERROR),
+                        lease_expired_at=target_session.analyze_lease_expired_at,
                         db_session=tx_session,
                     )
+            except Exception:
+                # ERROR로 바꾸지 못한 session은 START로 남아 lease가 만료되면 다시 claim 된다.
+                print(traceback.format_exc())
+        return True
+
+    def run_workers(self) -> int:
+        """
+        worker_count개의 worker가 각자 session을 하나씩 claim 하여 동시에 분석한다.
+        처리한 session 수를 반환한다.
+        """
+        return self.run_tick(mode="cron", work=lambda: int(self.run_from_db()))
+
+    def drain(self) -> int:
+        """
+        worker_count개의 worker가 claim할 session이 없을 때까지 계속 분석한다.
+        처리한 session 수를 반환한다.
+        """
+
+        def work() -> int:
+            processed = 0
+            while self.run_from_db():
+                processed += 1
+            return processed
+
+        return self.run_tick(mode="drain", work=work)
+
+    def run_tick(self, mode: str, work) -> int:
+        start_time = datetime.datetime.now()
+        try:
+            queue_depth = self.session_repository.count_by_analyze_state_id(
+                state_id=StateTypeEnum.READY
+            )
+        except Exception:
+            # queue depth는 모니터링 용도이므로 조회에 실패해도 분석은 계속한다.
+            print(traceback.format_exc())
+            queue_depth = None
+        with ThreadPoolExecutor(max_workers=self.worker_count) as executor:
+            futures = [executor.submit(work) for _ in range(self.worker_count)]
+        processed = sum(future.result() for future in futures)
+
+        elapsed_seconds = (datetime.datetime.now() - start_time).total_seconds()
+        self.queue_stats = QueueStats(
+            mode=mode,
+            queue_depth=queue_depth,
+            processed=processed,
+            elapsed_seconds=elapsed_seconds,
+            throughput_per_minute=(
+                processed * 60 / elapsed_seconds if elapsed_seconds > 0 else 0.0
+            ),
+            ticked_at=start_time.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        print(
+            f"[AnalyzeService] processed {processed} sessions (queue depth {queue_depth}) in {elapsed_seconds:.1f}s"
+        )
+        return processed
@@ -0,0 +1,24 @@
+from typing import Optional
+
+
+class BaseCacheBackend:
+
+    def __init__(self, ttl_seconds: int = None, max_size: int = None):
+        # ttl_seconds, max_size가 없으면 만료/개수 제한 없이 보관한다.
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+
+    def get(self, key: str) -> Optional[str]:
+        return None
+
+    def set(self, key: str, value: str):
+        pass
+
+    def delete(self, key: str):
+        pass
+
+    def clear(self):
+        pass
+
+    def size(self) -> int:
+        return 0
@@ -0,0 +1,50 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from analyze.service.cache.base_cache_backend import BaseCacheBackend
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """프로세스 메모리에 보관하는 LRU cache"""
+
+    def __init__(self, ttl_seconds: int = None, max_size: int = None):
+        super().__init__(ttl_seconds, max_size)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            value, expired_at = entry
+            if expired_at is not None and expired_at <= time.time():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str):
+        expired_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+        with self.lock:
+            self.entries[key] = (value, expired_at)
+            self.entries.move_to_end(key)
+            if self.max_size:
+                while len(self.entries) > self.max_size:
+                    self.entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def size(self) -> int:
+        with self.lock:
+            return len(self.entries)
@@ -0,0 +1,85 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from analyze.service.cache.base_cache_backend import BaseCacheBackend
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """local disk의 SQLite 파일에 보관하는 cache (프로세스 재시작 후에도 유지된다)"""
+
+    def __init__(self, path: str, ttl_seconds: int = None, max_size: int = None):
+        super().__init__(ttl_seconds, max_size)
+        file_dir = os.path.dirname(path)
+        if file_dir and not os.path.exists(file_dir):
+            os.makedirs(file_dir, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS tbl_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expired_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_accessed_at "
+                "ON tbl_cache (accessed_at)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                "SELECT value, expired_at FROM tbl_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expired_at = row
+            if expired_at is not None and expired_at <= now:
+                self.connection.execute("DELETE FROM tbl_cache WHERE key = ?", (key,))
+                return None
+
+            self.connection.execute(
+                "UPDATE tbl_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return value
+
+    def set(self, key: str, value: str):
+        now = time.time()
+        expired_at = now + self.ttl_seconds if self.ttl_seconds else None
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO tbl_cache (key, value, expired_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, expired_at, now),
+            )
+            self.connection.execute(
+                "DELETE FROM tbl_cache WHERE expired_at IS NOT NULL AND expired_at <= ?",
+                (now,),
+            )
+            if self.max_size:
+                # 가장 오래 사용되지 않은 항목부터 지운다.
+                self.connection.execute(
+                    "DELETE FROM tbl_cache WHERE key IN ("
+                    "SELECT key FROM tbl_cache ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+
+    def delete(self, key: str):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM tbl_cache WHERE key = ?", (key,))
+
+    def clear(self):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM tbl_cache")
+
+    def size(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM tbl_cache").fetchone()[
+                0
+            ]
@@ -0,0 +1,35 @@
+import datetime
+from core.repository.case import CaseRepository
+
+
+class CaseReconcileService:
+    """
+    tbl_case.session_count(session add/delete 시 증감)가 실제 tbl_session 개수와
+    어긋난 case를 찾아 고친다. (column 추가 전에 만든 session, 직접 수정한 DB 등)
+    case를 id 순으로 batch_size개씩 나눠 batch마다 짧은 transaction으로 처리한다.
+    """
+
+    def __init__(self, case_repository: CaseRepository, batch_size: int = None):
+        self.case_repository = case_repository
+        self.batch_size = batch_size or 500
+
+    def reconcile_session_count(self) -> int:
+        start_time = datetime.datetime.now()
+        after_id, batches, updated = 0, 0, 0
+        while True:
+            result = self.case_repository.reconcile_session_count(
+                after_id=after_id, limit=self.batch_size
+            )
+            if not result:
+                break
+            last_id, batch_updated = result
+            batches += 1
+            updated += batch_updated
+            after_id = last_id
+
+        elapsed_seconds = (datetime.datetime.now() - start_time).total_seconds()
+        print(
+            f"[CaseReconcileService] session_count reconciled: {updated} cases updated "
+            f"in {batches} batches ({elapsed_seconds:.1f}s)"
+        )
+        return updated
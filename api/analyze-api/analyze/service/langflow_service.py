@@ -1,114 +1,202 @@
-import http
-import json
+import asyncio
+import threading
+import time
 
-import requests
-import logging
-import http.client as http_client
-import subprocess
+import httpx
 
 
 class LangflowService:
-    def __init__(self, langflow_host: str, langflow_token: str, flow_id: str):
+    # flow 실행은 멱등이 아니므로 langflow가 요청을 처리하지 않은 것이 확실할 때만 재시도한다.
+    # (500/502/504나 read timeout은 flow가 이미 실행 중이거나 끝났을 수 있다)
+    RETRY_STATUS_CODES = (429, 503)
+    # 요청을 보내기 전에 실패한 오류 (connection을 얻지 못함)
+    RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+    def __init__(
+        self,
+        langflow_host: str,
+        langflow_token: str,
+        flow_id: str,
+        timeout: float = None,
+        connect_timeout: float = None,
+        max_connections: int = None,
+        max_retries: int = None,
+        backoff_factor: float = None,
+    ):
         self.langflow_token = langflow_token
         self.langflow_host = langflow_host
         self.flow_id = flow_id
 
-        http_client.HTTPConnection.debuglevel = 1
-        logging.basicConfig()
-        logging.getLogger().setLevel(logging.DEBUG)
-        requests_log = logging.getLogger("requests.packages.urllib3")
-        requests_log.setLevel(logging.DEBUG)
-        requests_log.propagate = True
-
-    """
-    def run(self, input_value: str, input_dict: dict) -> str:
-        url = f"{self.langflow_host}/api/v1/run/{self.flow_id}?stream=false"
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": f"{self.langflow_token}",
-        }
-        data = {
+        self.timeout = httpx.Timeout(
+            timeout if timeout is not None else 300.0,
+            connect=connect_timeout if connect_timeout is not None else 10.0,
+        )
+        self.limits = httpx.Limits(
+            max_connections=max_connections or 10,
+            max_keepalive_connections=max_connections or 10,
+        )
+        self.max_retries = max_retries if max_retries is not None else 3
+        self.backoff_factor = backoff_factor if backoff_factor is not None else 1.0
+
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def get_client(self) -> httpx.Client:
+        # connection pool을 공유하는 client를 한 번만 생성한다.
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=f"http://{self.langflow_host}",
+                        headers=self.make_headers(),
+                        timeout=self.timeout,
+                        limits=self.limits,
+                    )
+        return self._client
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def make_headers(self) -> dict:
+        return {"Content-Type": "application/json", "x-api-key": self.langflow_token}
+
+    def make_url(self, flow_id: str = None) -> str:
+        return f"/api/v1/run/{flow_id or self.flow_id}?stream=false"
+
+    def make_data(self, input_value: str, input_dict: dict) -> dict:
+        return {
             "message": input_value,
             "output_type": "chat",
             "input_type": "chat",
             "tweaks": input_dict,
         }
 
-        conn = http.client.HTTPConnection("playtherapy-langflow-alpha.dsail.skku.edu")
-
-        try:
-            conn.request(
-                "POST",
-                f"/api/v1/run/{self.flow_id}?stream=false",
-                body=json.dumps(data),
-                headers=headers,
-            )
-
-            response = conn.getresponse()
-
-            print("Status Code:", response.status)
-            response_data = response.read().decode()
-            print("Response JSON:", response_data)
-
-            response_json = json.loads(response_data)
-            print("Parsed JSON:", response_json)
-            return response_json
-        except Exception as e:
-            print(f"An error occurred: {e}")
-        finally:
-            conn.close()
-            return None
-
+    def get_backoff(self, attempt: int) -> float:
+        return self.backoff_factor * (2**attempt)
+
+    def should_retry(self, attempt: int, response: httpx.Response = None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        return response is None or response.status_code in self.RETRY_STATUS_CODES
+
+    def run(self, input_value: str, input_dict: dict, flow_id: str = None) -> dict:
+        data = self.make_data(input_value, input_dict)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.get_client().post(self.make_url(flow_id), json=data)
+            except self.RETRY_ERRORS as e:
+                if not self.should_retry(attempt):
+                    print(f"An error occurred: {e}")
+                    return None
+                print(f"[LangflowService] retry {attempt + 1} after error: {e}")
+                time.sleep(self.get_backoff(attempt))
+                continue
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
+
+            if self.should_retry(attempt, response):
+                print(
+                    f"[LangflowService] retry {attempt + 1} after status {response.status_code}"
+                )
+                time.sleep(self.get_backoff(attempt))
+                continue
+
+            print("Status Code:", response.status_code)
+            try:
+                response.raise_for_status()
+                return response.json()
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
+
+
+class AsyncLangflowService(LangflowService):
+    """
+    httpx.AsyncClient로 langflow를 호출하는 service
+    run()은 service 전용 event loop에 요청을 넘기므로 AnalyzeService의 worker thread들이
+    하나의 async connection pool을 공유한다.
     """
 
-    def run(self, input_value: str, input_dict: dict) -> dict:
-        langflow_host = self.langflow_host
-        flow_id = self.flow_id
-        langflow_token = self.langflow_token
-
-        url = f"http://{langflow_host}/api/v1/run/{flow_id}?stream=false"
-        headers = {"Content-Type": "application/json", "x-api-key": langflow_token}
-        data = {
-            "message": input_value,
-            "output_type": "chat",
-            "input_type": "chat",
-            "tweaks": input_dict,
-        }
-
-        curl_command = [
-            "curl",
-            "-s",
-            "-X",
-            "POST",
-            url,
-            "-H",
-            f"Content-Type: {headers['Content-Type']}",
-            "-H",
-            f"x-api-key: {headers['x-api-key']}",
-            "-d",
-            "@-",  # stdin으로 데이터를 전달
-        ]
-
-        try:
-            # Popen을 사용하여 데이터를 파이프를 통해 전달
-            process = subprocess.Popen(
-                curl_command,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._async_client = None
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever, name="langflow-loop", daemon=True
+                    ).start()
+                    self._loop = loop
+        return self._loop
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=f"http://{self.langflow_host}",
+                headers=self.make_headers(),
+                timeout=self.timeout,
+                limits=self.limits,
             )
-
-            # stdin을 통해 JSON 데이터를 전달
-            stdout, stderr = process.communicate(input=json.dumps(data))
-
-            # 명령어 실행 결과 출력
-            print("Status Code:", process.returncode)
-            print("Response JSON:", stdout)
-
-            response_json = json.loads(stdout)
-            print("Parsed JSON:", response_json)
-            return response_json
-        except Exception as e:
-            print(f"An error occurred: {e}")
+        return self._async_client
+
+    async def arun(
+        self, input_value: str, input_dict: dict, flow_id: str = None
+    ) -> dict:
+        data = self.make_data(input_value, input_dict)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.get_async_client().post(
+                    self.make_url(flow_id), json=data
+                )
+            except self.RETRY_ERRORS as e:
+                if not self.should_retry(attempt):
+                    print(f"An error occurred: {e}")
+                    return None
+                print(f"[LangflowService] retry {attempt + 1} after error: {e}")
+                await asyncio.sleep(self.get_backoff(attempt))
+                continue
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
+
+            if self.should_retry(attempt, response):
+                print(
+                    f"[LangflowService] retry {attempt + 1} after status {response.status_code}"
+                )
+                await asyncio.sleep(self.get_backoff(attempt))
+                continue
+
+            print("Status Code:", response.status_code)
+            try:
+                response.raise_for_status()
+                return response.json()
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
+
+    def run(self, input_value: str, input_dict: dict, flow_id: str = None) -> dict:
+        future = asyncio.run_coroutine_threadsafe(
+            self.arun(input_value, input_dict, flow_id), self.get_loop()
+        )
+        return future.result()
+
+    def close(self):
+        super().close()
+        if self._loop is not None:
+            if self._async_client is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self._async_client.aclose(), self._loop
+                ).result()
+                self._async_client = None
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
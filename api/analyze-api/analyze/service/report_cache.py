@@ -0,0 +1,88 @@
+import hashlib
+import json
+import threading
+from typing import List, Optional
+
+from core.model.domain.reports import BatchPromptReport
+from analyze.model.domain.cache import CacheStats
+from analyze.service.cache.base_cache_backend import BaseCacheBackend
+
+
+class ReportCacheService:
+    """
+    관찰척도 분석 결과(BatchPromptReport) cache
+    key는 (merged script, 관찰척도 kor_name, flow_id, prompt_version)의 hash이므로
+    script나 prompt가 바뀌면 자연스럽게 다른 key가 된다.
+    (batch flow의 결과는 batch flow_id로 저장하여 관찰척도 하나씩 분석한 결과와 섞이지 않는다)
+    """
+
+    def __init__(
+        self,
+        cache_backend: BaseCacheBackend,
+        flow_id: str,
+        prompt_version: str = None,
+    ):
+        self.cache_backend = cache_backend
+        self.flow_id = flow_id
+        self.prompt_version = prompt_version or "v1"
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def make_key(self, script: str, observation_name: str, flow_id: str = None) -> str:
+        source = json.dumps(
+            [script, observation_name, flow_id or self.flow_id, self.prompt_version],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def get(
+        self, script: str, observation_name: str, flow_ids: List[str] = None
+    ) -> Optional[BatchPromptReport]:
+        # flow_ids 순서대로 찾아서 먼저 찾은 결과를 돌려준다. (None은 기본 flow_id)
+        value = None
+        try:
+            for flow_id in flow_ids or [None]:
+                value = self.cache_backend.get(
+                    self.make_key(script, observation_name, flow_id)
+                )
+                if value is not None:
+                    break
+        except Exception as e:
+            print(f"[ReportCacheService] get error: {e}")
+
+        with self.lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return BatchPromptReport(**json.loads(value))
+
+    def set(
+        self,
+        script: str,
+        observation_name: str,
+        report: BatchPromptReport,
+        flow_id: str = None,
+    ):
+        # 결과가 제대로 나오지 않은 경우(level -1)는 다음 분석에서 다시 호출하도록 저장하지 않는다.
+        if report.level == -1:
+            return
+        try:
+            self.cache_backend.set(
+                self.make_key(script, observation_name, flow_id),
+                json.dumps(report.model_dump(), ensure_ascii=False),
+            )
+        except Exception as e:
+            print(f"[ReportCacheService] set error: {e}")
+
+    def stats(self) -> CacheStats:
+        with self.lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return CacheStats(
+            hits=hits,
+            misses=misses,
+            hit_rate=hits / total if total else 0.0,
+            size=self.cache_backend.size(),
+        )
@@ -0,0 +1,39 @@
+import json
+from typing import List
+
+from core.model.domain.reports import BatchPromptReport
+
+
+def merge_reports(reports: List[BatchPromptReport], category: str) -> BatchPromptReport:
+    """
+    window 별 BatchPromptReport를 하나로 합친다. (입력 순서가 같으면 결과도 같다)
+    - interactions: window 순서대로 이어 붙이고 overlap으로 중복된 항목은 한 번만 남긴다.
+    - level: 모든 window 중 가장 높은 level
+      (결과가 나오지 않은 window(level -1)가 하나라도 있으면 -1로 두어 재분석 대상이 되도록 한다.)
+    - descriptions: 비어있지 않은 description을 중복 없이 줄바꿈으로 이어 붙인다.
+    """
+    if len(reports) == 1:
+        return reports[0]
+
+    interactions = []
+    seen_interactions = set()
+    for report in reports:
+        for interaction in report.interactions:
+            key = json.dumps(interaction, ensure_ascii=False, sort_keys=True)
+            if key not in seen_interactions:
+                seen_interactions.add(key)
+                interactions.append(interaction)
+
+    levels = [report.level for report in reports]
+
+    descriptions = []
+    for report in reports:
+        if report.descriptions and report.descriptions not in descriptions:
+            descriptions.append(report.descriptions)
+
+    return BatchPromptReport(
+        category=category,
+        descriptions="\n".join(descriptions),
+        interactions=interactions,
+        level=-1 if -1 in levels else max(levels),
+    )
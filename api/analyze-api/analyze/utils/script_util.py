@@ -1,8 +1,81 @@
-from typing import List
+import math
+from typing import Iterable, Iterator, List
 
-from core.model.domain.script import Script
+from core.model.domain.script import Record, Script
+from analyze.exception import ScriptNotSorted
 
 
 def make_merged_script(scripts: Script) -> str:
-    records = scripts.scripts
+    return merge_records(scripts.scripts)
+
+
+def merge_records(records: Iterable[Record]) -> str:
     return "".join(f"{record.speaker}: {record.text}\n" for record in records)
+
+
+def estimate_tokens(text: str) -> int:
+    # tokenizer 없이 대략적인 token 수를 구한다.
+    # 한글은 글자(utf-8 3byte)당 1 token 안팎, 영문은 4글자당 1 token 정도이므로 크게 잡힌다.
+    return math.ceil(len(text.encode("utf-8")) / 3)
+
+
+def check_record_order(records: Iterable[Record]) -> Iterator[Record]:
+    """
+    record를 읽는 대로 넘기면서 start_time 순서인지 확인한다.
+    앞 record보다 start_time이 이른 record가 나오면 ScriptNotSorted를 raise 한다.
+    """
+    previous_start_time = None
+    for record in records:
+        if previous_start_time is not None and record.start_time < previous_start_time:
+            raise ScriptNotSorted(record.start_time)
+        previous_start_time = record.start_time
+        yield record
+
+
+def sort_records(records: Iterable[Record]) -> List[Record]:
+    # start_time이 같은 record는 script에 있던 순서를 유지한다.
+    return sorted(records, key=lambda record: record.start_time)
+
+
+def iter_record_windows(
+    records: Iterable[Record], max_tokens: int, overlap_tokens: int = 0
+) -> Iterator[List[Record]]:
+    """
+    record를 들어온 순서대로 읽으면서 max_tokens 이하의 window로 묶어 반환한다.
+    다음 window는 이전 window의 마지막 record들을 overlap_tokens 만큼 다시 포함한다.
+    record 하나가 max_tokens보다 크면 그 record만으로 window를 만든다.
+    (현재 window의 record만 메모리에 유지하므로 정렬하지 않는다.
+    records는 start_time 순서여야 하며, check_record_order로 확인하거나 sort_records로 정렬해서 넘긴다.)
+    """
+    window: List[Record] = []
+    tokens: List[int] = []
+    window_tokens = 0
+    for record in records:
+        record_tokens = estimate_tokens(merge_records([record]))
+        if window and window_tokens + record_tokens > max_tokens:
+            yield window
+
+            # 다음 window가 반드시 앞으로 나아가도록 마지막 record 하나는 남기지 않는다.
+            keep = 0
+            overlap = 0
+            while (
+                keep < len(window) - 1
+                and overlap + tokens[len(window) - 1 - keep] <= overlap_tokens
+            ):
+                overlap += tokens[len(window) - 1 - keep]
+                keep += 1
+            window = window[len(window) - keep :]
+            tokens = tokens[len(tokens) - keep :]
+            window_tokens = overlap
+
+            # overlap을 넣고도 record가 들어가지 않으면 앞에서부터 뺀다.
+            while window and window_tokens + record_tokens > max_tokens:
+                window.pop(0)
+                window_tokens -= tokens.pop(0)
+
+        window.append(record)
+        tokens.append(record_tokens)
+        window_tokens += record_tokens
+
+    if window:
+        yield window
@@ -0,0 +1,126 @@
+"""
+로컬 stub langflow 서버를 띄워 LangflowService transport 별 호출 당 overhead를 비교한다.
+
+    cd api/analyze-api
+    poetry run python benchmark/langflow_transport.py --calls 200
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from analyze.service.langflow_service import LangflowService, AsyncLangflowService
+
+RESPONSE = json.dumps(
+    {
+        "outputs": [
+            {
+                "outputs": [
+                    {
+                        "messages": [
+                            {"message": '```json{"reports": {"level": 1}}```'}
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+).encode("utf-8")
+
+
+class StubLangflowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # uvicorn 등 실제 서버처럼 TCP_NODELAY를 켜서 Nagle 지연이 측정에 섞이지 않도록 한다.
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_with_curl(host: str, flow_id: str, input_value: str, input_dict: dict):
+    # 기존 LangflowService.run()의 curl subprocess transport
+    data = {
+        "message": input_value,
+        "output_type": "chat",
+        "input_type": "chat",
+        "tweaks": input_dict,
+    }
+    process = subprocess.Popen(
+        [
+            "curl",
+            "-s",
+            "-X",
+            "POST",
+            f"http://{host}/api/v1/run/{flow_id}?stream=false",
+            "-H",
+            "Content-Type: application/json",
+            "-H",
+            "x-api-key: token",
+            "-d",
+            "@-",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+    )
+    stdout, _ = process.communicate(input=json.dumps(data))
+    return json.loads(stdout)
+
+
+def measure(name: str, call, calls: int):
+    call()  # warm up (connection 생성 포함)
+    elapsed = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        elapsed.append((time.perf_counter() - start) * 1000)
+    elapsed.sort()
+    p99 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.99))]
+    print(
+        f"{name:<10} mean {statistics.mean(elapsed):7.3f} ms  "
+        f"p50 {statistics.median(elapsed):7.3f} ms  p99 {p99:7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubLangflowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"127.0.0.1:{server.server_address[1]}"
+    input_dict = {"ChatInput": {"input_value": "T: 안녕\n" * 200}}
+
+    sync_service = LangflowService(host, "token", "flow")
+    async_service = AsyncLangflowService(host, "token", "flow")
+
+    measure(
+        "curl",
+        lambda: run_with_curl(host, "flow", "test", input_dict),
+        args.calls,
+    )
+    measure("sync", lambda: sync_service.run("test", input_dict), args.calls)
+    measure("asyncio", lambda: async_service.run("test", input_dict), args.calls)
+
+    sync_service.close()
+    async_service.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+script 파일을 통째로 읽어 parse 하는 방식과 record 단위로 streaming parse 하는 방식의
+merge 단계까지의 peak memory를 비교한다.
+
+    cd api/analyze-api
+    poetry run python benchmark/script_parse.py --records 50000
+"""
+
+import argparse
+import io
+import json
+import tracemalloc
+from unittest.mock import MagicMock
+
+from core.model.domain.script import Record, Script
+from object.service.script import ScriptService
+from analyze.utils.script_util import make_merged_script, merge_records
+
+
+def make_script_body(records: int) -> bytes:
+    return json.dumps(
+        {
+            "scripts": [
+                Record(
+                    speaker="T" if i % 2 else "C",
+                    text="선생님이랑 같이 블록으로 집을 만들어 볼까?",
+                    start_time="00:00:00.000000",
+                    end_time="00:00:01.000000",
+                ).model_dump()
+                for i in range(records)
+            ]
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def measure(name: str, call):
+    tracemalloc.start()
+    script = call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<10} peak {peak / 1024 / 1024:8.2f} MiB  "
+        f"(merged script {len(script.encode('utf-8')) / 1024 / 1024:.2f} MiB)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=50000)
+    args = parser.parse_args()
+
+    script_body = make_script_body(args.records)
+    script_repository = MagicMock()
+    script_repository.get_json.side_effect = lambda path: io.BytesIO(script_body)
+    script_service = ScriptService(script_repository=script_repository)
+
+    # S3 body 자체(script_body)는 두 방식 모두 측정 전에 만들어 두었으므로 peak에 포함되지 않는다.
+    measure(
+        "read",
+        lambda: make_merged_script(
+            Script(**json.loads(script_service.download_script("script.json")))
+        ),
+    )
+    measure(
+        "stream",
+        lambda: merge_records(script_service.iter_script_records("script.json")),
+    )
+
+
+if __name__ == "__main__":
+    main()
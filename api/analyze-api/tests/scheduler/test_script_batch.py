@@ -0,0 +1,52 @@
+import warnings
+
+warnings.filterwarnings("ignore")
+import unittest
+from unittest.mock import MagicMock
+from analyze.model.domain.queue import QueueStats
+from analyze.scheduler.script_batch import drain_job, sched
+
+
+class TestDrainJob(unittest.TestCase):
+
+    def setUp(self):
+        self.analyze_service = MagicMock()
+        self.analyze_service.queue_stats = QueueStats(mode="drain")
+
+    def tearDown(self):
+        if sched.get_job("analyze") is not None:
+            sched.remove_job("analyze")
+
+    def run_drain_job(self, idle_interval: float = None):
+        drain_job(
+            idle_interval=idle_interval,
+            analyze_service=self.analyze_service,
+            idle_interval_min=5,
+            idle_interval_max=60,
+        )
+        return sched.get_job("analyze")
+
+    def test_drain_job(self):
+        self.analyze_service.drain.return_value = 3
+
+        job = self.run_drain_job(idle_interval=40)
+
+        self.assertIsNotNone(job)
+        self.assertEqual(job.kwargs["idle_interval"], 5)
+
+    def test_drain_job_idle(self):
+        self.analyze_service.drain.return_value = 0
+
+        job = self.run_drain_job(idle_interval=40)
+
+        self.assertEqual(job.kwargs["idle_interval"], 60)
+
+    def test_drain_job_error(self):
+        self.analyze_service.drain.side_effect = ConnectionError()
+
+        job = self.run_drain_job()
+
+        # drain이 실패해도 다음 drain이 늘어난 간격으로 예약된다.
+        self.assertIsNotNone(job)
+        self.assertEqual(job.kwargs["idle_interval"], 10)
+        self.assertEqual(self.analyze_service.queue_stats.idle_interval, 10)
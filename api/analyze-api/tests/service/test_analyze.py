@@ -1,12 +1,25 @@
 import warnings
 
 warnings.filterwarnings("ignore")
+import io
 import json
 import os
+import time
 import unittest
+from unittest.mock import MagicMock
 from analyze.container import Container
+from analyze.model.domain.observation import Observation
+from analyze.service.analyze import AnalyzeService
+from analyze.service.cache.memory_cache_backend import MemoryCacheBackend
+from analyze.service.report_cache import ReportCacheService
+from core.model.domain.reports import AnalyzeReport, BatchPromptReport
+from object.service.script import ScriptService
+from core.model.domain.session import Session
+from core.model.domain.state_type import StateTypeEnum
 from datetime import datetime
 
+LEASE_EXPIRED_AT = datetime(2024, 1, 1, 1, 0)
+
 
 class TestAnalyzeService(unittest.TestCase):
 
@@ -31,3 +44,491 @@ class TestAnalyzeService(unittest.TestCase):
             json.dump(analyze_report_dict, f, ensure_ascii=False, indent=4)
 
         print(f"\n\n>>>>>>>>>>>\n\nFINISH!!!!!!!!!!!!!")
+
+
+def make_langflow_response(report: dict) -> dict:
+    message = "```json" + json.dumps({"reports": report}) + "```"
+    return {"outputs": [{"outputs": [{"messages": [{"message": message}]}]}]}
+
+
+class TestAnalyzeServiceConcurrency(unittest.TestCase):
+
+    def setUp(self):
+        self.script_repository = MagicMock()
+        self.set_script({"scripts": [{"speaker": "T", "text": "안녕"}]})
+        self.script_service = ScriptService(script_repository=self.script_repository)
+        self.observation_service = MagicMock()
+        self.observation_service.list.return_value = [
+            Observation(id=i, kor_name=f"척도{i}", eng_name=f"scale_{i}")
+            for i in range(4)
+        ]
+        self.langflow_service = MagicMock()
+        self.analyze_service = AnalyzeService(
+            connection_manager=MagicMock(),
+            script_service=self.script_service,
+            analyze_report_service=MagicMock(),
+            session_repository=MagicMock(),
+            langflow_service=self.langflow_service,
+            observation_service=self.observation_service,
+            max_workers=4,
+        )
+
+    def set_script(self, script: dict):
+        script_body = json.dumps(script, ensure_ascii=False).encode("utf-8")
+        self.script_repository.get_json.side_effect = lambda path: io.BytesIO(
+            script_body
+        )
+
+    def test_run_parallel(self):
+        def slow_run(input_value, input_dict):
+            time.sleep(0.2)
+            return make_langflow_response(
+                {"descriptions": input_value, "interactions": {}, "level": 2}
+            )
+
+        self.langflow_service.run.side_effect = slow_run
+
+        start = time.monotonic()
+        analyze_report = self.analyze_service.run("test/test.json")
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(
+            list(analyze_report.reports.keys()), [f"scale_{i}" for i in range(4)]
+        )
+        self.assertEqual(analyze_report.reports["scale_3"].descriptions, "척도3")
+        self.assertEqual(analyze_report.reports["scale_3"].interactions, [{}])
+
+    def test_run_result_error(self):
+        self.langflow_service.run.return_value = None
+
+        analyze_report = self.analyze_service.run("test/test.json")
+
+        for report in analyze_report.reports.values():
+            self.assertEqual(report.level, -1)
+
+    def test_run_exception(self):
+        def failing_run(input_value, input_dict):
+            if input_value == "척도1":
+                raise ValueError(input_value)
+            return make_langflow_response(
+                {"descriptions": "", "interactions": [], "level": 1}
+            )
+
+        self.langflow_service.run.side_effect = failing_run
+
+        with self.assertRaises(ValueError):
+            self.analyze_service.run("test/test.json")
+        self.assertEqual(self.langflow_service.run.call_count, 4)
+
+    def test_run_cached(self):
+        self.analyze_service.report_cache_service = ReportCacheService(
+            cache_backend=MemoryCacheBackend(), flow_id="flow"
+        )
+
+        def level_run(input_value, input_dict):
+            # 척도0만 결과가 나오지 않는다.
+            return make_langflow_response(
+                {
+                    "descriptions": input_value,
+                    "interactions": [],
+                    "level": None if input_value == "척도0" else 2,
+                }
+            )
+
+        self.langflow_service.run.side_effect = level_run
+        self.analyze_service.run("test/test.json")
+        self.assertEqual(self.langflow_service.run.call_count, 4)
+
+        # 실패한 척도0만 다시 호출한다.
+        analyze_report = self.analyze_service.run("test/test.json")
+        self.assertEqual(self.langflow_service.run.call_count, 5)
+        self.assertEqual(analyze_report.reports["scale_1"].category, "scale_1")
+        self.assertEqual(analyze_report.reports["scale_1"].level, 2)
+        self.assertEqual(self.analyze_service.report_cache_service.hits, 3)
+
+    def test_run_checkpoint(self):
+        analyze_report_service = self.analyze_service.analyze_report_service
+        analyze_report_service.download_checkpoints.return_value = {}
+
+        def failing_run(input_value, input_dict):
+            if input_value == "척도1":
+                raise ValueError(input_value)
+            return make_langflow_response(
+                {"descriptions": "", "interactions": [], "level": 1}
+            )
+
+        self.langflow_service.run.side_effect = failing_run
+
+        with self.assertRaises(ValueError):
+            self.analyze_service.run("test/test.json", checkpoint_path="LOCAL/1")
+        saved = [
+            call.args[2]
+            for call in analyze_report_service.upload_checkpoint.call_args_list
+        ]
+        self.assertEqual(sorted(saved), ["scale_0", "scale_2", "scale_3"])
+
+    def test_run_resume(self):
+        self.analyze_service.analyze_report_service.download_checkpoints.return_value = {
+            "scale_0": BatchPromptReport(category="scale_0", level=3),
+            "scale_1": BatchPromptReport(category="scale_1", level=-1),
+        }
+        self.langflow_service.run.return_value = make_langflow_response(
+            {"descriptions": "", "interactions": [], "level": 1}
+        )
+
+        analyze_report = self.analyze_service.run(
+            "test/test.json", checkpoint_path="LOCAL/1"
+        )
+
+        # 정상 결과가 있는 척도0만 다시 호출하지 않는다.
+        self.assertEqual(self.langflow_service.run.call_count, 3)
+        self.assertEqual(
+            list(analyze_report.reports.keys()), [f"scale_{i}" for i in range(4)]
+        )
+        self.assertEqual(analyze_report.reports["scale_0"].level, 3)
+        self.assertEqual(analyze_report.reports["scale_1"].level, 1)
+
+    def test_run_windows(self):
+        self.set_script(
+            {
+                "scripts": [
+                    {"speaker": "T", "text": "가나다", "start_time": f"00:00:{i:02d}"}
+                    for i in range(10)
+                ]
+            }
+        )
+        self.analyze_service.window_max_tokens = 20
+        self.analyze_service.window_overlap_tokens = 5
+
+        def window_run(input_value, input_dict):
+            script = input_dict[AnalyzeService.CHAT_INPUT_KEY]["input_value"]
+            return make_langflow_response(
+                {
+                    "descriptions": "",
+                    "interactions": [{"lines": script.count("\n")}],
+                    "level": script.count("\n"),
+                }
+            )
+
+        self.langflow_service.run.side_effect = window_run
+
+        analyze_report = self.analyze_service.run("test/test.json")
+
+        # 관찰척도 4개 x window 3개
+        self.assertEqual(self.langflow_service.run.call_count, 12)
+        report = analyze_report.reports["scale_0"]
+        self.assertEqual(report.category, "scale_0")
+        self.assertEqual(report.level, 4)
+        self.assertEqual(report.interactions, [{"lines": 4}])
+
+    def test_run_unsorted(self):
+        # start_time 순서가 아닌 script는 정렬한 뒤 분석한다.
+        self.set_script(
+            {
+                "scripts": [
+                    {"speaker": "T", "text": text, "start_time": start_time}
+                    for text, start_time in [
+                        ("둘", "00:00:02"),
+                        ("하나", "00:00:01"),
+                        ("셋", "00:00:03"),
+                    ]
+                ]
+            }
+        )
+        self.langflow_service.run.return_value = make_langflow_response(
+            {"descriptions": "", "interactions": [], "level": 1}
+        )
+
+        self.analyze_service.run("test/test.json")
+
+        script = self.langflow_service.run.call_args.args[1][
+            AnalyzeService.CHAT_INPUT_KEY
+        ]["input_value"]
+        self.assertEqual(script, "T: 하나\nT: 둘\nT: 셋\n")
+        self.assertEqual(self.script_repository.get_json.call_count, 2)
+
+    def test_run_batch(self):
+        self.analyze_service.batch_size = 3
+        self.analyze_service.batch_flow_id = "batch_flow"
+
+        def batch_run(input_value, input_dict, flow_id=None):
+            if flow_id is None:
+                return make_langflow_response(
+                    {"descriptions": input_value, "interactions": [], "level": 1}
+                )
+            kor_names = json.loads(
+                input_dict[AnalyzeService.TEXT_INPUT_KEY]["input_value"]
+            )
+            return make_langflow_response(
+                {
+                    kor_name: {
+                        "descriptions": kor_name,
+                        "interactions": {"T1": kor_name},
+                        "level": 2,
+                    }
+                    for kor_name in kor_names
+                }
+            )
+
+        self.langflow_service.run.side_effect = batch_run
+
+        analyze_report = self.analyze_service.run("test/test.json")
+
+        # 척도0~2는 batch 한 번, 척도3은 단독으로 분석한다.
+        self.assertEqual(self.langflow_service.run.call_count, 2)
+        self.assertEqual(
+            self.langflow_service.run.call_args_list[0].kwargs["flow_id"], "batch_flow"
+        )
+        report = analyze_report.reports["scale_1"]
+        self.assertEqual(report.category, "scale_1")
+        self.assertEqual(report.level, 2)
+        self.assertEqual(report.interactions, [{"T1": "척도1"}])
+        self.assertEqual(analyze_report.reports["scale_3"].level, 1)
+
+    def test_run_batch_cached(self):
+        self.analyze_service.batch_size = 4
+        self.analyze_service.batch_flow_id = "batch_flow"
+        self.analyze_service.report_cache_service = ReportCacheService(
+            cache_backend=MemoryCacheBackend(), flow_id="flow"
+        )
+        self.langflow_service.run.side_effect = (
+            lambda input_value, input_dict, flow_id: make_langflow_response(
+                {
+                    kor_name: {"descriptions": "batch", "interactions": [], "level": 2}
+                    for kor_name in json.loads(
+                        input_dict[AnalyzeService.TEXT_INPUT_KEY]["input_value"]
+                    )
+                }
+            )
+        )
+
+        self.analyze_service.run("test/test.json")
+        analyze_report = self.analyze_service.run("test/test.json")
+
+        # 두 번째 분석은 batch flow의 cache를 사용한다.
+        self.assertEqual(self.langflow_service.run.call_count, 1)
+        self.assertEqual(analyze_report.reports["scale_2"].descriptions, "batch")
+        # 관찰척도 하나씩 분석할 때는 batch flow의 결과를 사용하지 않는다.
+        self.analyze_service.batch_size = 1
+        self.langflow_service.run.side_effect = (
+            lambda input_value, input_dict: make_langflow_response(
+                {"descriptions": "single", "interactions": [], "level": 1}
+            )
+        )
+        analyze_report = self.analyze_service.run("test/test.json")
+        self.assertEqual(self.langflow_service.run.call_count, 5)
+        self.assertEqual(analyze_report.reports["scale_2"].descriptions, "single")
+
+    def test_run_batch_fallback(self):
+        self.analyze_service.batch_size = 4
+        self.analyze_service.batch_flow_id = "batch_flow"
+
+        def batch_run(input_value, input_dict, flow_id=None):
+            if flow_id is None:
+                return make_langflow_response(
+                    {"descriptions": "single", "interactions": [], "level": 1}
+                )
+            # 척도2는 빠지고 척도3은 level 형식이 맞지 않는다.
+            return make_langflow_response(
+                {
+                    "척도0": {"descriptions": "", "interactions": [], "level": 2},
+                    "척도1": {"descriptions": "", "interactions": [], "level": 2},
+                    "척도3": {"descriptions": "", "interactions": [], "level": "2"},
+                }
+            )
+
+        self.langflow_service.run.side_effect = batch_run
+
+        analyze_report = self.analyze_service.run("test/test.json")
+
+        self.assertEqual(self.langflow_service.run.call_count, 3)
+        self.assertEqual(analyze_report.reports["scale_0"].level, 2)
+        self.assertEqual(analyze_report.reports["scale_2"].descriptions, "single")
+        self.assertEqual(analyze_report.reports["scale_3"].descriptions, "single")
+
+    def test_run_batch_parse_error(self):
+        self.analyze_service.batch_size = 4
+        self.analyze_service.batch_flow_id = "batch_flow"
+
+        def batch_run(input_value, input_dict, flow_id=None):
+            if flow_id is None:
+                return make_langflow_response(
+                    {"descriptions": "", "interactions": [], "level": 1}
+                )
+            return {"outputs": [{"outputs": [{"messages": [{"message": "{"}]}]}]}
+
+        self.langflow_service.run.side_effect = batch_run
+
+        analyze_report = self.analyze_service.run("test/test.json")
+
+        self.assertEqual(self.langflow_service.run.call_count, 5)
+        for report in analyze_report.reports.values():
+            self.assertEqual(report.level, 1)
+
+
+class TestAnalyzeServiceWorkers(unittest.TestCase):
+
+    def setUp(self):
+        self.session_repository = MagicMock()
+        self.analyze_report_service = MagicMock()
+        self.analyze_report_service.upload.return_value = "LOCAL/1/report.json"
+        self.analyze_service = AnalyzeService(
+            connection_manager=MagicMock(),
+            script_service=MagicMock(),
+            analyze_report_service=self.analyze_report_service,
+            session_repository=self.session_repository,
+            langflow_service=MagicMock(),
+            observation_service=MagicMock(),
+            worker_count=3,
+            lease_seconds=60,
+        )
+        self.analyze_service.run = MagicMock(return_value=AnalyzeReport(reports={}))
+
+    def make_session(self, session_id: int) -> Session:
+        return Session(
+            id=session_id,
+            name="test",
+            session_state_id=1,
+            case_id=1,
+            source_script_url=f"LOCAL/1/{session_id}/script_v1.json",
+            script_state_id=3,
+            analyze_state_id=2,
+            created_date="2024-01-01",
+            analyze_lease_expired_at=LEASE_EXPIRED_AT,
+        )
+
+    def test_run_workers(self):
+        sessions = [self.make_session(1), self.make_session(2), None]
+        self.session_repository.claim_by_analyze_state_id.side_effect = sessions
+        self.session_repository.count_by_analyze_state_id.return_value = 2
+
+        processed = self.analyze_service.run_workers()
+
+        self.assertEqual(processed, 2)
+        self.session_repository.claim_by_analyze_state_id.assert_called_with(
+            lease_seconds=60
+        )
+        update = self.session_repository.update_analyze_state_by_session_id
+        self.assertEqual(update.call_count, 2)
+        self.assertEqual(update.call_args.kwargs["new_state_id"], StateTypeEnum.DONE)
+        self.assertEqual(update.call_args.kwargs["analyze_url"], "LOCAL/1/report.json")
+        self.assertEqual(update.call_args.kwargs["lease_expired_at"], LEASE_EXPIRED_AT)
+        # 시작할 때 다른 script의 checkpoint를, 끝나면 session의 checkpoint를 모두 지운다.
+        self.assertEqual(self.analyze_report_service.delete_checkpoints.call_count, 4)
+        self.analyze_report_service.delete_checkpoints.assert_any_call(
+            "LOCAL/1", exclude=None
+        )
+        self.analyze_report_service.delete_checkpoints.assert_any_call(
+            "LOCAL/2", exclude=None
+        )
+
+    def test_run_from_db_claim_error(self):
+        self.session_repository.claim_by_analyze_state_id.side_effect = ValueError()
+
+        self.assertFalse(self.analyze_service.run_from_db())
+        self.session_repository.update_analyze_state_by_session_id.assert_not_called()
+
+    def test_run_from_db_error(self):
+        self.session_repository.claim_by_analyze_state_id.return_value = (
+            self.make_session(1)
+        )
+        self.analyze_service.run.side_effect = ValueError()
+
+        self.assertTrue(self.analyze_service.run_from_db())
+        self.session_repository.update_analyze_state_by_session_id.assert_called_once()
+        self.assertEqual(
+            self.session_repository.update_analyze_state_by_session_id.call_args.kwargs[
+                "new_state_id"
+            ],
+            int(StateTypeEnum.ERROR),
+        )
+        self.assertEqual(
+            self.session_repository.update_analyze_state_by_session_id.call_args.kwargs[
+                "lease_expired_at"
+            ],
+            LEASE_EXPIRED_AT,
+        )
+        # 실패하면 같은 script의 checkpoint는 남긴다.
+        self.analyze_report_service.delete_checkpoints.assert_called_once_with(
+            "LOCAL/1",
+            exclude=self.analyze_service.make_checkpoint_path(self.make_session(1)),
+        )
+
+    def test_drain(self):
+        sessions = [self.make_session(i) for i in range(5)] + [None] * 3
+        self.session_repository.claim_by_analyze_state_id.side_effect = sessions
+        self.session_repository.count_by_analyze_state_id.return_value = 5
+
+        processed = self.analyze_service.drain()
+
+        self.assertEqual(processed, 5)
+        self.assertEqual(
+            self.session_repository.update_analyze_state_by_session_id.call_count, 5
+        )
+        self.assertEqual(self.analyze_service.queue_stats.mode, "drain")
+        self.assertEqual(self.analyze_service.queue_stats.queue_depth, 5)
+        self.assertEqual(self.analyze_service.queue_stats.processed, 5)
+
+    def test_make_checkpoint_path(self):
+        session = self.make_session(1)
+        checkpoint_path = self.analyze_service.make_checkpoint_path(session)
+
+        self.assertTrue(checkpoint_path.startswith("LOCAL/1/"))
+        self.assertEqual(
+            self.analyze_service.make_checkpoint_path(self.make_session(1)),
+            checkpoint_path,
+        )
+        # script가 다시 upload 되면 다른 checkpoint를 사용한다.
+        session.source_script_url = "LOCAL/1/1/script_v2.json"
+        self.assertNotEqual(
+            self.analyze_service.make_checkpoint_path(session), checkpoint_path
+        )
+
+    def test_run_from_db_checkpoint(self):
+        session = self.make_session(1)
+        self.session_repository.claim_by_analyze_state_id.return_value = session
+
+        self.assertTrue(self.analyze_service.run_from_db())
+
+        checkpoint_path = self.analyze_service.make_checkpoint_path(session)
+        self.analyze_service.run.assert_called_once_with(
+            session.source_script_url, checkpoint_path=checkpoint_path
+        )
+
+    def test_run_from_db_lease_expired(self):
+        self.session_repository.claim_by_analyze_state_id.return_value = (
+            self.make_session(1)
+        )
+        # lease가 만료되어 다른 worker가 다시 claim 했다면 update 되는 row가 없다.
+        self.session_repository.update_analyze_state_by_session_id.return_value = False
+
+        self.assertTrue(self.analyze_service.run_from_db())
+        # 다시 claim 한 worker가 이어서 분석하도록 checkpoint는 남긴다.
+        self.analyze_report_service.delete_checkpoints.assert_called_once()
+        self.assertIsNotNone(
+            self.analyze_report_service.delete_checkpoints.call_args.kwargs["exclude"]
+        )
+
+    def test_run_from_db_error_update_error(self):
+        self.session_repository.claim_by_analyze_state_id.return_value = (
+            self.make_session(1)
+        )
+        self.analyze_service.run.side_effect = ValueError()
+        self.session_repository.update_analyze_state_by_session_id.side_effect = (
+            ConnectionError()
+        )
+
+        self.assertTrue(self.analyze_service.run_from_db())
+
+    def test_drain_count_error(self):
+        sessions = [self.make_session(1), None, None]
+        self.session_repository.claim_by_analyze_state_id.side_effect = sessions
+        self.session_repository.count_by_analyze_state_id.side_effect = (
+            ConnectionError()
+        )
+
+        processed = self.analyze_service.drain()
+
+        self.assertEqual(processed, 1)
+        self.assertIsNone(self.analyze_service.queue_stats.queue_depth)
@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import MagicMock
+
+from analyze.service.case_reconcile import CaseReconcileService
+from core.repository.case import CaseRepository
+
+
+class TestCaseReconcileService(unittest.TestCase):
+    def setUp(self):
+        self.case_repository = MagicMock(spec=CaseRepository)
+        self.case_reconcile_service = CaseReconcileService(
+            case_repository=self.case_repository, batch_size=2
+        )
+
+    def test_reconcile_session_count(self):
+        self.case_repository.reconcile_session_count.side_effect = [
+            (2, 1),
+            (5, 0),
+            (6, 1),
+            None,
+        ]
+
+        updated = self.case_reconcile_service.reconcile_session_count()
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(
+            [
+                c.kwargs["after_id"]
+                for c in self.case_repository.reconcile_session_count.call_args_list
+            ],
+            [0, 2, 5, 6],
+        )
+        self.case_repository.reconcile_session_count.assert_called_with(
+            after_id=6, limit=2
+        )
+
+    def test_reconcile_session_count_no_case(self):
+        self.case_repository.reconcile_session_count.return_value = None
+        self.assertEqual(self.case_reconcile_service.reconcile_session_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,8 @@ warnings.filterwarnings("ignore")
 
 import unittest
 from analyze.container import Container
+from analyze.service.langflow_service import LangflowService, AsyncLangflowService
+import httpx
 import json
 
 
@@ -29,3 +31,120 @@ class TestLangflowService(unittest.TestCase):
         # JSON 파싱
         parsed_data = json.loads(clean_message)
         print("\n\n>>>>>>>>>>>\n\n", parsed_data)
+
+
+class TestLangflowServiceTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.status_codes = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        status_code = self.status_codes.pop(0) if self.status_codes else 200
+        if isinstance(status_code, Exception):
+            raise status_code
+        return httpx.Response(status_code, json={"outputs": []})
+
+    def make_service(self, service_class=LangflowService):
+        return service_class(
+            langflow_host="langflow.test",
+            langflow_token="token",
+            flow_id="flow",
+            max_retries=2,
+            backoff_factor=0,
+        )
+
+    def test_run(self):
+        service = self.make_service()
+        service._client = httpx.Client(
+            base_url="http://langflow.test",
+            headers=service.make_headers(),
+            transport=httpx.MockTransport(self.handler),
+        )
+
+        res = service.run(input_value="test", input_dict={"input": "dict"})
+
+        self.assertEqual(res, {"outputs": []})
+        request = self.requests[0]
+        self.assertEqual(request.url.path, "/api/v1/run/flow")
+        self.assertEqual(request.headers["x-api-key"], "token")
+        self.assertEqual(
+            json.loads(request.content),
+            {
+                "message": "test",
+                "output_type": "chat",
+                "input_type": "chat",
+                "tweaks": {"input": "dict"},
+            },
+        )
+
+    def test_run_flow_id(self):
+        service = self.make_service()
+        service._client = httpx.Client(
+            base_url="http://langflow.test",
+            transport=httpx.MockTransport(self.handler),
+        )
+
+        service.run("test", {}, flow_id="batch_flow")
+
+        self.assertEqual(self.requests[0].url.path, "/api/v1/run/batch_flow")
+
+    def test_run_retry(self):
+        self.status_codes = [503, 429]
+        service = self.make_service()
+        service._client = httpx.Client(
+            base_url="http://langflow.test",
+            transport=httpx.MockTransport(self.handler),
+        )
+
+        self.assertEqual(service.run("test", {}), {"outputs": []})
+        self.assertEqual(len(self.requests), 3)
+
+    def test_run_retry_exhausted(self):
+        self.status_codes = [503, 503, 503]
+        service = self.make_service()
+        service._client = httpx.Client(
+            base_url="http://langflow.test",
+            transport=httpx.MockTransport(self.handler),
+        )
+
+        self.assertIsNone(service.run("test", {}))
+        self.assertEqual(len(self.requests), 3)
+
+    def test_run_retry_connect_error(self):
+        self.status_codes = [httpx.ConnectError("refused"), 503]
+        service = self.make_service()
+        service._client = httpx.Client(
+            base_url="http://langflow.test",
+            transport=httpx.MockTransport(self.handler),
+        )
+
+        self.assertEqual(service.run("test", {}), {"outputs": []})
+        self.assertEqual(len(self.requests), 3)
+
+    def test_run_no_retry(self):
+        # flow가 이미 실행되었을 수 있는 응답/오류는 다시 보내지 않는다.
+        for error in [500, 502, 504, httpx.ReadTimeout("timeout")]:
+            self.requests = []
+            self.status_codes = [error]
+            service = self.make_service()
+            service._client = httpx.Client(
+                base_url="http://langflow.test",
+                transport=httpx.MockTransport(self.handler),
+            )
+
+            self.assertIsNone(service.run("test", {}))
+            self.assertEqual(len(self.requests), 1)
+
+    def test_async_run(self):
+        self.status_codes = [503]
+        service = self.make_service(AsyncLangflowService)
+        service._async_client = httpx.AsyncClient(
+            base_url="http://langflow.test",
+            transport=httpx.MockTransport(self.handler),
+        )
+
+        self.assertEqual(service.run("test", {}), {"outputs": []})
+        self.assertEqual(len(self.requests), 2)
+        service.close()
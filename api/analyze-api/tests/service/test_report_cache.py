@@ -0,0 +1,131 @@
+import os
+import tempfile
+import time
+import unittest
+from core.model.domain.reports import BatchPromptReport
+from analyze.service.cache.memory_cache_backend import MemoryCacheBackend
+from analyze.service.cache.sqlite_cache_backend import SQLiteCacheBackend
+from analyze.service.report_cache import ReportCacheService
+
+
+class TestMemoryCacheBackend(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        backend = MemoryCacheBackend(max_size=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.get("a")
+        backend.set("c", "3")
+
+        self.assertEqual(backend.get("a"), "1")
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("c"), "3")
+        self.assertEqual(backend.size(), 2)
+
+    def test_ttl(self):
+        backend = MemoryCacheBackend(ttl_seconds=0.05)
+        backend.set("a", "1")
+        self.assertEqual(backend.get("a"), "1")
+
+        time.sleep(0.1)
+        self.assertIsNone(backend.get("a"))
+
+
+class TestSQLiteCacheBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "cache", "report.sqlite3")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_persist(self):
+        backend = SQLiteCacheBackend(self.path)
+        backend.set("a", "1")
+        backend.connection.close()
+
+        backend = SQLiteCacheBackend(self.path)
+        self.assertEqual(backend.get("a"), "1")
+        backend.connection.close()
+
+    def test_lru_eviction(self):
+        backend = SQLiteCacheBackend(self.path, max_size=2)
+        backend.set("a", "1")
+        time.sleep(0.01)
+        backend.set("b", "2")
+        time.sleep(0.01)
+        backend.get("a")
+        time.sleep(0.01)
+        backend.set("c", "3")
+
+        self.assertEqual(backend.get("a"), "1")
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.size(), 2)
+        backend.connection.close()
+
+    def test_ttl(self):
+        backend = SQLiteCacheBackend(self.path, ttl_seconds=0.05)
+        backend.set("a", "1")
+        time.sleep(0.1)
+        self.assertIsNone(backend.get("a"))
+        backend.connection.close()
+
+
+class TestReportCacheService(unittest.TestCase):
+
+    def setUp(self):
+        self.report_cache_service = ReportCacheService(
+            cache_backend=MemoryCacheBackend(), flow_id="flow", prompt_version="v1"
+        )
+
+    def test_get_set(self):
+        report = BatchPromptReport(
+            category="scale", descriptions="설명", interactions=[{"a": 1}], level=2
+        )
+        self.assertIsNone(self.report_cache_service.get("T: 안녕", "척도"))
+
+        self.report_cache_service.set("T: 안녕", "척도", report)
+
+        self.assertEqual(self.report_cache_service.get("T: 안녕", "척도"), report)
+        self.assertIsNone(self.report_cache_service.get("T: 안녕!", "척도"))
+        stats = self.report_cache_service.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 2, 1))
+
+    def test_skip_error_report(self):
+        self.report_cache_service.set("T: 안녕", "척도", BatchPromptReport(level=-1))
+
+        self.assertIsNone(self.report_cache_service.get("T: 안녕", "척도"))
+
+    def test_make_key(self):
+        other_version = ReportCacheService(
+            cache_backend=MemoryCacheBackend(), flow_id="flow", prompt_version="v2"
+        )
+
+        self.assertEqual(
+            self.report_cache_service.make_key("T: 안녕", "척도"),
+            self.report_cache_service.make_key("T: 안녕", "척도"),
+        )
+        self.assertNotEqual(
+            self.report_cache_service.make_key("T: 안녕", "척도"),
+            other_version.make_key("T: 안녕", "척도"),
+        )
+        # batch flow의 결과는 다른 key에 저장한다.
+        self.assertNotEqual(
+            self.report_cache_service.make_key("T: 안녕", "척도"),
+            self.report_cache_service.make_key("T: 안녕", "척도", "batch_flow"),
+        )
+
+    def test_get_flow_ids(self):
+        report = BatchPromptReport(category="scale", level=2)
+        self.report_cache_service.set("T: 안녕", "척도", report, flow_id="batch_flow")
+
+        self.assertIsNone(self.report_cache_service.get("T: 안녕", "척도"))
+        self.assertEqual(
+            self.report_cache_service.get(
+                "T: 안녕", "척도", flow_ids=[None, "batch_flow"]
+            ),
+            report,
+        )
+        stats = self.report_cache_service.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
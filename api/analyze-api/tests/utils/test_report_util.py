@@ -0,0 +1,42 @@
+import unittest
+from core.model.domain.reports import BatchPromptReport
+from analyze.utils.report_util import merge_reports
+
+
+class TestReportUtil(unittest.TestCase):
+
+    def test_merge_reports(self):
+        reports = [
+            BatchPromptReport(
+                category="scale",
+                descriptions="앞",
+                interactions=[{"T1": "a"}, {"T2": "b"}],
+                level=1,
+            ),
+            BatchPromptReport(
+                category="scale",
+                descriptions="뒤",
+                interactions=[{"T2": "b"}, {"T3": "c"}],
+                level=3,
+            ),
+        ]
+
+        report = merge_reports(reports, "scale")
+
+        self.assertEqual(report.category, "scale")
+        self.assertEqual(report.descriptions, "앞\n뒤")
+        self.assertEqual(report.interactions, [{"T1": "a"}, {"T2": "b"}, {"T3": "c"}])
+        self.assertEqual(report.level, 3)
+
+    def test_merge_reports_error(self):
+        reports = [
+            BatchPromptReport(category="scale", level=2),
+            BatchPromptReport(category="scale", level=-1),
+        ]
+
+        self.assertEqual(merge_reports(reports, "scale").level, -1)
+
+    def test_merge_single_report(self):
+        report = BatchPromptReport(category="scale", level=2)
+
+        self.assertIs(merge_reports([report], "scale"), report)
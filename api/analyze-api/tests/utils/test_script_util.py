@@ -0,0 +1,96 @@
+import unittest
+from core.model.domain.script import Record, Script
+from analyze.exception import ScriptNotSorted
+from analyze.utils.script_util import (
+    check_record_order,
+    estimate_tokens,
+    iter_record_windows,
+    make_merged_script,
+    merge_records,
+    sort_records,
+)
+
+
+class TestScriptUtil(unittest.TestCase):
+
+    def make_records(self, count: int):
+        # record 하나는 "T: 가나다\n" (13byte -> 5 token)
+        for i in range(count):
+            yield Record(
+                speaker="T",
+                text="가나다",
+                start_time=f"00:00:{i:02d}.000000",
+                end_time=f"00:00:{i:02d}.500000",
+            )
+
+    def test_estimate_tokens(self):
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertEqual(estimate_tokens("가나다"), 3)
+        self.assertEqual(estimate_tokens("abcd"), 2)
+
+    def test_merge_records(self):
+        records = list(self.make_records(2))
+
+        self.assertEqual(merge_records(records), "T: 가나다\nT: 가나다\n")
+        self.assertEqual(
+            make_merged_script(Script(scripts=records)), merge_records(records)
+        )
+
+    def test_iter_record_windows(self):
+        windows = iter_record_windows(
+            self.make_records(10), max_tokens=20, overlap_tokens=5
+        )
+
+        self.assertEqual(
+            [[r.start_time[6:8] for r in w] for w in windows],
+            [
+                ["00", "01", "02", "03"],
+                ["03", "04", "05", "06"],
+                ["06", "07", "08", "09"],
+            ],
+        )
+
+    def test_iter_record_windows_overlap_overflow(self):
+        # overlap을 넣으면 다음 record가 들어가지 않는 경우 overlap을 줄인다.
+        records = list(self.make_records(3))
+        records[2].text = "가나다라마"
+
+        windows = iter_record_windows(records, max_tokens=10, overlap_tokens=5)
+
+        self.assertEqual([len(w) for w in windows], [2, 1])
+
+    def test_iter_record_windows_large_record(self):
+        # max_tokens보다 큰 record도 빠지지 않고 window 하나가 된다.
+        windows = iter_record_windows(
+            self.make_records(3), max_tokens=1, overlap_tokens=4
+        )
+
+        self.assertEqual([len(w) for w in windows], [1, 1, 1])
+
+    def test_check_record_order(self):
+        records = list(self.make_records(3))
+        self.assertEqual(list(check_record_order(records)), records)
+
+        records[1], records[2] = records[2], records[1]
+        with self.assertRaises(ScriptNotSorted):
+            list(check_record_order(records))
+
+    def test_sort_records(self):
+        records = list(self.make_records(3))
+        records[1].text = "다른 record"
+        same_start_time = records[1].model_copy(update={"text": "같은 시각"})
+
+        result = sort_records([records[2], records[1], same_start_time, records[0]])
+
+        self.assertEqual(
+            [r.text for r in result], ["가나다", "다른 record", "같은 시각", "가나다"]
+        )
+        self.assertEqual(
+            [r.start_time for r in result],
+            [records[0].start_time]
+            + [records[1].start_time] * 2
+            + [records[2].start_time],
+        )
+
+    def test_iter_record_windows_empty(self):
+        self.assertEqual(list(iter_record_windows([], max_tokens=10)), [])
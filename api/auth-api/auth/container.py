@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from configparser import ConfigParser
 
@@ -24,6 +25,19 @@ class Container(containers.DeclarativeContainer):
         ConnectionManager,
         db_url=config.mysql.db_url,
         pool_recycle=config.mysql.pool_recycle,
+        pool_size=config.mysql.pool_size,
+        max_overflow=config.mysql.max_overflow,
+        pool_timeout=config.mysql.pool_timeout,
+        pool_pre_ping=config.mysql.pool_pre_ping,
+        pool_use_lifo=config.mysql.pool_use_lifo,
+    )
+
+    # bcrypt hash/verify는 event loop를 막지 않도록 전용 thread pool에서 실행한다.
+    # (worker 수 = pod 당 동시에 hash 하는 로그인 수, CPU core 수 이하로 둔다)
+    password_executor = providers.Singleton(
+        ThreadPoolExecutor,
+        max_workers=config.security.hash_workers,
+        thread_name_prefix="password",
     )
 
     security_service = providers.Singleton(
@@ -31,6 +45,8 @@ class Container(containers.DeclarativeContainer):
         secret_key=config.security.secret_key,
         algorithm=config.security.algorithm,
         expires_delta=config.security.expires_delta,
+        bcrypt_rounds=config.security.bcrypt_rounds,
+        password_executor=password_executor,
     )
 
     # repositories
@@ -16,6 +16,7 @@ from auth.setting.config import settings
 from auth.route.auth import router as auth_router
 from auth.route.config import router as config_router
 from auth.route.user import router as user_router
+from auth.route.monitor import router as monitor_router
 from core.exception import InvalidToken
 
 config = providers.Configuration()
@@ -86,6 +87,11 @@ async def invalid_token_handler(request: Request, exc: InvalidToken):
     )
 
 
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    await container.connection_manager().dispose_async_engine()
+
+
 def register_routers(app: FastAPI):
     app.include_router(auth_router, prefix="/auth/api")
     app.include_router(user_router, prefix="/auth/api")
@@ -93,6 +99,7 @@ def register_routers(app: FastAPI):
         config_router,
         prefix="/auth/api",
     )
+    app.include_router(monitor_router, prefix="/auth/api/monitor")
 
 
 register_routers(app)
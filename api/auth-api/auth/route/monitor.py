@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends
+from fastapi.security import OAuth2PasswordBearer
+from dependency_injector.wiring import inject, Provide
+
+from core.db.connection import ConnectionManager
+from core.model.domain.pool import PoolStats
+from core.service.security import SecurityService
+from auth.container import Container
+
+router = APIRouter()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/api/signin")
+
+
+# MySQL connection pool 사용량과 checkout 대기 시간
+@router.get("/pool", tags=["monitor"])
+@inject
+async def get_pool_stats(
+    token: str = Depends(oauth2_scheme),
+    connection_manager: ConnectionManager = Depends(
+        Provide[Container.connection_manager]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> PoolStats:
+    security_service.verify_token(token)
+    return connection_manager.get_pool_stats()
+
+
+# API 요청이 사용하는 async engine(aiomysql)의 connection pool
+@router.get("/pool/async", tags=["monitor"])
+@inject
+async def get_async_pool_stats(
+    token: str = Depends(oauth2_scheme),
+    connection_manager: ConnectionManager = Depends(
+        Provide[Container.connection_manager]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> PoolStats:
+    security_service.verify_token(token)
+    return connection_manager.get_async_pool_stats()
@@ -19,6 +19,6 @@ async def get_user(
     user_service: UserService = Depends(Provide[Container.user_service]),
 ):
     payload = await auth_service.verify(token)
-    user = user_service.get_by_email(email=payload["user_email"])
+    user = await user_service.get_by_email(email=payload["user_email"])
     user.hashed_password = ""
     return user
@@ -17,12 +17,12 @@ class AuthService:
 
     async def signup(self, signup_request: SignupRequest) -> User:
         user = User(id=None, created_time=datetime.now(), **signup_request.model_dump())
-        result = self.user_service.add(user=user)
+        result = await self.user_service.add(user=user)
 
         return result
 
     async def signin(self, signin_request: SigninRequest) -> AccessTokenResponse:
-        user = self.user_service.get_by_email_and_password(
+        user = await self.user_service.get_by_email_and_password(
             email=signin_request.email, password=signin_request.password
         )
 
@@ -11,7 +11,7 @@ class ConfigService:
         self.org_repository = org_repository
 
     async def get(self) -> ConfigResponse:
-        user_types = self.user_type_repository.list()
-        orgs = self.org_repository.list()
+        user_types = await self.user_type_repository.async_list()
+        orgs = await self.org_repository.async_list()
 
         return ConfigResponse(user_types=user_types, orgs=orgs)
@@ -7,7 +7,7 @@ from core.repository.user import UserRepository
 from core.repository.whitelist import WhitelistRepository
 from core.service.security import SecurityService
 from core.db.connection import ConnectionManager
-from core.db.transaction import transaction_scope
+from core.db.transaction import async_transaction_scope
 
 
 class UserService:
@@ -25,37 +25,57 @@ class UserService:
         self.security_service = security_service
         self.connection_manager = connection_manager
 
-    def add(self, user: User) -> User:
-        session = self.connection_manager.make_session()
-        with transaction_scope(session) as tx_session:
-            whitelist = self.whitelist_repository.get(
+    async def add(self, user: User) -> User:
+        session = self.connection_manager.make_async_session()
+        async with async_transaction_scope(session) as tx_session:
+            whitelist = await self.whitelist_repository.async_get(
                 email=user.email, db_session=tx_session
             )
             if not whitelist:
                 raise InvalidUserEmail(user.email)
 
-            if self.user_repository.get_by_email(
+            if await self.user_repository.async_get_by_email(
                 email=user.email, db_session=tx_session
             ):
                 raise UserAlreadyExist(email=user.email)
 
-            user.hashed_password = self.security_service.get_password_hash(
+            user.hashed_password = await self.security_service.async_get_password_hash(
                 user.hashed_password
             )
-            user = self.user_repository.add(user=user, db_session=tx_session)
+            user = await self.user_repository.async_add(user=user, db_session=tx_session)
 
         return user
 
-    def get_by_email(self, email: str) -> User:
-        return self.user_repository.get_by_email(email=email)
+    async def get_by_email(self, email: str) -> User:
+        return await self.user_repository.async_get_by_email(email=email)
 
-    def get_by_email_and_password(self, email: str, password: str) -> Optional[User]:
-        user = self.user_repository.get_by_email(email=email)
+    async def get_by_email_and_password(
+        self, email: str, password: str
+    ) -> Optional[User]:
+        user = await self.user_repository.async_get_by_email(email=email)
 
         if not user:
             return None
 
-        if self.security_service.verify_password(password, user.hashed_password):
-            return user
-        else:
-            return None
\ No newline at end of file
+        verified, new_hashed_password = (
+            await self.security_service.async_verify_and_update(
+                password, user.hashed_password
+            )
+        )
+        if not verified:
+            return None
+
+        if new_hashed_password:
+            await self.update_password(user, new_hashed_password)
+        return user
+
+    async def update_password(self, user: User, hashed_password: str):
+        # bcrypt cost가 바뀌면 로그인할 때 평문 비밀번호로 다시 hash 하여 저장한다.
+        # 저장에 실패해도 로그인은 성공시키고 다음 로그인 때 다시 시도한다.
+        try:
+            await self.user_repository.async_update_password(
+                user_id=user.id, hashed_password=hashed_password
+            )
+            user.hashed_password = hashed_password
+        except Exception as e:
+            print(f"[UserService] user_id:[{user.id}] cannot update password hash: {e}")
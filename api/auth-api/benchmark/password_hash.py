@@ -0,0 +1,110 @@
+"""
+bcrypt cost factor 별 hash 시간을 재서 security.bcrypt_rounds를 정하고,
+로그인(비밀번호 검증)을 event loop에서 바로 할 때와 password_executor로 넘길 때의
+worker(process) 당 sign-ins/sec와 event loop 지연을 비교한다.
+
+    cd api/auth-api
+    poetry run python benchmark/password_hash.py --target-ms 250 --hash-workers 2
+
+배포할 pod의 CPU limit과 같은 환경에서 실행해야 의미가 있다.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.service.security import SecurityService
+
+PASSWORD = "benchmark-password"
+
+
+def measure_rounds(rounds: int, hashes: int) -> float:
+    service = SecurityService("secret", "HS256", 60, bcrypt_rounds=rounds)
+    hashed_password = service.get_password_hash(PASSWORD)
+    elapsed = []
+    for _ in range(hashes):
+        start = time.perf_counter()
+        service.verify_password(PASSWORD, hashed_password)
+        elapsed.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(elapsed)
+
+
+async def watch_loop(stop: asyncio.Event, interval: float = 0.005) -> float:
+    # event loop가 다른 요청을 처리하지 못하고 막힌 최대 시간 (ms)
+    max_lag = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, time.perf_counter() - start - interval)
+    return max_lag * 1000
+
+
+async def measure_signins(name: str, verify, signins: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def signin():
+        async with semaphore:
+            await verify()
+
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(watch_loop(stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(signin() for _ in range(signins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    max_lag = await watcher
+    print(
+        f"{name:<10} {signins / elapsed:7.2f} sign-ins/sec  "
+        f"max event loop lag {max_lag:8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--hashes", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--hash-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--signins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    recommended = args.min_rounds
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        mean = measure_rounds(rounds, args.hashes)
+        print(f"rounds {rounds:2d}  mean {mean:8.1f} ms")
+        if mean <= args.target_ms:
+            recommended = rounds
+    print(f"recommended bcrypt_rounds for {args.target_ms:.0f} ms: {recommended}")
+
+    executor = ThreadPoolExecutor(
+        max_workers=args.hash_workers, thread_name_prefix="password"
+    )
+    service = SecurityService(
+        "secret",
+        "HS256",
+        60,
+        bcrypt_rounds=recommended,
+        password_executor=executor,
+    )
+    hashed_password = service.get_password_hash(PASSWORD)
+
+    async def blocking():
+        service.verify_password(PASSWORD, hashed_password)
+
+    async def offloaded():
+        await service.async_verify_password(PASSWORD, hashed_password)
+
+    print(f"cpu {os.cpu_count()}  hash_workers {args.hash_workers}")
+    asyncio.run(measure_signins("blocking", blocking, args.signins, args.concurrency))
+    asyncio.run(measure_signins("offloaded", offloaded, args.signins, args.concurrency))
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -29,8 +29,8 @@ class TestConfigService(unittest.TestCase):
         )
         user_types = [user_type, user_type]
         orgs = [org, org]
-        self.user_type_repository.list.return_value = user_types
-        self.org_repository.list.return_value = orgs
+        self.user_type_repository.async_list.return_value = user_types
+        self.org_repository.async_list.return_value = orgs
         result = await self.config_service.get()
         self.assertEqual(result, ConfigResponse(user_types=user_types, orgs=orgs))
 
@@ -1,6 +1,6 @@
 import unittest
-from unittest.mock import MagicMock, ANY
-from sqlalchemy.orm import Session
+from unittest.mock import AsyncMock, MagicMock, ANY
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 from auth.exception import UserAlreadyExist, InvalidUserEmail
@@ -16,15 +16,21 @@ from core.service.security import SecurityService
 from core.db.connection import ConnectionManager
 
 
-class TestUserService(unittest.TestCase):
+class TestUserService(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.user_repository = MagicMock(spec=UserRepository)
         self.whitelist_repository = MagicMock(spec=WhitelistRepository)
         self.org_repository = MagicMock(spec=OrgRepository)
         self.security_service = MagicMock(spec=SecurityService)
+        self.security_service.async_get_password_hash = AsyncMock(
+            return_value="hashed_password"
+        )
+        self.security_service.async_verify_and_update = AsyncMock(
+            return_value=(True, None)
+        )
         self.connection_manager = MagicMock(spec=ConnectionManager)
-        self.session = MagicMock(spec=Session)
-        self.connection_manager.make_session.return_value = self.session
+        self.session = AsyncMock(spec=AsyncSession)
+        self.connection_manager.make_async_session.return_value = self.session
         self.user_service = UserService(
             user_repository=self.user_repository,
             whitelist_repository=self.whitelist_repository,
@@ -33,7 +39,7 @@ class TestUserService(unittest.TestCase):
             connection_manager=self.connection_manager,
         )
 
-    def test_add_user_success(self):
+    async def test_add_user_success(self):
         user = User(
             id=None,
             email="test@example.com",
@@ -48,21 +54,24 @@ class TestUserService(unittest.TestCase):
             org_id=1,
         )
         whitelist_entity = WhiteListEntity(id=1, email="test@example.com")
-        self.user_service.whitelist_repository.get.return_value = whitelist_entity
-        self.user_repository.get_by_email.return_value = None
-        self.user_repository.add.return_value = user
-        added_user = self.user_service.add(user)
+        self.user_service.whitelist_repository.async_get.return_value = whitelist_entity
+        self.user_repository.async_get_by_email.return_value = None
+        self.user_repository.async_add.return_value = user
+        added_user = await self.user_service.add(user)
 
-        self.security_service.get_password_hash.assert_called_once()
-        self.user_repository.add.assert_called_once_with(
+        self.security_service.async_get_password_hash.assert_awaited_once_with(
+            "test_password"
+        )
+        self.assertEqual(user.hashed_password, "hashed_password")
+        self.user_repository.async_add.assert_awaited_once_with(
             user=user, db_session=self.session
         )
         self.assertIsNotNone(added_user.org_id)
-        self.session.commit.assert_called_once()
+        self.session.commit.assert_awaited_once()
         self.session.rollback.assert_not_called()
-        self.session.close.assert_called_once()
+        self.session.close.assert_awaited_once()
 
-    def test_add_user_invalid_email(self):
+    async def test_add_user_invalid_email(self):
         user = User(
             id=None,
             email="test@example.com",
@@ -76,14 +85,14 @@ class TestUserService(unittest.TestCase):
             user_type_id=1,
             org_id=1,
         )
-        self.whitelist_repository.get.return_value = None
+        self.whitelist_repository.async_get.return_value = None
         with self.assertRaises(InvalidUserEmail):
-            self.user_service.add(user)
+            await self.user_service.add(user)
             self.session.commit.assert_not_called()
             self.session.rollback.assert_called_once()
-            self.session.close.assert_called_once()
+            self.session.close.assert_awaited_once()
 
-    def test_add_user_already_exist(self):
+    async def test_add_user_already_exist(self):
         user = User(
             id=None,
             email="test@example.com",
@@ -110,15 +119,15 @@ class TestUserService(unittest.TestCase):
             user_type_id=1,
             org_id=1,
         )
-        self.user_service.whitelist_repository.get.return_value = whitelist_entity
-        self.user_repository.get_by_email.return_value = user_entity
+        self.user_service.whitelist_repository.async_get.return_value = whitelist_entity
+        self.user_repository.async_get_by_email.return_value = user_entity
         with self.assertRaises(UserAlreadyExist):
-            self.user_service.add(user)
+            await self.user_service.add(user)
             self.session.commit.assert_not_called()
             self.session.rollback.assert_called_once()
-            self.session.close.assert_called_once()
+            self.session.close.assert_awaited_once()
 
-    def test_get_by_email_found(self):
+    async def test_get_by_email_found(self):
         test_email = "test@example.com"
         user_entity = UserEntity(
             email="test@example.com",
@@ -132,17 +141,17 @@ class TestUserService(unittest.TestCase):
             user_type_id=1,
             org_id=1,
         )
-        self.user_repository.get_by_email.return_value = user_entity
-        result = self.user_service.get_by_email(test_email)
+        self.user_repository.async_get_by_email.return_value = user_entity
+        result = await self.user_service.get_by_email(test_email)
         self.assertEqual(result, user_entity)
 
-    def test_get_by_email_not_found(self):
+    async def test_get_by_email_not_found(self):
         test_email = "test@example.com"
-        self.user_repository.get_by_email.return_value = None
-        result = self.user_service.get_by_email(test_email)
+        self.user_repository.async_get_by_email.return_value = None
+        result = await self.user_service.get_by_email(test_email)
         self.assertIsNone(result)
 
-    def test_get_by_email_and_password_found(self):
+    async def test_get_by_email_and_password_found(self):
         test_email = "test@example.com"
         test_password = "test_password"
         user_entity = UserEntity(
@@ -157,19 +166,81 @@ class TestUserService(unittest.TestCase):
             user_type_id=1,
             org_id=1,
         )
-        self.user_repository.get_by_email.return_value = user_entity
-        self.security_service.verify_password.return_value = True
-        result = self.user_service.get_by_email_and_password(test_email, test_password)
+        self.user_repository.async_get_by_email.return_value = user_entity
+        result = await self.user_service.get_by_email_and_password(
+            test_email, test_password
+        )
+        self.assertEqual(result, user_entity)
+        self.security_service.async_verify_and_update.assert_awaited_once_with(
+            test_password, "hashed_password"
+        )
+        self.user_repository.async_update_password.assert_not_called()
+
+    async def test_get_by_email_and_password_rehash(self):
+        user_entity = UserEntity(
+            id=1,
+            email="test@example.com",
+            name="test",
+            hashed_password="old_hashed_password",
+            birth_year=2000,
+            gender="N",
+            highest_education_level_id=1,
+            years_of_experience=1,
+            created_time=datetime.now(),
+            user_type_id=1,
+            org_id=1,
+        )
+        self.user_repository.async_get_by_email.return_value = user_entity
+        self.security_service.async_verify_and_update.return_value = (
+            True,
+            "new_hashed_password",
+        )
+        result = await self.user_service.get_by_email_and_password(
+            "test@example.com", "test_password"
+        )
+        self.assertEqual(result, user_entity)
+        self.user_repository.async_update_password.assert_awaited_once_with(
+            user_id=1, hashed_password="new_hashed_password"
+        )
+        self.assertEqual(result.hashed_password, "new_hashed_password")
+
+    async def test_get_by_email_and_password_rehash_failed(self):
+        user_entity = UserEntity(
+            id=1,
+            email="test@example.com",
+            name="test",
+            hashed_password="old_hashed_password",
+            birth_year=2000,
+            gender="N",
+            highest_education_level_id=1,
+            years_of_experience=1,
+            created_time=datetime.now(),
+            user_type_id=1,
+            org_id=1,
+        )
+        self.user_repository.async_get_by_email.return_value = user_entity
+        self.security_service.async_verify_and_update.return_value = (
+            True,
+            "new_hashed_password",
+        )
+        self.user_repository.async_update_password.side_effect = Exception("db")
+        result = await self.user_service.get_by_email_and_password(
+            "test@example.com", "test_password"
+        )
+        # hash 저장에 실패해도 로그인은 성공한다.
         self.assertEqual(result, user_entity)
+        self.assertEqual(result.hashed_password, "old_hashed_password")
 
-    def test_get_by_email_and_password_email_not_found(self):
+    async def test_get_by_email_and_password_email_not_found(self):
         test_email = "test@example.com"
         test_password = "test_password"
-        self.user_repository.get_by_email.return_value = None
-        result = self.user_service.get_by_email_and_password(test_email, test_password)
+        self.user_repository.async_get_by_email.return_value = None
+        result = await self.user_service.get_by_email_and_password(
+            test_email, test_password
+        )
         self.assertIsNone(result)
 
-    def test_get_by_email_and_password_password_not_match(self):
+    async def test_get_by_email_and_password_password_not_match(self):
         test_email = "test@example.com"
         test_password = "test_password"
         user_entity = UserEntity(
@@ -184,9 +255,11 @@ class TestUserService(unittest.TestCase):
             user_type_id=1,
             org_id=1,
         )
-        self.user_repository.get_by_email.return_value = user_entity
-        self.security_service.verify_password.return_value = False
-        result = self.user_service.get_by_email_and_password(test_email, test_password)
+        self.user_repository.async_get_by_email.return_value = user_entity
+        self.security_service.async_verify_and_update.return_value = (False, None)
+        result = await self.user_service.get_by_email_and_password(
+            test_email, test_password
+        )
         self.assertIsNone(result)
 
 
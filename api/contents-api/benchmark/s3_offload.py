@@ -0,0 +1,259 @@
+"""
+S3 download가 진행되는 동안 관계없는 endpoint(ping)의 응답 지연을 측정한다.
+boto3 호출을 event loop에서 바로 실행하는 경우(inline)와
+AsyncObjectRepository의 thread pool에서 실행하는 경우(executor)를 비교한다.
+
+    cd api/contents-api
+    poetry run python benchmark/s3_offload.py --downloads 8 --seconds 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from contents.service.script import ScriptManagerService
+from contents.service.video import VideoManagerService
+from core.model.domain.session import Session
+from core.model.domain.state_type import StateTypeEnum
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.script import ScriptRepository
+from object.repository.video import VideoRepository
+
+MB = 1024 * 1024
+
+
+class StubStreamingBody:
+    # botocore StreamingBody처럼 read(amt)와 1KB 단위 iteration을 제공한다.
+    def __init__(self, size: int, bandwidth: float):
+        self.remaining = size
+        self.bandwidth = bandwidth
+
+    def read(self, amt: int = None):
+        amt = self.remaining if amt is None else min(amt, self.remaining)
+        time.sleep(amt / self.bandwidth)
+        self.remaining -= amt
+        return b"0" * amt
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = self.read(1024)
+        if not chunk:
+            raise StopIteration()
+        return chunk
+
+    def close(self):
+        pass
+
+
+class StubS3Client:
+    def __init__(self, sizes: dict, first_byte_latency: float, bandwidth: float):
+        self.sizes = sizes
+        self.first_byte_latency = first_byte_latency
+        self.bandwidth = bandwidth
+
+    def get_object(self, Bucket: str, Key: str):
+        time.sleep(self.first_byte_latency)
+        size = self.sizes[Key.split("/")[0]]
+        return {"Body": StubStreamingBody(size, self.bandwidth), "ContentLength": size}
+
+
+class StubClientManager:
+    def __init__(self, client: StubS3Client):
+        self.client = client
+
+    def get_client(self):
+        return self.client
+
+
+class StubCaseRepository:
+    async def async_get(self, case_id: int, user_id: int = None):
+        return True
+
+
+class StubSessionRepository:
+    async def async_get(self, session_id: int):
+        return Session(
+            id=session_id,
+            name="benchmark",
+            session_state_id=StateTypeEnum.DONE,
+            case_id=1,
+            script_state_id=StateTypeEnum.DONE,
+            analyze_state_id=StateTypeEnum.DONE,
+            created_date="2024-01-01",
+            source_script_url="1/1/script_v1.json",
+            encoding_video_url="1/1/video.mp4",
+        )
+
+
+class InlineObjectRepository(AsyncObjectRepository):
+    # 변경 전처럼 boto3 호출을 event loop에서 바로 실행한다.
+    async def run(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def iter_chunks(self, body, chunk_size: int = None):
+        # 변경 전에는 StreamingBody를 그대로 넘겨 starlette thread pool에서 읽었다.
+        return body
+
+
+def make_app(mode: str, client_manager: StubClientManager, max_workers: int):
+    repository_class = (
+        InlineObjectRepository if mode == "inline" else AsyncObjectRepository
+    )
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="object")
+    video_manager_service = VideoManagerService(
+        video_repository=repository_class(
+            VideoRepository("bucket", client_manager), executor
+        ),
+        session_repository=StubSessionRepository(),
+        case_repository=StubCaseRepository(),
+        connection_manager=None,
+    )
+    script_manager_service = ScriptManagerService(
+        script_repository=repository_class(
+            ScriptRepository("bucket", client_manager), executor
+        ),
+        session_repository=StubSessionRepository(),
+        case_repository=StubCaseRepository(),
+        connection_manager=None,
+    )
+
+    app = FastAPI()
+
+    @app.get("/video")
+    async def download_video():
+        video_stream = await video_manager_service.download_video(
+            case_id=1, session_id=1, user_id=1
+        )
+        return StreamingResponse(video_stream.body, media_type="video/mp4")
+
+    @app.get("/script")
+    async def download_script():
+        script = await script_manager_service.download_script(
+            case_id=1, session_id=1, user_id=1
+        )
+        return StreamingResponse(script, media_type="application/json")
+
+    @app.get("/ping")
+    async def ping():
+        return {"msg": "pong"}
+
+    return app, executor
+
+
+async def request(app: FastAPI, path: str) -> int:
+    # httpx.ASGITransport는 응답 body를 한 번에 join하므로(event loop에서 복사)
+    # ASGI app을 직접 호출하고 받은 byte 수만 센다.
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("contents", 80),
+    }
+    response_complete = asyncio.Event()
+    request_complete = False
+    received = 0
+
+    async def receive():
+        nonlocal request_complete
+        if request_complete:
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+        request_complete = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    return received
+
+
+async def download_loop(app: FastAPI, path: str, deadline: float):
+    downloaded = 0
+    while time.perf_counter() < deadline:
+        downloaded += await request(app, path)
+    return downloaded
+
+
+async def ping_loop(app: FastAPI, deadline: float, interval: float):
+    # client도 같은 event loop에서 돌기 때문에 요청을 보낸 시각이 아니라
+    # 보냈어야 할 시각(interval 간격)부터 응답까지를 잰다. (coordinated omission 보정)
+    elapsed = []
+    scheduled = time.perf_counter()
+    while scheduled < deadline:
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await request(app, "/ping")
+        elapsed.append((time.perf_counter() - scheduled) * 1000)
+        scheduled += interval
+    return elapsed
+
+
+async def measure(mode: str, args, client_manager: StubClientManager):
+    app, executor = make_app(mode, client_manager, args.max_workers)
+    await request(app, "/ping")  # warm up
+    deadline = time.perf_counter() + args.seconds
+    downloads = [
+        download_loop(app, "/video" if i % 2 == 0 else "/script", deadline)
+        for i in range(args.downloads)
+    ]
+    results = await asyncio.gather(
+        ping_loop(app, deadline, args.ping_interval / 1000), *downloads
+    )
+    executor.shutdown()
+
+    elapsed = sorted(results[0])
+    p99 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.99))]
+    throughput = sum(results[1:]) / MB / args.seconds
+    print(
+        f"{mode:<9} ping n={len(elapsed):<5} p50 {statistics.median(elapsed):8.2f} ms  "
+        f"p99 {p99:8.2f} ms  max {elapsed[-1]:8.2f} ms  "
+        f"download {throughput:7.1f} MiB/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--downloads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--max-workers", type=int, default=16)
+    parser.add_argument("--ping-interval", type=float, default=10, help="ms")
+    parser.add_argument("--video-mb", type=int, default=64)
+    parser.add_argument("--script-mb", type=int, default=4)
+    parser.add_argument("--first-byte-ms", type=float, default=30)
+    parser.add_argument("--bandwidth-mb", type=float, default=100, help="MiB/s")
+    args = parser.parse_args()
+
+    client_manager = StubClientManager(
+        StubS3Client(
+            sizes={"video": args.video_mb * MB, "script": args.script_mb * MB},
+            first_byte_latency=args.first_byte_ms / 1000,
+            bandwidth=args.bandwidth_mb * MB,
+        )
+    )
+    for mode in ["inline", "executor"]:
+        asyncio.run(measure(mode, args, client_manager))
+
+
+if __name__ == "__main__":
+    main()
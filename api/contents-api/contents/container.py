@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from dependency_injector import containers, providers
 
 from core.repository.user import UserRepository
@@ -5,9 +6,13 @@ from core.repository.case import CaseRepository
 from core.repository.session import SessionRepository
 from core.db.connection import ConnectionManager
 from core.service.security import SecurityService
+from core.service.token_cache import TokenCache
+from core.service.case_authorization import CaseAuthorizationService
 from object.repository.video import VideoRepository
 from object.repository.script import ScriptRepository
 from object.repository.analyze_report import AnalyzeReportRepository
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.multipart_upload import MultipartUploader
 from object.storage.client import ClientManager
 from contents.service.case import CaseService
 from contents.service.session import SessionService
@@ -26,6 +31,19 @@ class Container(containers.DeclarativeContainer):
         ConnectionManager,
         db_url=config.mysql.db_url,
         pool_recycle=config.mysql.pool_recycle,
+        pool_size=config.mysql.pool_size,
+        max_overflow=config.mysql.max_overflow,
+        pool_timeout=config.mysql.pool_timeout,
+        pool_pre_ping=config.mysql.pool_pre_ping,
+        pool_use_lifo=config.mysql.pool_use_lifo,
+    )
+
+    # 모든 route가 매 요청 token을 검증하므로 검증한 payload를 exp 직전까지 cache 한다.
+    token_cache = providers.Singleton(
+        TokenCache,
+        max_size=config.security.token_cache.max_size,
+        expiry_margin_seconds=config.security.token_cache.expiry_margin_seconds,
+        max_ttl_seconds=config.security.token_cache.max_ttl_seconds,
     )
 
     security_service = providers.Singleton(
@@ -33,11 +51,14 @@ class Container(containers.DeclarativeContainer):
         secret_key=config.security.secret_key,
         algorithm=config.security.algorithm,
         expires_delta=config.security.expires_delta,
+        token_cache=token_cache,
     )
 
     # core repositories
     case_repository = providers.Singleton(
-        CaseRepository, connection_manager=connection_manager
+        CaseRepository,
+        connection_manager=connection_manager,
+        maintained_session_count=config.case.maintained_session_count,
     )
 
     user_repository = providers.Singleton(
@@ -53,19 +74,75 @@ class Container(containers.DeclarativeContainer):
         aws_access_key_id=config.aws.access_key,
         aws_secret_access_key=config.aws.secret_key,
         region_name=config.aws.region,
+        max_pool_connections=config.aws.max_workers,
+        endpoint_url=config.aws.endpoint_url,
+    )
+
+    # S3 호출은 event loop를 막지 않도록 전용 thread pool에서 실행한다.
+    object_executor = providers.Singleton(
+        ThreadPoolExecutor,
+        max_workers=config.aws.max_workers,
+        thread_name_prefix="object",
     )
 
     # object repositories
     video_repository = providers.Singleton(
-        VideoRepository, bucket=config.aws.bucket, client_manager=client_manager
+        VideoRepository,
+        bucket=config.aws.bucket,
+        client_manager=client_manager,
+        presigned_url_expires=config.aws.presigned_url_expires,
     )
 
     script_repository = providers.Singleton(
-        ScriptRepository, bucket=config.aws.bucket, client_manager=client_manager
+        ScriptRepository,
+        bucket=config.aws.bucket,
+        client_manager=client_manager,
+        presigned_url_expires=config.aws.presigned_url_expires,
     )
 
     analyze_report_repository = providers.Singleton(
-        AnalyzeReportRepository, bucket=config.aws.bucket, client_manager=client_manager
+        AnalyzeReportRepository,
+        bucket=config.aws.bucket,
+        client_manager=client_manager,
+        presigned_url_expires=config.aws.presigned_url_expires,
+    )
+
+    async_video_repository = providers.Singleton(
+        AsyncObjectRepository,
+        repository=video_repository,
+        executor=object_executor,
+        chunk_size=config.aws.chunk_size,
+    )
+
+    video_uploader = providers.Singleton(
+        MultipartUploader,
+        repository=async_video_repository,
+        part_size=config.aws.multipart.part_size,
+        max_concurrency=config.aws.multipart.max_concurrency,
+        max_retries=config.aws.multipart.max_retries,
+        retry_backoff=config.aws.multipart.retry_backoff,
+    )
+
+    async_script_repository = providers.Singleton(
+        AsyncObjectRepository,
+        repository=script_repository,
+        executor=object_executor,
+        chunk_size=config.aws.chunk_size,
+    )
+
+    async_analyze_report_repository = providers.Singleton(
+        AsyncObjectRepository,
+        repository=analyze_report_repository,
+        executor=object_executor,
+        chunk_size=config.aws.chunk_size,
+    )
+
+    # case 하위 API의 (user_id, case_id) 소유권 확인 결과를 service 간에 공유한다.
+    case_authorization = providers.Singleton(
+        CaseAuthorizationService,
+        case_repository=case_repository,
+        ttl_seconds=config.authorization.ttl_seconds,
+        max_size=config.authorization.max_size,
     )
 
     # domain services
@@ -74,6 +151,7 @@ class Container(containers.DeclarativeContainer):
         case_repository=case_repository,
         security_service=security_service,
         connection_manager=connection_manager,
+        case_authorization=case_authorization,
     )
 
     session_service = providers.Singleton(
@@ -82,27 +160,32 @@ class Container(containers.DeclarativeContainer):
         case_repository=case_repository,
         security_service=security_service,
         connection_manager=connection_manager,
+        case_authorization=case_authorization,
     )
 
     video_manager_service = providers.Singleton(
         VideoManagerService,
-        video_repository=video_repository,
+        video_repository=async_video_repository,
+        video_uploader=video_uploader,
         session_repository=session_repository,
         case_repository=case_repository,
         connection_manager=connection_manager,
+        case_authorization=case_authorization,
     )
 
     script_manager_service = providers.Singleton(
         ScriptManagerService,
-        script_repository=script_repository,
+        script_repository=async_script_repository,
         session_repository=session_repository,
         case_repository=case_repository,
         connection_manager=connection_manager,
+        case_authorization=case_authorization,
     )
 
     analyze_report_manager_service = providers.Singleton(
         AnalyzeReportManagerService,
-        analyze_report_repository=analyze_report_repository,
+        analyze_report_repository=async_analyze_report_repository,
         session_repository=session_repository,
         case_repository=case_repository,
+        case_authorization=case_authorization,
     )
@@ -0,0 +1,14 @@
+from enum import Enum
+from pydantic import BaseModel
+
+
+class DeliveryMode(str, Enum):
+    # proxy: contents-api를 거쳐 streaming / url: presigned url 응답 / redirect: presigned url로 307
+    PROXY = "proxy"
+    URL = "url"
+    REDIRECT = "redirect"
+
+
+class PresignedUrlResponse(BaseModel):
+    url: str
+    expires_in: int
@@ -0,0 +1,14 @@
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    # 다음(더 오래된) page는 after=next_cursor, 이전(더 최근) page는 before=prev_cursor로 요청한다.
+    # 더 없으면 None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    # total=true로 요청했을 때만 센다.
+    total_count: Optional[int] = None
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from pydantic import BaseModel, ConfigDict
+
+
+class VideoStream(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # S3 object body를 chunk 단위로 읽는 async iterator
+    body: Any
+    status_code: int
+    headers: Dict[str, str]
+
+
+# resumable upload (initiate -> part N upload -> 받은 part 조회 -> complete)
+class VideoUploadRequest(BaseModel):
+    filename: str
+
+
+class VideoUploadPart(BaseModel):
+    part_number: int
+    etag: str
+    size: int
+
+
+class VideoUpload(BaseModel):
+    upload_id: str
+    filename: str
+    # 마지막 part를 제외한 모든 part는 이 크기로 올려야 한다.
+    part_size: int
+    parts: List[VideoUploadPart] = []
+
+
+class VideoUploadState(BaseModel):
+    # S3에 저장하는 upload 상태 (s3_upload_id는 client에 내려주지 않는다)
+    upload_id: str
+    s3_upload_id: str
+    object_name: str
+    filename: str
+    case_id: int
+    session_id: int
+    part_size: int
+    created_time: datetime
@@ -62,3 +62,44 @@ class InvalidRange(ServiceException):
         self.status_code = 400
         self.error_code = 4
         super().__init__(self.message)
+
+
+class RangeNotSatisfiable(ServiceException):
+    """Range Not Satisfiable"""
+
+    def __init__(self, session_id: int, size: int = None):
+        self.message = f"Requested range not satisfiable for session ID {session_id}"
+        self.status_code = 416
+        self.error_code = 8
+        self.size = size
+        super().__init__(self.message)
+
+
+class InvalidUploadRequest(ServiceException):
+    """Invalid Upload Request"""
+
+    def __init__(self, reason: str):
+        self.message = f"Invalid upload request: {reason}"
+        self.status_code = 400
+        self.error_code = 9
+        super().__init__(self.message)
+
+
+class VideoUploadNotFound(ServiceException):
+    """Video Upload Not found"""
+
+    def __init__(self, upload_id: str):
+        self.message = f"Video upload {upload_id} not found"
+        self.status_code = 400
+        self.error_code = 10
+        super().__init__(self.message)
+
+
+class InvalidCursor(ServiceException):
+    """Invalid Cursor"""
+
+    def __init__(self, cursor: str):
+        self.message = f"Invalid cursor {cursor}"
+        self.status_code = 400
+        self.error_code = 11
+        super().__init__(self.message)
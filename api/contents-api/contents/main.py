@@ -17,12 +17,17 @@ from contents.exception import (
     ScriptNotFound,
     AnalyzeReportNotFound,
     InvalidRange,
+    InvalidCursor,
+    RangeNotSatisfiable,
+    InvalidUploadRequest,
+    VideoUploadNotFound,
 )
 from contents.route.case import router as case_router
 from contents.route.session import router as session_router
 from contents.route.video import router as video_router
 from contents.route.script import router as script_router
 from contents.route.analyze_report import router as analyze_report_router
+from contents.route.monitor import router as monitor_router
 
 container = Container()
 container.config.from_yaml(f"./contents/config-{os.getenv('PHASE','LOCAL')}.yaml")
@@ -108,6 +113,42 @@ async def invalid_range_handler(request: Request, exc: InvalidRange):
     )
 
 
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"message": exc.message, "error_code": exc.error_code},
+    )
+
+
+@app.exception_handler(RangeNotSatisfiable)
+async def range_not_satisfiable_handler(request: Request, exc: RangeNotSatisfiable):
+    headers = {}
+    if exc.size is not None:
+        headers["Content-Range"] = f"bytes */{exc.size}"
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"message": exc.message, "error_code": exc.error_code},
+        headers=headers,
+    )
+
+
+@app.exception_handler(InvalidUploadRequest)
+async def invalid_upload_request_handler(request: Request, exc: InvalidUploadRequest):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"message": exc.message, "error_code": exc.error_code},
+    )
+
+
+@app.exception_handler(VideoUploadNotFound)
+async def video_upload_not_found_handler(request: Request, exc: VideoUploadNotFound):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"message": exc.message, "error_code": exc.error_code},
+    )
+
+
 @app.exception_handler(InvalidToken)
 async def invalid_token_handler(request: Request, exc: InvalidToken):
     return JSONResponse(
@@ -132,12 +173,19 @@ async def download_failed_handler(request: Request, exc: DownloadFailed):
     )
 
 
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    await container.connection_manager().dispose_async_engine()
+    container.object_executor().shutdown(wait=False)
+
+
 def register_routers(app: FastAPI):
     app.include_router(case_router, prefix="/contents/api/case")
     app.include_router(session_router, prefix="/contents/api")
     app.include_router(video_router, prefix="/contents/api")
     app.include_router(script_router, prefix="/contents/api")
     app.include_router(analyze_report_router, prefix="/contents/api")
+    app.include_router(monitor_router, prefix="/contents/api/monitor")
 
 
 register_routers(app)
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, UploadFile, File
 from fastapi.security import OAuth2PasswordBearer
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, RedirectResponse
 from dependency_injector.wiring import inject, Provide
 
 from contents.container import Container
+from contents.dto.delivery import DeliveryMode
 from contents.service.analyze_report import AnalyzeReportManagerService
 from core.service.security import SecurityService
 
@@ -12,6 +13,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/api/signin")
 
 
 # 1. analyze_report(json) download
+# delivery=url/redirect이면 presigned url로 S3에서 바로 받는다.
 @router.get(
     "/case/{case_id}/session/{session_id}/analyze-report", tags=["analyze-report"]
 )
@@ -19,6 +21,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/api/signin")
 async def download_analyze_report(
     case_id: int,
     session_id: int,
+    delivery: DeliveryMode = DeliveryMode.PROXY,
     token: str = Depends(oauth2_scheme),
     analyze_report_manager_service: AnalyzeReportManagerService = Depends(
         Provide[Container.analyze_report_manager_service]
@@ -26,6 +29,16 @@ async def download_analyze_report(
     security_service: SecurityService = Depends(Provide[Container.security_service]),
 ):
     payload = security_service.verify_token(token)
+    if delivery != DeliveryMode.PROXY:
+        presigned_url = (
+            await analyze_report_manager_service.get_analyze_report_presigned_url(
+                case_id=case_id, session_id=session_id, user_id=payload.get("user_id")
+            )
+        )
+        if delivery == DeliveryMode.REDIRECT:
+            return RedirectResponse(presigned_url.url, status_code=307)
+        return presigned_url
+
     analyze_report = await analyze_report_manager_service.download_analyze_report(
         case_id=case_id, session_id=session_id, user_id=payload.get("user_id")
     )
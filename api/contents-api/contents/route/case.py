@@ -43,6 +43,31 @@ async def get_case_list(
     return case_list
 
 
+# cursor pagination: 첫 page는 cursor 없이, 이후 after=next_cursor / before=prev_cursor
+# (/{case_id}보다 먼저 등록해야 한다)
+@router.get("/page", tags=["case"])
+@inject
+async def get_case_page(
+    limit: int = None,
+    after: str = None,
+    before: str = None,
+    keyword: str = None,
+    total: bool = False,
+    token: str = Depends(oauth2_scheme),
+    case_service: CaseService = Depends(Provide[Container.case_service]),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+):
+    payload = security_service.verify_token(token)
+    return await case_service.get_case_page(
+        user_id=payload.get("user_id"),
+        limit=limit,
+        after=after,
+        before=before,
+        keyword=keyword,
+        total=total,
+    )
+
+
 @router.get("/{case_id}", tags=["case"])
 @inject
 async def get_case(
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends
+from fastapi.security import OAuth2PasswordBearer
+from dependency_injector.wiring import inject, Provide
+
+from core.db.connection import ConnectionManager
+from core.model.domain.pool import PoolStats
+from core.model.domain.security import TokenCacheStats
+from core.service.security import SecurityService
+from core.service.token_cache import TokenCache
+from contents.container import Container
+
+router = APIRouter()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/api/signin")
+
+
+# MySQL connection pool 사용량과 checkout 대기 시간
+@router.get("/pool", tags=["monitor"])
+@inject
+async def get_pool_stats(
+    token: str = Depends(oauth2_scheme),
+    connection_manager: ConnectionManager = Depends(
+        Provide[Container.connection_manager]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> PoolStats:
+    security_service.verify_token(token)
+    return connection_manager.get_pool_stats()
+
+
+# API 요청이 사용하는 async engine(aiomysql)의 connection pool
+@router.get("/pool/async", tags=["monitor"])
+@inject
+async def get_async_pool_stats(
+    token: str = Depends(oauth2_scheme),
+    connection_manager: ConnectionManager = Depends(
+        Provide[Container.connection_manager]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> PoolStats:
+    security_service.verify_token(token)
+    return connection_manager.get_async_pool_stats()
+
+
+# 검증한 token payload cache의 hit rate
+@router.get("/token-cache", tags=["monitor"])
+@inject
+async def get_token_cache_stats(
+    token: str = Depends(oauth2_scheme),
+    token_cache: TokenCache = Depends(Provide[Container.token_cache]),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> TokenCacheStats:
+    security_service.verify_token(token)
+    return token_cache.stats()
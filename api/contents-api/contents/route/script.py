@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, UploadFile, File
 from fastapi.security import OAuth2PasswordBearer
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, RedirectResponse
 from dependency_injector.wiring import inject, Provide
 
 from contents.container import Container
+from contents.dto.delivery import DeliveryMode
 from contents.service.script import ScriptManagerService
 from core.service.security import SecurityService
 
@@ -12,11 +13,13 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/api/signin")
 
 
 # 1. script(json) download
+# delivery=url/redirect이면 presigned url로 S3에서 바로 받는다.
 @router.get("/case/{case_id}/session/{session_id}/script", tags=["script"])
 @inject
 async def download_script(
     case_id: int,
     session_id: int,
+    delivery: DeliveryMode = DeliveryMode.PROXY,
     token: str = Depends(oauth2_scheme),
     script_manager_service: ScriptManagerService = Depends(
         Provide[Container.script_manager_service]
@@ -24,6 +27,14 @@ async def download_script(
     security_service: SecurityService = Depends(Provide[Container.security_service]),
 ):
     payload = security_service.verify_token(token)
+    if delivery != DeliveryMode.PROXY:
+        presigned_url = await script_manager_service.get_script_presigned_url(
+            case_id=case_id, session_id=session_id, user_id=payload.get("user_id")
+        )
+        if delivery == DeliveryMode.REDIRECT:
+            return RedirectResponse(presigned_url.url, status_code=307)
+        return presigned_url
+
     script = await script_manager_service.download_script(
         case_id=case_id, session_id=session_id, user_id=payload.get("user_id")
     )
@@ -55,6 +55,36 @@ async def get_session_list(
     return session_list
 
 
+# cursor pagination: 첫 page는 cursor 없이, 이후 after=next_cursor / before=prev_cursor
+# (/case/{case_id}/session/{session_id}보다 먼저 등록해야 한다)
+@router.get(
+    "/case/{case_id}/session/page",
+    tags=["session"],
+)
+@inject
+async def get_session_page(
+    case_id: int,
+    limit: int = None,
+    after: str = None,
+    before: str = None,
+    keyword: str = None,
+    total: bool = False,
+    token: str = Depends(oauth2_scheme),
+    session_service: SessionService = Depends(Provide[Container.session_service]),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+):
+    payload = security_service.verify_token(token)
+    return await session_service.get_session_page(
+        case_id=case_id,
+        user_id=payload.get("user_id"),
+        limit=limit,
+        after=after,
+        before=before,
+        keyword=keyword,
+        total=total,
+    )
+
+
 # 특정 사례의 세션 가져오는 API
 @router.get(
     "/case/{case_id}/session/{session_id}",
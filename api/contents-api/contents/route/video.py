@@ -1,11 +1,14 @@
-from io import BytesIO
-from fastapi import APIRouter, Depends, File, UploadFile, BackgroundTasks
-from fastapi.responses import StreamingResponse, JSONResponse
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse, JSONResponse, RedirectResponse
 from fastapi.security import OAuth2PasswordBearer
 from dependency_injector.wiring import inject, Provide
 
 from contents.container import Container
+from contents.dto.delivery import DeliveryMode
+from contents.dto.video import VideoUploadRequest
 from contents.service.video import VideoManagerService
+from contents.utils.multipart_util import MultipartFileStream
 from core.service.security import SecurityService
 
 router = APIRouter()
@@ -13,11 +16,16 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/api/signin")
 
 
 # 1. encoded video download (s3에서 바로 영상 스트리밍)
+# Range 요청이면 요청한 byte만 S3에서 읽어 206으로 응답한다. (영상 탐색)
+# delivery=url/redirect이면 presigned url로 S3에서 바로 받는다. (pod 대역폭을 거치지 않음)
 @router.get("/case/{case_id}/session/{session_id}/video", tags=["video"])
 @inject
 async def download_video(
     case_id: int,
     session_id: int,
+    delivery: DeliveryMode = DeliveryMode.PROXY,
+    range: Optional[str] = Header(None),
+    if_range: Optional[str] = Header(None),
     token: str = Depends(oauth2_scheme),
     video_manager_service: VideoManagerService = Depends(
         Provide[Container.video_manager_service]
@@ -25,18 +33,85 @@ async def download_video(
     security_service: SecurityService = Depends(Provide[Container.security_service]),
 ):
     payload = security_service.verify_token(token)
-    streaming_body = await video_manager_service.download_video(case_id=case_id, session_id=session_id, user_id=payload.get("user_id"))
-    return StreamingResponse(streaming_body, media_type="video/mp4")
+    if delivery != DeliveryMode.PROXY:
+        presigned_url = await video_manager_service.get_video_presigned_url(
+            case_id=case_id, session_id=session_id, user_id=payload.get("user_id")
+        )
+        if delivery == DeliveryMode.REDIRECT:
+            return RedirectResponse(presigned_url.url, status_code=307)
+        return presigned_url
+
+    video_stream = await video_manager_service.download_video(
+        case_id=case_id,
+        session_id=session_id,
+        user_id=payload.get("user_id"),
+        range_header=range,
+        if_range=if_range,
+    )
+    return StreamingResponse(
+        video_stream.body,
+        status_code=video_stream.status_code,
+        headers=video_stream.headers,
+        media_type="video/mp4",
+    )
+
+
+# HLS adaptive bitrate 재생 (master.m3u8 -> {rendition}/index.m3u8 -> {rendition}/segment_N.ts)
+# encode-api가 hls를 만들지 않은 session은 VideoNotFound -> 1번 mp4로 재생한다.
+@router.get("/case/{case_id}/session/{session_id}/video/hls/{path:path}", tags=["video"])
+@inject
+async def download_hls(
+    case_id: int,
+    session_id: int,
+    path: str,
+    if_none_match: Optional[str] = Header(None),
+    token: str = Depends(oauth2_scheme),
+    video_manager_service: VideoManagerService = Depends(
+        Provide[Container.video_manager_service]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+):
+    payload = security_service.verify_token(token)
+    hls_stream = await video_manager_service.download_hls(
+        case_id=case_id,
+        session_id=session_id,
+        user_id=payload.get("user_id"),
+        path=path,
+        if_none_match=if_none_match,
+    )
+    return StreamingResponse(
+        hls_stream.body,
+        status_code=hls_stream.status_code,
+        headers=hls_stream.headers,
+    )
 
 
-# 2. origin video upload (s3로 바로 upload -> JSON response 201)
-@router.post("/case/{case_id}/session/{session_id}/video", tags=["video"])
+# 2. origin video upload (request body를 받는 대로 s3 multipart upload -> JSON response 201)
+# UploadFile(File(...))은 파일 전체를 임시 파일로 받은 뒤에 handler가 실행되므로,
+# request stream에서 file part를 직접 읽어 part 단위로 S3에 올린다.
+@router.post(
+    "/case/{case_id}/session/{session_id}/video",
+    tags=["video"],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["file"],
+                        "properties": {"file": {"type": "string", "format": "binary"}},
+                    }
+                }
+            },
+        }
+    },
+)
 @inject
 async def upload_video(
     case_id: int,
     session_id: int,
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(...),
+    request: Request,
     token: str = Depends(oauth2_scheme),
     video_manager_service: VideoManagerService = Depends(
         Provide[Container.video_manager_service]
@@ -45,16 +120,150 @@ async def upload_video(
 ):
     payload = security_service.verify_token(token)
 
-    file_contents = await file.read()
-    file_obj = BytesIO(file_contents)  # 메모리에 파일을 저장하는 BytesIO 객체 생성
+    file_stream = MultipartFileStream(request.headers, request.stream())
+    filename = await file_stream.start()
+
+    await video_manager_service.upload_video_stream(
+        case_id=case_id,
+        session_id=session_id,
+        user_id=payload.get("user_id"),
+        chunks=file_stream,
+        filename=filename,
+    )
+
+    return JSONResponse(status_code=201, content={"msg": "s3 upload complete!"})
+
 
-    background_tasks.add_task(
-        video_manager_service.upload_video_obj,
+# 3. resumable video upload
+# 연결이 끊겨도 처음부터 다시 올리지 않도록 part 단위로 나눠 올린다.
+# initiate -> PUT part N (part_size 크기, 병렬 가능) -> GET으로 받은 part 확인 -> complete
+@router.post("/case/{case_id}/session/{session_id}/video/upload", tags=["video"])
+@inject
+async def create_video_upload(
+    case_id: int,
+    session_id: int,
+    upload_request: VideoUploadRequest,
+    token: str = Depends(oauth2_scheme),
+    video_manager_service: VideoManagerService = Depends(
+        Provide[Container.video_manager_service]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+):
+    payload = security_service.verify_token(token)
+    video_upload = await video_manager_service.create_video_upload(
         case_id=case_id,
         session_id=session_id,
         user_id=payload.get("user_id"),
-        file_obj=file_obj,
-        filename=file.filename,
+        filename=upload_request.filename,
     )
+    return JSONResponse(status_code=201, content=video_upload.model_dump())
+
 
-    return JSONResponse(status_code=201, content={"msg": "s3 upload start!"})
+@router.put(
+    "/case/{case_id}/session/{session_id}/video/upload/{upload_id}/part/{part_number}",
+    tags=["video"],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            },
+        }
+    },
+)
+@inject
+async def upload_video_part(
+    case_id: int,
+    session_id: int,
+    upload_id: str,
+    part_number: int,
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    video_manager_service: VideoManagerService = Depends(
+        Provide[Container.video_manager_service]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+):
+    payload = security_service.verify_token(token)
+    return await video_manager_service.upload_video_part(
+        case_id=case_id,
+        session_id=session_id,
+        user_id=payload.get("user_id"),
+        upload_id=upload_id,
+        part_number=part_number,
+        chunks=request.stream(),
+    )
+
+
+@router.get(
+    "/case/{case_id}/session/{session_id}/video/upload/{upload_id}", tags=["video"]
+)
+@inject
+async def get_video_upload(
+    case_id: int,
+    session_id: int,
+    upload_id: str,
+    token: str = Depends(oauth2_scheme),
+    video_manager_service: VideoManagerService = Depends(
+        Provide[Container.video_manager_service]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+):
+    payload = security_service.verify_token(token)
+    return await video_manager_service.get_video_upload(
+        case_id=case_id,
+        session_id=session_id,
+        user_id=payload.get("user_id"),
+        upload_id=upload_id,
+    )
+
+
+@router.post(
+    "/case/{case_id}/session/{session_id}/video/upload/{upload_id}/complete",
+    tags=["video"],
+)
+@inject
+async def complete_video_upload(
+    case_id: int,
+    session_id: int,
+    upload_id: str,
+    token: str = Depends(oauth2_scheme),
+    video_manager_service: VideoManagerService = Depends(
+        Provide[Container.video_manager_service]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+):
+    payload = security_service.verify_token(token)
+    await video_manager_service.complete_video_upload(
+        case_id=case_id,
+        session_id=session_id,
+        user_id=payload.get("user_id"),
+        upload_id=upload_id,
+    )
+    return JSONResponse(status_code=201, content={"msg": "s3 upload complete!"})
+
+
+@router.delete(
+    "/case/{case_id}/session/{session_id}/video/upload/{upload_id}", tags=["video"]
+)
+@inject
+async def abort_video_upload(
+    case_id: int,
+    session_id: int,
+    upload_id: str,
+    token: str = Depends(oauth2_scheme),
+    video_manager_service: VideoManagerService = Depends(
+        Provide[Container.video_manager_service]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+):
+    payload = security_service.verify_token(token)
+    await video_manager_service.abort_video_upload(
+        case_id=case_id,
+        session_id=session_id,
+        user_id=payload.get("user_id"),
+        upload_id=upload_id,
+    )
+    return JSONResponse(status_code=200, content={"msg": "s3 upload aborted!"})
@@ -1,37 +1,45 @@
 import io
 from functools import wraps
-from object.repository.analyze_report import AnalyzeReportRepository
+from object.repository.async_object import AsyncObjectRepository
 from object.exception import DownloadFailed
 from core.repository.session import SessionRepository
 from core.repository.case import CaseRepository
+from core.service.case_authorization import CaseAuthorizationService
+from contents.dto.delivery import PresignedUrlResponse
 from contents.exception import CaseNotFound, SessionNotFound, AnalyzeReportNotFound
 
 
 class AnalyzeReportManagerService:
     def __init__(
         self,
-        analyze_report_repository: AnalyzeReportRepository,
+        analyze_report_repository: AsyncObjectRepository,
         session_repository: SessionRepository,
         case_repository: CaseRepository,
+        case_authorization: CaseAuthorizationService = None,
     ):
         self.analyze_report_repository = analyze_report_repository
         self.session_repository = session_repository
         self.case_repository = case_repository
+        # case 소유권 확인 (없으면 cache 없이 매번 확인)
+        self.case_authorization = case_authorization or CaseAuthorizationService(
+            case_repository, ttl_seconds=0
+        )
 
     def check_case_exists(func):
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
             case_id = kwargs.get("case_id")
             user_id = kwargs.get("user_id")
-            case = self.case_repository.get(case_id=case_id, user_id=user_id)
-            if not case:
+            if not await self.case_authorization.check(
+                case_id=case_id, user_id=user_id
+            ):
                 raise CaseNotFound(case_id)
             return await func(self, *args, **kwargs)
 
         return wrapper
 
     async def get_analyze_report_url(self, session_id):
-        session = self.session_repository.get(session_id)
+        session = await self.session_repository.async_get(session_id)
         if not session:
             raise SessionNotFound(session_id)
         return session.analyze_url
@@ -44,9 +52,27 @@ class AnalyzeReportManagerService:
         if not analyze_report_url:
             raise AnalyzeReportNotFound(session_id)
 
-        analyze_report_body = self.analyze_report_repository.download(
+        analyze_report_body = await self.analyze_report_repository.download(
             analyze_report_url
         )
         if not analyze_report_body:
             raise DownloadFailed(analyze_report_url)
-        return io.BytesIO(analyze_report_body.read())
+        return io.BytesIO(
+            await self.analyze_report_repository.read(analyze_report_body)
+        )
+
+    @check_case_exists
+    async def get_analyze_report_presigned_url(
+        self, case_id: int, session_id: int, user_id: int
+    ) -> PresignedUrlResponse:
+        analyze_report_url = await self.get_analyze_report_url(session_id)
+        if not analyze_report_url:
+            raise AnalyzeReportNotFound(session_id)
+        url = await self.analyze_report_repository.generate_presigned_url(
+            analyze_report_url
+        )
+        if not url:
+            raise DownloadFailed(analyze_report_url)
+        return PresignedUrlResponse(
+            url=url, expires_in=self.analyze_report_repository.presigned_url_expires
+        )
@@ -2,16 +2,20 @@ from typing import List
 import json
 from datetime import datetime
 from contents.dto.case import CaseRequest
+from contents.dto.page import CursorPage
 from contents.exception import (
     CaseNotFound,
+    InvalidCursor,
     InvalidRange,
 )
+from contents.utils.cursor_util import decode_cursor, make_cursor_page
 from core.model.domain.case import Case
 from core.model.domain.state_type import StateTypeEnum
 from core.repository.case import CaseRepository
+from core.service.case_authorization import CaseAuthorizationService
 from core.service.security import SecurityService
 from core.db.connection import ConnectionManager
-from core.db.transaction import transaction_scope
+from core.db.transaction import async_transaction_scope
 
 
 class CaseService:
@@ -20,10 +24,13 @@ class CaseService:
         case_repository: CaseRepository,
         security_service: SecurityService,
         connection_manager: ConnectionManager,
+        case_authorization: CaseAuthorizationService = None,
     ):
         self.case_repository = case_repository
+        self.case_authorization = case_authorization
         self.security_service = security_service
         self.case_per_page = 10
+        self.max_page_size = 100
         self.max_length = 0
         self.connection_manager = connection_manager
 
@@ -31,8 +38,8 @@ class CaseService:
         return datetime.now().date().strftime("%Y-%m-%d")
 
     async def add(self, user_id: int, data: CaseRequest) -> Case:
-        db_session = self.connection_manager.make_session()
-        with transaction_scope(db_session) as tx_session:
+        db_session = self.connection_manager.make_async_session()
+        async with async_transaction_scope(db_session) as tx_session:
             case = Case(
                 description=json.dumps(data.description),
                 user_id=user_id,
@@ -49,20 +56,24 @@ class CaseService:
                     }
                 )
             )
-            added_case = self.case_repository.add(case=case, db_session=tx_session)
+            added_case = await self.case_repository.async_add(
+                case=case, db_session=tx_session
+            )
 
         return added_case
 
     # TODO: Resolving Case description pydantic warning
     async def get(self, case_id: int, user_id: int = None) -> Case:
-        case = self.case_repository.get(case_id=case_id, user_id=user_id)
+        case = await self.case_repository.async_get(case_id=case_id, user_id=user_id)
         if not case:
             raise CaseNotFound(case_id)
         case.description = json.loads(case.description)
         return case
 
     async def get_page_num(self, user_id: int = None, keyword: str = None) -> int:
-        total_cases = self.case_repository.total_count(user_id, keyword=keyword)
+        total_cases = await self.case_repository.async_total_count(
+            user_id, keyword=keyword
+        )
         if total_cases == 0:
             return 1
         return (total_cases + self.case_per_page - 1) // self.case_per_page
@@ -70,7 +81,9 @@ class CaseService:
     async def range_check(
         self, skip: int, limit: int, user_id: int = None, keyword: str = None
     ) -> bool:
-        max_length = self.case_repository.total_count(user_id=user_id, keyword=keyword)
+        max_length = await self.case_repository.async_total_count(
+            user_id=user_id, keyword=keyword
+        )
         self.max_length = max_length
         if skip is None:
             skip = 0
@@ -91,14 +104,50 @@ class CaseService:
                 raise InvalidRange(0, limit - 1)
             raise InvalidRange(skip, skip + limit - 1)
 
-        case_list = self.case_repository.get_list(user_id, skip, limit, keyword)
+        case_list = await self.case_repository.async_get_list(
+            user_id, skip, limit, keyword
+        )
         for case in case_list:
             case.description = json.loads(case.description)
         return case_list
 
+    async def get_case_page(
+        self,
+        user_id: int,
+        limit: int = None,
+        after: str = None,
+        before: str = None,
+        keyword: str = None,
+        total: bool = False,
+    ) -> CursorPage[Case]:
+        # offset/range_check 없이 cursor의 id 범위로 한 page만 읽는다. (total은 요청할 때만 센다)
+        limit = limit or self.case_per_page
+        if limit < 1 or limit > self.max_page_size:
+            raise InvalidRange(0, limit - 1)
+        after_id, before_id = decode_cursor(after), decode_cursor(before)
+        if after_id is not None and before_id is not None:
+            raise InvalidCursor(before)
+
+        case_list = await self.case_repository.async_get_list_by_cursor(
+            user_id=user_id,
+            limit=limit + 1,
+            after_id=after_id,
+            before_id=before_id,
+            keyword=keyword,
+        )
+        for case in case_list:
+            case.description = json.loads(case.description)
+
+        total_count = None
+        if total:
+            total_count = await self.case_repository.async_total_count(
+                user_id=user_id, keyword=keyword
+            )
+        return make_cursor_page(case_list, limit, after_id, before_id, total_count)
+
     async def update(self, user_id: int, case_id: int, case: CaseRequest) -> Case:
-        db_session = self.connection_manager.make_session()
-        with transaction_scope(db_session) as tx_session:
+        db_session = self.connection_manager.make_async_session()
+        async with async_transaction_scope(db_session) as tx_session:
             case.updated_date = self.get_current_date()
             if case.description:
                 case = Case(
@@ -108,7 +157,7 @@ class CaseService:
             else:
                 case = Case(**case.model_dump())
 
-            result = self.case_repository.update(
+            result = await self.case_repository.async_update(
                 case_id, user_id, case=case, db_session=tx_session
             )
             if not result:
@@ -116,11 +165,14 @@ class CaseService:
         return case
 
     async def delete(self, user_id: int, case_id: int) -> bool:
-        db_session = self.connection_manager.make_session()
-        with transaction_scope(db_session) as tx_session:
-            res = self.case_repository.delete(
+        db_session = self.connection_manager.make_async_session()
+        async with async_transaction_scope(db_session) as tx_session:
+            res = await self.case_repository.async_delete(
                 case_id=case_id, user_id=user_id, db_session=tx_session
             )
             if not res:
                 raise CaseNotFound(case_id)
+        # 삭제한 case는 cache된 소유권으로 하위 API를 통과하지 않도록 지운다.
+        if self.case_authorization:
+            self.case_authorization.evict_case(case_id)
         return True
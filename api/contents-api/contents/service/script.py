@@ -1,56 +1,64 @@
 import io
 import os
 from functools import wraps
-from object.repository.script import ScriptRepository
+from object.repository.async_object import AsyncObjectRepository
 from object.exception import UploadFailed, DownloadFailed
 from core.db.connection import ConnectionManager
 from core.repository.session import SessionRepository
 from core.repository.case import CaseRepository
-from core.db.transaction import transaction_scope
+from core.service.case_authorization import CaseAuthorizationService
+from core.db.transaction import async_transaction_scope
 from core.model.domain.state_type import StateTypeEnum
+from contents.dto.delivery import PresignedUrlResponse
 from contents.exception import CaseNotFound, SessionNotFound, ScriptNotFound
 
 
 class ScriptManagerService:
     def __init__(
         self,
-        script_repository: ScriptRepository,
+        script_repository: AsyncObjectRepository,
         session_repository: SessionRepository,
         case_repository: CaseRepository,
         connection_manager: ConnectionManager,
+        case_authorization: CaseAuthorizationService = None,
     ):
         self.connection_manager = connection_manager
         self.script_repository = script_repository
         self.session_repository = session_repository
         self.case_repository = case_repository
+        # case 소유권 확인 (없으면 cache 없이 매번 확인)
+        self.case_authorization = case_authorization or CaseAuthorizationService(
+            case_repository, ttl_seconds=0
+        )
 
     def check_case_exists(func):
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
             case_id = kwargs.get("case_id")
             user_id = kwargs.get("user_id")
-            case = self.case_repository.get(case_id=case_id, user_id=user_id)
-            if not case:
+            if not await self.case_authorization.check(
+                case_id=case_id, user_id=user_id
+            ):
                 raise CaseNotFound(case_id)
             return await func(self, *args, **kwargs)
 
         return wrapper
 
     async def get_script_url(self, session_id):
-        session = self.session_repository.get(session_id)
+        session = await self.session_repository.async_get(session_id)
         if not session:
             raise SessionNotFound(session_id)
         return session.source_script_url
 
     async def update_script_url(self, session_id, script_url):
-        db_session = self.connection_manager.make_session()
-        with transaction_scope(db_session) as tx_session:
-            session = self.session_repository.get(
+        db_session = self.connection_manager.make_async_session()
+        async with async_transaction_scope(db_session) as tx_session:
+            session = await self.session_repository.async_get(
                 session_id=session_id, db_session=tx_session
             )
             session.source_script_url = script_url
             session.script_state_id = StateTypeEnum.DONE
-            res = self.session_repository.update(
+            res = await self.session_repository.async_update(
                 session_id=session_id,
                 session=session,
                 db_session=tx_session,
@@ -65,10 +73,24 @@ class ScriptManagerService:
         if not script_url:
             raise ScriptNotFound(session_id)
 
-        script_body = self.script_repository.get_json(script_url)
+        script_body = await self.script_repository.get_json(script_url)
         if not script_body:
             raise DownloadFailed(script_url)
-        return io.BytesIO(script_body.read())
+        return io.BytesIO(await self.script_repository.read(script_body))
+
+    @check_case_exists
+    async def get_script_presigned_url(
+        self, case_id: int, session_id: int, user_id: int
+    ) -> PresignedUrlResponse:
+        script_url = await self.get_script_url(session_id)
+        if not script_url:
+            raise ScriptNotFound(session_id)
+        url = await self.script_repository.generate_presigned_url(script_url)
+        if not url:
+            raise DownloadFailed(script_url)
+        return PresignedUrlResponse(
+            url=url, expires_in=self.script_repository.presigned_url_expires
+        )
 
     @check_case_exists
     async def upload_script(
@@ -76,10 +98,11 @@ class ScriptManagerService:
     ):
         env = os.getenv("PHASE", "LOCAL")
         file_path = f"{env}/{case_id}/{session_id}"
-        key_count = self.script_repository.get_object_list(file_path)["KeyCount"]
+        object_list = await self.script_repository.get_object_list(file_path)
+        key_count = object_list["KeyCount"]
         object_name = f"{file_path}/script_v{key_count+1}.json"
 
-        script_url = self.script_repository.upload_json(script, object_name)
+        script_url = await self.script_repository.upload_json(script, object_name)
         if not script_url:
             raise UploadFailed(object_name)
 
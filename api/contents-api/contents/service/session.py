@@ -2,19 +2,23 @@ from typing import List
 from datetime import datetime
 from functools import wraps
 from contents.dto.session import SessionRequest
+from contents.dto.page import CursorPage
 from contents.exception import (
     CaseNotFound,
     SessionNotFound,
+    InvalidCursor,
     InvalidRange,
 )
+from contents.utils.cursor_util import decode_cursor, make_cursor_page
 from core.model.domain.case import Case
 from core.model.domain.session import Session
 from core.model.domain.state_type import StateTypeEnum
 from core.repository.case import CaseRepository
+from core.service.case_authorization import CaseAuthorizationService
 from core.repository.session import SessionRepository
 from core.service.security import SecurityService
 from core.db.connection import ConnectionManager
-from core.db.transaction import transaction_scope
+from core.db.transaction import async_transaction_scope
 
 
 class SessionService:
@@ -24,11 +28,17 @@ class SessionService:
         case_repository: CaseRepository,
         security_service: SecurityService,
         connection_manager: ConnectionManager,
+        case_authorization: CaseAuthorizationService = None,
     ):
         self.session_repository = session_repository
         self.case_repository = case_repository
+        # case 소유권 확인 (없으면 cache 없이 매번 확인)
+        self.case_authorization = case_authorization or CaseAuthorizationService(
+            case_repository, ttl_seconds=0
+        )
         self.security_service = security_service
         self.session_per_page = 10
+        self.max_page_size = 100
         self.max_length = 0
         self.connection_manager = connection_manager
 
@@ -40,8 +50,9 @@ class SessionService:
         async def wrapper(self, *args, **kwargs):
             case_id = kwargs.get("case_id")
             user_id = kwargs.get("user_id")
-            case = self.case_repository.get(case_id=case_id, user_id=user_id)
-            if not case:
+            if not await self.case_authorization.check(
+                case_id=case_id, user_id=user_id
+            ):
                 raise CaseNotFound(case_id)
             return await func(self, *args, **kwargs)
 
@@ -49,8 +60,8 @@ class SessionService:
 
     @check_case_exists
     async def add(self, case_id: int, user_id: int, data: SessionRequest) -> Session:
-        db_session = self.connection_manager.make_session()
-        with transaction_scope(db_session) as tx_session:
+        db_session = self.connection_manager.make_async_session()
+        async with async_transaction_scope(db_session) as tx_session:
             session = data.data
             session.case_id = case_id
             session.session_state_id = StateTypeEnum.READY
@@ -59,7 +70,7 @@ class SessionService:
             session.encoding_state_id = StateTypeEnum.NONE
             session.created_date = self.get_current_date()
 
-            session = self.session_repository.add(
+            session = await self.session_repository.async_add(
                 session=session, db_session=tx_session
             )
 
@@ -67,7 +78,7 @@ class SessionService:
 
     @check_case_exists
     async def get(self, case_id: int, session_id: int, user_id: int) -> Session:
-        session = self.session_repository.get(session_id=session_id)
+        session = await self.session_repository.async_get(session_id=session_id)
         if not session:
             raise SessionNotFound(session_id)
         return session
@@ -76,7 +87,9 @@ class SessionService:
     async def get_page_num(
         self, case_id: int, user_id: int, keyword: str = None
     ) -> int:
-        total_sessions = self.session_repository.total_count(case_id, keyword=keyword)
+        total_sessions = await self.session_repository.async_total_count(
+            case_id, keyword=keyword
+        )
         if total_sessions == 0:
             return 1
         return (total_sessions + self.session_per_page - 1) // self.session_per_page
@@ -84,7 +97,7 @@ class SessionService:
     async def range_check(
         self, skip: int, limit: int, case_id: int, keyword: str = None
     ) -> List[Session]:
-        max_length = self.session_repository.total_count(
+        max_length = await self.session_repository.async_total_count(
             case_id=case_id, keyword=keyword
         )
         self.max_length = max_length
@@ -106,18 +119,52 @@ class SessionService:
             if skip is None:
                 raise InvalidRange(0, limit - 1)
             raise InvalidRange(skip, skip + limit - 1)
-        return self.session_repository.get_list(
+        return await self.session_repository.async_get_list(
             case_id=case_id, skip=skip, limit=limit, keyword=keyword
         )
 
+    @check_case_exists
+    async def get_session_page(
+        self,
+        case_id: int,
+        user_id: int,
+        limit: int = None,
+        after: str = None,
+        before: str = None,
+        keyword: str = None,
+        total: bool = False,
+    ) -> CursorPage[Session]:
+        # offset/range_check 없이 cursor의 id 범위로 한 page만 읽는다. (total은 요청할 때만 센다)
+        limit = limit or self.session_per_page
+        if limit < 1 or limit > self.max_page_size:
+            raise InvalidRange(0, limit - 1)
+        after_id, before_id = decode_cursor(after), decode_cursor(before)
+        if after_id is not None and before_id is not None:
+            raise InvalidCursor(before)
+
+        session_list = await self.session_repository.async_get_list_by_cursor(
+            case_id=case_id,
+            limit=limit + 1,
+            after_id=after_id,
+            before_id=before_id,
+            keyword=keyword,
+        )
+
+        total_count = None
+        if total:
+            total_count = await self.session_repository.async_total_count(
+                case_id=case_id, keyword=keyword
+            )
+        return make_cursor_page(session_list, limit, after_id, before_id, total_count)
+
     @check_case_exists
     async def update(
         self, case_id: int, session_id: int, user_id: int, data: SessionRequest
     ) -> Session:
-        db_session = self.connection_manager.make_session()
-        with transaction_scope(db_session) as tx_session:
+        db_session = self.connection_manager.make_async_session()
+        async with async_transaction_scope(db_session) as tx_session:
             session = data.data
-            res = self.session_repository.update(
+            res = await self.session_repository.async_update(
                 session_id=session_id,
                 session=session,
                 db_session=tx_session,
@@ -129,9 +176,9 @@ class SessionService:
 
     @check_case_exists
     async def delete(self, case_id: int, session_id: int, user_id: int) -> bool:
-        db_session = self.connection_manager.make_session()
-        with transaction_scope(db_session) as tx_session:
-            res = self.session_repository.delete(
+        db_session = self.connection_manager.make_async_session()
+        async with async_transaction_scope(db_session) as tx_session:
+            res = await self.session_repository.async_delete(
                 session_id=session_id, db_session=tx_session
             )
             if not res:
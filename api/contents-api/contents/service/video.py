@@ -1,43 +1,111 @@
 import os
+import re
+import uuid
+import hashlib
+import logging
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from functools import wraps
-from typing import IO
-from object.repository.video import VideoRepository
-from object.exception import UploadFailed, DownloadFailed
+from typing import IO, AsyncIterator, Dict
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.multipart_upload import MultipartUploader
+from object.repository.video import (
+    SOURCE_HASH_ALGORITHM,
+    format_source_hash,
+    hls_object_name,
+)
+from object.exception import (
+    UploadFailed,
+    DownloadFailed,
+    InvalidObjectRange,
+    ObjectNotModified,
+    ObjectPreconditionFailed,
+)
 from core.db.connection import ConnectionManager
 from core.repository.session import SessionRepository
 from core.repository.case import CaseRepository
-from core.db.transaction import transaction_scope
-from core.model.domain.state_type import StateTypeEnum
-from contents.exception import CaseNotFound, SessionNotFound, VideoNotFound
+from core.service.case_authorization import CaseAuthorizationService
+from core.db.transaction import async_transaction_scope
+from contents.dto.delivery import PresignedUrlResponse
+from contents.dto.video import (
+    VideoStream,
+    VideoUpload,
+    VideoUploadPart,
+    VideoUploadState,
+)
+from contents.exception import (
+    CaseNotFound,
+    SessionNotFound,
+    VideoNotFound,
+    RangeNotSatisfiable,
+    InvalidUploadRequest,
+    VideoUploadNotFound,
+)
+from contents.utils.multipart_util import read_body
+from contents.utils.range_util import parse_range, parse_if_range
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+# S3 multipart upload의 최대 part 수
+MAX_PART_NUMBER = 10000
+# encode-api가 hls/ 아래에 만드는 파일만 내려준다.
+HLS_PATH_PATTERN = re.compile(
+    r"^(master\.m3u8|[0-9A-Za-z_-]+/(index\.m3u8|segment_\d+\.ts))$"
+)
+HLS_MEDIA_TYPES = {
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".ts": "video/mp2t",
+}
+# 다시 encoding 하면 같은 경로의 playlist와 segment가 바뀌므로 짧게 cache 하고,
+# 만료된 뒤에는 ETag(If-None-Match)로 재검증하여 바뀌지 않았으면 304로 응답한다.
+HLS_CACHE_CONTROL = {
+    ".m3u8": "private, max-age=60",
+    ".ts": "private, max-age=60",
+}
+
+
+async def empty_body() -> AsyncIterator[bytes]:
+    # 304처럼 body가 없는 응답
+    return
+    yield
 
 
 class VideoManagerService:
     def __init__(
         self,
-        video_repository: VideoRepository,
+        video_repository: AsyncObjectRepository,
         session_repository: SessionRepository,
         case_repository: CaseRepository,
         connection_manager: ConnectionManager,
+        video_uploader: MultipartUploader = None,
+        case_authorization: CaseAuthorizationService = None,
     ):
         self.connection_manager = connection_manager
         self.video_repository = video_repository
+        self.video_uploader = video_uploader
         self.session_repository = session_repository
         self.case_repository = case_repository
+        # case 소유권 확인 (없으면 cache 없이 매번 확인)
+        self.case_authorization = case_authorization or CaseAuthorizationService(
+            case_repository, ttl_seconds=0
+        )
 
     def check_case_exists(func):
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
             case_id = kwargs.get("case_id")
             user_id = kwargs.get("user_id")
-            case = self.case_repository.get(case_id=case_id, user_id=user_id)
-            if not case:
+            if not await self.case_authorization.check(
+                case_id=case_id, user_id=user_id
+            ):
                 raise CaseNotFound(case_id)
             return await func(self, *args, **kwargs)
 
         return wrapper
     
     async def get_encoded_video_url(self, session_id: int):
-        session = self.session_repository.get(session_id)
+        session = await self.session_repository.async_get(session_id)
         if not session:
             raise SessionNotFound(session_id)
         return session.encoding_video_url
@@ -54,35 +122,149 @@ class VideoManagerService:
             raise SessionNotFound(session_id)
         return session.source_video_url
 
-    async def update_origin_video_url(self, session_id, origin_video_url: str):
-        db_session = self.connection_manager.make_session()
+    # origin_video_hash: upload 하면서 계산한 원본 content hash
+    # (없으면 encode-api가 S3에서 읽어 계산하고, 같은 원본의 encoding 결과를 재사용한다)
+    async def update_origin_video_url(
+        self, session_id, origin_video_url: str, origin_video_hash: str = None
+    ):
+        db_session = self.connection_manager.make_async_session()
 
-        with transaction_scope(db_session) as tx_session:
-            session = self.session_repository.get(
-                session_id=session_id, db_session=tx_session
-            )
-            session.origin_video_url = origin_video_url
-            session.encoding_state_id = StateTypeEnum.READY
-            res = self.session_repository.update(
+        async with async_transaction_scope(db_session) as tx_session:
+            res = await self.session_repository.async_update_origin_video(
                 session_id=session_id,
-                session=session,
+                origin_video_url=origin_video_url,
+                origin_video_hash=origin_video_hash,
                 db_session=tx_session,
             )
             if not res:
                 raise SessionNotFound(session_id)
         return origin_video_url
 
+    def make_video_headers(self, video: Dict) -> Dict[str, str]:
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Length": str(video["ContentLength"]),
+        }
+        if video.get("ContentRange"):
+            headers["Content-Range"] = video["ContentRange"]
+        if video.get("ETag"):
+            headers["ETag"] = video["ETag"]
+        if video.get("LastModified"):
+            # boto3는 dateutil tzutc로 주므로 usegmt가 요구하는 timezone.utc로 바꾼다.
+            headers["Last-Modified"] = format_datetime(
+                video["LastModified"].astimezone(timezone.utc), usegmt=True
+            )
+        return headers
+
+    async def get_video_range(
+        self, session_id: int, encoded_video_url: str, byte_range: str, if_range: str
+    ):
+        # Range는 S3 ranged GET으로, If-Range는 S3 조건(IfMatch 등)으로 넘긴다.
+        conditions = parse_if_range(if_range)
+        if conditions is None:
+            return None
+        try:
+            return await self.video_repository.get_object(
+                encoded_video_url, byte_range=byte_range, **conditions
+            )
+        except ObjectPreconditionFailed:
+            # If-Range가 맞지 않으면 영상이 바뀐 것이므로 전체를 보낸다.
+            return None
+        except InvalidObjectRange:
+            video = await self.video_repository.head_object(encoded_video_url)
+            raise RangeNotSatisfiable(
+                session_id, video["ContentLength"] if video else None
+            )
+
     @check_case_exists
-    async def download_video(self, case_id: int, session_id: int, user_id: int):
+    async def download_video(
+        self,
+        case_id: int,
+        session_id: int,
+        user_id: int,
+        range_header: str = None,
+        if_range: str = None,
+    ) -> VideoStream:
         encoded_video_url = await self.get_encoded_video_url(session_id)
         if not encoded_video_url:
             raise VideoNotFound(session_id)
-        video = self.video_repository.get_object(encoded_video_url)
+
+        video = None
+        byte_range = parse_range(range_header)
+        if byte_range:
+            video = await self.get_video_range(
+                session_id, encoded_video_url, byte_range, if_range
+            )
+        if not video:
+            video = await self.video_repository.get_object(encoded_video_url)
         if not video:
             raise DownloadFailed(encoded_video_url)
-        return video["Body"]
+
+        return VideoStream(
+            body=self.video_repository.iter_chunks(video["Body"]),
+            status_code=206 if video.get("ContentRange") else 200,
+            headers=self.make_video_headers(video),
+        )
     
 
+    @check_case_exists
+    async def get_video_presigned_url(
+        self, case_id: int, session_id: int, user_id: int
+    ) -> PresignedUrlResponse:
+        encoded_video_url = await self.get_encoded_video_url(session_id)
+        if not encoded_video_url:
+            raise VideoNotFound(session_id)
+        url = await self.video_repository.generate_presigned_url(encoded_video_url)
+        if not url:
+            raise DownloadFailed(encoded_video_url)
+        return PresignedUrlResponse(
+            url=url, expires_in=self.video_repository.presigned_url_expires
+        )
+
+    # HLS master/rendition playlist와 segment (playlist 안의 경로는 이 path 기준 상대 경로)
+    @check_case_exists
+    async def download_hls(
+        self,
+        case_id: int,
+        session_id: int,
+        user_id: int,
+        path: str,
+        if_none_match: str = None,
+    ) -> VideoStream:
+        if not HLS_PATH_PATTERN.match(path):
+            raise VideoNotFound(session_id)
+        encoded_video_url = await self.get_encoded_video_url(session_id)
+        if not encoded_video_url:
+            raise VideoNotFound(session_id)
+
+        extension = os.path.splitext(path)[1]
+        try:
+            hls = await self.video_repository.get_object(
+                hls_object_name(encoded_video_url, path), if_none_match=if_none_match
+            )
+        except ObjectNotModified:
+            return VideoStream(
+                body=empty_body(),
+                status_code=304,
+                headers={
+                    "ETag": if_none_match,
+                    "Cache-Control": HLS_CACHE_CONTROL[extension],
+                },
+            )
+        if not hls:
+            raise VideoNotFound(session_id)
+
+        headers = self.make_video_headers(hls)
+        # Range는 받지 않는다. (segment가 작아 통째로 내려준다)
+        headers.pop("Accept-Ranges")
+        headers["Content-Type"] = HLS_MEDIA_TYPES[extension]
+        headers["Cache-Control"] = HLS_CACHE_CONTROL[extension]
+        return VideoStream(
+            body=self.video_repository.iter_chunks(hls["Body"]),
+            status_code=200,
+            headers=headers,
+        )
+
     @check_case_exists
     async def upload_video_obj(
         self,
@@ -94,8 +276,182 @@ class VideoManagerService:
     ):
         env = os.getenv("PHASE", "LOCAL")
         file_path = f"{env}/{case_id}/{session_id}/"
-        url_result = self.video_repository.upload_obj(file_obj, file_path + filename)
+        url_result = await self.video_repository.upload_obj(file_obj, file_path + filename)
+        if not url_result:
+            raise UploadFailed(filename)
+        updated_res = await self.update_origin_video_url(session_id, url_result)
+        return updated_res
+
+    # request body를 받는 대로 S3 multipart upload로 올린다. (파일 전체를 메모리에 올리지 않음)
+    @check_case_exists
+    async def upload_video_stream(
+        self,
+        case_id: int,
+        session_id: int,
+        user_id: int,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+    ):
+        # upload가 끝난 뒤에 실패하지 않도록 session을 먼저 확인한다.
+        if not await self.session_repository.async_get(session_id):
+            raise SessionNotFound(session_id)
+
+        env = os.getenv("PHASE", "LOCAL")
+        object_name = f"{env}/{case_id}/{session_id}/{filename}"
+
+        def on_progress(uploaded_bytes: int, part_count: int):
+            logger.info(
+                f"Uploading video '{object_name}': {part_count} parts, {uploaded_bytes} bytes"
+            )
+
+        # S3로 흘려보내는 chunk로 원본 content hash를 같이 계산한다.
+        hasher = hashlib.new(SOURCE_HASH_ALGORITHM)
+
+        async def hash_chunks():
+            async for chunk in chunks:
+                hasher.update(chunk)
+                yield chunk
+
+        url_result = await self.video_uploader.upload(
+            hash_chunks(), object_name, on_progress=on_progress
+        )
         if not url_result:
             raise UploadFailed(filename)
+        updated_res = await self.update_origin_video_url(
+            session_id, url_result, origin_video_hash=format_source_hash(hasher)
+        )
+        return updated_res
+
+    # resumable upload: initiate -> part N upload -> 받은 part 조회 -> complete
+    # upload 상태는 S3에 저장하므로 어느 pod에서든 이어서 올릴 수 있고,
+    # 연결이 끊기면 받은 part를 조회해서 빠진 part만 다시 올리면 된다.
+    @check_case_exists
+    async def create_video_upload(
+        self, case_id: int, session_id: int, user_id: int, filename: str
+    ) -> VideoUpload:
+        if not await self.session_repository.async_get(session_id):
+            raise SessionNotFound(session_id)
+
+        env = os.getenv("PHASE", "LOCAL")
+        object_name = f"{env}/{case_id}/{session_id}/{filename}"
+        s3_upload_id = await self.video_repository.create_multipart_upload(
+            object_name
+        )
+        if not s3_upload_id:
+            raise UploadFailed(filename)
+
+        state = VideoUploadState(
+            upload_id=uuid.uuid4().hex,
+            s3_upload_id=s3_upload_id,
+            object_name=object_name,
+            filename=filename,
+            case_id=case_id,
+            session_id=session_id,
+            part_size=self.video_uploader.part_size,
+            created_time=datetime.now(),
+        )
+        if not await self.video_repository.put_upload_state(
+            state.upload_id, state.model_dump(mode="json")
+        ):
+            await self.video_repository.abort_multipart_upload(
+                object_name, s3_upload_id
+            )
+            raise UploadFailed(filename)
+        return VideoUpload(
+            upload_id=state.upload_id, filename=filename, part_size=state.part_size
+        )
+
+    async def get_upload_state(
+        self, case_id: int, session_id: int, upload_id: str
+    ) -> VideoUploadState:
+        if not UPLOAD_ID_PATTERN.match(upload_id):
+            raise VideoUploadNotFound(upload_id)
+        state = await self.video_repository.get_upload_state(upload_id)
+        if not state:
+            raise VideoUploadNotFound(upload_id)
+        state = VideoUploadState(**state)
+        if state.case_id != case_id or state.session_id != session_id:
+            raise VideoUploadNotFound(upload_id)
+        return state
+
+    async def get_upload_parts(self, state: VideoUploadState):
+        parts = await self.video_repository.list_parts(
+            state.object_name, state.s3_upload_id
+        )
+        if parts is None:
+            # S3에서 multipart upload가 정리(abort, lifecycle)된 경우
+            raise VideoUploadNotFound(state.upload_id)
+        return [
+            VideoUploadPart(
+                part_number=part["PartNumber"], etag=part["ETag"], size=part["Size"]
+            )
+            for part in parts
+        ]
+
+    @check_case_exists
+    async def upload_video_part(
+        self,
+        case_id: int,
+        session_id: int,
+        user_id: int,
+        upload_id: str,
+        part_number: int,
+        chunks: AsyncIterator[bytes],
+    ) -> VideoUploadPart:
+        state = await self.get_upload_state(case_id, session_id, upload_id)
+        if not 1 <= part_number <= MAX_PART_NUMBER:
+            raise InvalidUploadRequest(f"Invalid part number {part_number}")
+
+        data = await read_body(chunks, state.part_size)
+        etag = await self.video_uploader.upload_part(
+            state.object_name, state.s3_upload_id, part_number, data
+        )
+        if not etag:
+            raise UploadFailed(f"{state.filename} (part {part_number})")
+        return VideoUploadPart(part_number=part_number, etag=etag, size=len(data))
+
+    @check_case_exists
+    async def get_video_upload(
+        self, case_id: int, session_id: int, user_id: int, upload_id: str
+    ) -> VideoUpload:
+        state = await self.get_upload_state(case_id, session_id, upload_id)
+        return VideoUpload(
+            upload_id=state.upload_id,
+            filename=state.filename,
+            part_size=state.part_size,
+            parts=await self.get_upload_parts(state),
+        )
+
+    @check_case_exists
+    async def complete_video_upload(
+        self, case_id: int, session_id: int, user_id: int, upload_id: str
+    ):
+        state = await self.get_upload_state(case_id, session_id, upload_id)
+        parts = await self.get_upload_parts(state)
+        part_numbers = [part.part_number for part in parts]
+        if not parts or part_numbers != list(range(1, len(parts) + 1)):
+            # 빠진 part가 있으면 영상이 깨지므로 complete하지 않는다.
+            raise InvalidUploadRequest("Parts must be numbered 1 to N without gaps")
+
+        url_result = await self.video_repository.complete_multipart_upload(
+            state.object_name,
+            state.s3_upload_id,
+            [{"PartNumber": part.part_number, "ETag": part.etag} for part in parts],
+        )
+        if not url_result:
+            # upload는 그대로 두어 part를 다시 올리고 complete를 재시도할 수 있게 한다.
+            raise UploadFailed(state.filename)
+        await self.video_repository.delete_upload_state(upload_id)
         updated_res = await self.update_origin_video_url(session_id, url_result)
-        return updated_res
\ No newline at end of file
+        return updated_res
+
+    @check_case_exists
+    async def abort_video_upload(
+        self, case_id: int, session_id: int, user_id: int, upload_id: str
+    ):
+        state = await self.get_upload_state(case_id, session_id, upload_id)
+        await self.video_repository.abort_multipart_upload(
+            state.object_name, state.s3_upload_id
+        )
+        await self.video_repository.delete_upload_state(upload_id)
+        return upload_id
@@ -0,0 +1,53 @@
+import base64
+import json
+from typing import List, Optional
+
+from contents.dto.page import CursorPage
+from contents.exception import InvalidCursor
+
+
+def encode_cursor(id: int) -> str:
+    # client는 cursor를 그대로 돌려주기만 한다. (id 외의 정렬 기준이 생겨도 형식을 바꿀 수 있도록)
+    data = json.dumps({"id": id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[int]:
+    if not cursor:
+        return None
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        id = json.loads(data)["id"]
+    except Exception:
+        raise InvalidCursor(cursor)
+    if not isinstance(id, int) or isinstance(id, bool):
+        raise InvalidCursor(cursor)
+    return id
+
+
+def make_cursor_page(
+    rows: List,
+    limit: int,
+    after_id: int = None,
+    before_id: int = None,
+    total_count: int = None,
+) -> CursorPage:
+    """
+    id 내림차순으로 limit + 1개까지 읽은 rows로 page를 만든다.
+    limit개보다 많이 읽혔으면 그 방향으로 page가 더 있다.
+    """
+    has_more = len(rows) > limit
+    if before_id is not None:
+        # before 방향은 before_id에 가까운 limit개(목록의 뒤쪽)가 이번 page
+        items = rows[len(rows) - limit :] if has_more else rows
+        has_next, has_prev = True, has_more
+    else:
+        items = rows[:limit]
+        has_next, has_prev = has_more, after_id is not None
+
+    return CursorPage(
+        items=items,
+        next_cursor=encode_cursor(items[-1].id) if items and has_next else None,
+        prev_cursor=encode_cursor(items[0].id) if items and has_prev else None,
+        total_count=total_count,
+    )
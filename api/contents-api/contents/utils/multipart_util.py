@@ -0,0 +1,137 @@
+from collections import deque
+from typing import AsyncIterator, Mapping
+
+import multipart
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import parse_options_header
+
+from contents.exception import InvalidUploadRequest
+
+
+class MultipartFileStream:
+    """
+    multipart/form-data request body에서 file field 하나를 chunk 단위로 꺼낸다.
+    request.form()(UploadFile)과 달리 파일 전체를 메모리나 임시 파일에 모으지 않고,
+    읽은 request chunk만큼만 parsing해서 넘겨준다.
+
+        file_stream = MultipartFileStream(request.headers, request.stream())
+        filename = await file_stream.start()  # file part의 header까지 읽는다
+        async for chunk in file_stream:
+            ...
+    """
+
+    def __init__(
+        self,
+        headers: Mapping[str, str],
+        body: AsyncIterator[bytes],
+        field_name: str = "file",
+    ):
+        content_type, params = parse_options_header(headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise InvalidUploadRequest("Content-Type must be multipart/form-data")
+
+        self.body = body.__aiter__()
+        self.field_name = field_name
+        self.filename = None
+        self.chunks = deque()
+        self.in_file = False
+        self.file_done = False
+        self.body_done = False
+        self.header_field = b""
+        self.header_value = b""
+        self.headers = {}
+        self.parser = multipart.MultipartParser(
+            params[b"boundary"],
+            {
+                "on_part_begin": self.on_part_begin,
+                "on_header_field": self.on_header_field,
+                "on_header_value": self.on_header_value,
+                "on_header_end": self.on_header_end,
+                "on_headers_finished": self.on_headers_finished,
+                "on_part_data": self.on_part_data,
+                "on_part_end": self.on_part_end,
+            },
+        )
+
+    def on_part_begin(self):
+        self.headers = {}
+
+    # header 이름과 값은 request chunk 경계에서 여러 번에 나눠 들어올 수 있다.
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self.header_value += data[start:end]
+
+    def on_header_end(self):
+        self.headers[self.header_field.lower()] = self.header_value
+        self.header_field = b""
+        self.header_value = b""
+
+    def on_headers_finished(self):
+        _, options = parse_options_header(self.headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("latin-1")
+        if self.filename is None and name == self.field_name and b"filename" in options:
+            self.filename = decode_filename(options[b"filename"])
+            self.in_file = True
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        if self.in_file:
+            self.chunks.append(data[start:end])
+
+    def on_part_end(self):
+        if self.in_file:
+            self.in_file = False
+            self.file_done = True
+
+    async def feed(self):
+        # request body chunk 하나를 parser에 넣는다.
+        try:
+            chunk = await self.body.__anext__()
+        except StopAsyncIteration:
+            self.body_done = True
+            chunk = None
+        try:
+            if chunk:
+                self.parser.write(chunk)
+            elif self.body_done:
+                self.parser.finalize()
+        except MultipartParseError as e:
+            raise InvalidUploadRequest(str(e))
+
+    async def start(self) -> str:
+        while self.filename is None:
+            if self.body_done:
+                raise InvalidUploadRequest(f"No file in field '{self.field_name}'")
+            await self.feed()
+        return self.filename
+
+    async def __aiter__(self):
+        await self.start()
+        while True:
+            while self.chunks:
+                yield self.chunks.popleft()
+            if self.file_done:
+                return
+            if self.body_done:
+                raise InvalidUploadRequest(
+                    "Request body ended in the middle of the file"
+                )
+            await self.feed()
+
+
+def decode_filename(value: bytes) -> str:
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return value.decode("latin-1")
+
+
+async def read_body(body: AsyncIterator[bytes], max_size: int) -> bytes:
+    # part 하나(최대 max_size)를 메모리로 읽는다. 더 크면 읽기를 멈추고 거절한다.
+    data = bytearray()
+    async for chunk in body:
+        data += chunk
+        if len(data) > max_size:
+            raise InvalidUploadRequest(f"Part is larger than {max_size} bytes")
+    return bytes(data)
@@ -0,0 +1,36 @@
+import re
+from typing import Dict, Optional
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(range_header: str) -> Optional[str]:
+    """
+    HTTP Range header를 S3 get_object의 Range로 넘길 단일 byte range로 정리한다.
+    여러 range나 형식이 잘못된 range는 무시(None)하고 전체를 보낸다. (RFC 7233)
+    """
+    if not range_header:
+        return None
+    match = RANGE_PATTERN.match(range_header.replace(" ", "").lower())
+    if not match:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if start and end and int(start) > int(end):
+        return None
+    return f"bytes={start}-{end}"
+
+
+def parse_if_range(if_range: str) -> Optional[Dict[str, str]]:
+    """
+    If-Range를 S3 get_object의 조건(if_match / if_unmodified_since)으로 바꾼다.
+    weak ETag는 If-Range에서 항상 불일치이므로 None(range 무시)을 돌려준다.
+    """
+    if not if_range:
+        return {}
+    if if_range.startswith("W/"):
+        return None
+    if if_range.startswith('"'):
+        return {"if_match": if_range}
+    return {"if_unmodified_since": if_range}
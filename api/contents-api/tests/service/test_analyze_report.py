@@ -16,11 +16,14 @@ from contents.service.analyze_report import AnalyzeReportManagerService
 class TestAnalyzeReportManagerService(unittest.TestCase):
     def SetUp(self):
         self.analyze_report_repository = AsyncMock(spec=AnalyzeReportRepository)
+        self.analyze_report_repository.read = AsyncMock(
+            side_effect=lambda body: body.read()
+        )
         self.session_repository = AsyncMock(spec=SessionRepository)
         self.case_repository = AsyncMock(spec=CaseRepository)
         self.connection_manager = AsyncMock(spec=ConnectionManager)
         self.db_session = AsyncMock(spec=Session)
-        self.connection_manager.make_session.return_value = self.db_session
+        self.connection_manager.make_async_session.return_value = self.db_session
         self.analyze_report_manager_service = AnalyzeReportManagerService(
             self.analyze_report_repository,
             self.session_repository,
@@ -44,14 +47,14 @@ class TestAnalyzeReportManagerService(unittest.TestCase):
             encoding_video_url="1/1/encoded_video.mp4",
             analyze_url="1/1/analyze_report_v1.json",
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         self.assertEqual(
             await self.analyze_report_manager_service.get_analyze_report_url(1),
             "1/1/analyze_report_v1.json",
         )
 
     async def test_get_analyze_report_url_not_found(self):
-        self.session_repository.get.return_value = None
+        self.session_repository.async_get.return_value = None
         with self.assertRaises(SessionNotFound):
             await self.analyze_report_manager_service.get_analyze_report_url(1)
 
@@ -21,7 +21,7 @@ class TestCaseService(unittest.TestCase):
         self.security_service = AsyncMock(spec=SecurityService)
         self.connection_manager = AsyncMock(spec=ConnectionManager)
         self.db_session = AsyncMock(spec=Session)
-        self.connection_manager.make_session.return_value = self.db_session
+        self.connection_manager.make_async_session.return_value = self.db_session
         self.case_service = CaseService(
             case_repository=self.case_repository,
             security_service=self.security_service,
@@ -49,7 +49,7 @@ class TestCaseService(unittest.TestCase):
             session_count=0,
             case_state_id=1,
         )
-        self.case_repository.add.return_value = case
+        self.case_repository.async_add.return_value = case
         result = await self.case_service.add(user_id, case_request)
         self.assertEqual(result, case)
         self.db_session.commit.assert_called_once()
@@ -69,14 +69,14 @@ class TestCaseService(unittest.TestCase):
             updated_date="2024-01-01",
             case_state_id=2,
         )
-        self.case_repository.get.return_value = case
+        self.case_repository.async_get.return_value = case
         result = await self.case_service.get(case_id, user_id)
         self.assertEqual(result, case)
 
     async def test_get_case_not_found(self):
         case_id = 1
         user_id = 1
-        self.case_repository.get.return_value = None
+        self.case_repository.async_get.return_value = None
         with self.assertRaises(CaseNotFound) as e:
             await self.case_service.get(case_id, user_id)
         self.assertEqual(e.exception.case_id, case_id)
@@ -84,7 +84,7 @@ class TestCaseService(unittest.TestCase):
     async def test_get_page_num(self):
         user_id = 1
         keyword = "keyword"
-        self.case_repository.total_count.return_value = 10
+        self.case_repository.async_total_count.return_value = 10
         result = await self.case_service.get_page_num(user_id, keyword)
         self.assertEqual(result, 1)
 
@@ -93,7 +93,7 @@ class TestCaseService(unittest.TestCase):
         limit = 10
         user_id = 1
         keyword = "keyword"
-        self.case_repository.total_count.return_value = 10
+        self.case_repository.async_total_count.return_value = 10
         result = await self.case_service.range_check(skip, limit, user_id, keyword)
         self.assertTrue(result)
 
@@ -102,7 +102,7 @@ class TestCaseService(unittest.TestCase):
         limit = 11
         user_id = 1
         keyword = "keyword"
-        self.case_repository.total_count.return_value = 10
+        self.case_repository.async_total_count.return_value = 10
         result = await self.case_service.range_check(skip, limit, user_id, keyword)
         self.assertFalse(result)
 
@@ -122,7 +122,7 @@ class TestCaseService(unittest.TestCase):
             case_state_id=2,
         )
         self.case_repository.range_check.return_value = True
-        self.case_repository.get_list.return_value = [case] * (limit - skip)
+        self.case_repository.async_get_list.return_value = [case] * (limit - skip)
         result = await self.case_service.get_case_list(skip, limit, user_id, keyword)
         self.assertEqual(len(result), limit - skip)
 
@@ -160,7 +160,7 @@ class TestCaseService(unittest.TestCase):
             updated_date=self.case_service.get_current_date(),
             case_state_id=3,
         )
-        self.case_repository.update.return_value = case
+        self.case_repository.async_update.return_value = case
         result = await self.case_service.update(user_id, case_id, case_request)
         self.assertTrue(result)
         self.db_session.commit.assert_called_once()
@@ -180,7 +180,7 @@ class TestCaseService(unittest.TestCase):
             updated_date="2024-01-01",
             case_state_id=3,
         )
-        self.case_repository.get.return_value = False
+        self.case_repository.async_get.return_value = False
         with self.assertRaises(CaseNotFound) as e:
             await self.case_service.update(user_id, case_id, case_request)
             self.db_session.commit.assert_not_called()
@@ -201,7 +201,7 @@ class TestCaseService(unittest.TestCase):
             updated_date="2024-01-01",
             case_state_id=2,
         )
-        self.case_repository.get.return_value = case
+        self.case_repository.async_get.return_value = case
         result = await self.case_service.delete(user_id, case_id)
         self.assertTrue(result)
         self.db_session.commit.assert_called_once()
@@ -211,7 +211,7 @@ class TestCaseService(unittest.TestCase):
     async def test_delete_case_not_found(self):
         user_id = 1
         case_id = 1
-        self.case_repository.get.return_value = None
+        self.case_repository.async_get.return_value = None
         with self.assertRaises(CaseNotFound) as e:
             await self.case_service.delete(user_id, case_id)
             self.db_session.commit.assert_not_called()
@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from contents.exception import CaseNotFound, InvalidCursor, InvalidRange
+from contents.service.case import CaseService
+from contents.service.session import SessionService
+from contents.utils.cursor_util import decode_cursor, encode_cursor
+from core.model.domain.case import Case
+from core.repository.case import CaseRepository
+from core.repository.session import SessionRepository
+from core.service.security import SecurityService
+from core.db.connection import ConnectionManager
+
+
+def make_case(id: int) -> Case:
+    return Case(
+        id=id,
+        given_name="name",
+        family_name=None,
+        description='{"age": 6}',
+        user_id=1,
+        session_count=0,
+        start_date="2024-01-01",
+        updated_date="2024-01-01",
+    )
+
+
+class TestCursorPagination(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.case_repository = AsyncMock(spec=CaseRepository)
+        self.session_repository = AsyncMock(spec=SessionRepository)
+        self.case_service = CaseService(
+            case_repository=self.case_repository,
+            security_service=MagicMock(spec=SecurityService),
+            connection_manager=MagicMock(spec=ConnectionManager),
+        )
+        self.session_service = SessionService(
+            session_repository=self.session_repository,
+            case_repository=self.case_repository,
+            security_service=MagicMock(spec=SecurityService),
+            connection_manager=MagicMock(spec=ConnectionManager),
+        )
+
+    async def test_get_case_page(self):
+        self.case_repository.async_get_list_by_cursor.return_value = [
+            make_case(id) for id in (9, 8, 7)
+        ]
+
+        page = await self.case_service.get_case_page(
+            user_id=1, limit=2, after=encode_cursor(10)
+        )
+
+        # limit + 1개를 읽어 다음 page가 있는지 확인한다. (total_count는 세지 않는다)
+        self.case_repository.async_get_list_by_cursor.assert_awaited_once_with(
+            user_id=1, limit=3, after_id=10, before_id=None, keyword=None
+        )
+        self.case_repository.async_total_count.assert_not_called()
+        self.assertEqual([case.id for case in page.items], [9, 8])
+        self.assertEqual(page.items[0].description, {"age": 6})
+        self.assertEqual(decode_cursor(page.next_cursor), 8)
+        self.assertEqual(decode_cursor(page.prev_cursor), 9)
+        self.assertIsNone(page.total_count)
+
+    async def test_get_case_page_total(self):
+        self.case_repository.async_get_list_by_cursor.return_value = []
+        self.case_repository.async_total_count.return_value = 0
+
+        page = await self.case_service.get_case_page(user_id=1, total=True)
+
+        self.case_repository.async_get_list_by_cursor.assert_awaited_once_with(
+            user_id=1, limit=11, after_id=None, before_id=None, keyword=None
+        )
+        self.assertEqual(page.total_count, 0)
+
+    async def test_get_case_page_invalid(self):
+        with self.assertRaises(InvalidRange):
+            await self.case_service.get_case_page(user_id=1, limit=101)
+        with self.assertRaises(InvalidCursor):
+            await self.case_service.get_case_page(user_id=1, after="invalid")
+        with self.assertRaises(InvalidCursor):
+            await self.case_service.get_case_page(
+                user_id=1, after=encode_cursor(1), before=encode_cursor(2)
+            )
+        self.case_repository.async_get_list_by_cursor.assert_not_called()
+
+    async def test_get_session_page(self):
+        self.case_repository.async_exists.return_value = True
+        self.session_repository.async_get_list_by_cursor.return_value = []
+        self.session_repository.async_total_count.return_value = 3
+
+        page = await self.session_service.get_session_page(
+            case_id=1, user_id=1, limit=5, before=encode_cursor(4), total=True
+        )
+
+        self.session_repository.async_get_list_by_cursor.assert_awaited_once_with(
+            case_id=1, limit=6, after_id=None, before_id=4, keyword=None
+        )
+        self.assertEqual(page.items, [])
+        self.assertEqual(page.total_count, 3)
+
+    async def test_get_session_page_case_not_found(self):
+        self.case_repository.async_exists.return_value = False
+
+        with self.assertRaises(CaseNotFound):
+            await self.session_service.get_session_page(case_id=1, user_id=2)
+        self.session_repository.async_get_list_by_cursor.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+from object.exception import DownloadFailed
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.video import VideoRepository
+from object.repository.script import ScriptRepository
+from core.repository.session import SessionRepository
+from core.repository.case import CaseRepository
+from core.db.connection import ConnectionManager
+from core.model.domain.session import Session as SessionDomain
+from core.model.domain.state_type import StateTypeEnum
+from contents.dto.delivery import PresignedUrlResponse
+from contents.exception import CaseNotFound, ScriptNotFound, VideoNotFound
+from contents.service.video import VideoManagerService
+from contents.service.script import ScriptManagerService
+
+
+class TestPresignedUrl(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.video_repository = MagicMock(spec=VideoRepository)
+        self.video_repository.presigned_url_expires = 300
+        self.script_repository = MagicMock(spec=ScriptRepository)
+        self.script_repository.presigned_url_expires = 60
+        self.session_repository = AsyncMock(spec=SessionRepository)
+        self.case_repository = AsyncMock(spec=CaseRepository)
+        self.video_manager_service = VideoManagerService(
+            AsyncObjectRepository(self.video_repository, self.executor),
+            self.session_repository,
+            self.case_repository,
+            MagicMock(spec=ConnectionManager),
+        )
+        self.script_manager_service = ScriptManagerService(
+            AsyncObjectRepository(self.script_repository, self.executor),
+            self.session_repository,
+            self.case_repository,
+            MagicMock(spec=ConnectionManager),
+        )
+        self.session_repository.async_get.return_value = SessionDomain(
+            id=1,
+            name="test",
+            session_state_id=StateTypeEnum.READY,
+            case_id=1,
+            script_state_id=StateTypeEnum.DONE,
+            analyze_state_id=StateTypeEnum.NONE,
+            encoding_state_id=StateTypeEnum.DONE,
+            created_date="2024-01-01",
+            encoding_video_url="1/1/encoded_video.mp4",
+            source_script_url="1/1/script_v1.json",
+        )
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_get_video_presigned_url(self):
+        self.video_repository.generate_presigned_url.return_value = "https://s3/video"
+
+        result = await self.video_manager_service.get_video_presigned_url(
+            case_id=1, session_id=1, user_id=1
+        )
+
+        self.video_repository.generate_presigned_url.assert_called_once_with(
+            "1/1/encoded_video.mp4"
+        )
+        self.assertEqual(
+            result, PresignedUrlResponse(url="https://s3/video", expires_in=300)
+        )
+
+    async def test_get_video_presigned_url_not_encoded(self):
+        self.session_repository.async_get.return_value.encoding_video_url = None
+
+        with self.assertRaises(VideoNotFound):
+            await self.video_manager_service.get_video_presigned_url(
+                case_id=1, session_id=1, user_id=1
+            )
+        self.video_repository.generate_presigned_url.assert_not_called()
+
+    async def test_get_video_presigned_url_failed(self):
+        self.video_repository.generate_presigned_url.return_value = None
+
+        with self.assertRaises(DownloadFailed):
+            await self.video_manager_service.get_video_presigned_url(
+                case_id=1, session_id=1, user_id=1
+            )
+
+    async def test_get_video_presigned_url_case_not_found(self):
+        self.case_repository.async_exists.return_value = False
+
+        with self.assertRaises(CaseNotFound):
+            await self.video_manager_service.get_video_presigned_url(
+                case_id=1, session_id=1, user_id=2
+            )
+        self.video_repository.generate_presigned_url.assert_not_called()
+
+    async def test_get_script_presigned_url(self):
+        self.script_repository.generate_presigned_url.return_value = "https://s3/script"
+
+        result = await self.script_manager_service.get_script_presigned_url(
+            case_id=1, session_id=1, user_id=1
+        )
+
+        self.script_repository.generate_presigned_url.assert_called_once_with(
+            "1/1/script_v1.json"
+        )
+        self.assertEqual(
+            result, PresignedUrlResponse(url="https://s3/script", expires_in=60)
+        )
+
+    async def test_get_script_presigned_url_not_found(self):
+        self.session_repository.async_get.return_value.source_script_url = None
+
+        with self.assertRaises(ScriptNotFound):
+            await self.script_manager_service.get_script_presigned_url(
+                case_id=1, session_id=1, user_id=1
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,7 @@ from object.exception import UploadFailed, DownloadFailed
 from core.db.connection import ConnectionManager
 from core.repository.session import SessionRepository
 from core.repository.case import CaseRepository
-from core.db.transaction import transaction_scope
+from core.db.transaction import async_transaction_scope
 from core.model.domain.session import Session as SessionDomain
 from core.model.domain.state_type import StateTypeEnum
 from contents.exception import CaseNotFound, SessionNotFound, ScriptNotFound
@@ -19,11 +19,12 @@ from contents.service.script import ScriptManagerService
 class TestScriptService(unittest.TestCase):
     def SetUp(self):
         self.script_repository = AsyncMock(spec=ScriptRepository)
+        self.script_repository.read = AsyncMock(side_effect=lambda body: body.read())
         self.session_repository = AsyncMock(spec=SessionRepository)
         self.case_repository = AsyncMock(spec=CaseRepository)
         self.connection_manager = AsyncMock(spec=ConnectionManager)
         self.db_session = AsyncMock(spec=Session)
-        self.connection_manager.make_session.return_value = self.db_session
+        self.connection_manager.make_async_session.return_value = self.db_session
         self.script_manager_service = ScriptManagerService(
             self.script_repository,
             self.session_repository,
@@ -47,13 +48,13 @@ class TestScriptService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         self.assertEqual(
             await self.script_manager_service.get_script_url(1), "1/1/script_v1.json"
         )
 
     async def test_get_script_url_not_found(self):
-        self.session_repository.get.return_value = None
+        self.session_repository.async_get.return_value = None
         with self.assertRaises(SessionNotFound):
             await self.script_manager_service.get_script_url(1)
 
@@ -74,14 +75,14 @@ class TestScriptService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         self.assertEqual(
             await self.script_manager_service.update_script_url(1, "1/1/script_v2.json"),
             "1/1/script_v2.json",
         )
 
     async def update_script_url_not_found(self):
-        self.session_repository.get.return_value = None
+        self.session_repository.async_get.return_value = None
         with self.assertRaises(SessionNotFound):
             await self.script_manager_service.update_script_url(1, "1/1/script_v2.json")
 
@@ -104,7 +105,7 @@ class TestScriptService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         script_body = io.BytesIO(b'{"script": "test"}')
         self.script_repository.get_json.return_value = script_body
         self.assertEqual(
@@ -113,7 +114,7 @@ class TestScriptService(unittest.TestCase):
         )
 
     async def download_script_not_found(self):
-        self.session_repository.get.return_value = None
+        self.session_repository.async_get.return_value = None
         with self.assertRaises(SessionNotFound):
             await self.script_manager_service.download_script(1, 1, 1)
 
@@ -136,7 +137,7 @@ class TestScriptService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         self.script_repository.get_json.return_value = None
         with self.assertRaises(DownloadFailed):
             await self.script_manager_service.download_script(case_id, session_id, user_id)
@@ -26,7 +26,7 @@ class TestSessionService(unittest.TestCase):
         self.security_service = AsyncMock(spec=SecurityService)
         self.connection_manager = AsyncMock(spec=ConnectionManager)
         self.db_session = AsyncMock(spec=Session)
-        self.connection_manager.make_session.return_value = self.db_session
+        self.connection_manager.make_async_session.return_value = self.db_session
         self.session_service = SessionService(
             session_repository=self.session_repository,
             case_repository=self.case_repository,
@@ -68,7 +68,7 @@ class TestSessionService(unittest.TestCase):
             origin_video_url=None,
             encoding_video_url=None,
         )
-        self.session_repository.add.return_value = session
+        self.session_repository.async_add.return_value = session
         result = await self.session_service.add(
             case_id=case_id, user_id=user_id, data=data
         )
@@ -96,7 +96,7 @@ class TestSessionService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         result = await self.session_service.get(
             case_id=case_id, session_id=session_id, user_id=user_id
         )
@@ -106,7 +106,7 @@ class TestSessionService(unittest.TestCase):
         case_id = 1
         session_id = 1
         user_id = 1
-        self.session_repository.get.return_value = None
+        self.session_repository.async_get.return_value = None
         with self.assertRaises(SessionNotFound):
             await self.session_service.get(
                 case_id=case_id, session_id=session_id, user_id=user_id
@@ -115,7 +115,7 @@ class TestSessionService(unittest.TestCase):
     async def test_get_page_num(self):
         case_id = 1
         user_id = 1
-        self.case_repository.total_count.return_value = 10
+        self.case_repository.async_total_count.return_value = 10
         result = self.session_service.get_page_num(case_id=case_id, user_id=user_id)
         self.assertEqual(result, 1)
 
@@ -123,7 +123,7 @@ class TestSessionService(unittest.TestCase):
         skip = 0
         limit = 10
         case_id = 1
-        self.session_repository.total_count.return_value = 10
+        self.session_repository.async_total_count.return_value = 10
         result = await self.session_service.range_check(skip, limit, case_id)
         self.assertTrue(result)
 
@@ -131,7 +131,7 @@ class TestSessionService(unittest.TestCase):
         skip = 0
         limit = 10
         case_id = 1
-        self.session_repository.total_count.return_value = 5
+        self.session_repository.async_total_count.return_value = 5
         result = await self.session_service.range_check(skip, limit, case_id)
         self.assertFalse(result)
 
@@ -155,8 +155,8 @@ class TestSessionService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.total_count.return_value = 100
-        self.session_repository.get_list.return_value = [session] * limit
+        self.session_repository.async_total_count.return_value = 100
+        self.session_repository.async_get_list.return_value = [session] * limit
         result = await self.session_service.get_session_list(
             case_id=case_id, skip=skip, limit=limit, user_id=user_id
         )
@@ -167,7 +167,7 @@ class TestSessionService(unittest.TestCase):
         skip = 0
         limit = 11
         user_id = 1
-        self.session_repository.total_count.return_value = 10
+        self.session_repository.async_total_count.return_value = 10
         with self.assertRaises(InvalidRange):
             await self.session_service.get_session_list(
                 case_id=case_id, skip=skip, limit=limit, user_id=user_id
@@ -209,7 +209,7 @@ class TestSessionService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.update.return_value = True
+        self.session_repository.async_update.return_value = True
         result = await self.session_service.update(
             case_id=case_id, session_id=session_id, user_id=user_id, data=data
         )
@@ -239,7 +239,7 @@ class TestSessionService(unittest.TestCase):
                 encoding_video_url="1/1/encoded_video.mp4",
             )
         )
-        self.session_repository.update.return_value = False
+        self.session_repository.async_update.return_value = False
         with self.assertRaises(SessionNotFound) as e:
             await self.session_service.update(
                 case_id=case_id, session_id=session_id, user_id=user_id, data=data
@@ -253,7 +253,7 @@ class TestSessionService(unittest.TestCase):
         case_id = 1
         session_id = 1
         user_id = 1
-        self.session_repository.delete.return_value = True
+        self.session_repository.async_delete.return_value = True
         result = await self.session_service.delete(
             case_id=case_id, session_id=session_id, user_id=user_id
         )
@@ -266,7 +266,7 @@ class TestSessionService(unittest.TestCase):
         case_id = 1
         session_id = 1
         user_id = 1
-        self.session_repository.delete.return_value = False
+        self.session_repository.async_delete.return_value = False
         with self.assertRaises(SessionNotFound) as e:
             await self.session_service.delete(
                 case_id=case_id, session_id=session_id, user_id=user_id
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 import os
 from functools import wraps
 from typing import IO
@@ -18,11 +18,12 @@ from contents.service.video import VideoManagerService
 class TestVideoManageService(unittest.TestCase):
     def setUp(self):
         self.video_repository = AsyncMock(spec=VideoRepository)
+        self.video_repository.iter_chunks = MagicMock(side_effect=lambda body: body)
         self.session_repository = AsyncMock(spec=SessionRepository)
         self.case_repository = AsyncMock(spec=CaseRepository)
         self.connection_manager = AsyncMock(spec=ConnectionManager)
         self.db_session = AsyncMock(spec=Session)
-        self.connection_manager.make_session.return_value = self.db_session
+        self.connection_manager.make_async_session.return_value = self.db_session
         self.video_manager_service = VideoManagerService(
             self.video_repository,
             self.session_repository,
@@ -47,42 +48,40 @@ class TestVideoManageService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         self.assertEqual(
             await self.video_manager_service.get_encoded_video_url(1), "1/1/encoded_video.mp4"
         )
 
     async def test_get_encoded_video_url_not_found(self):
-        self.session_repository.get.return_value = None
+        self.session_repository.async_get.return_value = None
         with self.assertRaises(SessionNotFound):
             await self.video_manager_service.get_encoded_video_url(1)
 
     # 처음 video upload하는 경우라고 가정
     async def test_update_origin_video_url_success(self):
-        session = SessionDomain(
-            id=1,
-            name="test",
-            session_state_id=StateTypeEnum.READY,
-            case_id=1,
-            source_video_url="video.mp4",
-            source_script_url=None,
-            script_state_id=StateTypeEnum.NONE,
-            analyze_state_id=StateTypeEnum.NONE,
-            encoding_state_id=StateTypeEnum.NONE,
-            created_date="2024-01-01",
-            video_length="00:30:00",
-            origin_video_url=None,
-            encoding_video_url=None,
-        )
-        self.session_repository.get.return_value = session
-        self.session_repository.update.return_value = True
+        self.session_repository.async_update_origin_video.return_value = True
         self.assertEqual(
             await self.video_manager_service.update_origin_video_url(1, "1/1/video.mp4"),
             "1/1/video.mp4",
         )
 
+    async def test_update_origin_video_url_hash(self):
+        self.session_repository.async_update_origin_video.return_value = True
+
+        await self.video_manager_service.update_origin_video_url(
+            1, "1/1/video.mp4", origin_video_hash="sha256:new"
+        )
+        kwargs = self.session_repository.async_update_origin_video.call_args.kwargs
+        self.assertEqual(kwargs["origin_video_hash"], "sha256:new")
+
+        # hash를 모르는 upload는 이전 원본의 hash를 남기지 않는다.
+        await self.video_manager_service.update_origin_video_url(1, "1/1/video.mp4")
+        kwargs = self.session_repository.async_update_origin_video.call_args.kwargs
+        self.assertIsNone(kwargs["origin_video_hash"])
+
     async def test_update_origin_video_url_not_found(self):
-        self.session_repository.get.return_value = None
+        self.session_repository.async_update_origin_video.return_value = False
         with self.assertRaises(SessionNotFound):
             await self.video_manager_service.update_origin_video_url(1, "1/1/video.mp4")
 
@@ -106,12 +105,15 @@ class TestVideoManageService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.get.return_value = session
-        self.video_repository.get_object.return_value = {"Body": "video"}
-        self.assertEqual(
-            await self.video_manager_service.download_video(case_id, session_id, user_id),
-            "video",
+        self.session_repository.async_get.return_value = session
+        self.video_repository.get_object.return_value = {
+            "Body": "video",
+            "ContentLength": 5,
+        }
+        video_stream = await self.video_manager_service.download_video(
+            case_id, session_id, user_id
         )
+        self.assertEqual(video_stream.body, "video")
 
     # encoded video url이 없는 경우
     async def test_download_video_not_found(self):
@@ -133,7 +135,7 @@ class TestVideoManageService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url=None,
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         with self.assertRaises(VideoNotFound):
             await self.video_manager_service.download_video(case_id, session_id, user_id)
 
@@ -157,7 +159,7 @@ class TestVideoManageService(unittest.TestCase):
             origin_video_url="1/1/video.mp4",
             encoding_video_url="1/1/encoded_video.mp4",
         )
-        self.session_repository.get.return_value = session
+        self.session_repository.async_get.return_value = session
         self.video_repository.get_object.return_value = None
         with self.assertRaises(DownloadFailed):
             await self.video_manager_service.download_video(case_id, session_id, user_id)
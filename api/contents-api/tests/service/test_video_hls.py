@@ -0,0 +1,113 @@
+import io
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.video import VideoRepository
+from core.repository.session import SessionRepository
+from core.repository.case import CaseRepository
+from core.db.connection import ConnectionManager
+from core.model.domain.session import Session as SessionDomain
+from core.model.domain.state_type import StateTypeEnum
+from object.exception import ObjectNotModified
+from contents.exception import VideoNotFound
+from contents.service.video import VideoManagerService
+
+
+class TestVideoHls(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.video_repository = MagicMock(spec=VideoRepository)
+        self.session_repository = AsyncMock(spec=SessionRepository)
+        self.case_repository = AsyncMock(spec=CaseRepository)
+        self.video_manager_service = VideoManagerService(
+            AsyncObjectRepository(self.video_repository, self.executor),
+            self.session_repository,
+            self.case_repository,
+            MagicMock(spec=ConnectionManager),
+        )
+        self.session_repository.async_get.return_value = SessionDomain(
+            id=1,
+            name="test",
+            session_state_id=StateTypeEnum.READY,
+            case_id=1,
+            script_state_id=StateTypeEnum.NONE,
+            analyze_state_id=StateTypeEnum.NONE,
+            encoding_state_id=StateTypeEnum.DONE,
+            created_date="2024-01-01",
+            encoding_video_url="LOCAL/1/1/encoded_video.mp4",
+        )
+        self.video_repository.get_object.side_effect = lambda object_name, **_: {
+            "Body": io.BytesIO(object_name.encode()),
+            "ContentLength": len(object_name),
+            "ETag": '"etag"',
+        }
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def download_hls(self, path: str, if_none_match: str = None):
+        hls_stream = await self.video_manager_service.download_hls(
+            case_id=1, session_id=1, user_id=1, path=path, if_none_match=if_none_match
+        )
+        body = b"".join([chunk async for chunk in hls_stream.body])
+        return hls_stream, body
+
+    async def test_download_master_playlist(self):
+        hls_stream, body = await self.download_hls("master.m3u8")
+
+        self.assertEqual(body, b"LOCAL/1/1/hls/master.m3u8")
+        self.assertEqual(hls_stream.status_code, 200)
+        self.assertEqual(
+            hls_stream.headers["Content-Type"], "application/vnd.apple.mpegurl"
+        )
+        self.assertEqual(hls_stream.headers["Cache-Control"], "private, max-age=60")
+        self.assertEqual(hls_stream.headers["ETag"], '"etag"')
+        self.assertNotIn("Accept-Ranges", hls_stream.headers)
+
+    async def test_download_segment(self):
+        hls_stream, body = await self.download_hls("480p/segment_00003.ts")
+
+        self.assertEqual(body, b"LOCAL/1/1/hls/480p/segment_00003.ts")
+        self.assertEqual(hls_stream.headers["Content-Type"], "video/mp2t")
+        # 다시 encoding 하면 같은 경로의 segment가 바뀌므로 오래 cache 하지 않는다.
+        self.assertEqual(hls_stream.headers["Cache-Control"], "private, max-age=60")
+        self.assertEqual(hls_stream.headers["ETag"], '"etag"')
+
+    async def test_download_segment_not_modified(self):
+        self.video_repository.get_object.side_effect = ObjectNotModified("segment")
+
+        hls_stream, body = await self.download_hls(
+            "480p/segment_00003.ts", if_none_match='"etag"'
+        )
+
+        self.assertEqual(hls_stream.status_code, 304)
+        self.assertEqual(body, b"")
+        self.assertEqual(hls_stream.headers["ETag"], '"etag"')
+        self.assertEqual(
+            self.video_repository.get_object.call_args.kwargs["if_none_match"],
+            '"etag"',
+        )
+
+    async def test_download_invalid_path(self):
+        for path in ["../encoded_video.mp4", "480p/../../x.ts", "480p/video.mp4"]:
+            with self.assertRaises(VideoNotFound):
+                await self.download_hls(path)
+        self.video_repository.get_object.assert_not_called()
+
+    async def test_download_hls_not_packaged(self):
+        self.video_repository.get_object.side_effect = None
+        self.video_repository.get_object.return_value = None
+
+        with self.assertRaises(VideoNotFound):
+            await self.download_hls("master.m3u8")
+
+    async def test_download_hls_not_encoded(self):
+        self.session_repository.async_get.return_value.encoding_video_url = None
+
+        with self.assertRaises(VideoNotFound):
+            await self.download_hls("master.m3u8")
+
+
+if __name__ == "__main__":
+    unittest.main()
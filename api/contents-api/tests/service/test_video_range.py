@@ -0,0 +1,132 @@
+import io
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from object.exception import InvalidObjectRange, ObjectPreconditionFailed
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.video import VideoRepository
+from core.repository.session import SessionRepository
+from core.repository.case import CaseRepository
+from core.db.connection import ConnectionManager
+from core.model.domain.session import Session as SessionDomain
+from core.model.domain.state_type import StateTypeEnum
+from contents.exception import RangeNotSatisfiable
+from contents.service.video import VideoManagerService
+
+
+class TestVideoRange(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.video_repository = MagicMock(spec=VideoRepository)
+        self.session_repository = AsyncMock(spec=SessionRepository)
+        self.case_repository = AsyncMock(spec=CaseRepository)
+        self.video_manager_service = VideoManagerService(
+            AsyncObjectRepository(self.video_repository, self.executor),
+            self.session_repository,
+            self.case_repository,
+            MagicMock(spec=ConnectionManager),
+        )
+        self.session_repository.async_get.return_value = SessionDomain(
+            id=1,
+            name="test",
+            session_state_id=StateTypeEnum.READY,
+            case_id=1,
+            script_state_id=StateTypeEnum.NONE,
+            analyze_state_id=StateTypeEnum.NONE,
+            encoding_state_id=StateTypeEnum.DONE,
+            created_date="2024-01-01",
+            encoding_video_url="1/1/encoded_video.mp4",
+        )
+        self.video = {
+            "Body": io.BytesIO(b"video"),
+            "ContentLength": 100,
+            "ETag": '"etag"',
+            "LastModified": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        }
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def download_video(self, **kwargs):
+        return await self.video_manager_service.download_video(
+            case_id=1, session_id=1, user_id=1, **kwargs
+        )
+
+    async def test_download_video_full(self):
+        self.video_repository.get_object.return_value = self.video
+
+        video_stream = await self.download_video()
+
+        self.video_repository.get_object.assert_called_once_with(
+            "1/1/encoded_video.mp4"
+        )
+        self.assertEqual(video_stream.status_code, 200)
+        self.assertEqual([chunk async for chunk in video_stream.body], [b"video"])
+        self.assertEqual(
+            video_stream.headers,
+            {
+                "Accept-Ranges": "bytes",
+                "Content-Length": "100",
+                "ETag": '"etag"',
+                "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            },
+        )
+
+    async def test_download_video_range(self):
+        self.video_repository.get_object.return_value = dict(
+            self.video, ContentLength=10, ContentRange="bytes 10-19/100"
+        )
+
+        video_stream = await self.download_video(
+            range_header="bytes=10-19", if_range='"etag"'
+        )
+
+        self.video_repository.get_object.assert_called_once_with(
+            "1/1/encoded_video.mp4", byte_range="bytes=10-19", if_match='"etag"'
+        )
+        self.assertEqual(video_stream.status_code, 206)
+        self.assertEqual(video_stream.headers["Content-Length"], "10")
+        self.assertEqual(video_stream.headers["Content-Range"], "bytes 10-19/100")
+
+    async def test_download_video_if_range_mismatch(self):
+        self.video_repository.get_object.side_effect = [
+            ObjectPreconditionFailed("1/1/encoded_video.mp4"),
+            self.video,
+        ]
+
+        video_stream = await self.download_video(
+            range_header="bytes=10-19", if_range='"old"'
+        )
+
+        self.assertEqual(self.video_repository.get_object.call_count, 2)
+        self.assertEqual(video_stream.status_code, 200)
+        self.assertNotIn("Content-Range", video_stream.headers)
+
+    async def test_download_video_weak_if_range(self):
+        self.video_repository.get_object.return_value = self.video
+
+        video_stream = await self.download_video(
+            range_header="bytes=10-19", if_range='W/"etag"'
+        )
+
+        self.video_repository.get_object.assert_called_once_with(
+            "1/1/encoded_video.mp4"
+        )
+        self.assertEqual(video_stream.status_code, 200)
+
+    async def test_download_video_range_not_satisfiable(self):
+        self.video_repository.get_object.side_effect = InvalidObjectRange(
+            "1/1/encoded_video.mp4", "bytes=200-"
+        )
+        self.video_repository.head_object.return_value = {"ContentLength": 100}
+
+        with self.assertRaises(RangeNotSatisfiable) as context:
+            await self.download_video(range_header="bytes=200-")
+
+        self.assertEqual(context.exception.size, 100)
+        self.assertEqual(context.exception.status_code, 416)
+
+
+if __name__ == "__main__":
+    unittest.main()
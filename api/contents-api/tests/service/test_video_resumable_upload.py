@@ -0,0 +1,214 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+from object.exception import UploadFailed
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.multipart_upload import MultipartUploader, MIN_PART_SIZE
+from object.repository.video import VideoRepository
+from core.repository.session import SessionRepository
+from core.repository.case import CaseRepository
+from core.db.connection import ConnectionManager
+from contents.dto.video import VideoUploadPart
+from contents.exception import InvalidUploadRequest, VideoUploadNotFound
+from contents.service.video import VideoManagerService
+
+UPLOAD_ID = "0123456789abcdef0123456789abcdef"
+
+
+async def iter_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestVideoResumableUpload(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.video_repository = MagicMock(spec=VideoRepository)
+        self.video_repository.create_multipart_upload.return_value = "s3-upload-id"
+        self.video_repository.put_upload_state.side_effect = (
+            lambda upload_id, state: upload_id
+        )
+        self.video_repository.get_upload_state.return_value = {
+            "upload_id": UPLOAD_ID,
+            "s3_upload_id": "s3-upload-id",
+            "object_name": "LOCAL/1/1/video.mp4",
+            "filename": "video.mp4",
+            "case_id": 1,
+            "session_id": 1,
+            "part_size": MIN_PART_SIZE,
+            "created_time": "2024-01-01T00:00:00",
+        }
+        self.video_repository.upload_part.return_value = '"etag"'
+        self.video_repository.complete_multipart_upload.side_effect = (
+            lambda object_name, upload_id, parts: object_name
+        )
+        self.session_repository = AsyncMock(spec=SessionRepository)
+        self.case_repository = AsyncMock(spec=CaseRepository)
+        async_video_repository = AsyncObjectRepository(
+            self.video_repository, self.executor
+        )
+        self.video_manager_service = VideoManagerService(
+            async_video_repository,
+            self.session_repository,
+            self.case_repository,
+            MagicMock(spec=ConnectionManager),
+            video_uploader=MultipartUploader(
+                async_video_repository, part_size=MIN_PART_SIZE, retry_backoff=0
+            ),
+        )
+        self.video_manager_service.update_origin_video_url = AsyncMock(
+            return_value="updated"
+        )
+        self.ids = {"case_id": 1, "session_id": 1, "user_id": 1}
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_create_video_upload(self):
+        video_upload = await self.video_manager_service.create_video_upload(
+            filename="video.mp4", **self.ids
+        )
+
+        self.assertRegex(video_upload.upload_id, "^[0-9a-f]{32}$")
+        self.assertEqual(video_upload.part_size, MIN_PART_SIZE)
+        self.assertEqual(video_upload.parts, [])
+        upload_id, state = self.video_repository.put_upload_state.call_args.args
+        self.assertEqual(upload_id, video_upload.upload_id)
+        self.assertEqual(state["s3_upload_id"], "s3-upload-id")
+        self.assertEqual(state["object_name"].split("/", 1)[1], "1/1/video.mp4")
+
+    async def test_create_video_upload_state_failed(self):
+        self.video_repository.put_upload_state.side_effect = None
+        self.video_repository.put_upload_state.return_value = None
+
+        with self.assertRaises(UploadFailed):
+            await self.video_manager_service.create_video_upload(
+                filename="video.mp4", **self.ids
+            )
+        self.video_repository.abort_multipart_upload.assert_called_once()
+
+    async def test_upload_video_part(self):
+        part = await self.video_manager_service.upload_video_part(
+            upload_id=UPLOAD_ID,
+            part_number=2,
+            chunks=iter_chunks(b"vid", b"eo"),
+            **self.ids,
+        )
+
+        self.assertEqual(part, VideoUploadPart(part_number=2, etag='"etag"', size=5))
+        self.video_repository.upload_part.assert_called_once_with(
+            "LOCAL/1/1/video.mp4", "s3-upload-id", 2, b"video"
+        )
+
+    async def test_upload_video_part_too_large(self):
+        with self.assertRaises(InvalidUploadRequest):
+            await self.video_manager_service.upload_video_part(
+                upload_id=UPLOAD_ID,
+                part_number=1,
+                chunks=iter_chunks(b"a" * MIN_PART_SIZE, b"a"),
+                **self.ids,
+            )
+        self.video_repository.upload_part.assert_not_called()
+
+    async def test_upload_video_part_invalid_part_number(self):
+        with self.assertRaises(InvalidUploadRequest):
+            await self.video_manager_service.upload_video_part(
+                upload_id=UPLOAD_ID,
+                part_number=0,
+                chunks=iter_chunks(b"video"),
+                **self.ids,
+            )
+
+    async def test_upload_not_found(self):
+        with self.assertRaises(VideoUploadNotFound):
+            await self.video_manager_service.get_video_upload(
+                upload_id="../../script", **self.ids
+            )
+        self.video_repository.get_upload_state.assert_not_called()
+
+        self.video_repository.get_upload_state.return_value = None
+        with self.assertRaises(VideoUploadNotFound):
+            await self.video_manager_service.get_video_upload(
+                upload_id=UPLOAD_ID, **self.ids
+            )
+
+    async def test_upload_of_other_session(self):
+        with self.assertRaises(VideoUploadNotFound):
+            await self.video_manager_service.get_video_upload(
+                upload_id=UPLOAD_ID, case_id=1, session_id=2, user_id=1
+            )
+
+    async def test_get_video_upload(self):
+        self.video_repository.list_parts.return_value = [
+            {"PartNumber": 1, "ETag": '"a"', "Size": MIN_PART_SIZE}
+        ]
+
+        video_upload = await self.video_manager_service.get_video_upload(
+            upload_id=UPLOAD_ID, **self.ids
+        )
+
+        self.assertEqual(
+            video_upload.parts,
+            [VideoUploadPart(part_number=1, etag='"a"', size=MIN_PART_SIZE)],
+        )
+
+    async def test_complete_video_upload(self):
+        self.video_repository.list_parts.return_value = [
+            {"PartNumber": 1, "ETag": '"a"', "Size": MIN_PART_SIZE},
+            {"PartNumber": 2, "ETag": '"b"', "Size": 10},
+        ]
+
+        result = await self.video_manager_service.complete_video_upload(
+            upload_id=UPLOAD_ID, **self.ids
+        )
+
+        self.assertEqual(result, "updated")
+        self.video_repository.complete_multipart_upload.assert_called_once_with(
+            "LOCAL/1/1/video.mp4",
+            "s3-upload-id",
+            [{"PartNumber": 1, "ETag": '"a"'}, {"PartNumber": 2, "ETag": '"b"'}],
+        )
+        self.video_repository.delete_upload_state.assert_called_once_with(UPLOAD_ID)
+        self.video_manager_service.update_origin_video_url.assert_awaited_once_with(
+            1, "LOCAL/1/1/video.mp4"
+        )
+
+    async def test_complete_video_upload_missing_part(self):
+        self.video_repository.list_parts.return_value = [
+            {"PartNumber": 1, "ETag": '"a"', "Size": MIN_PART_SIZE},
+            {"PartNumber": 3, "ETag": '"c"', "Size": 10},
+        ]
+
+        with self.assertRaises(InvalidUploadRequest):
+            await self.video_manager_service.complete_video_upload(
+                upload_id=UPLOAD_ID, **self.ids
+            )
+        self.video_repository.complete_multipart_upload.assert_not_called()
+
+    async def test_complete_video_upload_failed(self):
+        self.video_repository.list_parts.return_value = [
+            {"PartNumber": 1, "ETag": '"a"', "Size": 10}
+        ]
+        self.video_repository.complete_multipart_upload.side_effect = None
+        self.video_repository.complete_multipart_upload.return_value = None
+
+        with self.assertRaises(UploadFailed):
+            await self.video_manager_service.complete_video_upload(
+                upload_id=UPLOAD_ID, **self.ids
+            )
+        self.video_repository.delete_upload_state.assert_not_called()
+        self.video_repository.abort_multipart_upload.assert_not_called()
+
+    async def test_abort_video_upload(self):
+        await self.video_manager_service.abort_video_upload(
+            upload_id=UPLOAD_ID, **self.ids
+        )
+
+        self.video_repository.abort_multipart_upload.assert_called_once_with(
+            "LOCAL/1/1/video.mp4", "s3-upload-id"
+        )
+        self.video_repository.delete_upload_state.assert_called_once_with(UPLOAD_ID)
+
+
+if __name__ == "__main__":
+    unittest.main()
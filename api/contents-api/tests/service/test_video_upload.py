@@ -0,0 +1,98 @@
+import hashlib
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+from object.exception import UploadFailed
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.multipart_upload import MultipartUploader
+from object.repository.video import VideoRepository
+from core.repository.session import SessionRepository
+from core.repository.case import CaseRepository
+from core.db.connection import ConnectionManager
+from contents.exception import CaseNotFound, SessionNotFound
+from contents.service.video import VideoManagerService
+
+
+async def iter_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestVideoUpload(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.video_repository = MagicMock(spec=VideoRepository)
+        self.video_repository.create_multipart_upload.return_value = "upload-id"
+        self.video_repository.upload_part.return_value = '"etag"'
+        self.video_repository.complete_multipart_upload.side_effect = (
+            lambda object_name, upload_id, parts: object_name
+        )
+        self.session_repository = AsyncMock(spec=SessionRepository)
+        self.case_repository = AsyncMock(spec=CaseRepository)
+        async_video_repository = AsyncObjectRepository(
+            self.video_repository, self.executor
+        )
+        self.video_manager_service = VideoManagerService(
+            async_video_repository,
+            self.session_repository,
+            self.case_repository,
+            MagicMock(spec=ConnectionManager),
+            video_uploader=MultipartUploader(async_video_repository, retry_backoff=0),
+        )
+        self.video_manager_service.update_origin_video_url = AsyncMock(
+            return_value="updated"
+        )
+        self.object_name = f"{os.getenv('PHASE', 'LOCAL')}/1/1/video.mp4"
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def upload_video_stream(self, user_id: int = 1):
+        return await self.video_manager_service.upload_video_stream(
+            case_id=1,
+            session_id=1,
+            user_id=user_id,
+            chunks=iter_chunks(b"vid", b"eo"),
+            filename="video.mp4",
+        )
+
+    async def test_upload_video_stream(self):
+        self.assertEqual(await self.upload_video_stream(), "updated")
+
+        self.video_repository.upload_part.assert_called_once_with(
+            self.object_name, "upload-id", 1, b"video"
+        )
+        self.video_manager_service.update_origin_video_url.assert_awaited_once_with(
+            1,
+            self.object_name,
+            origin_video_hash="sha256:" + hashlib.sha256(b"video").hexdigest(),
+        )
+
+    async def test_upload_video_stream_failed(self):
+        self.video_repository.upload_part.return_value = None
+
+        with self.assertRaises(UploadFailed):
+            await self.upload_video_stream()
+        self.video_repository.abort_multipart_upload.assert_called_once_with(
+            self.object_name, "upload-id"
+        )
+        self.video_manager_service.update_origin_video_url.assert_not_awaited()
+
+    async def test_upload_video_stream_session_not_found(self):
+        self.session_repository.async_get.return_value = None
+
+        with self.assertRaises(SessionNotFound):
+            await self.upload_video_stream()
+        self.video_repository.create_multipart_upload.assert_not_called()
+
+    async def test_upload_video_stream_case_not_found(self):
+        self.case_repository.async_exists.return_value = False
+
+        with self.assertRaises(CaseNotFound):
+            await self.upload_video_stream(user_id=2)
+        self.video_repository.create_multipart_upload.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
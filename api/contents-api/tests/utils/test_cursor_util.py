@@ -0,0 +1,54 @@
+import unittest
+from types import SimpleNamespace
+
+from contents.exception import InvalidCursor
+from contents.utils.cursor_util import decode_cursor, encode_cursor, make_cursor_page
+
+
+def make_rows(*ids):
+    return [SimpleNamespace(id=id) for id in ids]
+
+
+class TestCursorUtil(unittest.TestCase):
+    def test_encode_decode(self):
+        cursor = encode_cursor(123)
+        self.assertNotIn("123", cursor)
+        self.assertEqual(decode_cursor(cursor), 123)
+        self.assertIsNone(decode_cursor(None))
+
+    def test_decode_invalid(self):
+        for cursor in ["!!", "bm90LWpzb24", encode_cursor("1"), encode_cursor(True)]:
+            with self.assertRaises(InvalidCursor):
+                decode_cursor(cursor)
+
+    def test_first_page(self):
+        page = make_cursor_page(make_rows(9, 8, 7), limit=2)
+        self.assertEqual([item.id for item in page.items], [9, 8])
+        self.assertEqual(decode_cursor(page.next_cursor), 8)
+        self.assertIsNone(page.prev_cursor)
+
+    def test_last_page(self):
+        page = make_cursor_page(make_rows(2, 1), limit=2, after_id=3)
+        self.assertIsNone(page.next_cursor)
+        self.assertEqual(decode_cursor(page.prev_cursor), 2)
+
+    def test_before_page(self):
+        # before 방향은 before_id에 가까운 limit개를 돌려준다.
+        page = make_cursor_page(make_rows(9, 8, 7), limit=2, before_id=6)
+        self.assertEqual([item.id for item in page.items], [8, 7])
+        self.assertEqual(decode_cursor(page.next_cursor), 7)
+        self.assertEqual(decode_cursor(page.prev_cursor), 8)
+
+        page = make_cursor_page(make_rows(9, 8), limit=2, before_id=7)
+        self.assertEqual(decode_cursor(page.next_cursor), 8)
+        self.assertIsNone(page.prev_cursor)
+
+    def test_empty_page(self):
+        page = make_cursor_page([], limit=10, total_count=0)
+        self.assertEqual(page.items, [])
+        self.assertIsNone(page.next_cursor)
+        self.assertEqual(page.total_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from contents.exception import InvalidUploadRequest
+from contents.utils.multipart_util import MultipartFileStream
+
+HEADERS = {"content-type": "multipart/form-data; boundary=BOUNDARY"}
+
+
+def make_body(*parts: bytes) -> bytes:
+    return b"".join(b"--BOUNDARY\r\n" + part + b"\r\n" for part in parts) + (
+        b"--BOUNDARY--\r\n"
+    )
+
+
+async def iter_body(body: bytes, chunk_size: int):
+    for i in range(0, len(body), chunk_size):
+        yield body[i : i + chunk_size]
+
+
+class TestMultipartFileStream(unittest.IsolatedAsyncioTestCase):
+    async def read(self, body: bytes, chunk_size: int = 7):
+        file_stream = MultipartFileStream(HEADERS, iter_body(body, chunk_size))
+        filename = await file_stream.start()
+        return filename, b"".join([chunk async for chunk in file_stream])
+
+    async def test_read_file(self):
+        body = make_body(
+            b'Content-Disposition: form-data; name="memo"\r\n\r\nhello',
+            b'Content-Disposition: form-data; name="file"; filename="video.mp4"\r\n'
+            b"Content-Type: video/mp4\r\n\r\n" + b"\x00video\r\n--data" * 100,
+        )
+        filename, data = await self.read(body)
+        self.assertEqual(filename, "video.mp4")
+        self.assertEqual(data, b"\x00video\r\n--data" * 100)
+
+    async def test_read_file_utf8_filename(self):
+        body = make_body(
+            'Content-Disposition: form-data; name="file"; filename="영상.mp4"\r\n\r\n'.encode()
+            + b"video"
+        )
+        self.assertEqual(await self.read(body, chunk_size=1), ("영상.mp4", b"video"))
+
+    async def test_no_file(self):
+        body = make_body(b'Content-Disposition: form-data; name="memo"\r\n\r\nhello')
+        with self.assertRaises(InvalidUploadRequest):
+            await self.read(body)
+
+    async def test_truncated_body(self):
+        body = make_body(
+            b'Content-Disposition: form-data; name="file"; filename="video.mp4"\r\n\r\n'
+            + b"video" * 10
+        )
+        with self.assertRaises(InvalidUploadRequest):
+            await self.read(body[:-30])
+
+    def test_not_multipart(self):
+        with self.assertRaises(InvalidUploadRequest):
+            MultipartFileStream({"content-type": "video/mp4"}, iter_body(b"", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
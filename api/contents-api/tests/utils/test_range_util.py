@@ -0,0 +1,30 @@
+import unittest
+from contents.utils.range_util import parse_range, parse_if_range
+
+
+class TestRangeUtil(unittest.TestCase):
+    def test_parse_range(self):
+        self.assertEqual(parse_range("bytes=0-1023"), "bytes=0-1023")
+        self.assertEqual(parse_range("bytes=1024-"), "bytes=1024-")
+        self.assertEqual(parse_range("bytes=-500"), "bytes=-500")
+        self.assertEqual(parse_range("Bytes = 0-1"), "bytes=0-1")
+
+    def test_parse_range_ignored(self):
+        self.assertIsNone(parse_range(None))
+        self.assertIsNone(parse_range("bytes=-"))
+        self.assertIsNone(parse_range("bytes=10-5"))
+        self.assertIsNone(parse_range("bytes=0-1,5-9"))
+        self.assertIsNone(parse_range("items=0-1"))
+
+    def test_parse_if_range(self):
+        self.assertEqual(parse_if_range(None), {})
+        self.assertEqual(parse_if_range('"etag"'), {"if_match": '"etag"'})
+        self.assertEqual(
+            parse_if_range("Wed, 21 Oct 2015 07:28:00 GMT"),
+            {"if_unmodified_since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        self.assertIsNone(parse_if_range('W/"etag"'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from dependency_injector import containers, providers
+
+from encode.service.encode import EncodeService
+
+from core.repository.session import SessionRepository
+from core.repository.encoded_video import EncodedVideoRepository
+from core.db.connection import ConnectionManager
+from core.service.security import SecurityService
+from object.storage.client import ClientManager
+from object.repository.video import VideoRepository
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.multipart_upload import MultipartUploader
+from object.service.video import VideoService
+
+
+class Container(containers.DeclarativeContainer):
+    wiring_config = containers.WiringConfiguration(modules=["."])
+
+    config = providers.Configuration()
+
+    # core services
+    connection_manager = providers.Singleton(
+        ConnectionManager,
+        db_url=config.mysql.db_url,
+        pool_recycle=config.mysql.pool_recycle,
+        pool_size=config.mysql.pool_size,
+        max_overflow=config.mysql.max_overflow,
+        pool_timeout=config.mysql.pool_timeout,
+        pool_pre_ping=config.mysql.pool_pre_ping,
+        pool_use_lifo=config.mysql.pool_use_lifo,
+    )
+
+    security_service = providers.Singleton(
+        SecurityService,
+        secret_key=config.security.secret_key,
+        algorithm=config.security.algorithm,
+        expires_delta=config.security.expires_delta,
+    )
+
+    # core repositories
+    session_repository = providers.Singleton(
+        SessionRepository, connection_manager=connection_manager
+    )
+    encoded_video_repository = providers.Singleton(
+        EncodedVideoRepository, connection_manager=connection_manager
+    )
+
+    # object repositories
+    client_manager = providers.Singleton(
+        ClientManager,
+        aws_access_key_id=config.aws.access_key,
+        aws_secret_access_key=config.aws.secret_key,
+        region_name=config.aws.region,
+        max_pool_connections=config.aws.max_workers,
+        endpoint_url=config.aws.endpoint_url,
+    )
+
+    # stream 모드에서 encoding 결과 part를 올리는 thread pool
+    object_executor = providers.Singleton(
+        ThreadPoolExecutor,
+        max_workers=config.aws.max_workers,
+        thread_name_prefix="object",
+    )
+
+    video_repository = providers.Singleton(
+        VideoRepository,
+        bucket=config.aws.bucket,
+        client_manager=client_manager,
+    )
+
+    async_video_repository = providers.Singleton(
+        AsyncObjectRepository,
+        repository=video_repository,
+        executor=object_executor,
+    )
+
+    video_uploader = providers.Singleton(
+        MultipartUploader,
+        repository=async_video_repository,
+        part_size=config.aws.multipart.part_size,
+        max_concurrency=config.aws.multipart.max_concurrency,
+        max_retries=config.aws.multipart.max_retries,
+        retry_backoff=config.aws.multipart.retry_backoff,
+    )
+
+    # object services
+    video_service = providers.Singleton(
+        VideoService,
+        video_repository=video_repository,
+        video_uploader=video_uploader,
+        source_url_expires=config.aws.source_url_expires,
+    )
+
+    # domain services
+    encode_service = providers.Singleton(
+        EncodeService,
+        session_repository=session_repository,
+        video_service=video_service,
+        worker_count=config.encode.worker_count,
+        threads_per_job=config.encode.threads_per_job,
+        lease_seconds=config.encode.lease_seconds,
+        work_dir=config.encode.work_dir,
+        mode=config.encode.mode,
+        hls=config.encode.hls.enabled,
+        hls_renditions=config.encode.hls.renditions,
+        encoded_video_repository=encoded_video_repository,
+        reuse=config.encode.reuse,
+    )
@@ -0,0 +1,39 @@
+import os
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from encode.container import Container
+from core.exception import InvalidToken
+from encode.setting.config import settings
+from encode.route.monitor import router as monitor_router
+from encode.scheduler.encode_batch import start_encode
+
+container = Container()
+container.config.from_yaml(f"./encode/config-{os.getenv('PHASE','LOCAL')}.yaml")
+
+container.wire(packages=["encode.route", "encode.scheduler"])
+
+app = FastAPI(
+    debug=True,
+    title=settings.APP_TITLE,
+    version=settings.VERSION,
+)
+
+
+@app.exception_handler(InvalidToken)
+async def invalid_token_handler(request: Request, exc: InvalidToken):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"message": exc.message, "error_code": exc.error_code},
+    )
+
+
+def register_routers(app: FastAPI):
+    app.include_router(
+        monitor_router,
+        prefix=f"/encode/api/monitor",
+    )
+
+
+start_encode()
+register_routers(app)
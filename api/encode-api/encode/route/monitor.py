@@ -0,0 +1,52 @@
+from dependency_injector.wiring import inject, Provide
+
+from fastapi import APIRouter, Depends
+from fastapi.security import OAuth2PasswordBearer
+
+from encode.container import Container
+from encode.model.domain.queue import QueueStats
+from core.db.connection import ConnectionManager
+from core.model.domain.pool import PoolStats
+from core.service.security import SecurityService
+from encode.service.encode import EncodeService
+
+router = APIRouter()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/api/signin")
+
+
+@router.post("/liveness", tags=["Get"])
+@inject
+async def get_liveness():
+    return "OK"
+
+
+@router.post("/readiness", tags=["Get"])
+@inject
+async def get_readiness():
+    return "OK"
+
+
+# encoding queue 깊이와 마지막 tick의 처리량
+@router.get("/queue", tags=["Get"])
+@inject
+async def get_queue_stats(
+    token: str = Depends(oauth2_scheme),
+    encode_service: EncodeService = Depends(Provide[Container.encode_service]),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> QueueStats:
+    security_service.verify_token(token)
+    return encode_service.queue_stats
+
+
+# MySQL connection pool 사용량과 checkout 대기 시간
+@router.get("/pool", tags=["Get"])
+@inject
+async def get_pool_stats(
+    token: str = Depends(oauth2_scheme),
+    connection_manager: ConnectionManager = Depends(
+        Provide[Container.connection_manager]
+    ),
+    security_service: SecurityService = Depends(Provide[Container.security_service]),
+) -> PoolStats:
+    security_service.verify_token(token)
+    return connection_manager.get_pool_stats()
@@ -0,0 +1,75 @@
+import traceback
+from datetime import datetime, timedelta
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
+from encode.container import Container
+from dependency_injector.wiring import inject, Provide
+
+from encode.service.encode import EncodeService
+
+sched = BackgroundScheduler(timezone="Asia/Seoul")
+
+
+@inject
+def encode_job(
+    encode_service: EncodeService = Provide[Container.encode_service],
+):
+    print("Encode start!")
+    encode_service.run_workers()
+
+
+@inject
+def drain_job(
+    idle_interval: float = None,
+    encode_service: EncodeService = Provide[Container.encode_service],
+    idle_interval_min: float = Provide[Container.config.encode.idle_interval_min],
+    idle_interval_max: float = Provide[Container.config.encode.idle_interval_max],
+):
+    """
+    encoding이 READY인 session이 없어질 때까지 처리하고, 할 일이 없으면 polling 간격을 두 배씩 늘린다.
+    """
+    print("Encode drain start!")
+    processed, failed = 0, False
+    try:
+        processed = encode_service.drain()
+    except Exception:
+        # drain이 실패해도 다음 drain은 예약해야 encoding이 멈추지 않는다.
+        print(traceback.format_exc())
+        failed = True
+    finally:
+        if failed:
+            # 실패하면(DB 장애 등) 바로 다시 시도하지 않고 polling 간격을 늘린다.
+            idle_interval = min(
+                (idle_interval or idle_interval_min) * 2, idle_interval_max
+            )
+        elif processed > 0 or idle_interval is None:
+            idle_interval = idle_interval_min
+        else:
+            idle_interval = min(idle_interval * 2, idle_interval_max)
+        encode_service.queue_stats.idle_interval = idle_interval
+
+        sched.add_job(
+            drain_job,
+            "date",
+            run_date=datetime.now(sched.timezone) + timedelta(seconds=idle_interval),
+            kwargs={"idle_interval": idle_interval},
+            id="encode",
+            replace_existing=True,
+        )
+
+
+@inject
+def start_encode(
+    schedule_mode: str = Provide[Container.config.encode.schedule_mode],
+):
+    if schedule_mode == "drain":
+        sched.add_job(drain_job, "date", id="encode")
+    else:
+        sched.add_job(encode_job, "cron", second="0", id="encode")
+    sched.start()
+
+
+def stop_encode():
+    sched.remove_job("encode")
+    if sched.state == STATE_RUNNING:
+        sched.shutdown()
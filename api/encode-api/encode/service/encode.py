@@ -0,0 +1,277 @@
+import os
+import asyncio
+import datetime
+import tempfile
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from object.service.video import VideoService
+from core.repository.session import SessionRepository
+from core.repository.encoded_video import EncodedVideoRepository
+from core.model.domain.encoded_video import EncodedVideo
+from core.model.domain.session import Session
+from core.model.domain.state_type import StateTypeEnum
+from encode.model.domain.queue import QueueStats
+
+
+class EncodeService:
+    def __init__(
+        self,
+        session_repository: SessionRepository,
+        video_service: VideoService,
+        worker_count: int = None,
+        threads_per_job: int = None,
+        lease_seconds: int = None,
+        work_dir: str = None,
+        mode: str = None,
+        hls: bool = False,
+        hls_renditions: list = None,
+        encoded_video_repository: EncodedVideoRepository = None,
+        reuse: bool = False,
+    ):
+        self.session_repository = session_repository
+        self.video_service = video_service
+        # 한 pod에서 동시에 encoding하는 session 수
+        self.worker_count = worker_count or 1
+        # job 하나가 쓰는 ffmpeg thread 수 (없으면 core를 worker_count개로 나눈 만큼)
+        # pod의 CPU limit ≈ worker_count * threads_per_job 으로 맞춘다.
+        self.threads_per_job = threads_per_job or max(
+            1, (os.cpu_count() or 1) // self.worker_count
+        )
+        # claim한 session을 점유하는 시간 (encoding 최대 소요 시간보다 길어야 한다)
+        self.lease_seconds = lease_seconds or 3600
+        # 원본/encoding 영상을 임시로 두는 위치 (없으면 시스템 임시 디렉토리)
+        self.work_dir = work_dir
+        # stream: S3 원본 -> ffmpeg -> multipart upload로 disk 없이 한 번에 처리
+        # file: 원본을 work_dir에 download 후 moviepy로 encoding 하여 upload
+        self.mode = mode or "file"
+        # mp4와 함께 adaptive bitrate 재생용 HLS rendition을 만든다. (없으면 기본 rendition)
+        self.hls = hls
+        self.hls_renditions = hls_renditions
+        # 원본 content hash와 encoding profile이 같은 encoding 결과가 있으면 다시 encoding 하지 않는다.
+        self.encoded_video_repository = encoded_video_repository
+        self.reuse = reuse
+        self.profile = video_service.encoding_profile(
+            hls=hls, hls_renditions=hls_renditions
+        )
+        self.queue_stats = QueueStats()
+
+    def encode(self, session: Session, source_hash: str = None) -> str:
+        """
+        원본 영상을 받아 encoding한 뒤 encoded_ 영상을 s3에 올리고 object name을 반환한다.
+        hls가 켜져 있으면 같은 prefix의 hls/ 아래에 HLS rendition도 올린다.
+        source_hash가 있으면 다음에 재사용할 수 있도록 encoding 결과를 index에 남긴다.
+        """
+        encoding_video_url = self.encode_video(session)
+        if self.hls and not self.package_hls(session):
+            # HLS가 없는 결과는 이 profile로 재사용하지 않는다.
+            return encoding_video_url
+        if source_hash:
+            self.add_encoded_video(source_hash, encoding_video_url)
+        return encoding_video_url
+
+    def get_source_hash(self, session: Session) -> str:
+        # upload 하면서 계산한 hash가 없으면(resumable upload 등) S3에서 읽어 계산한다.
+        if not self.reuse:
+            return None
+        if session.origin_video_hash:
+            return session.origin_video_hash
+        try:
+            return self.video_service.hash_video(session.origin_video_url)
+        except Exception as e:
+            print(f"[EncodeService] session_id:[{session.id}] cannot hash video: {e}")
+            return None
+
+    def find_encoded_video(self, source_hash: str) -> str:
+        if not source_hash:
+            return None
+        encoded_video = self.encoded_video_repository.get(
+            source_hash=source_hash, profile=self.profile
+        )
+        # index에 있어도 S3에서 지워졌으면 다시 encoding 한다.
+        if encoded_video and self.video_service.exists(
+            encoded_video.encoding_video_url
+        ):
+            return encoded_video.encoding_video_url
+        return None
+
+    def reuse_encoded_video(self, session: Session, encoding_video_url: str) -> str:
+        # 다른 session의 object를 그대로 가리키면 그 session이 지워질 때 같이 깨지므로
+        # 이 session의 prefix로 복사해서 쓴다. 복사하지 못하면 다시 encoding 한다.
+        if not encoding_video_url:
+            return None
+        try:
+            copied_video_url = self.video_service.copy_encoded_video(
+                encoding_video_url, session.origin_video_url, hls=self.hls
+            )
+        except Exception as e:
+            print(
+                f"[EncodeService] session_id:[{session.id}] cannot copy encoded video {encoding_video_url}: {e}"
+            )
+            return None
+        print(
+            f"[EncodeService] session_id:[{session.id}] reuse encoded video {encoding_video_url}"
+        )
+        return copied_video_url
+
+    def add_encoded_video(self, source_hash: str, encoding_video_url: str):
+        # 같은 원본을 동시에 encoding 한 다른 worker가 먼저 남겼다면 (unique key) 무시한다.
+        try:
+            self.encoded_video_repository.add(
+                EncodedVideo(
+                    source_hash=source_hash,
+                    profile=self.profile,
+                    encoding_video_url=encoding_video_url,
+                )
+            )
+        except Exception as e:
+            print(f"[EncodeService] cannot add encoded video {encoding_video_url}: {e}")
+
+    def encode_video(self, session: Session) -> str:
+        # file 모드의 작업 디렉토리는 job마다 만들고 끝나면 지운다.
+        if self.mode == "stream":
+            return asyncio.run(
+                self.video_service.stream_encode_video(
+                    session.origin_video_url, threads=self.threads_per_job
+                )
+            )
+
+        if self.work_dir:
+            os.makedirs(self.work_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.work_dir, prefix="encode-") as tmp:
+            file_name = os.path.basename(session.origin_video_url)
+            return self.video_service.upload_encode_video(
+                session.origin_video_url,
+                os.path.join(tmp, file_name),
+                os.path.join(tmp, "encoded", f"encoded_{file_name}"),
+                threads=self.threads_per_job,
+            )
+
+    def package_hls(self, session: Session) -> bool:
+        # HLS가 실패해도 mp4는 올라갔으므로 session은 DONE으로 두고 mp4로 재생한다.
+        if self.work_dir:
+            os.makedirs(self.work_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.work_dir, prefix="hls-") as tmp:
+            try:
+                self.video_service.package_hls(
+                    session.origin_video_url,
+                    tmp,
+                    threads=self.threads_per_job,
+                    renditions=self.hls_renditions,
+                )
+                return True
+            except Exception as e:
+                print(traceback.format_exc())
+                print(f"[EncodeService] session_id:[{session.id}] hls packaging failed")
+                return False
+
+    def run_from_db(self) -> bool:
+        """
+        1. encoding이 READY 상태(또는 lease가 만료된 START 상태)인 session 하나를 START로 claim 한다.
+        2. 같은 원본(content hash)과 profile의 encoding 결과가 있으면 이 session의 prefix로 복사하고,
+           없으면 원본 영상을 download 하여 encoding 후 encoded_ 영상을 s3에 upload
+        3. encoding_video_url을 저장하고 DONE 상태로 변경
+        처리할 session이 없으면 False를 반환한다.
+        """
+        current_time = datetime.datetime.now()
+        formatted_time = current_time.strftime("%H:%M:%S")
+        print(f"[EncodeService] run from db at {formatted_time}")
+
+        target_session: Session = None
+        try:
+            target_session = self.session_repository.claim_by_encoding_state_id(
+                lease_seconds=self.lease_seconds
+            )
+            if target_session is None:
+                print(f"[EncodeService] no target_session")
+                return False
+
+            source_hash = self.get_source_hash(target_session)
+            encoding_video_url = self.reuse_encoded_video(
+                target_session, self.find_encoded_video(source_hash)
+            )
+            if not encoding_video_url:
+                print(
+                    f"[EncodeService] session_id:[{target_session.id}] start encode video {target_session.origin_video_url}"
+                )
+                encoding_video_url = self.encode(target_session, source_hash)
+
+            print(
+                f"[EncodeService] session_id:[{target_session.id}] upload encoded video {encoding_video_url}"
+            )
+            # claim 한 lease가 그대로일 때만 DONE으로 바꾼다.
+            if not self.session_repository.update_encoding_state_by_session_id(
+                session_id=target_session.id,
+                new_state_id=StateTypeEnum.DONE,
+                encoding_video_url=encoding_video_url,
+                origin_video_hash=source_hash,
+                lease_expired_at=target_session.encoding_lease_expired_at,
+            ):
+                # encoding이 lease보다 오래 걸려 다른 worker가 다시 claim 한 session
+                print(
+                    f"[EncodeService] session_id:[{target_session.id}] lease expired, skip DONE"
+                )
+
+        except Exception as e:
+            print(traceback.format_exc())
+            # claim 단계에서 실패했다면 처리한 session이 없다.
+            if target_session is None:
+                return False
+            try:
+                self.session_repository.update_encoding_state_by_session_id(
+                    session_id=target_session.id,
+                    new_state_id=StateTypeEnum.ERROR,
+                    lease_expired_at=target_session.encoding_lease_expired_at,
+                )
+            except Exception:
+                # ERROR로 바꾸지 못한 session은 START로 남아 lease가 만료되면 다시 claim 된다.
+                print(traceback.format_exc())
+        return True
+
+    def run_workers(self) -> int:
+        """
+        worker_count개의 worker가 각자 session을 하나씩 claim 하여 동시에 encoding한다.
+        처리한 session 수를 반환한다.
+        """
+        return self.run_tick(mode="cron", work=lambda: int(self.run_from_db()))
+
+    def drain(self) -> int:
+        """
+        worker_count개의 worker가 claim할 session이 없을 때까지 계속 encoding한다.
+        처리한 session 수를 반환한다.
+        """
+
+        def work() -> int:
+            processed = 0
+            while self.run_from_db():
+                processed += 1
+            return processed
+
+        return self.run_tick(mode="drain", work=work)
+
+    def run_tick(self, mode: str, work) -> int:
+        start_time = datetime.datetime.now()
+        try:
+            queue_depth = self.session_repository.count_by_encoding_state_id(
+                state_id=StateTypeEnum.READY
+            )
+        except Exception:
+            # queue depth는 모니터링 용도이므로 조회에 실패해도 encoding은 계속한다.
+            print(traceback.format_exc())
+            queue_depth = None
+        with ThreadPoolExecutor(max_workers=self.worker_count) as executor:
+            futures = [executor.submit(work) for _ in range(self.worker_count)]
+        processed = sum(future.result() for future in futures)
+
+        elapsed_seconds = (datetime.datetime.now() - start_time).total_seconds()
+        self.queue_stats = QueueStats(
+            mode=mode,
+            queue_depth=queue_depth,
+            processed=processed,
+            elapsed_seconds=elapsed_seconds,
+            throughput_per_minute=(
+                processed * 60 / elapsed_seconds if elapsed_seconds > 0 else 0.0
+            ),
+            threads_per_job=self.threads_per_job,
+            ticked_at=start_time.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        return processed
@@ -0,0 +1,13 @@
+import os
+
+
+class Settings:
+    VERSION = "0.0.1"
+    APP_TITLE = "ENCODE"
+    PROJECT_NAME = "Play Therapy"
+
+    PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+    BASE_DIR = os.path.abspath(os.path.join(PROJECT_ROOT, os.pardir))
+
+
+settings = Settings()
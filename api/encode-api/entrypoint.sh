@@ -0,0 +1 @@
+poetry run uvicorn main:app --host 0.0.0.0 --app-dir ./encode
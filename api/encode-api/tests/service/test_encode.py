@@ -0,0 +1,332 @@
+import os
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from encode.service.encode import EncodeService
+from core.model.domain.session import Session
+from core.model.domain.encoded_video import EncodedVideo
+from core.model.domain.state_type import StateTypeEnum
+
+LEASE_EXPIRED_AT = datetime(2024, 1, 1, 0, 10)
+
+
+def make_session(session_id: int) -> Session:
+    return Session(
+        id=session_id,
+        name=f"session_{session_id}",
+        session_state_id=1,
+        case_id=1,
+        origin_video_url=f"video_{session_id}.mp4",
+        encoding_state_id=StateTypeEnum.START,
+        script_state_id=StateTypeEnum.READY,
+        analyze_state_id=StateTypeEnum.READY,
+        created_date=None,
+        encoding_lease_expired_at=LEASE_EXPIRED_AT,
+    )
+
+
+class TestEncodeService(unittest.TestCase):
+
+    def setUp(self):
+        self.session_repository = MagicMock()
+        self.session_repository.count_by_encoding_state_id.return_value = 0
+        self.video_service = MagicMock()
+        self.video_service.encoding_profile.return_value = "mp4"
+        self.video_service.upload_encode_video.side_effect = (
+            lambda object_name, file_name, encoded_file_name, threads: os.path.basename(
+                encoded_file_name
+            )
+        )
+        self.encoded_video_repository = MagicMock()
+        self.encoded_video_repository.get.return_value = None
+        self.encode_service = EncodeService(
+            session_repository=self.session_repository,
+            video_service=self.video_service,
+            worker_count=2,
+            threads_per_job=3,
+            lease_seconds=600,
+            encoded_video_repository=self.encoded_video_repository,
+        )
+
+    def test_run_from_db(self):
+        self.session_repository.claim_by_encoding_state_id.return_value = make_session(
+            1
+        )
+
+        self.assertTrue(self.encode_service.run_from_db())
+
+        self.session_repository.claim_by_encoding_state_id.assert_called_once_with(
+            lease_seconds=600
+        )
+        args, kwargs = self.video_service.upload_encode_video.call_args
+        self.assertEqual(args[0], "video_1.mp4")
+        self.assertEqual(kwargs["threads"], 3)
+        self.session_repository.update_encoding_state_by_session_id.assert_called_once_with(
+            session_id=1,
+            new_state_id=StateTypeEnum.DONE,
+            encoding_video_url="encoded_video_1.mp4",
+            origin_video_hash=None,
+            lease_expired_at=LEASE_EXPIRED_AT,
+        )
+
+    def test_run_from_db_no_session(self):
+        self.session_repository.claim_by_encoding_state_id.return_value = None
+
+        self.assertFalse(self.encode_service.run_from_db())
+        self.video_service.upload_encode_video.assert_not_called()
+
+    def test_run_from_db_error(self):
+        self.session_repository.claim_by_encoding_state_id.return_value = make_session(
+            1
+        )
+        self.video_service.upload_encode_video.side_effect = Exception("ffmpeg")
+
+        # 실패한 session은 ERROR로 남기고 다음 session으로 넘어간다.
+        self.assertTrue(self.encode_service.run_from_db())
+        self.session_repository.update_encoding_state_by_session_id.assert_called_once_with(
+            session_id=1,
+            new_state_id=StateTypeEnum.ERROR,
+            lease_expired_at=LEASE_EXPIRED_AT,
+        )
+
+    def test_drain(self):
+        sessions = iter([make_session(i) for i in range(5)])
+        self.session_repository.claim_by_encoding_state_id.side_effect = (
+            lambda lease_seconds: next(sessions, None)
+        )
+        self.session_repository.count_by_encoding_state_id.return_value = 5
+
+        self.assertEqual(self.encode_service.drain(), 5)
+
+        self.assertEqual(self.video_service.upload_encode_video.call_count, 5)
+        stats = self.encode_service.queue_stats
+        self.assertEqual(stats.mode, "drain")
+        self.assertEqual(stats.queue_depth, 5)
+        self.assertEqual(stats.processed, 5)
+        self.assertEqual(stats.threads_per_job, 3)
+
+    def test_run_from_db_lease_expired(self):
+        self.session_repository.claim_by_encoding_state_id.return_value = make_session(
+            1
+        )
+        # lease가 만료되어 다른 worker가 다시 claim 했다면 update 되는 row가 없다.
+        self.session_repository.update_encoding_state_by_session_id.return_value = False
+
+        self.assertTrue(self.encode_service.run_from_db())
+        self.session_repository.update_encoding_state_by_session_id.assert_called_once()
+        self.assertEqual(
+            self.session_repository.update_encoding_state_by_session_id.call_args.kwargs[
+                "new_state_id"
+            ],
+            StateTypeEnum.DONE,
+        )
+
+    def test_run_from_db_error_update_error(self):
+        self.session_repository.claim_by_encoding_state_id.return_value = make_session(
+            1
+        )
+        self.video_service.upload_encode_video.side_effect = Exception("ffmpeg")
+        self.session_repository.update_encoding_state_by_session_id.side_effect = (
+            ConnectionError()
+        )
+
+        # ERROR로 바꾸지 못해도 worker는 계속 다음 session을 처리한다.
+        self.assertTrue(self.encode_service.run_from_db())
+
+    def test_drain_count_error(self):
+        sessions = iter([make_session(1)])
+        self.session_repository.claim_by_encoding_state_id.side_effect = (
+            lambda lease_seconds: next(sessions, None)
+        )
+        self.session_repository.count_by_encoding_state_id.side_effect = (
+            ConnectionError()
+        )
+
+        self.assertEqual(self.encode_service.drain(), 1)
+        self.assertIsNone(self.encode_service.queue_stats.queue_depth)
+
+    def test_run_workers(self):
+        sessions = iter([make_session(i) for i in range(5)])
+        self.session_repository.claim_by_encoding_state_id.side_effect = (
+            lambda lease_seconds: next(sessions, None)
+        )
+
+        # cron 모드는 tick마다 worker_count개까지만 처리한다.
+        self.assertEqual(self.encode_service.run_workers(), 2)
+        self.assertEqual(self.encode_service.queue_stats.mode, "cron")
+
+    def test_run_from_db_stream(self):
+        self.session_repository.claim_by_encoding_state_id.return_value = make_session(
+            1
+        )
+        self.video_service.stream_encode_video = AsyncMock(
+            return_value="encoded_video_1.mp4"
+        )
+        self.encode_service.mode = "stream"
+
+        self.assertTrue(self.encode_service.run_from_db())
+
+        self.video_service.stream_encode_video.assert_awaited_once_with(
+            "video_1.mp4", threads=3
+        )
+        self.video_service.upload_encode_video.assert_not_called()
+        self.session_repository.update_encoding_state_by_session_id.assert_called_once_with(
+            session_id=1,
+            new_state_id=StateTypeEnum.DONE,
+            encoding_video_url="encoded_video_1.mp4",
+            origin_video_hash=None,
+            lease_expired_at=LEASE_EXPIRED_AT,
+        )
+
+    def test_run_from_db_hls(self):
+        self.session_repository.claim_by_encoding_state_id.return_value = make_session(
+            1
+        )
+        self.encode_service.hls = True
+        self.encode_service.hls_renditions = [
+            {"name": "240p", "height": 240, "video_bitrate": 300, "audio_bitrate": 64}
+        ]
+
+        self.assertTrue(self.encode_service.run_from_db())
+
+        args, kwargs = self.video_service.package_hls.call_args
+        self.assertEqual(args[0], "video_1.mp4")
+        self.assertEqual(kwargs["threads"], 3)
+        self.assertEqual(kwargs["renditions"], self.encode_service.hls_renditions)
+
+    def test_run_from_db_hls_failed(self):
+        self.session_repository.claim_by_encoding_state_id.return_value = make_session(
+            1
+        )
+        self.video_service.package_hls.side_effect = Exception("ffmpeg")
+        self.encode_service.hls = True
+
+        # HLS가 실패해도 mp4는 올라갔으므로 DONE으로 둔다.
+        self.assertTrue(self.encode_service.run_from_db())
+        self.session_repository.update_encoding_state_by_session_id.assert_called_once_with(
+            session_id=1,
+            new_state_id=StateTypeEnum.DONE,
+            encoding_video_url="encoded_video_1.mp4",
+            origin_video_hash=None,
+            lease_expired_at=LEASE_EXPIRED_AT,
+        )
+
+    def test_run_from_db_reuse(self):
+        session = make_session(1)
+        session.origin_video_hash = "sha256:abc"
+        self.session_repository.claim_by_encoding_state_id.return_value = session
+        self.encoded_video_repository.get.return_value = EncodedVideo(
+            source_hash="sha256:abc",
+            profile="mp4",
+            encoding_video_url="LOCAL/1/9/encoded_video.mp4",
+        )
+        self.video_service.exists.return_value = True
+        self.video_service.copy_encoded_video.return_value = "encoded_video_1.mp4"
+        self.encode_service.reuse = True
+
+        self.assertTrue(self.encode_service.run_from_db())
+
+        self.video_service.upload_encode_video.assert_not_called()
+        self.encoded_video_repository.get.assert_called_once_with(
+            source_hash="sha256:abc", profile=self.encode_service.profile
+        )
+        # 다른 session의 object를 가리키지 않고 이 session의 prefix로 복사한다.
+        self.video_service.copy_encoded_video.assert_called_once_with(
+            "LOCAL/1/9/encoded_video.mp4", "video_1.mp4", hls=False
+        )
+        self.session_repository.update_encoding_state_by_session_id.assert_called_once_with(
+            session_id=1,
+            new_state_id=StateTypeEnum.DONE,
+            encoding_video_url="encoded_video_1.mp4",
+            origin_video_hash="sha256:abc",
+            lease_expired_at=LEASE_EXPIRED_AT,
+        )
+
+    def test_run_from_db_reuse_deleted(self):
+        session = make_session(1)
+        session.origin_video_hash = "sha256:abc"
+        self.session_repository.claim_by_encoding_state_id.return_value = session
+        self.encoded_video_repository.get.return_value = EncodedVideo(
+            source_hash="sha256:abc",
+            profile="mp4",
+            encoding_video_url="LOCAL/1/9/encoded_video.mp4",
+        )
+        self.video_service.exists.return_value = False
+        self.encode_service.reuse = True
+
+        self.assertTrue(self.encode_service.run_from_db())
+
+        # S3에서 지워진 결과는 재사용하지 않고 다시 encoding 한다.
+        self.video_service.upload_encode_video.assert_called_once()
+
+    def test_run_from_db_reuse_copy_failed(self):
+        session = make_session(1)
+        session.origin_video_hash = "sha256:abc"
+        self.session_repository.claim_by_encoding_state_id.return_value = session
+        self.encoded_video_repository.get.return_value = EncodedVideo(
+            source_hash="sha256:abc",
+            profile="mp4",
+            encoding_video_url="LOCAL/1/9/encoded_video.mp4",
+        )
+        self.video_service.exists.return_value = True
+        self.video_service.copy_encoded_video.side_effect = Exception("copy")
+        self.encode_service.reuse = True
+
+        self.assertTrue(self.encode_service.run_from_db())
+
+        # 복사하지 못하면 다시 encoding 한다.
+        self.video_service.upload_encode_video.assert_called_once()
+        self.assertEqual(
+            self.session_repository.update_encoding_state_by_session_id.call_args.kwargs[
+                "encoding_video_url"
+            ],
+            "encoded_video_1.mp4",
+        )
+
+    def test_run_from_db_index(self):
+        # upload 할 때 hash를 계산하지 못한 원본은 S3에서 읽어 계산하고, 결과를 index에 남긴다.
+        self.session_repository.claim_by_encoding_state_id.return_value = make_session(
+            1
+        )
+        self.video_service.hash_video.return_value = "sha256:abc"
+        self.encode_service.reuse = True
+
+        self.assertTrue(self.encode_service.run_from_db())
+
+        self.video_service.hash_video.assert_called_once_with("video_1.mp4")
+        encoded_video = self.encoded_video_repository.add.call_args.args[0]
+        self.assertEqual(encoded_video.source_hash, "sha256:abc")
+        self.assertEqual(encoded_video.encoding_video_url, "encoded_video_1.mp4")
+        self.assertEqual(
+            self.session_repository.update_encoding_state_by_session_id.call_args.kwargs[
+                "origin_video_hash"
+            ],
+            "sha256:abc",
+        )
+
+    def test_run_from_db_index_hls_failed(self):
+        session = make_session(1)
+        session.origin_video_hash = "sha256:abc"
+        self.session_repository.claim_by_encoding_state_id.return_value = session
+        self.video_service.package_hls.side_effect = Exception("ffmpeg")
+        self.encode_service.reuse = True
+        self.encode_service.hls = True
+
+        self.assertTrue(self.encode_service.run_from_db())
+
+        # HLS가 없는 결과는 HLS profile로 남기지 않는다.
+        self.encoded_video_repository.add.assert_not_called()
+
+    @patch("encode.service.encode.os.cpu_count", return_value=8)
+    def test_threads_per_job_default(self, _):
+        encode_service = EncodeService(
+            session_repository=self.session_repository,
+            video_service=self.video_service,
+            worker_count=2,
+        )
+
+        self.assertEqual(encode_service.threads_per_job, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
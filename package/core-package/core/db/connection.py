@@ -1,20 +1,107 @@
 from abc import ABC
 from functools import wraps
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.orm import registry
 from sqlalchemy.orm import declarative_base
 from core.db.common_declarative_base import Base
+from core.db.metrics import PoolMetrics, TimedQueuePool, TimedAsyncAdaptedQueuePool
+from core.model.domain.pool import PoolStats
 
 class ConnectionManager(ABC):
-    def __init__(self, db_url: str, pool_recycle: int):
-        self.engine = create_engine(db_url, pool_recycle=pool_recycle)
+    def __init__(
+        self,
+        db_url: str,
+        pool_recycle: int,
+        pool_size: int = None,
+        max_overflow: int = None,
+        pool_timeout: float = None,
+        pool_pre_ping: bool = None,
+        pool_use_lifo: bool = None,
+        async_db_url: str = None,
+    ):
+        # 값이 없는 설정은 sqlalchemy 기본값을 사용한다.
+        pool_options = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_pre_ping": pool_pre_ping,
+            "pool_use_lifo": pool_use_lifo,
+        }
+        self.pool_options = {
+            key: value for key, value in pool_options.items() if value is not None
+        }
+        self.pool_recycle = pool_recycle
+        self.engine = create_engine(
+            db_url,
+            pool_recycle=pool_recycle,
+            poolclass=TimedQueuePool,
+            **self.pool_options,
+        )
+        self.pool_metrics = PoolMetrics()
+        self.pool_metrics.attach(self.engine)
+        self.engine.pool.metrics = self.pool_metrics
+
         self.mapper_registry = registry()
         self.mapper_registry.metadata.create_all(self.engine)
         Base.metadata.create_all(self.engine)
+        # engine 당 하나의 session factory를 재사용한다.
+        self.session_factory = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine
+        )
+
+        # async engine은 처음 사용할 때 만든다. (async driver가 필요 없는 batch 등)
+        self.async_db_url = async_db_url or self.make_async_db_url(db_url)
+        self.async_engine: AsyncEngine = None
+        self.async_session_factory = None
+        self.async_pool_metrics = PoolMetrics()
+
+    @staticmethod
+    def make_async_db_url(db_url: str) -> str:
+        # mysql+pymysql:// -> mysql+aiomysql://
+        url = make_url(db_url)
+        if url.get_backend_name() == "mysql":
+            url = url.set(drivername="mysql+aiomysql")
+        elif url.get_backend_name() == "sqlite":
+            url = url.set(drivername="sqlite+aiosqlite")
+        return url.render_as_string(hide_password=False)
 
     def make_session(self) -> Session:
-        return sessionmaker(autocommit=False, autoflush=False, bind=self.engine)()
+        return self.session_factory()
+
+    def get_async_engine(self) -> AsyncEngine:
+        if self.async_engine is None:
+            self.async_engine = create_async_engine(
+                self.async_db_url,
+                pool_recycle=self.pool_recycle,
+                poolclass=TimedAsyncAdaptedQueuePool,
+                **self.pool_options,
+            )
+            self.async_pool_metrics.attach(self.async_engine.sync_engine)
+            self.async_engine.sync_engine.pool.metrics = self.async_pool_metrics
+            self.async_session_factory = async_sessionmaker(
+                autocommit=False, autoflush=False, bind=self.async_engine
+            )
+        return self.async_engine
+
+    def make_async_session(self) -> AsyncSession:
+        self.get_async_engine()
+        return self.async_session_factory()
+
+    def get_pool_stats(self) -> PoolStats:
+        return self.pool_metrics.snapshot(self.engine.pool)
+
+    def get_async_pool_stats(self) -> PoolStats:
+        if self.async_engine is None:
+            return PoolStats()
+        return self.async_pool_metrics.snapshot(self.async_engine.sync_engine.pool)
+
+    async def dispose_async_engine(self):
+        if self.async_engine is not None:
+            await self.async_engine.dispose()
 
     @staticmethod
     def manage_db_session(func):
@@ -59,3 +146,53 @@ class ConnectionManager(ABC):
             return result
 
         return wrapper
+
+    @staticmethod
+    def manage_async_db_session(func):
+        """
+        manage_db_session으로 감싼 repository method를 AsyncSession에서 실행하는 async method로 만든다.
+        query 본문은 AsyncSession.run_sync()에서 sync Session으로 그대로 실행된다.
+        """
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            db_session = kwargs.pop("db_session", None)
+            if db_session is None:
+                db_session = self.connection_manager.make_async_session()
+                should_close = True
+            else:
+                should_close = False
+
+            try:
+                return await db_session.run_sync(
+                    lambda session: func(self, *args, db_session=session, **kwargs)
+                )
+            finally:
+                if should_close:
+                    await db_session.close()
+
+        return wrapper
+
+    @staticmethod
+    def manage_async_db_session_with_transaction(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            db_session = kwargs.pop("db_session", None)
+            if db_session is None:
+                db_session = self.connection_manager.make_async_session()
+                should_commit_and_close = True
+            else:
+                should_commit_and_close = False
+
+            try:
+                result = await db_session.run_sync(
+                    lambda session: func(self, *args, db_session=session, **kwargs)
+                )
+                if should_commit_and_close and result:
+                    await db_session.commit()
+                return result
+            finally:
+                if should_commit_and_close:
+                    await db_session.close()
+
+        return wrapper
@@ -0,0 +1,100 @@
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from core.model.domain.pool import PoolStats
+
+
+class PoolMetrics:
+    # checkout 대기 시간 histogram 구간 (초)
+    BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.bucket_counts = [0] * (len(self.BUCKETS) + 1)
+
+    def attach(self, engine):
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            with self.lock:
+                self.connects += 1
+
+    def observe_checkout(self, seconds: float):
+        index = len(self.BUCKETS)
+        for i, bucket in enumerate(self.BUCKETS):
+            if seconds <= bucket:
+                index = i
+                break
+        with self.lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.bucket_counts[index] += 1
+
+    def observe_timeout(self):
+        with self.lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool) -> PoolStats:
+        with self.lock:
+            checkout_latency = dict()
+            count = 0
+            for bucket, bucket_count in zip(
+                [str(bucket) for bucket in self.BUCKETS] + ["+Inf"], self.bucket_counts
+            ):
+                count += bucket_count
+                checkout_latency[bucket] = count
+            stats = PoolStats(
+                connects=self.connects,
+                checkouts=self.checkouts,
+                timeouts=self.timeouts,
+                wait_seconds_total=self.wait_seconds_total,
+                wait_seconds_max=self.wait_seconds_max,
+                checkout_latency=checkout_latency,
+            )
+
+        if isinstance(pool, QueuePool):
+            stats.size = pool.size()
+            stats.checked_in = pool.checkedin()
+            stats.checked_out = pool.checkedout()
+            stats.overflow = max(pool.overflow(), 0)
+        return stats
+
+
+class TimedPoolMixin:
+    """connection checkout에 걸린 시간(대기 포함)을 PoolMetrics에 기록한다."""
+
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            if self.metrics is not None:
+                self.metrics.observe_timeout()
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # dispose() 등으로 pool이 다시 만들어져도 같은 metrics를 사용한다.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class EncodedVideo(BaseModel):
+    id: Optional[int] = None
+    # "sha256:{hex}" 형식의 원본 영상 content hash
+    source_hash: str
+    # encoding 설정 (codec, bitrate, HLS rendition 등)
+    profile: str
+    encoding_video_url: str
+    created_time: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
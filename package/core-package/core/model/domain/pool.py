@@ -0,0 +1,16 @@
+from typing import Dict
+from pydantic import BaseModel, Field
+
+
+class PoolStats(BaseModel):
+    size: int = 0
+    checked_in: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    connects: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    # checkout 대기 시간 histogram (le: 초 단위 상한 -> 누적 개수)
+    checkout_latency: Dict[str, int] = Field(default_factory=dict)
@@ -12,3 +12,13 @@ class JwtPayload(BaseModel):
 
 class Token(BaseModel):
     access_token: str
+
+
+class TokenCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    # max_size를 넘어 LRU로 밀려난 token 수
+    evictions: int = 0
+    size: int = 0
+    max_size: int = 0
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, Field
 from typing import Optional
 
 
@@ -16,7 +17,14 @@ class Session(BaseModel):
     video_length: Optional[str] = None
     origin_video_url: Optional[str] = None
     encoding_video_url: Optional[str] = None
+    # 원본 영상 content hash (encoding 결과 재사용 key). 서버가 계산한 값만
+    # SessionRepository.update_origin_video / update_encoding_state_by_session_id로 저장한다.
+    # (client가 보낸 값이 update()로 저장되거나 응답에 나가지 않도록 dump 하지 않는다)
+    origin_video_hash: Optional[str] = Field(default=None, exclude=True)
     analyze_url: Optional[str] = None
+    # worker가 claim 할 때 잡은 lease 기한 (DONE/ERROR update 조건, 응답과 update()에는 포함하지 않는다)
+    analyze_lease_expired_at: Optional[datetime] = Field(default=None, exclude=True)
+    encoding_lease_expired_at: Optional[datetime] = Field(default=None, exclude=True)
 
     class Config:
         from_attributes = True
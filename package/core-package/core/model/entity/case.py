@@ -16,3 +16,5 @@ class CaseEntity(Base):
     start_date = Column(String)
     updated_date = Column(String)
     case_state_id = Column(Integer, nullable=False)
+    # tbl_session 개수 (session add/delete와 같은 transaction에서 증감한다)
+    session_count = Column(Integer, nullable=False, default=0, server_default="0")
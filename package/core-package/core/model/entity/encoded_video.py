@@ -0,0 +1,16 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, UniqueConstraint, func
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+
+class EncodedVideoEntity(Base):
+    # 원본 영상 content hash + encoding profile 별 encoding 결과 (같은 원본은 다시 encoding 하지 않는다)
+    __tablename__ = "tbl_encoded_video"
+    __table_args__ = (UniqueConstraint("source_hash", "profile"),)
+
+    id = Column(BigInteger, primary_key=True, nullable=False, autoincrement=True)
+    source_hash = Column(String(80), nullable=False)
+    profile = Column(String(255), nullable=False)
+    encoding_video_url = Column(String(1024), nullable=False)
+    created_time = Column(DateTime, default=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, BigInteger, Integer, String, Text
+from sqlalchemy import Column, ForeignKey, BigInteger, Integer, String, Text, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -21,4 +21,10 @@ class SessionEntity(Base):
     video_length = Column(String(128))
     origin_video_url = Column(String(1024))
     encoding_video_url = Column(String(1024))
+    # 원본 영상 content hash ("sha256:{hex}", upload 하면서 계산)
+    origin_video_hash = Column(String(80))
     analyze_url = Column(String(1024))
+    # analyze worker가 session을 점유하고 있는 기한 (만료되면 다른 worker가 다시 가져간다)
+    analyze_lease_expired_at = Column(DateTime)
+    # encode worker가 session을 점유하고 있는 기한 (만료되면 다른 worker가 다시 가져간다)
+    encoding_lease_expired_at = Column(DateTime)
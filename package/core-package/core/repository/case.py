@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from functools import wraps
 from sqlalchemy import or_, and_, func
 from sqlalchemy.orm import Session
@@ -10,8 +10,28 @@ from core.db.connection import ConnectionManager
 
 
 class CaseRepository:
-    def __init__(self, connection_manager: ConnectionManager):
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        maintained_session_count: bool = False,
+    ):
         self.connection_manager = connection_manager
+        # True: tbl_case.session_count(session add/delete 시 증감)를 읽는다.
+        # False: tbl_session을 join + group by 하여 매번 센다.
+        self.maintained_session_count = maintained_session_count
+
+    def query_with_session_count(self, db_session: Session):
+        if self.maintained_session_count:
+            return db_session.query(CaseEntity, CaseEntity.session_count)
+        return db_session.query(
+            CaseEntity,
+            func.count(SessionEntity.case_id).label("session_count"),
+        ).join(SessionEntity, CaseEntity.id == SessionEntity.case_id, isouter=True)
+
+    def group_by_case(self, query):
+        if self.maintained_session_count:
+            return query
+        return query.group_by(CaseEntity.id)
 
     @ConnectionManager.manage_db_session_with_transaction
     def add(self, case: Case, db_session: Optional[Session] = None) -> Case:
@@ -19,18 +39,14 @@ class CaseRepository:
         db_session.add(case_entity)
         return case
 
+    async_add = ConnectionManager.manage_async_db_session_with_transaction(add)
+
     @ConnectionManager.manage_db_session
     def get(
         self, case_id: int, user_id: int = None, db_session: Optional[Session] = None
     ) -> Case:
-        query = (
-            db_session.query(
-                CaseEntity,
-                func.count(SessionEntity.case_id).label("session_count"),
-            )
-            .join(SessionEntity, CaseEntity.id == SessionEntity.case_id, isouter=True)
-            .filter(CaseEntity.id == case_id)
-            .group_by(CaseEntity.id)
+        query = self.group_by_case(
+            self.query_with_session_count(db_session).filter(CaseEntity.id == case_id)
         )
 
         if user_id:
@@ -43,6 +59,20 @@ class CaseRepository:
 
         return None
 
+    async_get = ConnectionManager.manage_async_db_session(get)
+
+    @ConnectionManager.manage_db_session
+    def exists(
+        self, case_id: int, user_id: int = None, db_session: Optional[Session] = None
+    ) -> bool:
+        # 소유권 확인용: session 수 집계(join + group by) 없이 pk로 한 row만 확인한다.
+        query = db_session.query(CaseEntity.id).filter(CaseEntity.id == case_id)
+        if user_id:
+            query = query.filter(CaseEntity.user_id == user_id)
+        return bool(db_session.query(query.exists()).scalar())
+
+    async_exists = ConnectionManager.manage_async_db_session(exists)
+
     @ConnectionManager.manage_db_session
     def total_count(
         self,
@@ -63,24 +93,10 @@ class CaseRepository:
         total_cases = query.count()
         return total_cases
 
+    async_total_count = ConnectionManager.manage_async_db_session(total_count)
+
     # TODO: description 속 key 문자열("age","gender") 삭제 후 키워드 검색
-    @ConnectionManager.manage_db_session
-    def get_list(
-        self,
-        user_id: int = None,
-        skip: int = None,
-        limit: int = None,
-        keyword: str = None,
-        db_session: Optional[Session] = None,
-    ) -> List[Case]:
-        query = (
-            db_session.query(
-                CaseEntity,
-                func.count(SessionEntity.case_id).label("session_count"),
-            )
-            .join(SessionEntity, CaseEntity.id == SessionEntity.case_id, isouter=True)
-            .group_by(CaseEntity.id)
-        )
+    def filter_list(self, query, user_id: int = None, keyword: str = None):
         if user_id:
             query = query.filter(CaseEntity.user_id == user_id)
         if keyword:
@@ -92,6 +108,22 @@ class CaseRepository:
                     ).like(f"%{keyword}%"),
                 )
             )
+        return query
+
+    @ConnectionManager.manage_db_session
+    def get_list(
+        self,
+        user_id: int = None,
+        skip: int = None,
+        limit: int = None,
+        keyword: str = None,
+        db_session: Optional[Session] = None,
+    ) -> List[Case]:
+        query = self.filter_list(
+            self.group_by_case(self.query_with_session_count(db_session)),
+            user_id=user_id,
+            keyword=keyword,
+        )
         case_entities = (
             query.order_by(CaseEntity.id.desc()).offset(skip).limit(limit).all()
         )
@@ -101,6 +133,44 @@ class CaseRepository:
             result.append(Case.model_validate(case_entity, session_count))
         return result
 
+    async_get_list = ConnectionManager.manage_async_db_session(get_list)
+
+    @ConnectionManager.manage_db_session
+    def get_list_by_cursor(
+        self,
+        user_id: int = None,
+        limit: int = None,
+        after_id: int = None,
+        before_id: int = None,
+        keyword: str = None,
+        db_session: Optional[Session] = None,
+    ) -> List[Case]:
+        # OFFSET 없이 id 범위로 한 page만 읽는다. (id 내림차순으로 반환)
+        # after_id: 그보다 오래된(작은 id) case / before_id: 그보다 최근(큰 id) case
+        query = self.filter_list(
+            self.group_by_case(self.query_with_session_count(db_session)),
+            user_id=user_id,
+            keyword=keyword,
+        )
+        if before_id is not None:
+            query = query.filter(CaseEntity.id > before_id).order_by(CaseEntity.id)
+        else:
+            if after_id is not None:
+                query = query.filter(CaseEntity.id < after_id)
+            query = query.order_by(CaseEntity.id.desc())
+
+        case_entities = query.limit(limit).all()
+        if before_id is not None:
+            case_entities.reverse()
+        return [
+            Case.model_validate(case_entity, session_count)
+            for case_entity, session_count in case_entities
+        ]
+
+    async_get_list_by_cursor = ConnectionManager.manage_async_db_session(
+        get_list_by_cursor
+    )
+
     @ConnectionManager.manage_db_session_with_transaction
     def update(
         self,
@@ -117,6 +187,8 @@ class CaseRepository:
 
         return update_count > 0
 
+    async_update = ConnectionManager.manage_async_db_session_with_transaction(update)
+
     @ConnectionManager.manage_db_session_with_transaction
     def delete(self, case_id: int, user_id: int, db_session: Optional[Session] = None):
         delete_count = (
@@ -125,3 +197,46 @@ class CaseRepository:
             .delete()
         )
         return delete_count > 0
+
+    async_delete = ConnectionManager.manage_async_db_session_with_transaction(delete)
+
+    @ConnectionManager.manage_db_session_with_transaction
+    def reconcile_session_count(
+        self,
+        after_id: int = 0,
+        limit: int = 500,
+        db_session: Optional[Session] = None,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        id가 after_id보다 큰 case limit개의 session_count를 tbl_session 개수로 맞춘다.
+        (마지막 case id, 고친 case 수)를 반환하고, 남은 case가 없으면 None을 반환한다.
+        case row를 먼저 잠그므로 그 사이에 추가/삭제된 session의 증감은 이 batch 이후에 반영된다.
+        """
+        cases = (
+            db_session.query(CaseEntity.id, CaseEntity.session_count)
+            .filter(CaseEntity.id > after_id)
+            .order_by(CaseEntity.id)
+            .limit(limit)
+            .with_for_update()
+            .all()
+        )
+        if not cases:
+            return None
+
+        case_ids = [case_id for case_id, _ in cases]
+        session_counts = dict(
+            db_session.query(SessionEntity.case_id, func.count(SessionEntity.id))
+            .filter(SessionEntity.case_id.in_(case_ids))
+            .group_by(SessionEntity.case_id)
+            .all()
+        )
+
+        updated = 0
+        for case_id, session_count in cases:
+            actual_count = session_counts.get(case_id, 0)
+            if session_count != actual_count:
+                db_session.query(CaseEntity).filter(CaseEntity.id == case_id).update(
+                    {"session_count": actual_count}, synchronize_session=False
+                )
+                updated += 1
+        return case_ids[-1], updated
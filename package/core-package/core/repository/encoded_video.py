@@ -0,0 +1,40 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from core.model.domain.encoded_video import EncodedVideo
+from core.model.entity.encoded_video import EncodedVideoEntity
+from core.db.connection import ConnectionManager
+
+
+class EncodedVideoRepository:
+    def __init__(self, connection_manager: ConnectionManager):
+        self.connection_manager = connection_manager
+
+    @ConnectionManager.manage_db_session
+    def get(
+        self, source_hash: str, profile: str, db_session: Optional[Session] = None
+    ) -> Optional[EncodedVideo]:
+        encoded_video_entity = (
+            db_session.query(EncodedVideoEntity)
+            .filter(
+                EncodedVideoEntity.source_hash == source_hash,
+                EncodedVideoEntity.profile == profile,
+            )
+            .first()
+        )
+        if encoded_video_entity is not None:
+            return EncodedVideo.model_validate(encoded_video_entity)
+
+        return None
+
+    @ConnectionManager.manage_db_session_with_transaction
+    def add(
+        self, encoded_video: EncodedVideo, db_session: Optional[Session] = None
+    ) -> EncodedVideo:
+        encoded_video_entity = EncodedVideoEntity(
+            **encoded_video.model_dump(exclude={"id", "created_time"})
+        )
+        db_session.add(encoded_video_entity)
+        db_session.flush()
+
+        return EncodedVideo.model_validate(encoded_video_entity)
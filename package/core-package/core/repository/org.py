@@ -27,3 +27,5 @@ class OrgRepository:
                 result.append(Org.model_validate(entity))
             return result
         return []
+
+    async_list = ConnectionManager.manage_async_db_session(list)
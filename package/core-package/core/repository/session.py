@@ -1,8 +1,11 @@
+from datetime import datetime, timedelta
 from typing import Optional, List
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session as SQLAlchemySession
 
 from core.model.domain.session import Session as SessionDomain
 from core.model.domain.state_type import StateTypeEnum
+from core.model.entity.case import CaseEntity
 from core.model.entity.session import SessionEntity
 from core.db.connection import ConnectionManager
 
@@ -20,9 +23,27 @@ class SessionRepository:
         session_entity = SessionEntity(**session.model_dump())
         db_session.add(session_entity)
         db_session.flush()
+        self.update_session_count(session_entity.case_id, 1, db_session)
 
         return SessionDomain.model_validate(session_entity)
 
+    async_add = ConnectionManager.manage_async_db_session_with_transaction(add)
+
+    @staticmethod
+    def update_session_count(
+        case_id: int, delta: int, db_session: SQLAlchemySession
+    ) -> bool:
+        # tbl_case.session_count를 session add/delete와 같은 transaction에서 증감한다.
+        # (값을 읽지 않고 UPDATE 한 번으로 더하므로 동시에 추가해도 누락되지 않는다)
+        query = db_session.query(CaseEntity).filter(CaseEntity.id == case_id)
+        if delta < 0:
+            query = query.filter(CaseEntity.session_count >= -delta)
+        update_count = query.update(
+            {CaseEntity.session_count: CaseEntity.session_count + delta},
+            synchronize_session=False,
+        )
+        return update_count > 0
+
     @ConnectionManager.manage_db_session
     def get(
         self, session_id: int, db_session: Optional[SQLAlchemySession] = None
@@ -37,6 +58,8 @@ class SessionRepository:
 
         return None
 
+    async_get = ConnectionManager.manage_async_db_session(get)
+
     @ConnectionManager.manage_db_session
     def total_count(
         self,
@@ -50,6 +73,8 @@ class SessionRepository:
         total_sessions = query.count()
         return total_sessions
 
+    async_total_count = ConnectionManager.manage_async_db_session(total_count)
+
     @ConnectionManager.manage_db_session
     def get_list(
         self,
@@ -74,6 +99,43 @@ class SessionRepository:
             else []
         )
 
+    async_get_list = ConnectionManager.manage_async_db_session(get_list)
+
+    @ConnectionManager.manage_db_session
+    def get_list_by_cursor(
+        self,
+        case_id: int = None,
+        limit: int = None,
+        after_id: int = None,
+        before_id: int = None,
+        keyword: str = None,
+        db_session: Optional[SQLAlchemySession] = None,
+    ) -> List[SessionDomain]:
+        # OFFSET 없이 (case_id, id) 범위로 한 page만 읽는다. (id 내림차순으로 반환)
+        # after_id: 그보다 오래된(작은 id) session / before_id: 그보다 최근(큰 id) session
+        query = db_session.query(SessionEntity)
+        if case_id:
+            query = query.filter(SessionEntity.case_id == case_id)
+        if keyword:
+            query = query.filter(SessionEntity.name.like(f"%{keyword}%"))
+        if before_id is not None:
+            query = query.filter(SessionEntity.id > before_id).order_by(
+                SessionEntity.id
+            )
+        else:
+            if after_id is not None:
+                query = query.filter(SessionEntity.id < after_id)
+            query = query.order_by(SessionEntity.id.desc())
+
+        session_entities = query.limit(limit).all()
+        if before_id is not None:
+            session_entities.reverse()
+        return [SessionDomain.model_validate(entity) for entity in session_entities]
+
+    async_get_list_by_cursor = ConnectionManager.manage_async_db_session(
+        get_list_by_cursor
+    )
+
     @ConnectionManager.manage_db_session
     def list_by_state_id(
         self, state_id: StateTypeEnum, db_session: Optional[SQLAlchemySession] = None
@@ -118,6 +180,102 @@ class SessionRepository:
 
         return SessionDomain.model_validate(session_entity)
 
+    @ConnectionManager.manage_db_session
+    def count_by_analyze_state_id(
+        self, state_id: StateTypeEnum, db_session: Optional[SQLAlchemySession] = None
+    ) -> int:
+        return (
+            db_session.query(SessionEntity)
+            .filter(SessionEntity.analyze_state_id == int(state_id))
+            .count()
+        )
+
+    @ConnectionManager.manage_db_session_with_transaction
+    def claim_by_analyze_state_id(
+        self, lease_seconds: int, db_session: Optional[SQLAlchemySession] = None
+    ) -> Optional[SessionDomain]:
+        """
+        READY 상태이거나 lease가 만료된 START 상태의 session 하나를 잠그고 START로 바꾼다.
+        SKIP LOCKED로 다른 worker가 잠근 row는 건너뛰므로 여러 replica가 동시에 호출해도
+        같은 session을 중복으로 가져가지 않는다.
+        반환한 session의 analyze_lease_expired_at을 DONE/ERROR update에 넘기면, lease가 만료되어
+        다른 worker가 다시 claim 한 session은 바꾸지 않는다.
+        """
+        # DATETIME column에 저장되는 값과 비교할 수 있도록 초 단위로 맞춘다.
+        now = datetime.now().replace(microsecond=0)
+        session_entity = (
+            db_session.query(SessionEntity)
+            .filter(
+                or_(
+                    SessionEntity.analyze_state_id == int(StateTypeEnum.READY),
+                    and_(
+                        SessionEntity.analyze_state_id == int(StateTypeEnum.START),
+                        SessionEntity.analyze_lease_expired_at < now,
+                    ),
+                ),
+                SessionEntity.source_script_url.isnot(None),
+                SessionEntity.source_script_url != "",
+            )
+            .order_by(SessionEntity.id)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if session_entity is None:
+            return None
+
+        session_entity.analyze_state_id = int(StateTypeEnum.START)
+        session_entity.analyze_lease_expired_at = now + timedelta(seconds=lease_seconds)
+        db_session.flush()
+
+        return SessionDomain.model_validate(session_entity)
+
+    @ConnectionManager.manage_db_session
+    def count_by_encoding_state_id(
+        self, state_id: StateTypeEnum, db_session: Optional[SQLAlchemySession] = None
+    ) -> int:
+        return (
+            db_session.query(SessionEntity)
+            .filter(SessionEntity.encoding_state_id == int(state_id))
+            .count()
+        )
+
+    @ConnectionManager.manage_db_session_with_transaction
+    def claim_by_encoding_state_id(
+        self, lease_seconds: int, db_session: Optional[SQLAlchemySession] = None
+    ) -> Optional[SessionDomain]:
+        """
+        encoding이 READY 상태이거나 lease가 만료된 START 상태인 session 하나를 잠그고
+        START로 바꾼다. (claim_by_analyze_state_id와 같은 방식)
+        """
+        now = datetime.now().replace(microsecond=0)
+        session_entity = (
+            db_session.query(SessionEntity)
+            .filter(
+                or_(
+                    SessionEntity.encoding_state_id == int(StateTypeEnum.READY),
+                    and_(
+                        SessionEntity.encoding_state_id == int(StateTypeEnum.START),
+                        SessionEntity.encoding_lease_expired_at < now,
+                    ),
+                ),
+                SessionEntity.origin_video_url.isnot(None),
+                SessionEntity.origin_video_url != "",
+            )
+            .order_by(SessionEntity.id)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if session_entity is None:
+            return None
+
+        session_entity.encoding_state_id = int(StateTypeEnum.START)
+        session_entity.encoding_lease_expired_at = now + timedelta(
+            seconds=lease_seconds
+        )
+        db_session.flush()
+
+        return SessionDomain.model_validate(session_entity)
+
     @ConnectionManager.manage_db_session_with_transaction
     def get_by_encode_state_id(
         self, state_id: StateTypeEnum, db_session: Optional[SQLAlchemySession] = None
@@ -168,16 +326,82 @@ class SessionRepository:
         self,
         session_id: int,
         new_state_id: StateTypeEnum,
+        analyze_url: Optional[str] = None,
+        lease_expired_at: Optional[datetime] = None,
+        db_session: Optional[SQLAlchemySession] = None,
+    ) -> bool:
+        # lease_expired_at: claim 할 때 잡은 lease. 그 사이 다른 worker가 다시 claim 했다면 바꾸지 않는다.
+        values = {"analyze_state_id": int(new_state_id)}
+        if analyze_url is not None:
+            values["analyze_url"] = analyze_url
+        conditions = [SessionEntity.id == session_id]
+        if lease_expired_at is not None:
+            conditions += [
+                SessionEntity.analyze_state_id == int(StateTypeEnum.START),
+                SessionEntity.analyze_lease_expired_at == lease_expired_at,
+            ]
+        update_count = (
+            db_session.query(SessionEntity).filter(*conditions).update(values)
+        )
+
+        return update_count > 0
+
+    @ConnectionManager.manage_db_session_with_transaction
+    def update_encoding_state_by_session_id(
+        self,
+        session_id: int,
+        new_state_id: StateTypeEnum,
+        encoding_video_url: Optional[str] = None,
+        origin_video_hash: Optional[str] = None,
+        lease_expired_at: Optional[datetime] = None,
         db_session: Optional[SQLAlchemySession] = None,
     ) -> bool:
+        # encoding이 끝나면 encoding_video_url과 state를 한 transaction에서 바꾼다.
+        # (lease_expired_at은 update_analyze_state_by_session_id와 같은 조건)
+        values = {"encoding_state_id": int(new_state_id)}
+        if encoding_video_url is not None:
+            values["encoding_video_url"] = encoding_video_url
+        if origin_video_hash is not None:
+            values["origin_video_hash"] = origin_video_hash
+        conditions = [SessionEntity.id == session_id]
+        if lease_expired_at is not None:
+            conditions += [
+                SessionEntity.encoding_state_id == int(StateTypeEnum.START),
+                SessionEntity.encoding_lease_expired_at == lease_expired_at,
+            ]
+        update_count = (
+            db_session.query(SessionEntity).filter(*conditions).update(values)
+        )
+
+        return update_count > 0
+
+    @ConnectionManager.manage_db_session_with_transaction
+    def update_origin_video(
+        self,
+        session_id: int,
+        origin_video_url: str,
+        origin_video_hash: Optional[str] = None,
+        db_session: Optional[SQLAlchemySession] = None,
+    ) -> bool:
+        # 원본을 다시 올리면 hash를 모르더라도 이전 원본의 hash는 지우고 encoding을 다시 한다.
         update_count = (
             db_session.query(SessionEntity)
             .filter(SessionEntity.id == session_id)
-            .update({"analyze_state_id": int(new_state_id)})
+            .update(
+                {
+                    "origin_video_url": origin_video_url,
+                    "origin_video_hash": origin_video_hash,
+                    "encoding_state_id": int(StateTypeEnum.READY),
+                }
+            )
         )
 
         return update_count > 0
 
+    async_update_origin_video = (
+        ConnectionManager.manage_async_db_session_with_transaction(update_origin_video)
+    )
+
     @ConnectionManager.manage_db_session_with_transaction
     def update(
         self,
@@ -193,17 +417,28 @@ class SessionRepository:
 
         return update_count > 0
 
+    async_update = ConnectionManager.manage_async_db_session_with_transaction(update)
+
     @ConnectionManager.manage_db_session_with_transaction
     def delete(
         self, session_id: int, db_session: Optional[SQLAlchemySession] = None
     ) -> bool:
+        session_entity = (
+            db_session.query(SessionEntity.case_id)
+            .filter(SessionEntity.id == session_id)
+            .first()
+        )
         delete_count = (
             db_session.query(SessionEntity)
             .filter(SessionEntity.id == session_id)
             .delete()
         )
+        if delete_count > 0 and session_entity is not None:
+            self.update_session_count(session_entity.case_id, -1, db_session)
         return delete_count > 0
 
+    async_delete = ConnectionManager.manage_async_db_session_with_transaction(delete)
+
     @ConnectionManager.manage_db_session_with_transaction
     def update_url(
         self,
@@ -18,6 +18,8 @@ class UserRepository:
         
         return User.model_validate(user_entity)
 
+    async_add = ConnectionManager.manage_async_db_session_with_transaction(add)
+
     @ConnectionManager.manage_db_session
     def get_by_id(
         self, user_id: int, db_session: Optional[Session] = None
@@ -29,6 +31,8 @@ class UserRepository:
             return User.model_validate(user_entity)
         return None
 
+    async_get_by_id = ConnectionManager.manage_async_db_session(get_by_id)
+
     @ConnectionManager.manage_db_session
     def get_by_email(
         self, email: str, db_session: Optional[Session] = None
@@ -40,6 +44,8 @@ class UserRepository:
             return User.model_validate(user_entity)
         return None
 
+    async_get_by_email = ConnectionManager.manage_async_db_session(get_by_email)
+
     @ConnectionManager.manage_db_session
     def get_by_email_and_password(
         self, email: str, hashed_password: str, db_session: Optional[Session] = None
@@ -54,6 +60,22 @@ class UserRepository:
             return User.model_validate(user_entity)
         return None
 
+    @ConnectionManager.manage_db_session_with_transaction
+    def update_password(
+        self, user_id: int, hashed_password: str, db_session: Optional[Session] = None
+    ) -> bool:
+        update_count = (
+            db_session.query(UserEntity)
+            .filter(UserEntity.id == user_id)
+            .update({"hashed_password": hashed_password})
+        )
+
+        return update_count > 0
+
+    async_update_password = ConnectionManager.manage_async_db_session_with_transaction(
+        update_password
+    )
+
 
 class UserTypeRepository:
     def __init__(self, connection_manager: ConnectionManager):
@@ -68,3 +90,5 @@ class UserTypeRepository:
                 result.append(UserType.model_validate(entity))
             return result
         return []
+
+    async_list = ConnectionManager.manage_async_db_session(list)
@@ -25,3 +25,5 @@ class WhitelistRepository:
             return WhiteList.model_validate(whitelist)
 
         return None
+
+    async_get = ConnectionManager.manage_async_db_session(get)
@@ -0,0 +1,70 @@
+import threading
+import time
+from collections import OrderedDict
+
+from core.repository.case import CaseRepository
+
+
+class CaseAuthorizationService:
+    """
+    (user_id, case_id) 소유권 확인 결과를 ttl_seconds 동안 cache 한다.
+    case 하위 API(session/video/script/report)는 매 요청 소유권을 확인하므로
+    cache에 없을 때만 CaseRepository.exists로 pk 한 row를 확인한다.
+    소유하지 않은 case는 저장하지 않으므로 새로 만든 case는 바로 접근할 수 있다.
+    (case 삭제는 evict_case로 지우고, 다른 pod에서 삭제한 경우는 최대 ttl_seconds 동안 통과한다)
+    """
+
+    def __init__(
+        self,
+        case_repository: CaseRepository,
+        ttl_seconds: int = None,
+        max_size: int = None,
+    ):
+        self.case_repository = case_repository
+        # 0이면 cache 하지 않고 매번 확인한다.
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else 30
+        self.max_size = max_size or 10000
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: tuple) -> bool:
+        with self.lock:
+            expired_at = self.entries.get(key)
+            if expired_at is None:
+                return False
+            if expired_at <= time.time():
+                del self.entries[key]
+                return False
+            self.entries.move_to_end(key)
+            return True
+
+    def set(self, key: tuple):
+        if self.ttl_seconds <= 0:
+            return
+        with self.lock:
+            self.entries[key] = time.time() + self.ttl_seconds
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    async def check(self, case_id: int, user_id: int = None) -> bool:
+        key = (user_id, case_id)
+        if self.get(key):
+            return True
+
+        if not await self.case_repository.async_exists(
+            case_id=case_id, user_id=user_id
+        ):
+            return False
+        self.set(key)
+        return True
+
+    def evict_case(self, case_id: int):
+        with self.lock:
+            keys = [key for key in self.entries if key[1] == case_id]
+            for key in keys:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
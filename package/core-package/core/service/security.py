@@ -1,19 +1,48 @@
+import asyncio
 from abc import ABC
+from concurrent.futures import Executor
 from datetime import datetime, timedelta
+from functools import partial
+from typing import Optional, Tuple
 import jwt
 from passlib.context import CryptContext
 
 from core.model.domain.security import Token, JwtPayload
 from core.exception import InvalidToken
+from core.service.token_cache import TokenCache
 
 
 class SecurityService(ABC):
 
-    def __init__(self, secret_key: str, algorithm: str, expires_delta: int):
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str,
+        expires_delta: int,
+        bcrypt_rounds: int = None,
+        password_executor: Executor = None,
+        token_cache: TokenCache = None,
+    ):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.expires_delta = expires_delta
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # bcrypt cost factor (benchmark/password_hash.py로 hash 1회가 목표 시간이 되도록 정한다)
+        # 다른 cost로 만든 hash는 needs_update로 판단되어 로그인할 때 다시 hash 한다.
+        bcrypt_options = {}
+        if bcrypt_rounds:
+            bcrypt_options = {
+                "bcrypt__default_rounds": bcrypt_rounds,
+                "bcrypt__min_rounds": bcrypt_rounds,
+                "bcrypt__max_rounds": bcrypt_rounds,
+            }
+        self.pwd_context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto", **bcrypt_options
+        )
+        # bcrypt는 GIL을 놓고 CPU를 오래 쓰므로 event loop 밖의 전용 pool에서 실행한다.
+        # (없으면 event loop의 기본 executor)
+        self.password_executor = password_executor
+        # 같은 token은 페이지를 쓰는 동안 계속 다시 오므로 검증한 payload를 cache 한다.
+        self.token_cache = token_cache
 
     def create_token(self, data: JwtPayload):
         if self.expires_delta:
@@ -37,16 +66,60 @@ class SecurityService(ABC):
         return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
 
     def verify_token(self, token: str):
+        if self.token_cache:
+            payload = self.token_cache.get(token)
+            if payload is not None:
+                return payload
+
         try:
             payload = self.decode_token(token)
         except Exception as e:
             raise InvalidToken(token=token)
         if payload.get("user_id") is None:
             raise InvalidToken(token=token)
+
+        if self.token_cache:
+            self.token_cache.set(token, payload)
         return payload
 
+    # token을 폐기할 때 호출하여 cache된 payload로 더 이상 통과하지 않도록 한다.
+    def evict_token(self, token: str):
+        if self.token_cache:
+            self.token_cache.evict(token)
+
+    def evict_user_tokens(self, user_id: int):
+        if self.token_cache:
+            self.token_cache.evict_user(user_id)
+
     def get_password_hash(self, password: str):
         return self.pwd_context.hash(password)
 
     def verify_password(self, plain_password: str, hashed_password: str):
         return self.pwd_context.verify(plain_password, hashed_password)
+
+    def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        # 비밀번호가 맞고 hash의 cost가 현재 설정과 다르면 새 hash를 함께 반환한다.
+        return self.pwd_context.verify_and_update(plain_password, hashed_password)
+
+    async def run_password_task(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.password_executor, partial(func, *args))
+
+    async def async_get_password_hash(self, password: str) -> str:
+        return await self.run_password_task(self.get_password_hash, password)
+
+    async def async_verify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        return await self.run_password_task(
+            self.verify_password, plain_password, hashed_password
+        )
+
+    async def async_verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        return await self.run_password_task(
+            self.verify_and_update, plain_password, hashed_password
+        )
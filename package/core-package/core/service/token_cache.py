@@ -0,0 +1,104 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from core.model.domain.security import TokenCacheStats
+
+
+class TokenCache:
+    """
+    verify_token으로 검증한 JWT payload를 프로세스 메모리에 보관하는 LRU cache
+    key는 token의 sha256 digest이고, token의 exp보다 expiry_margin_seconds 먼저 만료시킨다.
+    다른 process(pod)에서 폐기한 token은 알 수 없으므로 max_ttl_seconds보다 오래 보관하지 않는다.
+    (폐기한 token이 cache로 통과할 수 있는 시간은 최대 max_ttl_seconds)
+    (서명이 틀렸거나 만료된 token은 저장하지 않으므로 매번 jwt.decode로 검증한다)
+    """
+
+    def __init__(
+        self,
+        max_size: int = None,
+        expiry_margin_seconds: int = None,
+        max_ttl_seconds: int = None,
+    ):
+        self.max_size = max_size or 10000
+        self.expiry_margin_seconds = (
+            expiry_margin_seconds if expiry_margin_seconds is not None else 5
+        )
+        self.max_ttl_seconds = max_ttl_seconds or 60
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self.make_key(token)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] <= time.time():
+                del self.entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def set(self, token: str, payload: dict):
+        # exp가 없는 token은 언제까지 유효한지 알 수 없으므로 저장하지 않는다.
+        exp = payload.get("exp")
+        if exp is None:
+            return
+        now = time.time()
+        expired_at = min(exp - self.expiry_margin_seconds, now + self.max_ttl_seconds)
+        if expired_at <= now:
+            return
+
+        key = self.make_key(token)
+        with self.lock:
+            self.entries[key] = (dict(payload), expired_at)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    # token 폐기(로그아웃, 비밀번호 변경, 권한 회수 등) 시 이 process의 cache에서 지운다.
+    def evict(self, token: str):
+        with self.lock:
+            self.entries.pop(self.make_key(token), None)
+
+    def evict_user(self, user_id: int):
+        with self.lock:
+            keys = [
+                key
+                for key, (payload, _) in self.entries.items()
+                if payload.get("user_id") == user_id
+            ]
+            for key in keys:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> TokenCacheStats:
+        with self.lock:
+            hits, misses = self.hits, self.misses
+            evictions, size = self.evictions, len(self.entries)
+        total = hits + misses
+        return TokenCacheStats(
+            hits=hits,
+            misses=misses,
+            hit_rate=hits / total if total else 0.0,
+            evictions=evictions,
+            size=size,
+            max_size=self.max_size,
+        )
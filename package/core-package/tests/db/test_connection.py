@@ -0,0 +1,178 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from core.db.connection import ConnectionManager
+from core.db.transaction import async_transaction_scope
+
+
+class TestConnectionManager(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite:///{os.path.join(self.temp_dir.name, 'test.db')}"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_connection_manager(self, **kwargs) -> ConnectionManager:
+        connection_manager = ConnectionManager(
+            db_url=self.db_url, pool_recycle=3600, **kwargs
+        )
+        self.addCleanup(connection_manager.engine.dispose)
+        return connection_manager
+
+    def test_pool_options(self):
+        connection_manager = self.make_connection_manager(
+            pool_size=2,
+            max_overflow=1,
+            pool_timeout=3,
+            pool_pre_ping=True,
+            pool_use_lifo=True,
+        )
+
+        pool = connection_manager.engine.pool
+        self.assertEqual(pool.size(), 2)
+        self.assertEqual(pool._max_overflow, 1)
+        self.assertEqual(pool._timeout, 3)
+        self.assertTrue(pool._pre_ping)
+        self.assertTrue(pool._pool.use_lifo)
+
+    def test_make_session(self):
+        connection_manager = self.make_connection_manager()
+
+        session = connection_manager.make_session()
+        other_session = connection_manager.make_session()
+
+        self.assertIsNot(session, other_session)
+        self.assertIs(session.bind, connection_manager.engine)
+        self.assertFalse(session.autoflush)
+        session.close()
+        other_session.close()
+
+    def test_get_pool_stats(self):
+        connection_manager = self.make_connection_manager(pool_size=2)
+
+        session = connection_manager.make_session()
+        session.execute(text("SELECT 1"))
+        stats = connection_manager.get_pool_stats()
+        session.close()
+
+        self.assertEqual(stats.size, 2)
+        self.assertEqual(stats.checked_out, 1)
+        self.assertGreaterEqual(stats.checkouts, 1)
+        self.assertEqual(stats.checkout_latency["+Inf"], stats.checkouts)
+        self.assertEqual(connection_manager.get_pool_stats().checked_out, 0)
+
+    def test_get_pool_stats_timeout(self):
+        connection_manager = self.make_connection_manager(
+            pool_size=1, max_overflow=0, pool_timeout=0.05
+        )
+
+        connection = connection_manager.engine.connect()
+        with self.assertRaises(TimeoutError):
+            connection_manager.engine.connect()
+        connection.close()
+
+        stats = connection_manager.get_pool_stats()
+        self.assertEqual(stats.timeouts, 1)
+        self.assertEqual(stats.overflow, 0)
+
+    def test_dispose(self):
+        connection_manager = self.make_connection_manager()
+
+        connection_manager.engine.dispose()
+        with connection_manager.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        self.assertIs(
+            connection_manager.engine.pool.metrics, connection_manager.pool_metrics
+        )
+
+    def test_make_async_db_url(self):
+        self.assertEqual(
+            ConnectionManager.make_async_db_url("mysql+pymysql://user:pw@host:3306/db"),
+            "mysql+aiomysql://user:pw@host:3306/db",
+        )
+        self.assertEqual(
+            ConnectionManager.make_async_db_url("sqlite:///test.db"),
+            "sqlite+aiosqlite:///test.db",
+        )
+
+    def test_get_async_pool_stats_before_use(self):
+        connection_manager = self.make_connection_manager()
+
+        stats = connection_manager.get_async_pool_stats()
+
+        self.assertIsNone(connection_manager.async_engine)
+        self.assertEqual(stats.checkouts, 0)
+
+
+class DummyRepository:
+    def __init__(self, connection_manager: ConnectionManager):
+        self.connection_manager = connection_manager
+
+    @ConnectionManager.manage_db_session
+    def get(self, value, db_session=None):
+        return (value, db_session)
+
+    async_get = ConnectionManager.manage_async_db_session(get)
+
+    @ConnectionManager.manage_db_session_with_transaction
+    def add(self, value, db_session=None):
+        return value
+
+    async_add = ConnectionManager.manage_async_db_session_with_transaction(add)
+
+
+class TestAsyncDbSession(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.sync_session = MagicMock(spec=Session)
+        self.async_session = AsyncMock(spec=AsyncSession)
+        self.async_session.run_sync.side_effect = lambda fn: fn(self.sync_session)
+        self.connection_manager = MagicMock(spec=ConnectionManager)
+        self.connection_manager.make_async_session.return_value = self.async_session
+        self.repository = DummyRepository(self.connection_manager)
+
+    async def test_manage_async_db_session(self):
+        result = await self.repository.async_get(1)
+
+        self.assertEqual(result, (1, self.sync_session))
+        self.connection_manager.make_async_session.assert_called_once()
+        self.async_session.close.assert_awaited_once()
+        self.sync_session.close.assert_not_called()
+
+    async def test_manage_async_db_session_with_session(self):
+        result = await self.repository.async_get(1, db_session=self.async_session)
+
+        self.assertEqual(result, (1, self.sync_session))
+        self.connection_manager.make_async_session.assert_not_called()
+        self.async_session.close.assert_not_awaited()
+
+    async def test_manage_async_db_session_with_transaction(self):
+        result = await self.repository.async_add(1)
+
+        self.assertEqual(result, 1)
+        self.async_session.commit.assert_awaited_once()
+        self.async_session.close.assert_awaited_once()
+        self.sync_session.commit.assert_not_called()
+
+    async def test_manage_async_db_session_with_transaction_no_result(self):
+        result = await self.repository.async_add(None)
+
+        self.assertIsNone(result)
+        self.async_session.commit.assert_not_awaited()
+        self.async_session.close.assert_awaited_once()
+
+    async def test_async_transaction_scope_rollback(self):
+        with self.assertRaises(ValueError):
+            async with async_transaction_scope(self.async_session) as tx_session:
+                await self.repository.async_add(1, db_session=tx_session)
+                raise ValueError()
+
+        self.async_session.commit.assert_not_awaited()
+        self.async_session.rollback.assert_awaited_once()
+        self.async_session.close.assert_awaited_once()
@@ -66,6 +66,58 @@ class TestCaseRepository(unittest.TestCase):
         self.assertEqual(result.user_id, user_id)
         self.db_session.close.assert_called_once()
 
+    def test_exists(self):
+        self.db_session.query.return_value.scalar.return_value = True
+        self.assertTrue(self.case_repo.exists(case_id=1, user_id=1))
+        # session 수 집계 없이 tbl_case만 조회한다.
+        self.db_session.query.return_value.join.assert_not_called()
+        self.db_session.close.assert_called_once()
+
+    def test_exists_not_found(self):
+        self.db_session.query.return_value.scalar.return_value = False
+        self.assertFalse(self.case_repo.exists(case_id=1, user_id=2))
+
+    def test_get_maintained_session_count(self):
+        case_repo = CaseRepository(
+            self.connection_manager, maintained_session_count=True
+        )
+        self.db_session.query.return_value.filter.return_value.filter.return_value.first.return_value = (
+            MagicMock(),
+            3,
+        )
+        with patch("core.repository.case.Case.model_validate") as model_validate:
+            case_repo.get(case_id=1, user_id=1)
+        model_validate.assert_called_once()
+        self.assertEqual(model_validate.call_args.args[1], 3)
+        # tbl_session을 join/group by 하지 않는다.
+        self.db_session.query.return_value.join.assert_not_called()
+
+    def test_reconcile_session_count(self):
+        for_update = (
+            self.db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.with_for_update.return_value
+        )
+        for_update.all.return_value = [(1, 2), (2, 0), (3, 5)]
+        self.db_session.query.return_value.filter.return_value.group_by.return_value.all.return_value = [
+            (1, 2),
+            (2, 1),
+        ]
+
+        result = self.case_repo.reconcile_session_count(after_id=0, limit=3)
+
+        # case 2(0 -> 1)와 case 3(5 -> 0)만 고친다.
+        self.assertEqual(result, (3, 2))
+        self.assertEqual(
+            self.db_session.query.return_value.filter.return_value.update.call_count, 2
+        )
+        self.db_session.commit.assert_called_once()
+
+    def test_reconcile_session_count_done(self):
+        for_update = (
+            self.db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.with_for_update.return_value
+        )
+        for_update.all.return_value = []
+        self.assertIsNone(self.case_repo.reconcile_session_count(after_id=10))
+
     def test_get_case_not_found(self):
         case_id = 1
         user_id = 1
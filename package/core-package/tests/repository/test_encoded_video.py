@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import MagicMock
+from sqlalchemy.orm import Session
+
+from core.repository.encoded_video import EncodedVideoRepository
+from core.model.domain.encoded_video import EncodedVideo
+from core.model.entity.encoded_video import EncodedVideoEntity
+from core.db.connection import ConnectionManager
+
+
+class TestEncodedVideoRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.connection_manager = MagicMock(spec=ConnectionManager)
+        self.db_session = MagicMock(spec=Session)
+        self.connection_manager.make_session.return_value = self.db_session
+        self.encoded_video_repo = EncodedVideoRepository(self.connection_manager)
+
+    def test_get_found(self):
+        encoded_video_entity = EncodedVideoEntity(
+            id=1,
+            source_hash="sha256:abc",
+            profile="mp4",
+            encoding_video_url="LOCAL/1/1/encoded_video.mp4",
+        )
+        self.db_session.query.return_value.filter.return_value.first.return_value = (
+            encoded_video_entity
+        )
+        result = self.encoded_video_repo.get("sha256:abc", "mp4")
+        self.assertEqual(result.encoding_video_url, "LOCAL/1/1/encoded_video.mp4")
+        self.db_session.close.assert_called_once()
+
+    def test_get_not_found(self):
+        self.db_session.query.return_value.filter.return_value.first.return_value = None
+        result = self.encoded_video_repo.get("sha256:abc", "mp4")
+        self.assertIsNone(result)
+        self.db_session.close.assert_called_once()
+
+    def test_add(self):
+        encoded_video = EncodedVideo(
+            source_hash="sha256:abc",
+            profile="mp4",
+            encoding_video_url="LOCAL/1/1/encoded_video.mp4",
+        )
+        result = self.encoded_video_repo.add(encoded_video)
+        self.assertEqual(result.source_hash, "sha256:abc")
+        added = self.db_session.add.call_args.args[0]
+        self.assertIsInstance(added, EncodedVideoEntity)
+        self.assertEqual(added.profile, "mp4")
+        self.db_session.commit.assert_called_once()
+        self.db_session.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
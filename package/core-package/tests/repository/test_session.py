@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 from typing import Optional, List
 from sqlalchemy import or_, and_
@@ -33,9 +34,12 @@ class TestSessionRepository(unittest.TestCase):
             origin_video_url=None,
             encoding_video_url=None,
         )
+        self.db_session.query.return_value.filter.return_value.update.return_value = 1
         result = self.session_repo.add(session)
         self.assertEqual(result, session)
         self.db_session.add.assert_called_once()
+        # 같은 transaction에서 case의 session_count를 하나 늘린다.
+        self.db_session.query.return_value.filter.return_value.update.assert_called_once()
         self.db_session.commit.assert_called_once()
         self.db_session.close.assert_called_once()
 
@@ -229,6 +233,164 @@ class TestSessionRepository(unittest.TestCase):
         self.assertEqual(result, sessions)
         self.db_session.close.assert_called_once()
 
+    def test_claim_by_analyze_state_id_found(self):
+        session_entity = SessionEntity(
+            id=1,
+            name="test",
+            session_state_id=1,
+            case_id=1,
+            source_video_url="/source/video.mp4",
+            source_script_url="/source/script.json",
+            script_state_id=3,
+            analyze_state_id=1,
+            created_date="2024-01-01",
+        )
+        self.db_session.query.return_value.filter.return_value.order_by.return_value.with_for_update.return_value.first.return_value = (
+            session_entity
+        )
+        result = self.session_repo.claim_by_analyze_state_id(lease_seconds=60)
+        self.assertEqual(result.id, 1)
+        self.assertEqual(result.analyze_state_id, StateTypeEnum.START)
+        self.assertIsNotNone(session_entity.analyze_lease_expired_at)
+        self.db_session.query.return_value.filter.return_value.order_by.return_value.with_for_update.assert_called_once_with(
+            skip_locked=True
+        )
+        self.db_session.commit.assert_called_once()
+        self.db_session.close.assert_called_once()
+
+    def test_claim_by_analyze_state_id_not_found(self):
+        self.db_session.query.return_value.filter.return_value.order_by.return_value.with_for_update.return_value.first.return_value = (
+            None
+        )
+        result = self.session_repo.claim_by_analyze_state_id(lease_seconds=60)
+        self.assertIsNone(result)
+        self.db_session.commit.assert_not_called()
+        self.db_session.close.assert_called_once()
+
+    def test_claim_by_encoding_state_id_found(self):
+        session_entity = SessionEntity(
+            id=1,
+            name="test",
+            session_state_id=1,
+            case_id=1,
+            script_state_id=5,
+            analyze_state_id=5,
+            encoding_state_id=1,
+            created_date="2024-01-01",
+            origin_video_url="1/1/video.mp4",
+        )
+        self.db_session.query.return_value.filter.return_value.order_by.return_value.with_for_update.return_value.first.return_value = (
+            session_entity
+        )
+        result = self.session_repo.claim_by_encoding_state_id(lease_seconds=60)
+        self.assertEqual(result.id, 1)
+        self.assertEqual(result.encoding_state_id, StateTypeEnum.START)
+        self.assertIsNotNone(session_entity.encoding_lease_expired_at)
+        self.db_session.query.return_value.filter.return_value.order_by.return_value.with_for_update.assert_called_once_with(
+            skip_locked=True
+        )
+        self.db_session.commit.assert_called_once()
+        self.db_session.close.assert_called_once()
+
+    def test_claim_by_encoding_state_id_not_found(self):
+        self.db_session.query.return_value.filter.return_value.order_by.return_value.with_for_update.return_value.first.return_value = (
+            None
+        )
+        result = self.session_repo.claim_by_encoding_state_id(lease_seconds=60)
+        self.assertIsNone(result)
+        self.db_session.commit.assert_not_called()
+        self.db_session.close.assert_called_once()
+
+    def test_update_encoding_state_by_session_id(self):
+        self.db_session.query.return_value.filter.return_value.update.return_value = 1
+        res = self.session_repo.update_encoding_state_by_session_id(
+            1, StateTypeEnum.DONE, encoding_video_url="1/1/encoded_video.mp4"
+        )
+        self.assertTrue(res)
+        self.db_session.query.return_value.filter.return_value.update.assert_called_once_with(
+            {
+                "encoding_state_id": int(StateTypeEnum.DONE),
+                "encoding_video_url": "1/1/encoded_video.mp4",
+            }
+        )
+        self.db_session.commit.assert_called_once()
+
+    def test_update_analyze_state_by_session_id_lease(self):
+        lease_expired_at = datetime(2024, 1, 1, 1, 0)
+        self.db_session.query.return_value.filter.return_value.update.return_value = 0
+        res = self.session_repo.update_analyze_state_by_session_id(
+            1,
+            StateTypeEnum.DONE,
+            analyze_url="LOCAL/1/analyze_report_v1.json",
+            lease_expired_at=lease_expired_at,
+        )
+        # 다른 worker가 다시 claim 하여 lease가 바뀐 session은 update 되지 않는다.
+        self.assertFalse(res)
+        conditions = self.db_session.query.return_value.filter.call_args.args
+        self.assertEqual(len(conditions), 3)
+        self.db_session.query.return_value.filter.return_value.update.assert_called_once_with(
+            {
+                "analyze_state_id": int(StateTypeEnum.DONE),
+                "analyze_url": "LOCAL/1/analyze_report_v1.json",
+            }
+        )
+
+    def test_claim_lease_seconds(self):
+        session_entity = SessionEntity(
+            id=1,
+            name="test",
+            session_state_id=1,
+            case_id=1,
+            script_state_id=5,
+            analyze_state_id=5,
+            encoding_state_id=1,
+            created_date="2024-01-01",
+            origin_video_url="1/1/video.mp4",
+        )
+        self.db_session.query.return_value.filter.return_value.order_by.return_value.with_for_update.return_value.first.return_value = (
+            session_entity
+        )
+        result = self.session_repo.claim_by_encoding_state_id(lease_seconds=60)
+        # DATETIME column과 비교할 수 있도록 초 단위로 저장하고 반환한다.
+        self.assertEqual(result.encoding_lease_expired_at.microsecond, 0)
+        self.assertEqual(
+            result.encoding_lease_expired_at, session_entity.encoding_lease_expired_at
+        )
+        self.assertNotIn("encoding_lease_expired_at", result.model_dump())
+
+    def test_update_origin_video(self):
+        self.db_session.query.return_value.filter.return_value.update.return_value = 1
+        res = self.session_repo.update_origin_video(
+            1, "1/1/video.mp4", origin_video_hash="sha256:abc"
+        )
+        self.assertTrue(res)
+        self.db_session.query.return_value.filter.return_value.update.assert_called_once_with(
+            {
+                "origin_video_url": "1/1/video.mp4",
+                "origin_video_hash": "sha256:abc",
+                "encoding_state_id": int(StateTypeEnum.READY),
+            }
+        )
+
+    def test_update_skip_origin_video_hash(self):
+        # client가 보낸 origin_video_hash는 update()로 저장하지 않는다.
+        session = SessionDomain(
+            id=1,
+            name="test",
+            session_state_id=1,
+            case_id=1,
+            script_state_id=1,
+            analyze_state_id=1,
+            created_date="2024-01-01",
+            origin_video_hash="sha256:other",
+        )
+        self.db_session.query.return_value.filter.return_value.update.return_value = 1
+        self.session_repo.update(1, session)
+        values = self.db_session.query.return_value.filter.return_value.update.call_args.args[
+            0
+        ]
+        self.assertNotIn("origin_video_hash", values)
+
     def test_update_state_by_session_id_success(self):
         session_id = 1
         new_state_id = StateTypeEnum.START
@@ -289,11 +451,30 @@ class TestSessionRepository(unittest.TestCase):
         self.assertFalse(res)
         self.db_session.close.assert_called_once()
 
+    def test_get_list_by_cursor(self):
+        query = self.db_session.query.return_value.filter.return_value
+        query.filter.return_value.order_by.return_value.limit.return_value.all.return_value = (
+            []
+        )
+        result = self.session_repo.get_list_by_cursor(case_id=1, limit=11, after_id=5)
+        self.assertEqual(result, [])
+        # OFFSET 없이 id 범위와 limit만 건다.
+        query.filter.return_value.order_by.return_value.offset.assert_not_called()
+        query.filter.return_value.order_by.return_value.limit.assert_called_once_with(
+            11
+        )
+        self.db_session.close.assert_called_once()
+
     def test_delete_success(self):
         session_id = 1
         self.db_session.query.return_value.filter.return_value.delete.return_value = 1
+        self.db_session.query.return_value.filter.return_value.filter.return_value.update.return_value = (
+            1
+        )
         res = self.session_repo.delete(session_id)
         self.assertTrue(res)
+        # session_count가 0 아래로 내려가지 않도록 조건을 걸고 하나 줄인다.
+        self.db_session.query.return_value.filter.return_value.filter.return_value.update.assert_called_once()
         self.db_session.commit.assert_called_once()
         self.db_session.close.assert_called_once()
 
@@ -302,6 +483,7 @@ class TestSessionRepository(unittest.TestCase):
         self.db_session.query.return_value.filter.return_value.delete.return_value = 0
         res = self.session_repo.delete(session_id)
         self.assertFalse(res)
+        self.db_session.query.return_value.filter.return_value.filter.return_value.update.assert_not_called()
         self.db_session.close.assert_called_once()
 
 
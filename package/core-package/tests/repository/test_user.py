@@ -94,6 +94,18 @@ class TestUserRepository(unittest.TestCase):
         self.assertIsNone(result)
         self.db_session.close.assert_called_once()
 
+    def test_update_password(self):
+        self.db_session.query.return_value.filter.return_value.update.return_value = 1
+        result = self.user_repo.update_password(
+            user_id=1, hashed_password="new_hashed_password"
+        )
+        self.assertTrue(result)
+        self.db_session.query.return_value.filter.return_value.update.assert_called_once_with(
+            {"hashed_password": "new_hashed_password"}
+        )
+        self.db_session.commit.assert_called_once()
+        self.db_session.close.assert_called_once()
+
     def test_get_by_email_and_password_user_found(self):
         test_email = "test@example.com"
         test_password = "test_password"
@@ -0,0 +1,62 @@
+import time
+import unittest
+from unittest.mock import AsyncMock
+
+from core.repository.case import CaseRepository
+from core.service.case_authorization import CaseAuthorizationService
+
+
+class TestCaseAuthorizationService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.case_repository = AsyncMock(spec=CaseRepository)
+        self.case_repository.async_exists.return_value = True
+        self.case_authorization = CaseAuthorizationService(
+            self.case_repository, ttl_seconds=30, max_size=2
+        )
+
+    async def test_check_cached(self):
+        self.assertTrue(await self.case_authorization.check(case_id=1, user_id=1))
+        self.assertTrue(await self.case_authorization.check(case_id=1, user_id=1))
+
+        self.case_repository.async_exists.assert_awaited_once_with(case_id=1, user_id=1)
+
+    async def test_check_not_owner_not_cached(self):
+        self.case_repository.async_exists.return_value = False
+        self.assertFalse(await self.case_authorization.check(case_id=1, user_id=2))
+
+        # 새로 만든 case는 바로 접근할 수 있어야 한다.
+        self.case_repository.async_exists.return_value = True
+        self.assertTrue(await self.case_authorization.check(case_id=1, user_id=2))
+        self.assertEqual(self.case_repository.async_exists.await_count, 2)
+
+    async def test_check_expired(self):
+        await self.case_authorization.check(case_id=1, user_id=1)
+        self.case_authorization.entries[(1, 1)] = time.time() - 1
+
+        await self.case_authorization.check(case_id=1, user_id=1)
+        self.assertEqual(self.case_repository.async_exists.await_count, 2)
+
+    async def test_check_ttl_disabled(self):
+        case_authorization = CaseAuthorizationService(
+            self.case_repository, ttl_seconds=0
+        )
+        await case_authorization.check(case_id=1, user_id=1)
+        await case_authorization.check(case_id=1, user_id=1)
+        self.assertEqual(self.case_repository.async_exists.await_count, 2)
+
+    async def test_max_size(self):
+        for case_id in (1, 2, 3):
+            await self.case_authorization.check(case_id=case_id, user_id=1)
+        self.assertEqual(list(self.case_authorization.entries), [(1, 2), (1, 3)])
+
+    async def test_evict_case(self):
+        await self.case_authorization.check(case_id=1, user_id=1)
+        await self.case_authorization.check(case_id=2, user_id=1)
+
+        self.case_authorization.evict_case(1)
+
+        self.assertEqual(list(self.case_authorization.entries), [(1, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
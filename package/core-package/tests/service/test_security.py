@@ -0,0 +1,99 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from core.exception import InvalidToken
+from core.model.domain.security import JwtPayload
+from core.service.security import SecurityService
+from core.service.token_cache import TokenCache
+
+
+class TestSecurityService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.security_service = SecurityService(
+            secret_key="secret",
+            algorithm="HS256",
+            expires_delta=60,
+            bcrypt_rounds=4,
+            password_executor=self.executor,
+        )
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_verify_token(self):
+        token = self.security_service.create_token(
+            JwtPayload(user_id=1, user_email="a@b.c", user_name="test", user_type=1)
+        )
+        self.assertEqual(self.security_service.verify_token(token)["user_id"], 1)
+        with self.assertRaises(InvalidToken):
+            self.security_service.verify_token(token + "x")
+
+    def test_verify_token_cached(self):
+        security_service = SecurityService(
+            "secret", "HS256", 60, token_cache=TokenCache(max_size=10)
+        )
+        token = security_service.create_token(
+            JwtPayload(user_id=1, user_email="a@b.c", user_name="test", user_type=1)
+        )
+        payload = security_service.verify_token(token)
+
+        with patch.object(
+            security_service, "decode_token", wraps=security_service.decode_token
+        ) as decode_token:
+            # 두 번째부터는 jwt.decode를 하지 않는다.
+            self.assertEqual(security_service.verify_token(token), payload)
+            decode_token.assert_not_called()
+
+            security_service.evict_token(token)
+            security_service.verify_token(token)
+            decode_token.assert_called_once_with(token)
+        self.assertEqual(security_service.token_cache.stats().hits, 1)
+
+    def test_verify_token_invalid_not_cached(self):
+        security_service = SecurityService(
+            "secret", "HS256", 60, token_cache=TokenCache(max_size=10)
+        )
+        with self.assertRaises(InvalidToken):
+            security_service.verify_token("invalid")
+        self.assertEqual(security_service.token_cache.stats().size, 0)
+
+    async def test_async_password_hash(self):
+        hashed_password = await self.security_service.async_get_password_hash("pw")
+
+        self.assertTrue(hashed_password.startswith("$2b$04$"))
+        self.assertTrue(
+            await self.security_service.async_verify_password("pw", hashed_password)
+        )
+        self.assertFalse(
+            await self.security_service.async_verify_password("no", hashed_password)
+        )
+
+    async def test_async_verify_and_update_same_rounds(self):
+        hashed_password = self.security_service.get_password_hash("pw")
+
+        self.assertEqual(
+            await self.security_service.async_verify_and_update("pw", hashed_password),
+            (True, None),
+        )
+
+    async def test_async_verify_and_update_rounds_changed(self):
+        # 다른 cost로 만든 hash는 로그인에 성공하면 현재 cost로 다시 hash 한다.
+        old_service = SecurityService("secret", "HS256", 60, bcrypt_rounds=5)
+        hashed_password = old_service.get_password_hash("pw")
+
+        verified, new_hashed_password = (
+            await self.security_service.async_verify_and_update("pw", hashed_password)
+        )
+
+        self.assertTrue(verified)
+        self.assertTrue(new_hashed_password.startswith("$2b$04$"))
+        self.assertEqual(
+            await self.security_service.async_verify_and_update("no", hashed_password),
+            (False, None),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
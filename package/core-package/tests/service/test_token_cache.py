@@ -0,0 +1,96 @@
+import threading
+import time
+import unittest
+
+from core.service.token_cache import TokenCache
+
+
+def make_payload(user_id: int = 1, expires_in: int = 60) -> dict:
+    return {"user_id": user_id, "exp": int(time.time()) + expires_in}
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.token_cache = TokenCache(max_size=2, expiry_margin_seconds=5)
+
+    def test_get_set(self):
+        payload = make_payload()
+        self.assertIsNone(self.token_cache.get("token"))
+
+        self.token_cache.set("token", payload)
+
+        self.assertEqual(self.token_cache.get("token"), payload)
+        stats = self.token_cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_key_is_digest(self):
+        self.token_cache.set("token", make_payload())
+        self.assertNotIn("token", self.token_cache.entries)
+
+    def test_expiry_margin(self):
+        # exp까지 expiry_margin_seconds 이하로 남은 token은 저장하지 않는다.
+        self.token_cache.set("token", make_payload(expires_in=3))
+        self.token_cache.set("no-exp", {"user_id": 1})
+        self.assertEqual(self.token_cache.stats().size, 0)
+
+    def test_max_ttl(self):
+        # exp가 멀어도 max_ttl_seconds 뒤에는 다시 jwt.decode로 검증한다.
+        token_cache = TokenCache(expiry_margin_seconds=5, max_ttl_seconds=30)
+        token_cache.set("token", make_payload(expires_in=3600))
+
+        _, expired_at = token_cache.entries[TokenCache.make_key("token")]
+        self.assertLessEqual(expired_at, time.time() + 30)
+
+    def test_expired_entry(self):
+        self.token_cache.set("token", make_payload())
+        key = TokenCache.make_key("token")
+        payload, _ = self.token_cache.entries[key]
+        self.token_cache.entries[key] = (payload, time.time() - 1)
+
+        self.assertIsNone(self.token_cache.get("token"))
+        self.assertEqual(self.token_cache.stats().size, 0)
+
+    def test_lru_eviction(self):
+        self.token_cache.set("a", make_payload())
+        self.token_cache.set("b", make_payload())
+        self.token_cache.get("a")
+        self.token_cache.set("c", make_payload())
+
+        self.assertIsNone(self.token_cache.get("b"))
+        self.assertIsNotNone(self.token_cache.get("a"))
+        self.assertEqual(self.token_cache.stats().evictions, 1)
+
+    def test_evict(self):
+        self.token_cache.set("a", make_payload(user_id=1))
+        self.token_cache.set("b", make_payload(user_id=2))
+
+        self.token_cache.evict("a")
+        self.assertIsNone(self.token_cache.get("a"))
+
+        self.token_cache.evict_user(2)
+        self.assertIsNone(self.token_cache.get("b"))
+
+    def test_concurrent_access(self):
+        token_cache = TokenCache(max_size=50)
+        payload = make_payload()
+
+        def work(i: int):
+            for j in range(200):
+                token = f"token-{(i + j) % 100}"
+                if token_cache.get(token) is None:
+                    token_cache.set(token, payload)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = token_cache.stats()
+        self.assertEqual(stats.hits + stats.misses, 8 * 200)
+        self.assertLessEqual(stats.size, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
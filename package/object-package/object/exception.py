@@ -22,3 +22,43 @@ class DownloadFailed(ServiceException):
         self.status_code = 400
         self.error_code = 1001
         super().__init__(self.message)
+
+
+class InvalidObjectRange(ServiceException):
+    """Invalid Object Range"""
+
+    def __init__(self, file: str, byte_range: str):
+        self.message = f"Range [{byte_range}] of file [{file}] is not satisfiable."
+        self.status_code = 416
+        self.error_code = 1002
+        super().__init__(self.message)
+
+
+class ObjectPreconditionFailed(ServiceException):
+    """Object Precondition Failed"""
+
+    def __init__(self, file: str):
+        self.message = f"File [{file}] does not match the precondition."
+        self.status_code = 412
+        self.error_code = 1003
+        super().__init__(self.message)
+
+
+class ObjectNotModified(ServiceException):
+    """Object Not Modified"""
+
+    def __init__(self, file: str):
+        self.message = f"File [{file}] is not modified."
+        self.status_code = 304
+        self.error_code = 1005
+        super().__init__(self.message)
+
+
+class EncodeFailed(ServiceException):
+    """Encode Failed"""
+
+    def __init__(self, file: str):
+        self.message = f"File [{file}] Encode failed."
+        self.status_code = 400
+        self.error_code = 1004
+        super().__init__(self.message)
@@ -0,0 +1,59 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import AsyncIterator
+
+
+class AsyncObjectRepository:
+    """
+    object repository(VideoRepository, ScriptRepository 등)의 blocking boto3 호출을
+    전용 thread pool에서 실행하여 event loop를 막지 않도록 감싼다.
+    감싼 repository의 method는 같은 이름의 async method로 호출한다.
+
+        video_repository = AsyncObjectRepository(VideoRepository(...), executor)
+        video = await video_repository.get_object(object_name)
+    """
+
+    def __init__(
+        self,
+        repository,
+        executor: ThreadPoolExecutor,
+        chunk_size: int = 1024 * 1024,
+    ):
+        self.repository = repository
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    def __getattr__(self, name):
+        attr = getattr(self.repository, name)
+        if not callable(attr):
+            return attr
+
+        @wraps(attr)
+        async def wrapper(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        return wrapper
+
+    async def read(self, body) -> bytes:
+        # get_object()["Body"] 전체를 읽는다. (script, analyze report 등 작은 object)
+        try:
+            return await self.run(body.read)
+        finally:
+            body.close()
+
+    async def iter_chunks(self, body, chunk_size: int = None) -> AsyncIterator[bytes]:
+        # 영상처럼 큰 object를 chunk_size 단위로 읽어 StreamingResponse로 흘려보낸다.
+        chunk_size = chunk_size or self.chunk_size
+        try:
+            while True:
+                chunk = await self.run(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
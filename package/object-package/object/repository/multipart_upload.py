@@ -0,0 +1,140 @@
+import asyncio
+from typing import AsyncIterator, Callable, Optional
+
+from object.repository.async_object import AsyncObjectRepository
+
+# S3 multipart upload의 마지막 part를 제외한 최소 part 크기
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class MultipartUploader:
+    """
+    AsyncIterator[bytes]로 들어오는 데이터(request body 등)를 part_size 단위로 잘라
+    S3 multipart upload로 흘려보낸다. 파일 전체를 메모리나 disk에 모으지 않는다.
+
+    - 동시에 올리는 part는 max_concurrency개까지이고, 그동안 다음 chunk를 읽지 않는다.
+      (메모리 사용량은 upload 하나당 최대 (max_concurrency + 1) * part_size)
+    - 실패한 part는 max_retries번까지 다시 올린다. (retry_backoff초부터 2배씩 대기)
+    - part가 끝날 때마다 on_progress(uploaded_bytes, part_count)를 호출한다.
+
+        uploader = MultipartUploader(AsyncObjectRepository(VideoRepository(...), executor))
+        object_name = await uploader.upload(request_chunks, object_name)
+
+    repository는 create_multipart_upload, upload_part, complete_multipart_upload,
+    abort_multipart_upload를 가진 object repository(VideoRepository)를 감싼 것이어야 한다.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncObjectRepository,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 2,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+        self.repository = repository
+        self.part_size = part_size
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+    async def upload(
+        self,
+        chunks: AsyncIterator[bytes],
+        object_name: str,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Optional[str]:
+        upload_id = await self.repository.create_multipart_upload(object_name)
+        if not upload_id:
+            return None
+
+        progress = {"uploaded_bytes": 0, "part_count": 0}
+        parts = []
+        in_flight = set()
+
+        async def send_part(part_number: int, data: bytes):
+            etag = await self.upload_part(object_name, upload_id, part_number, data)
+            if etag:
+                progress["uploaded_bytes"] += len(data)
+                progress["part_count"] += 1
+                if on_progress:
+                    on_progress(progress["uploaded_bytes"], progress["part_count"])
+            return {"PartNumber": part_number, "ETag": etag}
+
+        def collect(tasks) -> bool:
+            for task in tasks:
+                part = task.result()
+                if not part["ETag"]:
+                    return False
+                parts.append(part)
+            return True
+
+        try:
+            async for part_number, data in self.iter_parts(chunks):
+                if len(in_flight) >= self.max_concurrency:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not collect(done):
+                        await self.abort(object_name, upload_id, in_flight)
+                        return None
+                in_flight.add(asyncio.create_task(send_part(part_number, data)))
+
+            if in_flight:
+                done, in_flight = await asyncio.wait(in_flight)
+                if not collect(done):
+                    await self.abort(object_name, upload_id, in_flight)
+                    return None
+        except BaseException:
+            # client 연결 끊김, 취소 등: 올라간 part가 S3에 남지 않도록 abort 후 다시 raise
+            await self.abort(object_name, upload_id, in_flight)
+            raise
+
+        parts.sort(key=lambda part: part["PartNumber"])
+        result = await self.repository.complete_multipart_upload(
+            object_name, upload_id, parts
+        )
+        if not result:
+            await self.repository.abort_multipart_upload(object_name, upload_id)
+        return result
+
+    async def iter_parts(self, chunks: AsyncIterator[bytes]):
+        # chunk들을 모아 part_size 크기의 (part_number, data)로 잘라낸다.
+        # 빈 파일도 part 1개(0 byte)로 올려야 complete가 가능하다.
+        buffer = bytearray()
+        part_number = 0
+        async for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= self.part_size:
+                part_number += 1
+                with memoryview(buffer) as view:
+                    data = bytes(view[: self.part_size])
+                del buffer[: self.part_size]
+                yield part_number, data
+        if buffer or part_number == 0:
+            yield part_number + 1, bytes(buffer)
+
+    async def upload_part(
+        self, object_name: str, upload_id: str, part_number: int, data: bytes
+    ) -> Optional[str]:
+        for attempt in range(self.max_retries + 1):
+            etag = await self.repository.upload_part(
+                object_name, upload_id, part_number, data
+            )
+            if etag:
+                return etag
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_backoff * 2**attempt)
+        print(f"Upload part {part_number} of file: '{object_name}' failed.")
+        return None
+
+    async def abort(self, object_name: str, upload_id: str, in_flight=()):
+        # thread에서 이미 실행 중인 upload_part는 멈출 수 없어 abort 뒤에 part가 남을 수 있다.
+        # (bucket lifecycle의 AbortIncompleteMultipartUpload 규칙으로 정리)
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.wait(in_flight)
+        await self.repository.abort_multipart_upload(object_name, upload_id)
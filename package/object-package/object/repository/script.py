@@ -2,9 +2,15 @@ from object.storage.client import ClientManager
 
 
 class ScriptRepository:
-    def __init__(self, bucket: str, client_manager: ClientManager):
+    def __init__(
+        self,
+        bucket: str,
+        client_manager: ClientManager,
+        presigned_url_expires: int = 300,
+    ):
         self.bucket = bucket
         self.client_manager = client_manager
+        self.presigned_url_expires = presigned_url_expires
         self.path = "script/"
 
     def upload(self, file_name: str, object_name: str):
@@ -65,3 +71,16 @@ class ScriptRepository:
         except Exception as e:
             print(f"Cannot get object list in '{self.path}' from S3.")
             return None
+
+    def generate_presigned_url(self, object_name: str, expires_in: int = None):
+        # client가 S3에서 바로 받을 수 있는 GET url (expires_in초 동안 유효)
+        try:
+            client = self.client_manager.get_client()
+            return client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.bucket, "Key": self.path + object_name},
+                ExpiresIn=expires_in or self.presigned_url_expires,
+            )
+        except Exception as e:
+            print(f"Cannot generate presigned url of file: '{object_name}'.")
+            return None
@@ -1,11 +1,29 @@
+import json
+import hashlib
+from botocore.exceptions import ClientError
 from object.storage.client import ClientManager
+from object.exception import (
+    InvalidObjectRange,
+    ObjectNotModified,
+    ObjectPreconditionFailed,
+)
 import traceback
+import posixpath
 import os
 
+# 원본 영상 content hash 알고리즘 ("sha256:{hex}")
+SOURCE_HASH_ALGORITHM = "sha256"
+
 class VideoRepository:
-    def __init__(self, bucket: str, client_manager: ClientManager):
+    def __init__(
+        self,
+        bucket: str,
+        client_manager: ClientManager,
+        presigned_url_expires: int = 300,
+    ):
         self.bucket = bucket
         self.client_manager = client_manager
+        self.presigned_url_expires = presigned_url_expires
         self.path = "video/"
 
     def upload(self, file_name: str, object_name: str):
@@ -44,14 +62,178 @@ class VideoRepository:
             print(f"Cannot download file: '{object_name}' from S3.")
             return None
 
-    def get_object(self, object_name: str):
+    def get_object(
+        self,
+        object_name: str,
+        byte_range: str = None,
+        if_match: str = None,
+        if_unmodified_since: str = None,
+        if_none_match: str = None,
+    ):
+        # byte_range: "bytes=0-1023" 형식의 HTTP Range (S3가 206 응답과 ContentRange를 준다)
+        params = {"Bucket": self.bucket, "Key": self.path + object_name}
+        if byte_range:
+            params["Range"] = byte_range
+        if if_match:
+            params["IfMatch"] = if_match
+        if if_unmodified_since:
+            params["IfUnmodifiedSince"] = if_unmodified_since
+        if if_none_match:
+            params["IfNoneMatch"] = if_none_match
         try:
             client = self.client_manager.get_client()
-            return client.get_object(Bucket=self.bucket, Key=self.path + object_name)
+            return client.get_object(**params)
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code == "InvalidRange":
+                raise InvalidObjectRange(object_name, byte_range)
+            if code == "PreconditionFailed":
+                raise ObjectPreconditionFailed(object_name)
+            if code == "304":
+                raise ObjectNotModified(object_name)
+            print(f"Cannot download file: '{object_name}' from S3.")
+            return None
         except Exception as e:
             print(f"Cannot download file: '{object_name}' from S3.")
             return None
 
+    # multipart upload: 큰 영상을 part 단위로 나눠 올린다. (MultipartUploader에서 사용)
+    def create_multipart_upload(self, object_name: str):
+        try:
+            client = self.client_manager.get_client()
+            response = client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.path + object_name
+            )
+            return response["UploadId"]
+        except Exception as e:
+            print(f"Cannot create multipart upload: '{object_name}' to S3.", e)
+            return None
+
+    def upload_part(
+        self, object_name: str, upload_id: str, part_number: int, data: bytes
+    ):
+        try:
+            client = self.client_manager.get_client()
+            response = client.upload_part(
+                Bucket=self.bucket,
+                Key=self.path + object_name,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+            return response["ETag"]
+        except Exception as e:
+            print(f"Cannot upload part {part_number} of file: '{object_name}'.", e)
+            return None
+
+    def complete_multipart_upload(self, object_name: str, upload_id: str, parts: list):
+        # parts: [{"PartNumber": 1, "ETag": "..."}, ...] (PartNumber 오름차순)
+        try:
+            client = self.client_manager.get_client()
+            client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.path + object_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            return object_name
+        except Exception as e:
+            print(f"Cannot complete multipart upload: '{object_name}' to S3.", e)
+            return None
+
+    def list_parts(self, object_name: str, upload_id: str):
+        # S3에 올라간 part 목록: [{"PartNumber": 1, "ETag": "...", "Size": 123}, ...]
+        try:
+            client = self.client_manager.get_client()
+            paginator = client.get_paginator("list_parts")
+            parts = []
+            for page in paginator.paginate(
+                Bucket=self.bucket, Key=self.path + object_name, UploadId=upload_id
+            ):
+                parts.extend(
+                    {
+                        "PartNumber": part["PartNumber"],
+                        "ETag": part["ETag"],
+                        "Size": part["Size"],
+                    }
+                    for part in page.get("Parts", [])
+                )
+            return parts
+        except Exception as e:
+            print(f"Cannot list parts of file: '{object_name}'.", e)
+            return None
+
+    def abort_multipart_upload(self, object_name: str, upload_id: str):
+        try:
+            client = self.client_manager.get_client()
+            client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.path + object_name, UploadId=upload_id
+            )
+            return object_name
+        except Exception as e:
+            print(f"Cannot abort multipart upload: '{object_name}'.", e)
+            return None
+
+    # resumable upload 상태: 어느 contents-api pod에서도 이어서 올릴 수 있도록 S3에 저장한다.
+    def put_upload_state(self, upload_id: str, state: dict):
+        try:
+            client = self.client_manager.get_client()
+            client.put_object(
+                Bucket=self.bucket,
+                Key=self.path + f"uploads/{upload_id}.json",
+                Body=json.dumps(state).encode("utf-8"),
+                ContentType="application/json",
+            )
+            return upload_id
+        except Exception as e:
+            print(f"Cannot save upload state: '{upload_id}' to S3.", e)
+            return None
+
+    def get_upload_state(self, upload_id: str):
+        try:
+            client = self.client_manager.get_client()
+            response = client.get_object(
+                Bucket=self.bucket, Key=self.path + f"uploads/{upload_id}.json"
+            )
+            with response["Body"] as body:
+                return json.loads(body.read())
+        except Exception as e:
+            print(f"Cannot get upload state: '{upload_id}' from S3.")
+            return None
+
+    def delete_upload_state(self, upload_id: str):
+        try:
+            client = self.client_manager.get_client()
+            client.delete_object(
+                Bucket=self.bucket, Key=self.path + f"uploads/{upload_id}.json"
+            )
+            return upload_id
+        except Exception as e:
+            print(f"Cannot delete upload state: '{upload_id}' from S3.")
+            return None
+
+    def head_object(self, object_name: str):
+        try:
+            client = self.client_manager.get_client()
+            return client.head_object(Bucket=self.bucket, Key=self.path + object_name)
+        except Exception as e:
+            print(f"Cannot get metadata of file: '{object_name}' from S3.")
+            return None
+
+    def hash_object(self, object_name: str, chunk_size: int = 1024 * 1024):
+        # object를 chunk 단위로 읽으며 content hash를 계산한다. (disk에 받지 않음)
+        try:
+            client = self.client_manager.get_client()
+            response = client.get_object(Bucket=self.bucket, Key=self.path + object_name)
+            hasher = hashlib.new(SOURCE_HASH_ALGORITHM)
+            with response["Body"] as body:
+                for chunk in iter(lambda: body.read(chunk_size), b""):
+                    hasher.update(chunk)
+            return format_source_hash(hasher)
+        except Exception as e:
+            print(f"Cannot hash file: '{object_name}' from S3.", e)
+            return None
+
     def delete(self, object_name: str):
         try:
             client = self.client_manager.get_client()
@@ -61,6 +243,38 @@ class VideoRepository:
             print(f"Cannot delete file: '{object_name}' from S3.")
             return None
 
+    def copy(self, source_object_name: str, object_name: str):
+        # S3 안에서 object를 복사한다. (download/upload 없이, 5GB가 넘으면 multipart copy)
+        try:
+            client = self.client_manager.get_client()
+            client.copy(
+                {"Bucket": self.bucket, "Key": self.path + source_object_name},
+                self.bucket,
+                self.path + object_name,
+            )
+            return object_name
+        except Exception as e:
+            print(f"Cannot copy file: '{source_object_name}' to '{object_name}'.", e)
+            return None
+
+    def list_object_names(self, prefix: str):
+        # prefix 아래 object name 목록 (self.path는 뺀다)
+        try:
+            client = self.client_manager.get_client()
+            paginator = client.get_paginator("list_objects_v2")
+            object_names = []
+            for page in paginator.paginate(
+                Bucket=self.bucket, Prefix=self.path + prefix
+            ):
+                object_names.extend(
+                    content["Key"][len(self.path) :]
+                    for content in page.get("Contents", [])
+                )
+            return object_names
+        except Exception as e:
+            print(f"Cannot get object list in '{prefix}' from S3.", e)
+            return None
+
     def get_object_list(self):
         try:
             client = self.client_manager.get_client()
@@ -68,3 +282,26 @@ class VideoRepository:
         except Exception as e:
             print(f"Cannot get object list in '{self.path}' from S3.")
             return None
+
+    def generate_presigned_url(self, object_name: str, expires_in: int = None):
+        # client가 S3에서 바로 받을 수 있는 GET url (expires_in초 동안 유효)
+        try:
+            client = self.client_manager.get_client()
+            return client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.bucket, "Key": self.path + object_name},
+                ExpiresIn=expires_in or self.presigned_url_expires,
+            )
+        except Exception as e:
+            print(f"Cannot generate presigned url of file: '{object_name}'.")
+            return None
+
+
+def hls_object_name(object_name: str, path: str) -> str:
+    # 영상 object와 같은 prefix의 hls/ 아래에 playlist와 segment를 둔다.
+    # (LOCAL/1/1/encoded_video.mp4 -> LOCAL/1/1/hls/{path})
+    return posixpath.join(posixpath.dirname(object_name), "hls", path)
+
+
+def format_source_hash(hasher) -> str:
+    return f"{hasher.name}:{hasher.hexdigest()}"
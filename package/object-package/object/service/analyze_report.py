@@ -1,11 +1,16 @@
 import os
 import io
+import json
+from typing import Dict
 from object.repository.analyze_report import AnalyzeReportRepository
 from object.exception import UploadFailed, DownloadFailed
-from core.model.domain.reports import AnalyzeReport
+from core.model.domain.reports import AnalyzeReport, BatchPromptReport
 
 
 class AnalyzeReportService:
+    # 분석 도중의 관찰척도 별 결과는 report 버전(KeyCount)에 섞이지 않도록 별도 prefix에 저장한다.
+    CHECKPOINT_PATH = "checkpoint"
+
     def __init__(self, analyze_report_repository: AnalyzeReportRepository):
         self.analyze_report_repository = analyze_report_repository
 
@@ -20,3 +25,53 @@ class AnalyzeReportService:
             return self.analyze_report_repository.upload(data, object_name)
         except Exception as e:
             raise UploadFailed(file_path + "/analyze_report.json")
+
+    def upload_checkpoint(
+        self, report: BatchPromptReport, file_path: str, name: str
+    ) -> str:
+        object_name = f"{self.CHECKPOINT_PATH}/{file_path}/{name}.json"
+        data = report.model_dump_json().encode("utf-8")
+        result = self.analyze_report_repository.upload(data, object_name)
+        if result is None:
+            raise UploadFailed(object_name)
+        return result
+
+    def download_checkpoints(self, file_path: str) -> Dict[str, BatchPromptReport]:
+        """
+        file_path에 저장된 관찰척도 별 결과를 {name: BatchPromptReport}로 반환
+        """
+        checkpoint_path = f"{self.CHECKPOINT_PATH}/{file_path}/"
+        object_list = self.analyze_report_repository.get_object_list(checkpoint_path)
+        if object_list is None:
+            raise DownloadFailed(checkpoint_path)
+
+        checkpoints = dict()
+        for content in object_list.get("Contents", []):
+            object_name = content["Key"][len(self.analyze_report_repository.path) :]
+            body = self.analyze_report_repository.download(object_name)
+            if body is None:
+                raise DownloadFailed(object_name)
+
+            name = os.path.splitext(os.path.basename(object_name))[0]
+            checkpoints[name] = BatchPromptReport(**json.loads(body.read()))
+        return checkpoints
+
+    def delete_checkpoints(self, file_path: str, exclude: str = None) -> int:
+        """
+        file_path 아래의 checkpoint를 삭제한다. (exclude 아래의 checkpoint는 남긴다)
+        """
+        checkpoint_path = f"{self.CHECKPOINT_PATH}/{file_path}/"
+        object_list = self.analyze_report_repository.get_object_list(checkpoint_path)
+        if object_list is None:
+            return 0
+
+        deleted = 0
+        for content in object_list.get("Contents", []):
+            object_name = content["Key"][len(self.analyze_report_repository.path) :]
+            if exclude is not None and object_name.startswith(
+                f"{self.CHECKPOINT_PATH}/{exclude}/"
+            ):
+                continue
+            if self.analyze_report_repository.delete(object_name) is not None:
+                deleted += 1
+        return deleted
@@ -1,6 +1,9 @@
 import io
+from typing import Iterator
+import ijson
 from object.repository.script import ScriptRepository
 from object.exception import UploadFailed, DownloadFailed
+from core.model.domain.script import Record
 
 
 class ScriptService:
@@ -23,6 +26,19 @@ class ScriptService:
             raise DownloadFailed(file_path)
         return script_body.read()
 
+    def iter_script_records(self, file_path: str) -> Iterator[Record]:
+        """
+        script 파일 전체를 메모리에 올리지 않고 S3 body를 읽으면서 scripts[]의 record를 하나씩 반환
+        """
+        script_body = self.script_repository.get_json(file_path)
+        if not script_body:
+            raise DownloadFailed(file_path)
+        try:
+            for item in ijson.items(script_body, "scripts.item", use_float=True):
+                yield Record(**item)
+        finally:
+            script_body.close()
+
     def get_script_list(self, file_path: str):
         try:
             return self.script_repository.get_object_list(file_path)
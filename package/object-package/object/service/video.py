@@ -1,11 +1,46 @@
-from object.repository.video import VideoRepository
+from object.repository.video import VideoRepository, hls_object_name
+from object.repository.multipart_upload import MultipartUploader
 from moviepy.editor import VideoFileClip
-from object.exception import UploadFailed
+from moviepy.config import get_setting
+from object.exception import UploadFailed, DownloadFailed, EncodeFailed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import subprocess
 import os
+import re
+
+# ffmpeg stdout(encoding 결과)을 읽는 단위
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# HLS rendition (bitrate 단위: kbps). 원본보다 큰 해상도로 키우지는 않는다.
+HLS_RENDITIONS = [
+    {"name": "240p", "height": 240, "video_bitrate": 300, "audio_bitrate": 64},
+    {"name": "480p", "height": 480, "video_bitrate": 1000, "audio_bitrate": 96},
+    {"name": "720p", "height": 720, "video_bitrate": 2500, "audio_bitrate": 128},
+]
+# encoding 결과를 재사용하는 key. encode_video/ffmpeg_command/hls_command 설정을 바꾸면 같이 바꾼다.
+ENCODING_PROFILE = "mp4:libx264-96k/aac-72k/24fps"
+# segment 길이 (초). keyframe 간격을 맞춰 모든 rendition의 segment 경계를 같게 한다.
+HLS_SEGMENT_SECONDS = 4
+# segment upload를 동시에 실행하는 thread 수
+HLS_UPLOAD_WORKERS = 8
+# ffmpeg -i 출력의 입력 audio stream (예: "Stream #0:1[0x2](und): Audio: aac ...")
+AUDIO_STREAM_PATTERN = re.compile(rb"Stream #\d+:\d+.*: Audio: ")
+
 
 class VideoService:
-    def __init__(self, video_repository: VideoRepository):
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        video_uploader: MultipartUploader = None,
+        source_url_expires: int = 3600,
+    ):
         self.video_repository = video_repository
+        # stream_encode_video에서 encoding 결과를 multipart upload로 올린다.
+        self.video_uploader = video_uploader
+        # ffmpeg가 원본을 읽는 presigned url 유효 시간 (encoding 최대 소요 시간보다 길어야 한다)
+        self.source_url_expires = source_url_expires
 
     def upload_origin_video(self, file_name: str, object_name: str):
         url_result = self.video_repository.upload(file_name, object_name)
@@ -14,24 +49,92 @@ class VideoService:
         return url_result
     
     def upload_encode_video(
-        self, object_name: str, file_name: str, encoded_path: str
+        self, object_name: str, file_name: str, encoded_path: str, threads: int = None
     ):
         encoded_path = self.download_and_encode_video(
-            object_name, file_name, encoded_path
+            object_name, file_name, encoded_path, threads=threads
         )
-
-        encoded_video_url = object_name.split('/')
-        encoded_video_url[-1] = "encoded_"+encoded_video_url[-1]
+        if not encoded_path:
+            raise EncodeFailed(object_name)
 
         url_result = self.video_repository.upload(
-            encoded_path, '/'.join(encoded_video_url)
+            encoded_path, encoded_object_name(object_name)
         )
         if not url_result:
             raise UploadFailed(encoded_path)
         return url_result
-    
+
+    async def stream_encode_video(self, object_name: str, threads: int = None):
+        """
+        원본을 download 하지 않고 ffmpeg가 presigned url로 바로 읽게 한 뒤,
+        stdout으로 나오는 fragmented MP4를 그대로 multipart upload로 올린다.
+        원본/encoding 영상을 disk에 쓰지 않고 한 번에 처리한다.
+        ffmpeg가 실패하면 upload를 complete 하지 않고 abort 한다.
+        """
+        source_url = self.video_repository.generate_presigned_url(
+            object_name, expires_in=self.source_url_expires
+        )
+        if not source_url:
+            raise EncodeFailed(object_name)
+
+        print(f"[ObjectService] start stream encoding: '{object_name}'.")
+        process = await asyncio.create_subprocess_exec(
+            *self.ffmpeg_command(source_url, threads),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # stderr를 읽지 않으면 pipe가 차서 ffmpeg가 멈춘다. 실패 원인 확인용으로 마지막 몇 줄만 남긴다.
+        stderr_tail = deque(maxlen=20)
+        stderr_task = asyncio.create_task(read_lines(process.stderr, stderr_tail))
+        try:
+            url_result = await self.video_uploader.upload(
+                iter_encoded(process, object_name), encoded_object_name(object_name)
+            )
+        except EncodeFailed:
+            await stderr_task
+            # presigned url(서명)이 log에 남지 않도록 object name으로 바꾼다.
+            error = [line.replace(source_url, object_name) for line in stderr_tail]
+            print(f"Cannot encode video: '{object_name}'. Error: {error}")
+            raise
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if not stderr_task.done():
+                stderr_task.cancel()
+
+        if not url_result:
+            raise UploadFailed(encoded_object_name(object_name))
+        print(f"[ObjectService] end stream encoding: '{url_result}'.")
+        return url_result
+
+    # encode_video(moviepy)와 같은 설정으로 encoding 하되, 앞에서부터 바로 재생/upload 할 수 있도록
+    # moov를 먼저 쓰고 keyframe마다 fragment로 나누어 stdout으로 내보낸다.
+    def ffmpeg_command(self, source_url: str, threads: int = None):
+        return [
+            get_setting("FFMPEG_BINARY"),
+            "-nostdin",
+            "-loglevel", "error",
+            "-reconnect", "1",
+            "-i", source_url,
+            "-r", "24",
+            "-c:v", "libx264",
+            "-preset", "ultrafast",
+            "-b:v", "96k",
+            "-pix_fmt", "yuv420p",
+            "-c:a", "aac",
+            "-b:a", "72k",
+            "-threads", str(threads or os.cpu_count() - 1),
+            "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+            "-f", "mp4",
+            "pipe:1",
+        ]
+
         
-    def download_and_encode_video(self, object_name: str, file_name: str, encoded_path: str):
+    def download_and_encode_video(
+        self, object_name: str, file_name: str, encoded_path: str, threads: int = None
+    ):
 
         try:
             print(f"Downloading video: {object_name}")
@@ -40,7 +143,7 @@ class VideoService:
             if downloaded_file:
                 print(f"[ObjectService] start encoding: '{file_name}'.")
                 print(f"Encoding video: {object_name}")
-                encoded_path = self.encode_video(downloaded_file, encoded_path)
+                return self.encode_video(downloaded_file, encoded_path, threads=threads)
             else:
                 print(f"[ObjectService] no download file: '{file_name}'.")
                 return None
@@ -48,26 +151,248 @@ class VideoService:
             print(f"Cannot encode video: '{object_name}'. Error: {e}")
             return None
         
-    def encode_video(self, file_name: str, encoded_path: str):
+    # threads: ffmpeg encoding thread 수 (job 하나의 CPU 사용량, 없으면 core 수 - 1)
+    def encode_video(self, file_name: str, encoded_path: str, threads: int = None):
         try:
             file_dir = os.path.dirname(encoded_path)
             if not os.path.exists(file_dir):
                 os.makedirs(file_dir, exist_ok=True)
 
             clip = VideoFileClip(file_name)
-            clip.write_videofile(
-                encoded_path,
-                fps=24,
-                threads=os.cpu_count()-1,
-                codec="libx264",
-                bitrate="96k",
-                audio_codec="aac",
-                logger=None,
-                audio_bitrate="72k",
-                preset="ultrafast",
-            )
+            try:
+                clip.write_videofile(
+                    encoded_path,
+                    fps=24,
+                    threads=threads or os.cpu_count()-1,
+                    codec="libx264",
+                    bitrate="96k",
+                    audio_codec="aac",
+                    logger=None,
+                    audio_bitrate="72k",
+                    preset="ultrafast",
+                )
+            finally:
+                # ffmpeg reader process를 정리한다. (worker에서 반복 실행)
+                clip.close()
             print(f"[ObjectService] end encoding: '{encoded_path}'.")
             return encoded_path
         except Exception as e:
             print(f"Cannot encode video: '{file_name}'. Error: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def hash_video(self, object_name: str):
+        # upload 할 때 hash를 계산하지 못한 원본(resumable upload 등)은 S3에서 읽어 계산한다.
+        source_hash = self.video_repository.hash_object(object_name)
+        if not source_hash:
+            raise DownloadFailed(object_name)
+        return source_hash
+
+    def exists(self, object_name: str) -> bool:
+        return self.video_repository.head_object(object_name) is not None
+
+    def copy_encoded_video(
+        self, encoding_video_url: str, object_name: str, hls: bool = False
+    ) -> str:
+        """
+        다른 session의 encoding 결과를 object_name의 encoded_ 영상으로 복사하고 object name을 반환한다.
+        원래 session이 지워지거나 다시 encoding 되어도 복사한 영상은 남는다. (transcode 없음)
+        hls가 켜져 있으면 hls/ 아래도 복사하고, master playlist는 마지막에 복사한다.
+        """
+        target_url = encoded_object_name(object_name)
+        if target_url == encoding_video_url:
+            return target_url
+
+        if hls:
+            source_prefix = hls_object_name(encoding_video_url, "")
+            paths = self.video_repository.list_object_names(source_prefix)
+            if not paths or source_prefix + "master.m3u8" not in paths:
+                raise DownloadFailed(source_prefix + "master.m3u8")
+            paths = [p[len(source_prefix) :] for p in paths]
+            paths.sort(key=lambda path: path == "master.m3u8")
+
+            def copy(path: str):
+                return self.video_repository.copy(
+                    source_prefix + path, hls_object_name(target_url, path)
+                )
+
+            with ThreadPoolExecutor(max_workers=HLS_UPLOAD_WORKERS) as executor:
+                for path, url_result in zip(paths[:-1], executor.map(copy, paths[:-1])):
+                    if not url_result:
+                        raise UploadFailed(path)
+            if not copy(paths[-1]):
+                raise UploadFailed(paths[-1])
+
+        url_result = self.video_repository.copy(encoding_video_url, target_url)
+        if not url_result:
+            raise UploadFailed(target_url)
+        return url_result
+
+    def encoding_profile(self, hls: bool = False, hls_renditions: list = None) -> str:
+        # HLS까지 만든 결과는 rendition 설정까지 같아야 재사용한다.
+        if not hls:
+            return ENCODING_PROFILE
+        renditions = ",".join(
+            f"{r['name']}-{r['height']}-{r['video_bitrate']}k-{r['audio_bitrate']}k"
+            for r in hls_renditions or HLS_RENDITIONS
+        )
+        return f"{ENCODING_PROFILE}+hls:{HLS_SEGMENT_SECONDS}s/{renditions}"
+
+    def package_hls(
+        self,
+        object_name: str,
+        work_dir: str,
+        threads: int = None,
+        renditions: list = None,
+    ):
+        """
+        원본을 여러 해상도/bitrate의 HLS rendition으로 나누어 work_dir에 만든 뒤
+        영상과 같은 prefix의 hls/ 아래에 올리고 master playlist의 object name을 반환한다.
+
+            hls/master.m3u8
+            hls/{rendition}/index.m3u8
+            hls/{rendition}/segment_00000.ts
+
+        master playlist는 rendition playlist와 segment가 모두 올라간 뒤에 올린다.
+        """
+        source_url = self.video_repository.generate_presigned_url(
+            object_name, expires_in=self.source_url_expires
+        )
+        if not source_url:
+            raise EncodeFailed(object_name)
+
+        print(f"[ObjectService] start hls packaging: '{object_name}'.")
+        os.makedirs(work_dir, exist_ok=True)
+        has_audio = self.has_audio(source_url)
+        result = subprocess.run(
+            self.hls_command(
+                source_url,
+                work_dir,
+                threads,
+                renditions or HLS_RENDITIONS,
+                has_audio=has_audio,
+            ),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if result.returncode != 0:
+            error = result.stderr.decode("utf-8", errors="replace")
+            error = error.replace(source_url, object_name).strip().splitlines()[-20:]
+            print(f"Cannot package hls: '{object_name}'. Error: {error}")
+            raise EncodeFailed(object_name)
+
+        files = []
+        for root, _, file_names in os.walk(work_dir):
+            for file_name in file_names:
+                path = os.path.relpath(os.path.join(root, file_name), work_dir)
+                if path != "master.m3u8":
+                    files.append(path.replace(os.sep, "/"))
+
+        def upload(path: str):
+            return self.video_repository.upload(
+                os.path.join(work_dir, path), hls_object_name(object_name, path)
+            )
+
+        with ThreadPoolExecutor(max_workers=HLS_UPLOAD_WORKERS) as executor:
+            for path, url_result in zip(files, executor.map(upload, files)):
+                if not url_result:
+                    raise UploadFailed(path)
+
+        url_result = upload("master.m3u8")
+        if not url_result:
+            raise UploadFailed("master.m3u8")
+        print(f"[ObjectService] end hls packaging: '{url_result}'.")
+        return url_result
+
+    def has_audio(self, source_url: str) -> bool:
+        # ffmpeg -i 만 실행하면 stderr에 입력 stream 목록을 출력한다. (출력 파일이 없어 exit code는 1)
+        result = subprocess.run(
+            [get_setting("FFMPEG_BINARY"), "-nostdin", "-hide_banner", "-i", source_url],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        return AUDIO_STREAM_PATTERN.search(result.stderr) is not None
+
+    def hls_command(
+        self,
+        source_url: str,
+        work_dir: str,
+        threads: int,
+        renditions: list,
+        has_audio: bool = True,
+    ):
+        # 음성이 없는 원본은 audio를 map 하지 않고 video만으로 rendition을 만든다.
+        count = len(renditions)
+        filters = [f"[0:v]split={count}" + "".join(f"[v{i}]" for i in range(count))]
+        command = [
+            get_setting("FFMPEG_BINARY"),
+            "-nostdin",
+            "-loglevel", "error",
+            "-reconnect", "1",
+            "-i", source_url,
+        ]
+        for i, rendition in enumerate(renditions):
+            filters.append(
+                f"[v{i}]scale=-2:'min({rendition['height']},ih)'[v{i}out]"
+            )
+        command += ["-filter_complex", ";".join(filters)]
+        for i, rendition in enumerate(renditions):
+            command += ["-map", f"[v{i}out]"]
+            command += [
+                f"-b:v:{i}", f"{rendition['video_bitrate']}k",
+                f"-maxrate:v:{i}", f"{rendition['video_bitrate']}k",
+                f"-bufsize:v:{i}", f"{rendition['video_bitrate'] * 2}k",
+            ]
+            if has_audio:
+                command += ["-map", "0:a:0?", f"-b:a:{i}", f"{rendition['audio_bitrate']}k"]
+        gop = 24 * HLS_SEGMENT_SECONDS
+        return command + [
+            "-r", "24",
+            "-c:v", "libx264",
+            "-preset", "veryfast",
+            "-pix_fmt", "yuv420p",
+            "-g", str(gop),
+            "-keyint_min", str(gop),
+            "-sc_threshold", "0",
+            "-c:a", "aac",
+            "-ac", "2",
+            "-threads", str(threads or os.cpu_count() - 1),
+            "-f", "hls",
+            "-hls_time", str(HLS_SEGMENT_SECONDS),
+            "-hls_playlist_type", "vod",
+            "-hls_flags", "independent_segments",
+            "-hls_segment_filename", os.path.join(work_dir, "%v", "segment_%05d.ts"),
+            "-master_pl_name", "master.m3u8",
+            "-var_stream_map",
+            " ".join(
+                f"v:{i},a:{i},name:{rendition['name']}"
+                if has_audio
+                else f"v:{i},name:{rendition['name']}"
+                for i, rendition in enumerate(renditions)
+            ),
+            os.path.join(work_dir, "%v", "index.m3u8"),
+        ]
+
+
+
+def encoded_object_name(object_name: str) -> str:
+    encoded_video_url = object_name.split('/')
+    encoded_video_url[-1] = "encoded_"+encoded_video_url[-1]
+    return '/'.join(encoded_video_url)
+
+
+async def iter_encoded(process, object_name: str):
+    while True:
+        chunk = await process.stdout.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+    # stdout이 끝난 뒤 ffmpeg 종료 코드를 확인한다. (실패면 multipart upload가 abort 된다)
+    if await process.wait() != 0:
+        raise EncodeFailed(object_name)
+
+
+async def read_lines(stream, lines: deque):
+    async for line in stream:
+        lines.append(line.decode("utf-8", errors="replace").rstrip())
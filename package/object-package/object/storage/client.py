@@ -10,17 +10,34 @@ logging.getLogger("urllib3").setLevel(logging.CRITICAL)
 
 from abc import ABC
 import boto3
+from botocore.config import Config
 
 
 class ClientManager(ABC):
     def __init__(
-        self, aws_access_key_id: str, aws_secret_access_key: str, region_name: str
+        self,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        region_name: str,
+        max_pool_connections: int = None,
+        endpoint_url: str = None,
     ):
+        # client는 thread-safe하므로 여러 thread가 공유한다.
+        # thread pool에서 호출할 때는 max_pool_connections를 worker 수 이상으로 맞춘다.
+        # presigned url은 region에 관계없이 SigV4로 서명한다.
+        options = {"signature_version": "s3v4"}
+        if max_pool_connections is not None:
+            options["max_pool_connections"] = max_pool_connections
+        if endpoint_url:
+            # MinIO 등 S3 호환 storage는 bucket을 host가 아닌 path로 구분한다.
+            options["s3"] = {"addressing_style": "path"}
         self.client = boto3.client(
             "s3",
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name,
+            endpoint_url=endpoint_url or None,
+            config=Config(**options),
         )
 
     def get_client(self):
@@ -0,0 +1,68 @@
+import io
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.video import VideoRepository
+
+
+class TestAsyncObjectRepository(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="object")
+        self.repository = MagicMock(spec=VideoRepository)
+        self.repository.bucket = "bucket"
+        self.async_repository = AsyncObjectRepository(
+            self.repository, self.executor, chunk_size=4
+        )
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_method_runs_in_executor(self):
+        thread_names = []
+
+        def get_object(object_name):
+            thread_names.append(threading.current_thread().name)
+            return {"Body": object_name}
+
+        self.repository.get_object.side_effect = get_object
+        result = await self.async_repository.get_object("object_name")
+
+        self.assertEqual(result, {"Body": "object_name"})
+        self.repository.get_object.assert_called_once_with("object_name")
+        self.assertTrue(thread_names[0].startswith("object"))
+
+    async def test_attribute(self):
+        self.assertEqual(self.async_repository.bucket, "bucket")
+
+    async def test_read(self):
+        body = io.BytesIO(b"script")
+
+        result = await self.async_repository.read(body)
+
+        self.assertEqual(result, b"script")
+        self.assertTrue(body.closed)
+
+    async def test_iter_chunks(self):
+        body = io.BytesIO(b"0123456789")
+
+        chunks = [chunk async for chunk in self.async_repository.iter_chunks(body)]
+
+        self.assertEqual(chunks, [b"0123", b"4567", b"89"])
+        self.assertTrue(body.closed)
+
+    async def test_iter_chunks_closed_on_break(self):
+        body = io.BytesIO(b"0123456789")
+
+        chunks = self.async_repository.iter_chunks(body, chunk_size=2)
+        async for chunk in chunks:
+            break
+        await chunks.aclose()
+
+        self.assertEqual(chunk, b"01")
+        self.assertTrue(body.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, call
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.multipart_upload import MultipartUploader, MIN_PART_SIZE
+from object.repository.video import VideoRepository
+
+
+async def iter_chunks(data: bytes, chunk_size: int):
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
+class TestMultipartUploader(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.repository = MagicMock(spec=VideoRepository)
+        self.repository.create_multipart_upload.return_value = "upload-id"
+        self.repository.upload_part.side_effect = (
+            lambda object_name, upload_id, part_number, data: f'"etag-{part_number}"'
+        )
+        self.repository.complete_multipart_upload.return_value = "object_name"
+        self.uploader = MultipartUploader(
+            AsyncObjectRepository(self.repository, self.executor),
+            part_size=MIN_PART_SIZE,
+            max_concurrency=2,
+            max_retries=2,
+            retry_backoff=0,
+        )
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_upload(self):
+        data = b"a" * (MIN_PART_SIZE * 2 + 10)
+        progress = []
+
+        result = await self.uploader.upload(
+            iter_chunks(data, 64 * 1024),
+            "object_name",
+            on_progress=lambda uploaded, count: progress.append((uploaded, count)),
+        )
+
+        self.assertEqual(result, "object_name")
+        part_sizes = {
+            c.args[2]: len(c.args[3])
+            for c in self.repository.upload_part.call_args_list
+        }
+        self.assertEqual(part_sizes, {1: MIN_PART_SIZE, 2: MIN_PART_SIZE, 3: 10})
+        self.repository.complete_multipart_upload.assert_called_once_with(
+            "object_name",
+            "upload-id",
+            [
+                {"PartNumber": 1, "ETag": '"etag-1"'},
+                {"PartNumber": 2, "ETag": '"etag-2"'},
+                {"PartNumber": 3, "ETag": '"etag-3"'},
+            ],
+        )
+        self.assertEqual(progress[-1], (len(data), 3))
+        self.repository.abort_multipart_upload.assert_not_called()
+
+    async def test_upload_empty(self):
+        result = await self.uploader.upload(iter_chunks(b"", 1), "object_name")
+
+        self.assertEqual(result, "object_name")
+        self.repository.upload_part.assert_called_once_with(
+            "object_name", "upload-id", 1, b""
+        )
+
+    async def test_upload_part_retry(self):
+        etags = iter([None, None, '"etag-1"'])
+        self.repository.upload_part.side_effect = lambda *args: next(etags)
+
+        result = await self.uploader.upload(iter_chunks(b"video", 1), "object_name")
+
+        self.assertEqual(result, "object_name")
+        self.assertEqual(self.repository.upload_part.call_count, 3)
+        self.repository.complete_multipart_upload.assert_called_once_with(
+            "object_name", "upload-id", [{"PartNumber": 1, "ETag": '"etag-1"'}]
+        )
+
+    async def test_upload_part_failed(self):
+        self.repository.upload_part.side_effect = None
+        self.repository.upload_part.return_value = None
+
+        result = await self.uploader.upload(iter_chunks(b"video", 1), "object_name")
+
+        self.assertIsNone(result)
+        self.assertEqual(self.repository.upload_part.call_count, 3)
+        self.repository.complete_multipart_upload.assert_not_called()
+        self.repository.abort_multipart_upload.assert_called_once_with(
+            "object_name", "upload-id"
+        )
+
+    async def test_upload_create_failed(self):
+        self.repository.create_multipart_upload.return_value = None
+
+        result = await self.uploader.upload(iter_chunks(b"video", 1), "object_name")
+
+        self.assertIsNone(result)
+        self.repository.upload_part.assert_not_called()
+
+    async def test_upload_complete_failed(self):
+        self.repository.complete_multipart_upload.return_value = None
+
+        result = await self.uploader.upload(iter_chunks(b"video", 1), "object_name")
+
+        self.assertIsNone(result)
+        self.repository.abort_multipart_upload.assert_called_once_with(
+            "object_name", "upload-id"
+        )
+
+    async def test_upload_source_error(self):
+        async def broken_chunks():
+            yield b"a" * MIN_PART_SIZE
+            raise ConnectionError("client disconnected")
+
+        with self.assertRaises(ConnectionError):
+            await self.uploader.upload(broken_chunks(), "object_name")
+        self.repository.complete_multipart_upload.assert_not_called()
+        self.repository.abort_multipart_upload.assert_called_once_with(
+            "object_name", "upload-id"
+        )
+
+    async def test_upload_bounded_in_flight(self):
+        # 올리는 중인 part가 max_concurrency개면 다음 chunk를 읽지 않는다.
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def upload_part(object_name, upload_id, part_number, data):
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            return f'"etag-{part_number}"'
+
+        self.repository.upload_part.side_effect = upload_part
+        read = []
+
+        async def chunks():
+            for i in range(4):
+                read.append(i)
+                yield b"a" * MIN_PART_SIZE
+
+        task = asyncio.create_task(self.uploader.upload(chunks(), "object_name"))
+        await asyncio.sleep(0.1)
+        self.assertEqual(read, [0, 1, 2])
+        release.set()
+
+        self.assertEqual(await task, "object_name")
+        self.assertEqual(read, [0, 1, 2, 3])
+
+    def test_part_size_too_small(self):
+        with self.assertRaises(ValueError):
+            MultipartUploader(MagicMock(), part_size=MIN_PART_SIZE - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
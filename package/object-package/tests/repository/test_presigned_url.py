@@ -0,0 +1,87 @@
+import threading
+import unittest
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+from object.storage.client import ClientManager
+from object.repository.analyze_report import AnalyzeReportRepository
+from object.repository.script import ScriptRepository
+from object.repository.video import VideoRepository
+
+OBJECTS = {"/bucket/video/1/1/video.mp4": b"video"}
+
+
+class StubS3Handler(BaseHTTPRequestHandler):
+    # presigned url의 query 서명만 확인하고 object를 돌려주는 S3 호환 stand-in
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if "X-Amz-Signature" not in query or url.path not in OBJECTS:
+            self.send_response(403)
+            self.end_headers()
+            return
+        body = OBJECTS[url.path]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPresignedUrl(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubS3Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.endpoint_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.client_manager = ClientManager(
+            "access_key",
+            "secret_key",
+            "ap-northeast-2",
+            endpoint_url=self.endpoint_url,
+        )
+
+    def test_generate_presigned_url(self):
+        video_repo = VideoRepository(
+            "bucket", self.client_manager, presigned_url_expires=60
+        )
+        url = video_repo.generate_presigned_url("1/1/video.mp4")
+
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        self.assertTrue(url.startswith(self.endpoint_url))
+        self.assertEqual(parsed.path, "/bucket/video/1/1/video.mp4")
+        self.assertEqual(query["X-Amz-Algorithm"], ["AWS4-HMAC-SHA256"])
+        self.assertEqual(query["X-Amz-Expires"], ["60"])
+        with urllib.request.urlopen(url) as response:
+            self.assertEqual(response.read(), b"video")
+
+    def test_generate_presigned_url_expires_in(self):
+        script_repo = ScriptRepository("bucket", self.client_manager)
+        url = script_repo.generate_presigned_url("1/1/script_v1.json", expires_in=10)
+
+        query = parse_qs(urlparse(url).query)
+        self.assertEqual(urlparse(url).path, "/bucket/script/1/1/script_v1.json")
+        self.assertEqual(query["X-Amz-Expires"], ["10"])
+
+    def test_generate_presigned_url_exception(self):
+        client_manager = MagicMock(spec=ClientManager)
+        client_manager.get_client.side_effect = Exception
+        analyze_report_repo = AnalyzeReportRepository("bucket", client_manager)
+        self.assertIsNone(
+            analyze_report_repo.generate_presigned_url("1/1/analyze_report.json")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,16 @@
+import hashlib
+import io
 import unittest
 from unittest.mock import MagicMock, patch
 from boto3 import client
+from botocore.exceptions import ClientError
 from object.storage.client import ClientManager
 from object.repository.video import VideoRepository
+from object.exception import (
+    InvalidObjectRange,
+    ObjectNotModified,
+    ObjectPreconditionFailed,
+)
 
 
 class TestVideoRepository(unittest.TestCase):
@@ -104,3 +112,228 @@ class TestVideoRepository(unittest.TestCase):
         self.client_manager.get_client.return_value = s3_client
         result = self.video_repo.get_object_list()
         self.assertIsNone(result)
+
+    def test_copy(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        result = self.video_repo.copy("1/9/encoded_video.mp4", "1/1/encoded_video.mp4")
+        s3_client.copy.assert_called_once_with(
+            {"Bucket": "bucket", "Key": "video/1/9/encoded_video.mp4"},
+            "bucket",
+            "video/1/1/encoded_video.mp4",
+        )
+        self.assertEqual(result, "1/1/encoded_video.mp4")
+
+    def test_copy_exception(self):
+        s3_client = MagicMock(spec=client("s3"))
+        s3_client.copy.side_effect = Exception
+        self.client_manager.get_client.return_value = s3_client
+        self.assertIsNone(self.video_repo.copy("1/9/a.mp4", "1/1/a.mp4"))
+
+    def test_list_object_names(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "video/1/9/hls/master.m3u8"}]},
+            {"Contents": [{"Key": "video/1/9/hls/240p/index.m3u8"}]},
+            {},
+        ]
+        result = self.video_repo.list_object_names("1/9/hls/")
+        s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="bucket", Prefix="video/1/9/hls/"
+        )
+        self.assertEqual(result, ["1/9/hls/master.m3u8", "1/9/hls/240p/index.m3u8"])
+
+    def test_get_object(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.get_object.return_value = {"Body": "video"}
+        result = self.video_repo.get_object("1/1/video.mp4")
+        s3_client.get_object.assert_called_once_with(
+            Bucket="bucket", Key="video/1/1/video.mp4"
+        )
+        self.assertEqual(result, {"Body": "video"})
+
+    def test_get_object_range(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.get_object.return_value = {"ContentRange": "bytes 0-9/100"}
+        result = self.video_repo.get_object(
+            "1/1/video.mp4", byte_range="bytes=0-9", if_match='"etag"'
+        )
+        s3_client.get_object.assert_called_once_with(
+            Bucket="bucket",
+            Key="video/1/1/video.mp4",
+            Range="bytes=0-9",
+            IfMatch='"etag"',
+        )
+        self.assertEqual(result, {"ContentRange": "bytes 0-9/100"})
+
+    def test_get_object_invalid_range(self):
+        s3_client = MagicMock(spec=client("s3"))
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "InvalidRange"}}, "GetObject"
+        )
+        self.client_manager.get_client.return_value = s3_client
+        with self.assertRaises(InvalidObjectRange):
+            self.video_repo.get_object("1/1/video.mp4", byte_range="bytes=100-")
+
+    def test_get_object_precondition_failed(self):
+        s3_client = MagicMock(spec=client("s3"))
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "PreconditionFailed"}}, "GetObject"
+        )
+        self.client_manager.get_client.return_value = s3_client
+        with self.assertRaises(ObjectPreconditionFailed):
+            self.video_repo.get_object(
+                "1/1/video.mp4", byte_range="bytes=0-", if_match='"old"'
+            )
+
+    def test_get_object_not_modified(self):
+        s3_client = MagicMock(spec=client("s3"))
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "304", "Message": "Not Modified"}}, "GetObject"
+        )
+        self.client_manager.get_client.return_value = s3_client
+        with self.assertRaises(ObjectNotModified):
+            self.video_repo.get_object("1/1/hls/master.m3u8", if_none_match='"etag"')
+        self.assertEqual(s3_client.get_object.call_args.kwargs["IfNoneMatch"], '"etag"')
+
+    def test_get_object_exception(self):
+        s3_client = MagicMock(spec=client("s3"))
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+        )
+        self.client_manager.get_client.return_value = s3_client
+        result = self.video_repo.get_object("1/1/video.mp4")
+        self.assertIsNone(result)
+
+    def test_head_object(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.head_object.return_value = {"ContentLength": 100}
+        result = self.video_repo.head_object("1/1/video.mp4")
+        s3_client.head_object.assert_called_once_with(
+            Bucket="bucket", Key="video/1/1/video.mp4"
+        )
+        self.assertEqual(result, {"ContentLength": 100})
+
+    def test_multipart_upload(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+        s3_client.upload_part.return_value = {"ETag": '"etag"'}
+        parts = [{"PartNumber": 1, "ETag": '"etag"'}]
+
+        upload_id = self.video_repo.create_multipart_upload("1/1/video.mp4")
+        etag = self.video_repo.upload_part("1/1/video.mp4", upload_id, 1, b"video")
+        result = self.video_repo.complete_multipart_upload(
+            "1/1/video.mp4", upload_id, parts
+        )
+
+        self.assertEqual(upload_id, "upload-id")
+        self.assertEqual(etag, '"etag"')
+        self.assertEqual(result, "1/1/video.mp4")
+        s3_client.upload_part.assert_called_once_with(
+            Bucket="bucket",
+            Key="video/1/1/video.mp4",
+            UploadId="upload-id",
+            PartNumber=1,
+            Body=b"video",
+        )
+        s3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="video/1/1/video.mp4",
+            UploadId="upload-id",
+            MultipartUpload={"Parts": parts},
+        )
+
+    def test_upload_part_exception(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.upload_part.side_effect = Exception
+        result = self.video_repo.upload_part("1/1/video.mp4", "upload-id", 1, b"")
+        self.assertIsNone(result)
+
+    def test_abort_multipart_upload(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        result = self.video_repo.abort_multipart_upload("1/1/video.mp4", "upload-id")
+        s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="video/1/1/video.mp4", UploadId="upload-id"
+        )
+        self.assertEqual(result, "1/1/video.mp4")
+
+    def test_list_parts(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Parts": [{"PartNumber": 1, "ETag": '"a"', "Size": 5, "LastModified": 0}]},
+            {"Parts": [{"PartNumber": 2, "ETag": '"b"', "Size": 3, "LastModified": 0}]},
+        ]
+        result = self.video_repo.list_parts("1/1/video.mp4", "upload-id")
+        s3_client.get_paginator.assert_called_once_with("list_parts")
+        s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="bucket", Key="video/1/1/video.mp4", UploadId="upload-id"
+        )
+        self.assertEqual(
+            result,
+            [
+                {"PartNumber": 1, "ETag": '"a"', "Size": 5},
+                {"PartNumber": 2, "ETag": '"b"', "Size": 3},
+            ],
+        )
+
+    def test_list_parts_exception(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.get_paginator.side_effect = Exception
+        self.assertIsNone(self.video_repo.list_parts("1/1/video.mp4", "upload-id"))
+
+    def test_upload_state(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        state = {"upload_id": "abc", "case_id": 1}
+
+        self.assertEqual(self.video_repo.put_upload_state("abc", state), "abc")
+        body = s3_client.put_object.call_args.kwargs["Body"]
+        s3_client.get_object.return_value = {"Body": io.BytesIO(body)}
+
+        self.assertEqual(self.video_repo.get_upload_state("abc"), state)
+        s3_client.get_object.assert_called_once_with(
+            Bucket="bucket", Key="video/uploads/abc.json"
+        )
+        self.assertEqual(self.video_repo.delete_upload_state("abc"), "abc")
+        s3_client.delete_object.assert_called_once_with(
+            Bucket="bucket", Key="video/uploads/abc.json"
+        )
+
+    def test_get_upload_state_not_found(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+        )
+        self.assertIsNone(self.video_repo.get_upload_state("abc"))
+
+    def test_hash_object(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        data = b"video" * 1000
+        s3_client.get_object.return_value = {"Body": io.BytesIO(data)}
+
+        result = self.video_repo.hash_object("1/1/video.mp4", chunk_size=7)
+
+        self.assertEqual(result, "sha256:" + hashlib.sha256(data).hexdigest())
+        s3_client.get_object.assert_called_once_with(
+            Bucket="bucket", Key="video/1/1/video.mp4"
+        )
+
+    def test_hash_object_exception(self):
+        s3_client = MagicMock(spec=client("s3"))
+        self.client_manager.get_client.return_value = s3_client
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+        )
+        self.assertIsNone(self.video_repo.hash_object("1/1/video.mp4"))
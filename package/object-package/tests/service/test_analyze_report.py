@@ -1,7 +1,7 @@
 import unittest
 import io
 from unittest.mock import MagicMock, patch
-from core.model.domain.reports import AnalyzeReport
+from core.model.domain.reports import AnalyzeReport, BatchPromptReport
 from object.service.analyze_report import AnalyzeReportService
 from object.repository.analyze_report import AnalyzeReportRepository
 from object.exception import UploadFailed, DownloadFailed
@@ -27,6 +27,76 @@ class TestAnalyzeReportService(unittest.TestCase):
         )
         self.assertEqual(result, file_path + "/analyze_report_v1.json")
 
+    def test_upload_checkpoint(self):
+        report = BatchPromptReport(category="scale", level=2)
+        self.mock_repo.upload.return_value = "checkpoint/LOCAL/1/scale.json"
+
+        result = self.service.upload_checkpoint(report, "LOCAL/1", "scale")
+
+        self.mock_repo.upload.assert_called_once_with(
+            report.model_dump_json().encode("utf-8"), "checkpoint/LOCAL/1/scale.json"
+        )
+        self.assertEqual(result, "checkpoint/LOCAL/1/scale.json")
+
+    def test_upload_checkpoint_exception(self):
+        self.mock_repo.upload.return_value = None
+
+        with self.assertRaises(UploadFailed):
+            self.service.upload_checkpoint(BatchPromptReport(), "LOCAL/1", "scale")
+
+    def test_download_checkpoints(self):
+        report = BatchPromptReport(category="scale", level=2)
+        self.mock_repo.path = "analyze_report/"
+        self.mock_repo.get_object_list.return_value = {
+            "KeyCount": 1,
+            "Contents": [{"Key": "analyze_report/checkpoint/LOCAL/1/scale.json"}],
+        }
+        self.mock_repo.download.return_value = io.BytesIO(
+            report.model_dump_json().encode("utf-8")
+        )
+
+        result = self.service.download_checkpoints("LOCAL/1")
+
+        self.mock_repo.get_object_list.assert_called_once_with("checkpoint/LOCAL/1/")
+        self.mock_repo.download.assert_called_once_with("checkpoint/LOCAL/1/scale.json")
+        self.assertEqual(result, {"scale": report})
+
+    def test_download_checkpoints_empty(self):
+        self.mock_repo.get_object_list.return_value = {"KeyCount": 0}
+
+        self.assertEqual(self.service.download_checkpoints("LOCAL/1"), {})
+
+    def test_delete_checkpoints(self):
+        self.mock_repo.path = "analyze_report/"
+        self.mock_repo.get_object_list.return_value = {
+            "KeyCount": 1,
+            "Contents": [{"Key": "analyze_report/checkpoint/LOCAL/1/scale.json"}],
+        }
+        self.mock_repo.delete.return_value = "checkpoint/LOCAL/1/scale.json"
+
+        result = self.service.delete_checkpoints("LOCAL/1")
+
+        self.mock_repo.delete.assert_called_once_with("checkpoint/LOCAL/1/scale.json")
+        self.assertEqual(result, 1)
+
+    def test_delete_checkpoints_exclude(self):
+        self.mock_repo.path = "analyze_report/"
+        self.mock_repo.get_object_list.return_value = {
+            "KeyCount": 2,
+            "Contents": [
+                {"Key": "analyze_report/checkpoint/LOCAL/1/old/scale.json"},
+                {"Key": "analyze_report/checkpoint/LOCAL/1/new/scale.json"},
+            ],
+        }
+        self.mock_repo.delete.return_value = "checkpoint/LOCAL/1/old/scale.json"
+
+        result = self.service.delete_checkpoints("LOCAL/1", exclude="LOCAL/1/new")
+
+        self.mock_repo.delete.assert_called_once_with(
+            "checkpoint/LOCAL/1/old/scale.json"
+        )
+        self.assertEqual(result, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,5 @@
+import io
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 from object.service.script import ScriptService
@@ -31,6 +33,33 @@ class TestScriptService(unittest.TestCase):
         self.mock_repo.get_json.assert_called_once_with("file_path")
         self.assertEqual(result, "Script Content")
 
+    def test_iter_script_records(self):
+        script_body = io.BytesIO(
+            json.dumps(
+                {
+                    "scripts": [
+                        {"speaker": "T", "text": "안녕", "start_time": "00:00:01"},
+                        {"speaker": "C", "text": "네", "start_time": "00:00:02"},
+                    ]
+                },
+                ensure_ascii=False,
+            ).encode("utf-8")
+        )
+        self.mock_repo.get_json.return_value = script_body
+
+        records = list(self.service.iter_script_records("file_path"))
+
+        self.mock_repo.get_json.assert_called_once_with("file_path")
+        self.assertEqual([record.text for record in records], ["안녕", "네"])
+        self.assertEqual(records[1].speaker, "C")
+        self.assertTrue(script_body.closed)
+
+    def test_iter_script_records_exception(self):
+        self.mock_repo.get_json.return_value = None
+
+        with self.assertRaises(DownloadFailed):
+            list(self.service.iter_script_records("file_path"))
+
     def test_get_script_list(self):
         self.mock_repo.get_object_list.return_value = {"KeyCount": 1}
 
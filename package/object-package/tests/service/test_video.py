@@ -1,7 +1,13 @@
+import sys
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
+from object.repository.async_object import AsyncObjectRepository
+from object.repository.multipart_upload import MultipartUploader, MIN_PART_SIZE
 from object.repository.video import VideoRepository
 from object.service.video import VideoService
+from object.exception import DownloadFailed, EncodeFailed, UploadFailed
 from moviepy.editor import VideoFileClip
 import os
 
@@ -81,3 +87,299 @@ class TestVideoService(unittest.TestCase):
                 preset="ultrafast",
             )
             self.assertIsNone(result)
+
+    @patch("object.service.video.VideoFileClip")
+    def test_encode_video_threads(self, mock_video_clip):
+        mock_clip = MagicMock(spec=VideoFileClip)
+        mock_video_clip.return_value = mock_clip
+
+        with patch("os.path.exists", return_value=True):
+            result = self.video_service.encode_video(
+                "video.mp4", "encoded/encoded_video.mp4", threads=2
+            )
+
+        self.assertEqual(result, "encoded/encoded_video.mp4")
+        self.assertEqual(mock_clip.write_videofile.call_args.kwargs["threads"], 2)
+        mock_clip.close.assert_called_once()
+
+    def test_upload_encode_video_failed(self):
+        self.video_repo.download.return_value = None
+        with self.assertRaises(EncodeFailed):
+            self.video_service.upload_encode_video(
+                "LOCAL/1/1/video.mp4", "video.mp4", "encoded_video.mp4"
+            )
+        self.video_repo.upload.assert_not_called()
+
+    def test_copy_encoded_video(self):
+        self.video_repo.copy.side_effect = lambda source, object_name: object_name
+
+        result = self.video_service.copy_encoded_video(
+            "LOCAL/1/9/encoded_video.mp4", "LOCAL/1/1/video.mp4"
+        )
+
+        self.assertEqual(result, "LOCAL/1/1/encoded_video.mp4")
+        self.video_repo.copy.assert_called_once_with(
+            "LOCAL/1/9/encoded_video.mp4", "LOCAL/1/1/encoded_video.mp4"
+        )
+        self.video_repo.list_object_names.assert_not_called()
+
+    def test_copy_encoded_video_hls(self):
+        self.video_repo.copy.side_effect = lambda source, object_name: object_name
+        self.video_repo.list_object_names.return_value = [
+            "LOCAL/1/9/hls/master.m3u8",
+            "LOCAL/1/9/hls/240p/index.m3u8",
+            "LOCAL/1/9/hls/240p/segment_00000.ts",
+        ]
+
+        result = self.video_service.copy_encoded_video(
+            "LOCAL/1/9/encoded_video.mp4", "LOCAL/1/1/video.mp4", hls=True
+        )
+
+        self.assertEqual(result, "LOCAL/1/1/encoded_video.mp4")
+        self.video_repo.list_object_names.assert_called_once_with("LOCAL/1/9/hls/")
+        copied = [c.args for c in self.video_repo.copy.call_args_list]
+        self.assertCountEqual(
+            copied[:2],
+            [
+                ("LOCAL/1/9/hls/240p/index.m3u8", "LOCAL/1/1/hls/240p/index.m3u8"),
+                (
+                    "LOCAL/1/9/hls/240p/segment_00000.ts",
+                    "LOCAL/1/1/hls/240p/segment_00000.ts",
+                ),
+            ],
+        )
+        # master playlist는 rendition을 다 복사한 뒤에, mp4는 마지막에 복사한다.
+        self.assertEqual(
+            copied[2:],
+            [
+                ("LOCAL/1/9/hls/master.m3u8", "LOCAL/1/1/hls/master.m3u8"),
+                ("LOCAL/1/9/encoded_video.mp4", "LOCAL/1/1/encoded_video.mp4"),
+            ],
+        )
+
+    def test_copy_encoded_video_hls_missing(self):
+        self.video_repo.list_object_names.return_value = []
+        with self.assertRaises(DownloadFailed):
+            self.video_service.copy_encoded_video(
+                "LOCAL/1/9/encoded_video.mp4", "LOCAL/1/1/video.mp4", hls=True
+            )
+        self.video_repo.copy.assert_not_called()
+
+    def test_copy_encoded_video_failed(self):
+        self.video_repo.copy.return_value = None
+        with self.assertRaises(UploadFailed):
+            self.video_service.copy_encoded_video(
+                "LOCAL/1/9/encoded_video.mp4", "LOCAL/1/1/video.mp4"
+            )
+
+
+# ffmpeg 대신 stdout으로 데이터를 쓰고 exit_code로 끝나는 process
+def fake_ffmpeg(size: int, exit_code: int = 0):
+    script = (
+        f"import sys; sys.stdout.buffer.write(b'v' * {size}); "
+        f"sys.stderr.write('ffmpeg log\\n'); sys.exit({exit_code})"
+    )
+    return lambda source_url, threads=None: [sys.executable, "-c", script]
+
+
+class TestVideoServiceStreamEncode(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.video_repo = MagicMock(spec=VideoRepository)
+        self.video_repo.generate_presigned_url.return_value = "https://s3/video.mp4"
+        self.video_repo.create_multipart_upload.return_value = "upload-id"
+        self.video_repo.upload_part.side_effect = (
+            lambda object_name, upload_id, part_number, data: f'"etag-{part_number}"'
+        )
+        self.video_repo.complete_multipart_upload.side_effect = (
+            lambda object_name, upload_id, parts: object_name
+        )
+        self.video_service = VideoService(
+            self.video_repo,
+            video_uploader=MultipartUploader(
+                AsyncObjectRepository(self.video_repo, self.executor),
+                part_size=MIN_PART_SIZE,
+                retry_backoff=0,
+            ),
+            source_url_expires=600,
+        )
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_stream_encode_video(self):
+        self.video_service.ffmpeg_command = fake_ffmpeg(MIN_PART_SIZE + 10)
+
+        result = await self.video_service.stream_encode_video(
+            "LOCAL/1/1/video.mp4", threads=2
+        )
+
+        self.assertEqual(result, "LOCAL/1/1/encoded_video.mp4")
+        self.video_repo.generate_presigned_url.assert_called_once_with(
+            "LOCAL/1/1/video.mp4", expires_in=600
+        )
+        part_sizes = [len(c.args[3]) for c in self.video_repo.upload_part.call_args_list]
+        self.assertEqual(sorted(part_sizes), [10, MIN_PART_SIZE])
+        self.video_repo.download.assert_not_called()
+        self.video_repo.abort_multipart_upload.assert_not_called()
+
+    async def test_stream_encode_video_ffmpeg_failed(self):
+        self.video_service.ffmpeg_command = fake_ffmpeg(10, exit_code=1)
+
+        with self.assertRaises(EncodeFailed):
+            await self.video_service.stream_encode_video("LOCAL/1/1/video.mp4")
+
+        self.video_repo.complete_multipart_upload.assert_not_called()
+        self.video_repo.abort_multipart_upload.assert_called_once_with(
+            "LOCAL/1/1/encoded_video.mp4", "upload-id"
+        )
+
+    async def test_stream_encode_video_upload_failed(self):
+        self.video_service.ffmpeg_command = fake_ffmpeg(10)
+        self.video_repo.complete_multipart_upload.side_effect = None
+        self.video_repo.complete_multipart_upload.return_value = None
+
+        with self.assertRaises(UploadFailed):
+            await self.video_service.stream_encode_video("LOCAL/1/1/video.mp4")
+
+    def test_ffmpeg_command(self):
+        command = self.video_service.ffmpeg_command("https://s3/video.mp4", threads=2)
+
+        self.assertEqual(command[command.index("-i") + 1], "https://s3/video.mp4")
+        self.assertEqual(command[command.index("-threads") + 1], "2")
+        self.assertIn("frag_keyframe", command[command.index("-movflags") + 1])
+        self.assertEqual(command[-1], "pipe:1")
+
+
+# ffmpeg 대신 work_dir에 HLS 파일을 만들고 exit_code로 끝나는 process
+def fake_hls_ffmpeg(exit_code: int = 0):
+    script = (
+        "import os, sys; d = sys.argv[1]; os.makedirs(os.path.join(d, '240p')); "
+        "[open(os.path.join(d, p), 'w').write(p) for p in "
+        "['master.m3u8', '240p/index.m3u8', '240p/segment_00000.ts']]; "
+        f"sys.exit({exit_code})"
+    )
+    return lambda source_url, work_dir, threads, renditions, has_audio=True: [
+        sys.executable,
+        "-c",
+        script,
+        work_dir,
+    ]
+
+
+class TestVideoServiceHls(unittest.TestCase):
+
+    def setUp(self):
+        self.video_repo = MagicMock(spec=VideoRepository)
+        self.video_repo.generate_presigned_url.return_value = "https://s3/video.mp4"
+        self.video_repo.upload.side_effect = lambda file_name, object_name: object_name
+        self.video_service = VideoService(self.video_repo)
+        self.video_service.has_audio = MagicMock(return_value=True)
+        self.work_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    def test_package_hls(self):
+        self.video_service.hls_command = fake_hls_ffmpeg()
+
+        result = self.video_service.package_hls(
+            "LOCAL/1/1/video.mp4", self.work_dir.name, threads=2
+        )
+
+        self.assertEqual(result, "LOCAL/1/1/hls/master.m3u8")
+        self.video_service.has_audio.assert_called_once_with("https://s3/video.mp4")
+        uploaded = [c.args[1] for c in self.video_repo.upload.call_args_list]
+        self.assertCountEqual(
+            uploaded,
+            [
+                "LOCAL/1/1/hls/master.m3u8",
+                "LOCAL/1/1/hls/240p/index.m3u8",
+                "LOCAL/1/1/hls/240p/segment_00000.ts",
+            ],
+        )
+        # master playlist는 마지막에 올린다.
+        self.assertEqual(uploaded[-1], "LOCAL/1/1/hls/master.m3u8")
+
+    def test_package_hls_ffmpeg_failed(self):
+        self.video_service.hls_command = fake_hls_ffmpeg(exit_code=1)
+
+        with self.assertRaises(EncodeFailed):
+            self.video_service.package_hls("LOCAL/1/1/video.mp4", self.work_dir.name)
+        self.video_repo.upload.assert_not_called()
+
+    def test_package_hls_upload_failed(self):
+        self.video_service.hls_command = fake_hls_ffmpeg()
+        self.video_repo.upload.side_effect = None
+        self.video_repo.upload.return_value = None
+
+        with self.assertRaises(UploadFailed):
+            self.video_service.package_hls("LOCAL/1/1/video.mp4", self.work_dir.name)
+        uploaded = [c.args[1] for c in self.video_repo.upload.call_args_list]
+        self.assertNotIn("LOCAL/1/1/hls/master.m3u8", uploaded)
+
+    def test_encoding_profile(self):
+        self.assertEqual(
+            self.video_service.encoding_profile(), "mp4:libx264-96k/aac-72k/24fps"
+        )
+        self.assertEqual(
+            self.video_service.encoding_profile(
+                hls=True,
+                hls_renditions=[
+                    {"name": "240p", "height": 240, "video_bitrate": 300, "audio_bitrate": 64}
+                ],
+            ),
+            "mp4:libx264-96k/aac-72k/24fps+hls:4s/240p-240-300k-64k",
+        )
+        self.assertIn("720p", self.video_service.encoding_profile(hls=True))
+
+    def test_hls_command(self):
+        renditions = [
+            {"name": "240p", "height": 240, "video_bitrate": 300, "audio_bitrate": 64},
+            {"name": "720p", "height": 720, "video_bitrate": 2500, "audio_bitrate": 128},
+        ]
+        command = self.video_service.hls_command(
+            "https://s3/video.mp4", "work", 2, renditions
+        )
+
+        self.assertEqual(
+            command[command.index("-var_stream_map") + 1],
+            "v:0,a:0,name:240p v:1,a:1,name:720p",
+        )
+        self.assertIn("split=2", command[command.index("-filter_complex") + 1])
+        self.assertEqual(command[command.index("-b:v:1") + 1], "2500k")
+        self.assertEqual(command[command.index("-g") + 1], "96")
+        self.assertEqual(command[-1], os.path.join("work", "%v", "index.m3u8"))
+        self.assertIn("0:a:0?", command)
+
+    def test_hls_command_no_audio(self):
+        renditions = [
+            {"name": "240p", "height": 240, "video_bitrate": 300, "audio_bitrate": 64},
+            {"name": "720p", "height": 720, "video_bitrate": 2500, "audio_bitrate": 128},
+        ]
+        command = self.video_service.hls_command(
+            "https://s3/video.mp4", "work", 2, renditions, has_audio=False
+        )
+
+        # 음성이 없는 원본은 video만 map 한다.
+        self.assertEqual(
+            command[command.index("-var_stream_map") + 1],
+            "v:0,name:240p v:1,name:720p",
+        )
+        self.assertNotIn("0:a:0?", command)
+        self.assertNotIn("-b:a:0", command)
+        self.assertEqual(command.count("-map"), 2)
+
+    def test_has_audio(self):
+        with patch("object.service.video.subprocess.run") as run:
+            run.return_value.stderr = (
+                b"  Stream #0:0[0x1](und): Video: h264, yuv420p, 320x240\n"
+                b"  Stream #0:1[0x2](und): Audio: aac (LC), 44100 Hz, mono\n"
+            )
+            self.assertTrue(VideoService(self.video_repo).has_audio("video.mp4"))
+
+            run.return_value.stderr = (
+                b"  Stream #0:0[0x1](und): Video: h264, yuv420p, 320x240\n"
+            )
+            self.assertFalse(VideoService(self.video_repo).has_audio("video.mp4"))
@@ -1,7 +1,7 @@
 @echo off
 setlocal
 
-set modules=api/auth-api api/contents-api api/analyze-api package/core-package package/object-package
+set modules=api/auth-api api/contents-api api/analyze-api package/core-package package/object-package api/encode-api
 
 for %%G in (%modules%) do (
     cd %%G